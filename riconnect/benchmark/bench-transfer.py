@@ -0,0 +1,196 @@
+#!/bin/env python3
+
+import os
+import sys
+import argparse
+import socket
+import struct
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'vzi_services'))
+
+import riconnect
+from riconnect import ric_pb2
+
+from vzi_services.previewgenservice import PreviewgenService
+from vzi_services.cameraservice import CameraService
+
+class TransferSwitch(object):
+    """Minimal riconnect switch answering every function call with a server to client transfer."""
+    def __init__(self, transferSize, bufferSize=riconnect.CONFIG_RIC_TRANSFER_DATA_BUFFER_SIZE):
+        self.transferSize = transferSize
+        self.bufferSize = bufferSize
+        self._server = socket.socket()
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen(16)
+        self.address = '127.0.0.1:{}'.format(self._server.getsockname()[1])
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            sock, addr = self._server.accept()
+            riconnect.setNoDelay(sock)
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _send(self, sock, sendLock, linkId, frameType, srcHash, dstHash, payload, protocol=riconnect.RICON_SWL_PROTOCOL_TYPE_RIC):
+        pkg = bytearray(4)
+        pkg.extend(riconnect.createFrameHeader(linkId, frameType, srcHash=srcHash, dstHash=dstHash, protocol=protocol))
+        pkg.extend(payload)
+        riconnect.updateFrameSize(pkg)
+        with sendLock:
+            sock.sendall(pkg)
+
+    def _transfer(self, sock, sendLock, acks, linkId, srcHash, dstHash, txnId):
+        data = bytes(self.bufferSize)
+        sent = 0
+        while sent < self.transferSize:
+            chunk = data[:min(self.bufferSize, self.transferSize - sent)]
+            self._send(sock, sendLock, linkId, riconnect.RICON_SWL_FRAME_TYPE_DATA, srcHash, dstHash, riconnect.createMessage(
+                riconnect.RICON_RIC_MESSAGE_TRANSFER | riconnect.RICON_RIC_MESSAGE_ACK_REQ,
+                riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_BINARY_DATA, txnId, chunk))
+            acks.acquire()
+            sent += len(chunk)
+        self._send(sock, sendLock, linkId, riconnect.RICON_SWL_FRAME_TYPE_DATA, srcHash, dstHash, riconnect.createMessage(
+            riconnect.RICON_RIC_MESSAGE_TRANSFER | riconnect.RICON_RIC_MESSAGE_ACK_REQ,
+            riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_END, txnId))
+        acks.acquire()
+        response = ric_pb2.CallResponse()
+        response.status = 0
+        response.num = 4
+        response.param.add().u32 = 1
+        response.param.add().u32 = 1
+        response.param.add().f = 1.0
+        response.param.add().f = 1.0
+        self._send(sock, sendLock, linkId, riconnect.RICON_SWL_FRAME_TYPE_DATA, srcHash, dstHash, riconnect.createMessage(
+            riconnect.RICON_RIC_MESSAGE_SERVICE_RESPONSE, riconnect.RICON_RIC_MESSAGE_TYPE_CALL_RESPONSE,
+            txnId, response.SerializeToString()))
+
+    def _serve(self, sock):
+        sendLock = threading.Lock()
+        acks = threading.Semaphore(0)
+        try:
+            while True:
+                frame = riconnect.readFrame(sock)
+                srcHash, dstHash, linkId, frameType, proto = struct.unpack_from("!IIHBB", frame)
+                body = frame[12:]
+                if frameType == riconnect.RICON_SWL_FRAME_TYPE_NAMING_REQUEST:
+                    self._send(sock, sendLock, linkId, riconnect.RICON_SWL_FRAME_TYPE_NAMING_RESPONSE,
+                        riconnect.RICON_SWL_NODE_ALIAS_SWITCH_HASH, riconnect.RICON_SWL_NODE_ALIAS_ENDPOINT_HASH,
+                        bytes(body[1:1 + riconnect.CONFIG_NODE_NAME_MAX_STRLEN]), riconnect.RICON_SWL_PROTOCOL_TYPE_NONE)
+                elif frameType == riconnect.RICON_SWL_FRAME_TYPE_ALIVE_HEARTBEAT:
+                    self._send(sock, sendLock, linkId, riconnect.RICON_SWL_FRAME_TYPE_ALIVE_HEARTBEAT_ACK,
+                        riconnect.RICON_SWL_NODE_ALIAS_SWITCH_HASH, srcHash, b'', riconnect.RICON_SWL_PROTOCOL_TYPE_NONE)
+                elif frameType == riconnect.RICON_SWL_FRAME_TYPE_DATA and len(body) >= 2:
+                    msgDomain, msgType = struct.unpack_from("BB", body)
+                    if msgDomain == riconnect.RICON_RIC_MESSAGE_ACK:
+                        acks.release()
+                        continue
+                    txnId = struct.unpack_from("!H", body, 2)[0]
+                    if msgDomain == riconnect.RICON_RIC_MESSAGE_TRANSFER and msgType == riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_START_REQUEST:
+                        self._send(sock, sendLock, linkId, riconnect.RICON_SWL_FRAME_TYPE_DATA, dstHash, srcHash, riconnect.createMessage(
+                            riconnect.RICON_RIC_MESSAGE_TRANSFER, riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_START_RESPONSE, txnId,
+                            struct.pack("!BII", riconnect.RICON_RIC_TRANSFER_MODE_S2C, self.bufferSize, riconnect.CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS)))
+                        threading.Thread(target=self._transfer, args=(sock, sendLock, acks, linkId, dstHash, srcHash, txnId), daemon=True).start()
+        except Exception:
+            pass
+
+def legacyReceiveData(sock, size):
+    """Frame reception as used by riconnect up to version 1.2 (growing buffer, sleep on empty reads)."""
+    data = bytearray()
+    while len(data) < size:
+        toreceive = size - len(data)
+        data.extend(sock.recv(toreceive))
+        if toreceive == size - len(data):
+            time.sleep(0.05)
+    return data
+
+def legacyReadMessage(sock):
+    frameSize = struct.unpack("!I", legacyReceiveData(sock, 4))[0]
+    frameBuffer = legacyReceiveData(sock, frameSize)
+    message = frameBuffer[12:]
+    return message[4:]
+
+def readMessage(sock):
+    return riconnect.readMessage(sock)[3]
+
+def frameSender(sock, numFrames, frameData, segmentSize):
+    pkg = bytearray(4)
+    pkg.extend(riconnect.createFrameHeader(1, riconnect.RICON_SWL_FRAME_TYPE_DATA, protocol=riconnect.RICON_SWL_PROTOCOL_TYPE_RIC))
+    pkg.extend(riconnect.createMessage(riconnect.RICON_RIC_MESSAGE_TRANSFER, riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_BINARY_DATA, 1, frameData))
+    riconnect.updateFrameSize(pkg)
+    view = memoryview(pkg)
+    for i in range(numFrames):
+        # send frames in segments to force fragmented reception
+        for offset in range(0, len(pkg), segmentSize):
+            sock.sendall(view[offset:offset + segmentSize])
+
+def runFrames(name, readFn, size, bufferSize, segmentSize):
+    numFrames = -(-size // bufferSize)
+    a, b = socket.socketpair()
+    sender = threading.Thread(target=frameSender, args=(a, numFrames, bytes(bufferSize), segmentSize), daemon=True)
+    start = time.perf_counter()
+    sender.start()
+    data = b''.join([readFn(b) for i in range(numFrames)])
+    duration = time.perf_counter() - start
+    sender.join()
+    a.close()
+    b.close()
+    report(name, len(data), duration)
+
+def runCalls(name, fn, repeat):
+    fn()
+    numBytes = 0
+    start = time.perf_counter()
+    for i in range(repeat):
+        numBytes += len(fn())
+    report(name, numBytes, time.perf_counter() - start)
+
+def runLatency(name, fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for i in range(repeat):
+        fn()
+    duration = time.perf_counter() - start
+    print("{0:<28} {1:>10} calls  {2:>8.3f} s  {3:>9.2f} ms/call".format(
+        name, repeat, duration, duration / repeat * 1e3 if repeat > 0 else 0))
+
+def report(name, numBytes, duration):
+    print("{0:<28} {1:>10} bytes  {2:>8.3f} s  {3:>9.1f} MB/s".format(
+        name, numBytes, duration, numBytes / duration / 1e6 if duration > 0 else 0))
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure riconnect frame reception and transfer throughput.')
+    parser.add_argument('--size', type=int, default=8 * 1024 * 1024,
+        help='transfer size in bytes (default=8388608)')
+    parser.add_argument('--buffer-size', type=int, default=riconnect.CONFIG_RIC_TRANSFER_DATA_BUFFER_SIZE,
+        help='transfer data bytes per frame (default={})'.format(riconnect.CONFIG_RIC_TRANSFER_DATA_BUFFER_SIZE))
+    parser.add_argument('--segment-size', type=int, default=1448,
+        help='socket write size of the frame sender (default=1448)')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='number of service calls (default=5)')
+    parser.add_argument('--small-size', type=int, default=64,
+        help='transfer size in bytes of the latency measurement (default=64)')
+    parser.add_argument('--small-repeat', type=int, default=50,
+        help='number of service calls of the latency measurement (default=50)')
+    args = parser.parse_args()
+
+    runFrames('frames (legacy)', legacyReadMessage, args.size, args.buffer_size, args.segment_size)
+    runFrames('frames (recv_into)', readMessage, args.size, args.buffer_size, args.segment_size)
+
+    switch = TransferSwitch(args.size, args.buffer_size)
+    previewSvc = PreviewgenService(switch.address)
+    runCalls('PreviewgenService.getPreview', lambda: previewSvc.getPreview(0)[4], args.repeat)
+    cameraSvc = CameraService(switch.address)
+    runCalls('CameraService.captureBuffer', lambda: cameraSvc.captureBuffer(False), args.repeat)
+
+    # small transfers are dominated by the round trips of request, data and acknowledge frames
+    smallSwitch = TransferSwitch(args.small_size, args.buffer_size)
+    cameraSvc = CameraService(smallSwitch.address)
+    runLatency('CameraService.list', cameraSvc.list, args.small_repeat)
+    previewSvc = PreviewgenService(smallSwitch.address)
+    runLatency('PreviewgenService.getPreview', lambda: previewSvc.getPreview(0), args.small_repeat)
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,9 @@ import traceback
 import weakref
 import numbers
 import time
-from threading import Lock, Thread, Condition
+import queue
+from contextlib import nullcontext
+from threading import Lock, Thread, Condition, BoundedSemaphore
 from .lookup3 import hashlittle
 from . import ric_pb2
 from . import ricerror
@@ -88,6 +90,7 @@ CONFIG_NODE_NAME_MAX_STRLEN = 64
 CONFIG_NODE_DESC_MAX_STRLEN = 64
 CONFIG_RIC_TRANSFER_DATA_BUFFER_SIZE = 32768
 CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS = 10000
+CONFIG_RIC_MAX_INFLIGHT_CALLS = 32
 
 class RiconnectError(Exception):
     def __init__(self, errCode):
@@ -126,6 +129,7 @@ class _Counter(object):
         with self._lck:
             return self._value
 _linkCounter = _Counter()
+_txnCounter = _Counter()
 
 def _parseIPv4(address):
     try:
@@ -188,6 +192,16 @@ def createMessage(msgDomain, msgType, txnId, msgData=None):
         msg.extend(msgData)
     return msg
 
+def setNoDelay(sock):
+    """Disable Nagle's algorithm on a TCP socket connection.
+
+       Requests and acknowledges are small frames, delaying them until the
+       previous frame is acknowledged adds up to 40ms to each service call.
+
+       sock ... socket instance
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
 def sendFrame(sock, data):
     """Send binary data via socket connection.
 
@@ -207,44 +221,56 @@ def sendFrame(sock, data):
             raise RuntimeError("socket connection broken")
         totalsent = totalsent + sent
 
-def _receiveData(sock, size):
-    data = bytearray()
-    while len(data) < size:
-        toreceive = size - len(data)
-        while True:
-            try:
-                data.extend(sock.recv(toreceive))
-                break
-            except InterruptedError:
-                continue
-        if toreceive == size - len(data):
-            # no data received
-            time.sleep(0.05)
+def _receiveInto(sock, view, deadline=None):
+    """Fill memoryview with data received from socket connection.
+
+       sock ... socket instance
+       view ... writable memoryview
+       deadline ... time.monotonic() value the data must be received until
+    """
+    received = 0
+    size = len(view)
+    while received < size:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([sock], [], [], remaining)[0]:
+                raise socket.timeout("timed out")
+        try:
+            n = sock.recv_into(view[received:])
+        except InterruptedError:
+            continue
+        if n == 0:
+            raise ConnectionResetError("socket connection closed")
+        received += n
+
+def _receiveData(sock, size, deadline=None):
+    data = bytearray(size)
+    _receiveInto(sock, memoryview(data), deadline)
     return data
 
 def readFrame(sock, timeout=None):
     """Retrieve response frame data from socket connection.
 
+       The frame data is received into a buffer allocated once with the
+       frame size, the timeout is applied to the whole frame.
+
        sock ... socket instance
-       timeout ... socket timeout
+       timeout ... timeout in seconds, None to wait without timeout
     """
-    timeoutChange = False
-    oldTimeout = sock.gettimeout()
-    if timeout != oldTimeout:
-        sock.settimeout(timeout)
-        timeoutChange = True
-    frameSize = struct.unpack("!I", _receiveData(sock, 4))[0]
+    deadline = None if timeout is None else time.monotonic() + timeout
+    frameHeader = bytearray(4)
+    _receiveInto(sock, memoryview(frameHeader), deadline)
+    frameSize = struct.unpack("!I", frameHeader)[0]
     if frameSize <= 0:
         raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
-    frameBuffer = _receiveData(sock, frameSize)
-    if timeoutChange:
-        sock.settimeout(oldTimeout)
-    return frameBuffer
+    return _receiveData(sock, frameSize, deadline)
 
 def updateFrameSize(framebuffer):
     struct.pack_into("!I", framebuffer, 0, len(framebuffer)-4)
 
 def readMessage(sock, txnId=None, timeout=None):
+    if isinstance(sock, CallStream):
+        return sock.readMessage(txnId=txnId, timeout=timeout)
     while(True):
         frameBuffer = readFrame(sock, timeout=timeout)
         srcHash, dstHash, linkId, fType, proto = struct.unpack_from(
@@ -252,7 +278,7 @@ def readMessage(sock, txnId=None, timeout=None):
         )
         if fType == RICON_SWL_FRAME_TYPE_NO_ROUTE:
             raise RiconnectError(ricerror.RICON_NO_ROUTE_TO_DESTINATION_NODE)
-        message = frameBuffer[12:]
+        message = memoryview(frameBuffer)[12:]
         if not message or len(message) < 4:
             return [None] * 4
         msgDomain, msgType, rxnId = struct.unpack_from("!BBH", message)
@@ -265,28 +291,35 @@ def readMessage(sock, txnId=None, timeout=None):
         if txnId is None or txnId == rxnId:
             return (msgDomain, msgType, rxnId, msgData)
 
-def sendMessageAcknowledgment(sock, linkId, srcHash, dstHash):
+def createMessageAcknowledgment(linkId, srcHash, dstHash):
     pkg = bytearray(4)
     pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=srcHash, dstHash=dstHash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
     pkg.extend(struct.pack("BB", RICON_RIC_MESSAGE_ACK, 0))
     updateFrameSize(pkg)
-    sendFrame(sock, pkg)
+    return pkg
 
-def readMessageAcknowledgment(sock, txnId=None, timeout=None):
-    msgDomain, msgType, rxnId, msgData = readMessage(sock, txnId=txnId, timeout=timeout)
+def checkMessageAcknowledgment(message):
+    msgDomain, msgType, rxnId, msgData = message
     if (msgDomain & (~RICON_RIC_MESSAGE_ACK_REQ)) != RICON_RIC_MESSAGE_ACK:
         raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
 
-def sendTransferStart(sock, linkId, txnId, srcHash, dstHash, transferMode, timeout=None):
+def sendMessageAcknowledgment(sock, linkId, srcHash, dstHash):
+    sendFrame(sock, createMessageAcknowledgment(linkId, srcHash, dstHash))
+
+def readMessageAcknowledgment(sock, txnId=None, timeout=None):
+    checkMessageAcknowledgment(readMessage(sock, txnId=txnId, timeout=timeout))
+
+def createTransferStartRequest(linkId, txnId, srcHash, dstHash, transferMode):
     pkg = bytearray(4)
     pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=srcHash, dstHash=dstHash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
     pkg.extend(createMessage(RICON_RIC_MESSAGE_TRANSFER, RICON_RIC_MESSAGE_TYPE_TRANSFER_START_REQUEST, txnId))
     msgData = struct.pack("!BII", transferMode, CONFIG_RIC_TRANSFER_DATA_BUFFER_SIZE, CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS)
     pkg.extend(msgData)
     updateFrameSize(pkg)
-    sendFrame(sock, pkg)
-    # read response
-    msgDomain, msgType, rxnId, msgData = readMessage(sock, txnId=txnId, timeout=timeout)
+    return pkg
+
+def parseTransferStartResponse(message, transferMode):
+    msgDomain, msgType, rxnId, msgData = message
     if msgDomain != RICON_RIC_MESSAGE_TRANSFER or msgType != RICON_RIC_MESSAGE_TYPE_TRANSFER_START_RESPONSE:
         raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
     remoteTransferMode, remoteBufferSize, remoteTimeoutMs = struct.unpack("!BII", msgData)
@@ -294,6 +327,26 @@ def sendTransferStart(sock, linkId, txnId, srcHash, dstHash, transferMode, timeo
     timeout = remoteTimeoutMs if transferMode == RICON_RIC_TRANSFER_MODE_C2S else CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS
     return (bsize, timeout)
 
+def createTransferData(linkId, txnId, srcHash, dstHash, data):
+    pkg = bytearray(4)
+    pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=srcHash, dstHash=dstHash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
+    pkg.extend(createMessage(RICON_RIC_MESSAGE_TRANSFER | RICON_RIC_MESSAGE_ACK_REQ, RICON_RIC_MESSAGE_TYPE_TRANSFER_BINARY_DATA, txnId))
+    pkg.extend(data)
+    updateFrameSize(pkg)
+    return pkg
+
+def createTransferEnd(linkId, txnId, srcHash, dstHash):
+    pkg = bytearray(4)
+    pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=srcHash, dstHash=dstHash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
+    pkg.extend(createMessage(RICON_RIC_MESSAGE_TRANSFER | RICON_RIC_MESSAGE_ACK_REQ, RICON_RIC_MESSAGE_TYPE_TRANSFER_END, txnId))
+    updateFrameSize(pkg)
+    return pkg
+
+def sendTransferStart(sock, linkId, txnId, srcHash, dstHash, transferMode, timeout=None):
+    sendFrame(sock, createTransferStartRequest(linkId, txnId, srcHash, dstHash, transferMode))
+    # read response
+    return parseTransferStartResponse(readMessage(sock, txnId=txnId, timeout=timeout), transferMode)
+
 def sendTransferData(sock, linkId, txnId, srcHash, dstHash, data, bufferSize, timeout=None):
     dataLength = len(data)
     dataSent = 0
@@ -302,35 +355,254 @@ def sendTransferData(sock, linkId, txnId, srcHash, dstHash, data, bufferSize, ti
         if pkgDataSize > bufferSize:
             pkgDataSize = bufferSize
         pkgData = data[dataSent:dataSent+pkgDataSize]
-        pkg = bytearray(4)
-        pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=srcHash, dstHash=dstHash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
-        pkg.extend(createMessage(RICON_RIC_MESSAGE_TRANSFER | RICON_RIC_MESSAGE_ACK_REQ, RICON_RIC_MESSAGE_TYPE_TRANSFER_BINARY_DATA, txnId))
-        pkg.extend(pkgData)
-        updateFrameSize(pkg)
-        sendFrame(sock, pkg)
+        sendFrame(sock, createTransferData(linkId, txnId, srcHash, dstHash, pkgData))
         readMessageAcknowledgment(sock, txnId=txnId, timeout=timeout)
         dataSent = dataSent + pkgDataSize
 
 def sendTransferEnd(sock, linkId, txnId, srcHash, dstHash, timeout=None):
+    sendFrame(sock, createTransferEnd(linkId, txnId, srcHash, dstHash))
+    # read response
+    readMessageAcknowledgment(sock, txnId=txnId, timeout=timeout)
+
+def joinTransferBuffers(buffers, numOutputTransfers):
+    """Copy received transfer data into numOutputTransfers output buffers."""
+    # transfer data are memoryviews of the received frames, copy once
+    if numOutputTransfers == 1:
+        outputTransfers = [b''.join(buffers)]
+    else:
+        outputTransfers = [bytes(ot) for ot in buffers]
+    if len(outputTransfers) > numOutputTransfers:
+        outputTransfers = outputTransfers[0:numOutputTransfers]
+    if len(outputTransfers) < numOutputTransfers:
+        outputTransfers.extend([bytes()]*(numOutputTransfers-len(outputTransfers)))
+    return outputTransfers
+
+def createNameRequest(linkId, nodeName, nodeDescription):
+    nodeName = bytearray(nodeName.encode(encoding="utf-8"))
+    if len(nodeName) >= CONFIG_NODE_NAME_MAX_STRLEN:
+        nodeName = nodeName[:CONFIG_NODE_NAME_MAX_STRLEN-1]
+    nodeName = nodeName.ljust(CONFIG_NODE_NAME_MAX_STRLEN, b'\0')
+    nodeDesc = bytearray(nodeDescription.encode(encoding="utf-8"))
+    if len(nodeDesc) >= CONFIG_NODE_DESC_MAX_STRLEN:
+        nodeDesc = nodeDesc[:CONFIG_NODE_DESC_MAX_STRLEN-1]
+    nodeDesc = nodeDesc.ljust(CONFIG_NODE_DESC_MAX_STRLEN, b'\0')
+    # create data package
+    pkg = bytearray(4)
+    pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_NAMING_REQUEST))
+    pkg.extend(struct.pack("B", 0)) # force
+    pkg.extend(nodeName)
+    pkg.extend(nodeDesc)
+    updateFrameSize(pkg)
+    return pkg
+
+def parseNameResponse(frameBuffer, linkId):
+    """Return node name assigned by the switch or None if the frame is no naming response."""
+    srcHash, dstHash, rxLinkId, fType, proto = struct.unpack_from(
+        "!IIHBB", frameBuffer
+    )
+    if not (
+            (srcHash == RICON_SWL_NODE_ALIAS_SWITCH_HASH) and
+            (dstHash == RICON_SWL_NODE_ALIAS_ENDPOINT_HASH) and
+            (rxLinkId == linkId) and
+            (fType == RICON_SWL_FRAME_TYPE_NAMING_RESPONSE) and
+            (proto == RICON_SWL_PROTOCOL_TYPE_NONE)
+        ):
+        return None
+    return bytes(frameBuffer[12:]).rstrip(b'\0').decode(encoding="utf-8")
+
+def createHeartbeat(linkId, nodeNameHash):
+    pkg = bytearray(4)
+    pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_ALIVE_HEARTBEAT, srcHash=nodeNameHash))
+    pkg.extend(struct.pack("B", 10)) # interval + check timeout in seconds
+    updateFrameSize(pkg)
+    return pkg
+
+def checkHeartbeatAcknowledgment(frameBuffer, linkId, nodeNameHash):
+    srcHash, dstHash, rxLinkId, fType, proto = struct.unpack_from(
+        "!IIHBB", frameBuffer
+    )
+    if not (
+            (srcHash == RICON_SWL_NODE_ALIAS_SWITCH_HASH) and
+            (dstHash == nodeNameHash) and
+            (rxLinkId == linkId) and
+            (fType == RICON_SWL_FRAME_TYPE_ALIVE_HEARTBEAT_ACK) and
+            (proto == RICON_SWL_PROTOCOL_TYPE_NONE)
+        ):
+        raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
+
+def createSignalRequest(linkId, srcHash, msgType, signalName, signallerName, subscriberName):
+    pkg = bytearray(4)
+    pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=srcHash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
+    if msgType == RICON_RIC_MESSAGE_TYPE_SIGNAL_SUBSCRIBE:
+        payload = ric_pb2.SignalSubscribe()
+    else:
+        payload = ric_pb2.SignalUnsubscribe()
+    payload.signal = signalName
+    payload.signaller = signallerName
+    payload.subscriber = subscriberName
+    msgData = payload.SerializeToString()
+    pkg.extend(createMessage(RICON_RIC_MESSAGE_SIGNAL, msgType, 0, msgData))
+    updateFrameSize(pkg)
+    return pkg
+
+def parseSignal(message):
+    """Return decoded SignalSend message or None if message is no signal."""
+    msgDomain, msgType, rxnId, msgData = message
+    if msgDomain != RICON_RIC_MESSAGE_SIGNAL or msgType != RICON_RIC_MESSAGE_TYPE_SIGNAL_SEND:
+        return None
+    sigData = ric_pb2.SignalSend()
+    sigData.ParseFromString(bytes(msgData))
+    return sigData
+
+def checkTimeout(timeout):
+    """Validate request timeout, timeouts smaller than 1 select the default timeout."""
+    if timeout is not None and not isinstance(timeout, numbers.Number):
+        raise TypeError("Timeout must be numer.")
+    if timeout is not None and timeout < 1:
+        timeout =  CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS / 1000
+    return timeout
+
+def checkInputs(inputs):
+    if inputs is None:
+        return
+    if not isinstance(inputs, list):
+        raise RuntimeError("Inputs must be a list of Value objects.")
+    for i in inputs:
+        if not isinstance(i, Value):
+            raise RuntimeError("Inputs must be a list of Value objects.")
+
+def parsePropertyIndex(index):
+    idx0, idx1, idx2 = [0, 0, 0]
+    if index is not None:
+        if isinstance(index, int):
+            idx0 = index
+        elif isinstance(index, list) or isinstance(index, tuple):
+            indexLen = len(index)
+            idx0 = int(index[0] if indexLen > 0 else 0)
+            idx1 = int(index[1] if indexLen > 1 else 0)
+            idx2 = int(index[2] if indexLen > 2 else 0)
+            if idx0 < 0 or idx1 < 0 or idx2 < 0:
+                raise ValueError("Index must be positive.")
+        else:
+            raise TypeError("Index must be an int of list of ints.")
+    return (idx0, idx1, idx2)
+
+def createCallRequest(linkId, srcHash, dstHash, txnId, name, inputs=None, withTransfer=False):
+    request = ric_pb2.CallRequest()
+    request.command = name
+    request.num = 0
+    if inputs is not None:
+        request.num = len(inputs)
+        for v in inputs:
+            request.param.add().CopyFrom(v)
+    requestMsgDomain = RICON_RIC_MESSAGE_SERVICE_REQUEST
+    if withTransfer:
+        requestMsgDomain = RICON_RIC_MESSAGE_SERVICE_REQUEST_WITH_TRANSFER
+    return _createServiceRequest(linkId, srcHash, dstHash, txnId, requestMsgDomain, RICON_RIC_MESSAGE_TYPE_CALL_REQUEST, request)
+
+def createGetRequest(linkId, srcHash, dstHash, txnId, name, index=None):
+    idx0, idx1, idx2 = parsePropertyIndex(index)
+    request = ric_pb2.GetRequest()
+    request.command = name
+    request.index0 = idx0
+    request.index1 = idx1
+    request.index2 = idx2
+    return _createServiceRequest(linkId, srcHash, dstHash, txnId, RICON_RIC_MESSAGE_SERVICE_REQUEST, RICON_RIC_MESSAGE_TYPE_GET_REQUEST, request)
+
+def createSetRequest(linkId, srcHash, dstHash, txnId, name, value, index=None):
+    if not isinstance(value, Value):
+        raise TypeError("Value must be a Value object.")
+    idx0, idx1, idx2 = parsePropertyIndex(index)
+    request = ric_pb2.SetRequest()
+    request.command = name
+    request.index0 = idx0
+    request.index1 = idx1
+    request.index2 = idx2
+    request.value.CopyFrom(value)
+    return _createServiceRequest(linkId, srcHash, dstHash, txnId, RICON_RIC_MESSAGE_SERVICE_REQUEST, RICON_RIC_MESSAGE_TYPE_SET_REQUEST, request)
+
+def _createServiceRequest(linkId, srcHash, dstHash, txnId, msgDomain, msgType, request):
     pkg = bytearray(4)
     pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=srcHash, dstHash=dstHash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
-    pkg.extend(createMessage(RICON_RIC_MESSAGE_TRANSFER | RICON_RIC_MESSAGE_ACK_REQ, RICON_RIC_MESSAGE_TYPE_TRANSFER_END, txnId))
+    pkg.extend(createMessage(msgDomain, msgType, txnId))
+    pkg.extend(request.SerializeToString())
     updateFrameSize(pkg)
-    sendFrame(sock, pkg)
-    # read response
-    readMessageAcknowledgment(sock, txnId=txnId, timeout=timeout)
+    return pkg
 
-def sendNodeRemoveRequest(sock, linkId, srcHash):
+def _checkServiceResponse(message, txnId, msgType):
+    msgDomain, rxnType, rxnId, msgData = message
+    if not msgDomain in [RICON_RIC_MESSAGE_SERVICE_RESPONSE, RICON_RIC_MESSAGE_SERVICE_RESPONSE_WITH_ERROR]:
+        raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
+    if not rxnType == msgType:
+        raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
+    if rxnId != txnId:
+        raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
+    return msgData
+
+def parseCallResponse(message, txnId):
+    """Validate call response message and return list of output values."""
+    msgData = _checkServiceResponse(message, txnId, RICON_RIC_MESSAGE_TYPE_CALL_RESPONSE)
+    outputs = []
+    if msgData is not None:
+        response = ric_pb2.CallResponse()
+        response.ParseFromString(bytes(msgData))
+        if response.num > 0:
+            for i in range(0, response.num):
+                outputs.append(response.param[i])
+        status = response.status
+        errMsg = response.errstr if response.HasField('errstr') else None
+        if status != 0:
+            if errMsg == "UNKNOWN_METHOD_COMMAND":
+                raise UnknownMethodError()
+            else:
+                raise ServiceError(status, errMsg)
+    return outputs
+
+def parseGetResponse(message, txnId):
+    """Validate get response message and return property value."""
+    msgData = _checkServiceResponse(message, txnId, RICON_RIC_MESSAGE_TYPE_GET_RESPONSE)
+    output = None
+    if msgData is not None:
+        response = ric_pb2.GetResponse()
+        response.ParseFromString(bytes(msgData))
+        status = response.status
+        errMsg = response.errstr if response.HasField('errstr') else None
+        if status != 0:
+            raise ServiceError(status, errMsg)
+        output = response.value
+    return output
+
+def parseSetResponse(message, txnId):
+    """Validate set response message."""
+    msgData = _checkServiceResponse(message, txnId, RICON_RIC_MESSAGE_TYPE_SET_RESPONSE)
+    if msgData is not None:
+        response = ric_pb2.SetResponse()
+        response.ParseFromString(bytes(msgData))
+        status = response.status
+        errMsg = response.errstr if response.HasField('errstr') else None
+        if status != 0:
+            raise ServiceError(status, errMsg)
+
+def nextTransactionId():
+    """Return transaction id unique across services sharing a connection."""
+    return _txnCounter.next() % (2**16)
+
+def createNodeRemoveRequest(linkId, srcHash):
     pkg = bytearray(4)
     pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_NODE_REMOVE_REQUEST, srcHash=srcHash))
     updateFrameSize(pkg)
-    sendFrame(sock, pkg)
-    # read response
-    frameBuffer = readFrame(sock, timeout=5)
+    return pkg
+
+def checkNodeRemoveResponse(frameBuffer):
     fType = struct.unpack_from("!IIHBB", frameBuffer)[3]
     if fType != RICON_SWL_FRAME_TYPE_NODE_REMOVE_RESPONSE:
         raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
 
+def sendNodeRemoveRequest(sock, linkId, srcHash):
+    sendFrame(sock, createNodeRemoveRequest(linkId, srcHash))
+    # read response
+    checkNodeRemoveResponse(readFrame(sock, timeout=5))
+
 class Messenger(object):
     """The messenger allows to push an new message on the riconnect message stack."""
     def __init__(self):
@@ -352,6 +624,7 @@ class Messenger(object):
             self._socket = socket.socket(family=endpoint['family'], type=socket.SOCK_STREAM)
             if endpoint['family'] == socket.AF_INET:
                 self._socket.connect((endpoint['host'], endpoint['port']))
+                setNoDelay(self._socket)
             else:
                 self._socket.connect((endpoint['node']))
 
@@ -391,12 +664,130 @@ class Messenger(object):
         updateFrameSize(pkg)
         sendFrame(self._socket, pkg)
 
+class CallStream(object):
+    """Message stream of a single service call on a ServiceChannel.
+
+       Can be used in place of a socket with sendFrame() and readMessage()."""
+    def __init__(self, channel, key):
+        self._channel = channel
+        self.key = key
+        self._messages = queue.Queue()
+
+    def send(self, data):
+        self._channel.send(data)
+        return len(data)
+
+    def put(self, message):
+        self._messages.put(message)
+
+    def readMessage(self, txnId=None, timeout=None):
+        try:
+            message = self._messages.get(timeout=timeout)
+        except queue.Empty:
+            raise socket.timeout("service call timed out")
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+class ServiceChannel(Thread):
+    """Multiplexed service connection.
+
+       Requests of all services sharing the connection are sent as soon as
+       they are issued. A single reader thread routes the received messages
+       by service name hash and transaction id to the waiting calls, so many
+       calls can be in flight at once. The number of calls in flight is
+       bounded by maxInFlight."""
+    def __init__(self, name, sock, linkId, maxInFlight=CONFIG_RIC_MAX_INFLIGHT_CALLS):
+        super().__init__(name="{0}-service-channel-thread".format(name))
+        self.daemon = True
+        self._socket = sock
+        self._linkId = linkId
+        self._sendLock = Lock()
+        self._lock = Lock()
+        self._calls = {}
+        self._window = BoundedSemaphore(maxInFlight)
+        self._stopped = False
+        self._error = None
+
+    def begin(self, serviceHash, txnId, timeout=None):
+        """Register call and return its message stream."""
+        if not self._window.acquire(timeout=timeout):
+            raise socket.timeout("too many service calls in flight")
+        key = (serviceHash, txnId)
+        stream = CallStream(self, key)
+        with self._lock:
+            if self._error is not None:
+                self._window.release()
+                raise self._error
+            self._calls[key] = stream
+        return stream
+
+    def end(self, stream):
+        """Unregister call, late messages of the call are dropped."""
+        with self._lock:
+            if self._calls.pop(stream.key, None) is None:
+                return
+        self._window.release()
+
+    def send(self, data):
+        with self._sendLock:
+            self._socket.sendall(data)
+
+    def inFlight(self):
+        with self._lock:
+            return len(self._calls)
+
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+
+    def run(self):
+        while True:
+            try:
+                frameBuffer = readFrame(self._socket)
+                self._dispatch(frameBuffer)
+            except Exception as err:
+                with self._lock:
+                    stopped = self._stopped
+                    self._error = err if not stopped else RuntimeError("Service connection closed.")
+                    calls = list(self._calls.values())
+                for stream in calls:
+                    stream.put(self._error)
+                break
+
+    def _dispatch(self, frameBuffer):
+        srcHash, dstHash, linkId, fType, proto = struct.unpack_from(
+            "!IIHBB", frameBuffer
+        )
+        if fType == RICON_SWL_FRAME_TYPE_NO_ROUTE:
+            # the frame does not tell which call failed, fail all calls
+            with self._lock:
+                calls = list(self._calls.values())
+            for stream in calls:
+                stream.put(RiconnectError(ricerror.RICON_NO_ROUTE_TO_DESTINATION_NODE))
+            return
+        message = memoryview(frameBuffer)[12:]
+        if len(message) < 4:
+            return
+        msgDomain, msgType, rxnId = struct.unpack_from("!BBH", message)
+        # check if message needs an acknowledgement
+        if (msgDomain & RICON_RIC_MESSAGE_ACK_REQ) > 0:
+            self.send(createMessageAcknowledgment(linkId, dstHash, srcHash))
+            msgDomain = msgDomain & (~RICON_RIC_MESSAGE_ACK_REQ)
+        with self._lock:
+            stream = self._calls.get((srcHash, rxnId))
+        if stream is not None:
+            stream.put((msgDomain, msgType, rxnId, message[4:]))
+
 class HeartbeatThread(Thread):
-    """The service heartbeat thread."""
-    def __init__(self, nodeName, nodeNameHash, sock, linkId, interval=5):
+    """The service heartbeat thread.
+
+       Sends the heartbeats of all nodes registered on a root connection."""
+    def __init__(self, nodeName, nodeNameHash, sock, linkId, interval=5, sockLock=None):
         super().__init__(name="{0}-heartbeat-thread".format(nodeName))
-        self._nodeNameHash = nodeNameHash
+        self._nodes = [nodeNameHash] if nodeNameHash is not None else []
         self._socket = sock
+        self._sockLock = Lock() if sockLock is None else sockLock
         self._linkId = linkId
         self._interval = interval
         self._stopped = False
@@ -407,16 +798,25 @@ class HeartbeatThread(Thread):
     def run(self):
         with self._lock:
             self._connected = True
-            self._socket.settimeout(3)
             while not self._stopped:
                 try:
-                    self._sendHeartbeat()
+                    for nodeNameHash in self._nodes[:]:
+                        self._sendHeartbeat(nodeNameHash)
                 except Exception:
                     self._stopped = True
                 if not self._stopped:
                     self._wc.wait(timeout=self._interval)
             self._connected = False
 
+    def addNode(self, nodeNameHash):
+        with self._lock:
+            self._nodes.append(nodeNameHash)
+
+    def removeNode(self, nodeNameHash):
+        with self._lock:
+            if nodeNameHash in self._nodes:
+                self._nodes.remove(nodeNameHash)
+
     def stop(self):
         with self._lock:
             self._stopped = True
@@ -426,35 +826,27 @@ class HeartbeatThread(Thread):
         with self._lock:
             return self._connected
 
-    def _sendHeartbeat(self):
-        pkg = bytearray(4)
-        pkg.extend(createFrameHeader(self._linkId, RICON_SWL_FRAME_TYPE_ALIVE_HEARTBEAT, srcHash=self._nodeNameHash))
-        pkg.extend(struct.pack("B", 10)) # interval + check timeout in seconds
-        updateFrameSize(pkg)
-        sendFrame(self._socket, pkg)
-        frameBuffer = readFrame(self._socket)
-        srcHash, dstHash, linkId, fType, proto = struct.unpack_from(
-            "!IIHBB", frameBuffer
-        )
-        if not (
-                (srcHash == RICON_SWL_NODE_ALIAS_SWITCH_HASH) and
-                (dstHash == self._nodeNameHash) and
-                (linkId == self._linkId) and
-                (fType == RICON_SWL_FRAME_TYPE_ALIVE_HEARTBEAT_ACK) and
-                (proto == RICON_SWL_PROTOCOL_TYPE_NONE)
-            ):
-            raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
+    def _sendHeartbeat(self, nodeNameHash):
+        with self._sockLock:
+            sendFrame(self._socket, createHeartbeat(self._linkId, nodeNameHash))
+            frameBuffer = readFrame(self._socket, timeout=10)
+        checkHeartbeatAcknowledgment(frameBuffer, self._linkId, nodeNameHash)
 
 class SignalThread(Thread):
-    """The service signal thread."""
-    def __init__(self, nodeName, nodeNameHash, sock, linkId, signalFunc):
+    """The service signal thread.
+
+       Dispatches the signals received on a signal connection to the
+       registered subscriber nodes."""
+    def __init__(self, nodeName, nodeNameHash, sock, linkId, signalFunc, sockLock=None):
         super().__init__(name="{0}-signal-thread".format(nodeName))
-        self._nodeNameHash = nodeNameHash
         self._socket = sock
+        self._sockLock = Lock() if sockLock is None else sockLock
         self._linkId = linkId
         self._stopped = False
         self._lock = Lock()
-        self._signalFunc = signalFunc
+        self._receivers = {}
+        if signalFunc is not None:
+            self._receivers[nodeNameHash] = signalFunc
 
     def run(self):
         while True:
@@ -474,32 +866,54 @@ class SignalThread(Thread):
         with self._lock:
             self._stopped = True
 
+    def addReceiver(self, nodeNameHash, signalFunc):
+        with self._lock:
+            self._receivers[nodeNameHash] = signalFunc
+
+    def removeReceiver(self, nodeNameHash):
+        with self._lock:
+            self._receivers.pop(nodeNameHash, None)
+
     def _receiveData(self):
         rlist, wlist, xlist = select.select([self._socket], [], [], 0.5)
         if not rlist:
             # timeout
             return
         # read whole message
-        msgDomain, msgType, rxnId, msgData = readMessage(self._socket)
+        with self._sockLock:
+            msgDomain, msgType, rxnId, msgData = readMessage(self._socket)
         # check if message is a signal
-        if msgDomain == RICON_RIC_MESSAGE_SIGNAL and msgType == RICON_RIC_MESSAGE_TYPE_SIGNAL_SEND:
-            # decode message SignalSend
-            sigData = ric_pb2.SignalSend()
-            sigData.ParseFromString(bytes(msgData))
-            if self._signalFunc:
-                stopped = False
-                with self._lock:
-                    stopped = self._stopped
-                if not stopped:
-                    self._signalFunc(sigData)
+        sigData = parseSignal((msgDomain, msgType, rxnId, msgData))
+        if sigData is not None:
+            signalFunc = None
+            with self._lock:
+                if not self._stopped:
+                    signalFunc = self._receivers.get(sigData.subscriber)
+            if signalFunc:
+                signalFunc(sigData)
+
+class _Connection(object):
+    def __init__(self, sock, linkId):
+        self.sock = sock
+        self.linkId = linkId
+        self.refs = 1
+        self.lock = Lock()
+        self.thread = None
 
 class ConnectionFactory(object):
-    """Connection factory for socket connections."""
-    def __init__(self):
+    """Connection factory for socket connections.
+
+       All services opened with the same factory share the root, service and
+       signal socket connections to an address, as well as one heartbeat
+       thread and one signal thread per address. Exchanges on a shared socket
+       are serialized with the socket lock (see socketLock())."""
+    def __init__(self, maxInFlight=CONFIG_RIC_MAX_INFLIGHT_CALLS):
         self._lock = Lock()
         self._rootSockets = {}
         self._serviceSockets = {}
         self._signalSockets = {}
+        self._reconnects = 0
+        self._maxInFlight = maxInFlight
     def acquireRootConnection(self, address):
         with self._lock:
             return self._acquireConnection(self._rootSockets, address)
@@ -509,15 +923,98 @@ class ConnectionFactory(object):
     def acquireSignalConnection(self, address):
         with self._lock:
             return self._acquireConnection(self._signalSockets, address)
-    def releaseRootConnection(self, address, srcHash):
+    def releaseRootConnection(self, address, srcHash, sock=None):
+        with self._lock:
+            return self._releaseConnection(self._rootSockets, address, srcHash, sock=sock)
+    def releaseServiceConnection(self, address, sock=None):
+        with self._lock:
+            return self._releaseConnection(self._serviceSockets, address, sock=sock)
+    def releaseSignalConnection(self, address, sock=None):
         with self._lock:
-            return self._releaseConnection(self._rootSockets, address, srcHash)
-    def releaseServiceConnection(self, address):
+            return self._releaseConnection(self._signalSockets, address, sock=sock)
+    def socketLock(self, sock):
+        """Return lock serializing the exchanges on a socket connection."""
         with self._lock:
-            return self._releaseConnection(self._serviceSockets, address)
-    def releaseSignalConnection(self, address):
+            for cache in (self._rootSockets, self._serviceSockets, self._signalSockets):
+                for con in cache.values():
+                    if con.sock is sock:
+                        return con.lock
+        return Lock()
+    def serviceChannel(self, address, sock):
+        """Return multiplexed channel of the service connection."""
         with self._lock:
-            return self._releaseConnection(self._signalSockets, address)
+            con = self._serviceSockets.get(address)
+            if con is None or con.sock is not sock:
+                raise RuntimeError("Service connection not established.")
+            if con.thread is None:
+                con.thread = ServiceChannel(address, con.sock, con.linkId, maxInFlight=self._maxInFlight)
+                con.thread.start()
+            return con.thread
+    def registerNode(self, address, nodeName, nodeNameHash, signalFunc):
+        """Start sending heartbeats and dispatching signals for a node."""
+        with self._lock:
+            root = self._rootSockets[address]
+            if root.thread is None:
+                root.thread = HeartbeatThread(nodeName, None, root.sock, root.linkId, sockLock=root.lock)
+                root.thread.daemon = True
+                root.thread.start()
+            root.thread.addNode(nodeNameHash)
+            sig = self._signalSockets[address]
+            if sig.thread is None:
+                sig.thread = SignalThread(nodeName, None, sig.sock, sig.linkId, None, sockLock=sig.lock)
+                sig.thread.daemon = True
+                sig.thread.start()
+            sig.thread.addReceiver(nodeNameHash, signalFunc)
+    def unregisterNode(self, address, nodeNameHash, rootSock=None, signalSock=None):
+        """Stop sending heartbeats and dispatching signals for a node."""
+        with self._lock:
+            root = self._rootSockets.get(address)
+            if root is not None and root.thread is not None and (rootSock is None or root.sock is rootSock):
+                root.thread.removeNode(nodeNameHash)
+            sig = self._signalSockets.get(address)
+            if sig is not None and sig.thread is not None and (signalSock is None or sig.sock is signalSock):
+                sig.thread.removeReceiver(nodeNameHash)
+    def isConnected(self, address, rootSock=None):
+        """Return true if the root connection to the address is alive."""
+        with self._lock:
+            root = self._rootSockets.get(address)
+            if root is None or (rootSock is not None and root.sock is not rootSock):
+                return False
+            service = self._serviceSockets.get(address)
+            if service is not None and service.thread is not None and not service.thread.is_alive():
+                return False
+            return root.thread is None or (root.thread.is_alive() and root.thread.is_connected())
+    def invalidate(self, address):
+        """Close all connections to the address.
+
+           Connections are re-established by the next acquire call, services
+           still holding the closed connections have to be reopened."""
+        with self._lock:
+            for cache in (self._rootSockets, self._serviceSockets, self._signalSockets):
+                con = cache.pop(address, None)
+                if con is not None:
+                    self._closeConnection(con)
+            self._reconnects += 1
+    def getStatistics(self):
+        """Return number of open sockets, running threads, calls in flight and reconnects."""
+        with self._lock:
+            sockets = 0
+            threads = 0
+            inFlight = 0
+            for cache in (self._rootSockets, self._serviceSockets, self._signalSockets):
+                sockets += len(cache)
+                for con in cache.values():
+                    if con.thread is not None and con.thread.is_alive():
+                        threads += 1
+            for con in self._serviceSockets.values():
+                if con.thread is not None:
+                    inFlight += con.thread.inFlight()
+            return {
+                'sockets': sockets,
+                'threads': threads,
+                'in_flight': inFlight,
+                'reconnects': self._reconnects
+            }
     def _acquireConnection(self, cache, address):
         r = cache.get(address)
         if r is None:
@@ -527,37 +1024,45 @@ class ConnectionFactory(object):
                 addr = (endpoint['host'], endpoint['port'])
                 sock = socket.create_connection(addr, 20)
                 sock.settimeout(None)
+                setNoDelay(sock)
             elif endpoint['family'] == socket.AF_INET6:
                 addr = (endpoint['host'], endpoint['port'], endpoint['flowinfo'], endpoint['scopeid'])
                 sock = socket.create_connection(addr, 20)
                 sock.settimeout(None)
+                setNoDelay(sock)
             else:
                 sock = socket.socket(family=endpoint['family'], type=socket.SOCK_STREAM)
                 sock.settimeout(20)
                 sock.connect((endpoint['node']))
                 sock.settimeout(None)
-            r = [sock, linkId, 1]
+            r = _Connection(sock, linkId)
             cache[address] = r
-            return r[:2]
         else:
-            r[2] += 1
-        return r[:2]
-    def _releaseConnection(self, cache, address, srcHash=None):
+            r.refs += 1
+        return (r.sock, r.linkId)
+    def _releaseConnection(self, cache, address, srcHash=None, sock=None):
         r = cache.get(address)
-        if r is not None:
-            if r[2] > 1:
-                r[2] -= 1
+        if r is not None and (sock is None or r.sock is sock):
+            if r.refs > 1:
+                r.refs -= 1
             else:
                 # close connection
-                sock = r[0]
-                try:
-                    if srcHash is not None:
-                        sendNodeRemoveRequest(sock, r[1], srcHash)
-                    sock.shutdown(socket.SHUT_RDWR)
-                    sock.close()
-                except:
-                    pass
+                self._closeConnection(r, srcHash)
                 del cache[address]
+    def _closeConnection(self, con, srcHash=None):
+        if con.thread is not None:
+            con.thread.stop()
+        try:
+            if srcHash is not None:
+                with con.lock:
+                    sendNodeRemoveRequest(con.sock, con.linkId, srcHash)
+        except:
+            pass
+        try:
+            con.sock.shutdown(socket.SHUT_RDWR)
+            con.sock.close()
+        except:
+            pass
 
 class Service(object):
     """The riconnect Service class allows communication with Riegl's VZi scanners.
@@ -592,9 +1097,9 @@ class Service(object):
                 self._node_description = os.path.splitext(os.path.basename(sys.argv[0]))[0]
         except Exception:
             self._node_description = "DefaultNodeDesc"
-        self._heartbeatthread = None
-        self._signalthread = None
-        self._txnId = 0
+        self._rootConnectionLock = None
+        self._signalConnectionLock = None
+        self._serviceChannel = None
         self._address = None
 
     def open(self, address):
@@ -610,68 +1115,53 @@ class Service(object):
             self._rootConnection, self._rootConnectionLinkId = self._factory.acquireRootConnection(address)
             self._serviceConnection, self._serviceConnectionLinkId = self._factory.acquireServiceConnection(address)
             self._signalConnection, self._signalConnectionLinkId = self._factory.acquireSignalConnection(address)
+            self._rootConnectionLock = self._factory.socketLock(self._rootConnection)
+            self._signalConnectionLock = self._factory.socketLock(self._signalConnection)
+            self._serviceChannel = self._factory.serviceChannel(address, self._serviceConnection)
             self._address = address
             self._sendNameRequest()
-            self._heartbeatthread = HeartbeatThread(self._client_name, self._client_hash, self._rootConnection, self._rootConnectionLinkId)
-            self._heartbeatthread.daemon = True
-            self._heartbeatthread.start()
-            self._signalthread = SignalThread(self._client_name, self._client_hash, self._signalConnection, self._signalConnectionLinkId, self._onSignalReceived)
-            self._signalthread.daemon = True
-            self._signalthread.start()
+            self._factory.registerNode(address, self._client_name, self._client_hash, self._onSignalReceived)
 
     def close(self):
         """Close service connection."""
         with self._serviceLock:
             if self._address is not None:
                 self._subscriptions = {}
-                if self._signalthread is not None:
-                    self._signalthread.stop()
-                self._factory.releaseSignalConnection(self._address)
+                self._factory.unregisterNode(self._address, self._client_hash, self._rootConnection, self._signalConnection)
+                self._factory.releaseSignalConnection(self._address, self._signalConnection)
                 self._signalConnection = None
-                self._factory.releaseServiceConnection(self._address)
+                self._factory.releaseServiceConnection(self._address, self._serviceConnection)
                 self._serviceConnection = None
-                if self._heartbeatthread is not None:
-                    self._heartbeatthread.stop()
-                self._factory.releaseRootConnection(self._address, self._client_hash)
+                self._serviceChannel = None
+                self._factory.releaseRootConnection(self._address, self._client_hash, self._rootConnection)
                 self._rootConnection = None
                 self._address = None
 
+    def callLock(self):
+        """Return context manager for serializing calls of a service client.
+
+           Calls are multiplexed over the service connection, so they do not
+           need to be serialized by the caller."""
+        return nullcontext()
+
+    def isConnected(self):
+        """Return true if the service connection is established and alive."""
+        with self._serviceLock:
+            if self._address is None:
+                return False
+            return self._factory.isConnected(self._address, self._rootConnection)
+
     def _sendNameRequest(self):
-        nodeName = bytearray(self._client_name.encode(encoding="utf-8"))
-        if len(nodeName) >= CONFIG_NODE_NAME_MAX_STRLEN:
-            nodeName = nodeName[:CONFIG_NODE_NAME_MAX_STRLEN-1]
-        nodeName = nodeName.ljust(CONFIG_NODE_NAME_MAX_STRLEN, b'\0')
-        nodeDesc = bytearray(self._node_description.encode(encoding="utf-8"))
-        if len(nodeDesc) >= CONFIG_NODE_DESC_MAX_STRLEN:
-            nodeDesc = nodeDesc[:CONFIG_NODE_DESC_MAX_STRLEN-1]
-        nodeDesc = nodeDesc.ljust(CONFIG_NODE_DESC_MAX_STRLEN, b'\0')
-        # create data package
-        pkg = bytearray(4)
-        pkg.extend(createFrameHeader(self._rootConnectionLinkId, RICON_SWL_FRAME_TYPE_NAMING_REQUEST))
-        pkg.extend(struct.pack("B", 0)) # force
-        pkg.extend(nodeName)
-        pkg.extend(nodeDesc)
-        updateFrameSize(pkg)
-        sendFrame(self._rootConnection, pkg)
-        # get result
-        frameBuffer = readFrame(self._rootConnection, timeout=10)
-        if self._checkFrame(frameBuffer, RICON_SWL_FRAME_TYPE_NAMING_RESPONSE):
-            recNodeName = frameBuffer[12:].rstrip(b'\0').decode(encoding="utf-8")
+        pkg = createNameRequest(self._rootConnectionLinkId, self._client_name, self._node_description)
+        with self._rootConnectionLock:
+            sendFrame(self._rootConnection, pkg)
+            # get result
+            frameBuffer = readFrame(self._rootConnection, timeout=10)
+        recNodeName = parseNameResponse(frameBuffer, self._rootConnectionLinkId)
+        if recNodeName is not None:
             self._client_name = recNodeName
             self._client_hash = hashlittle(self._client_name, initval=RICON_HASH_INITVAL)
 
-    def _checkFrame(self, frameBuffer, frameType):
-        srcHash, dstHash, linkId, fType, proto = struct.unpack_from(
-            "!IIHBB", frameBuffer
-        )
-        return (
-            (srcHash == RICON_SWL_NODE_ALIAS_SWITCH_HASH) and
-            (dstHash == RICON_SWL_NODE_ALIAS_ENDPOINT_HASH) and
-            (linkId == self._rootConnectionLinkId) and
-            (fType == frameType) and
-            (proto == RICON_SWL_PROTOCOL_TYPE_NONE)
-        )
-
     def subscribe(self, signalName, cbFunc):
         """Subscribe to service signal.
 
@@ -726,28 +1216,14 @@ class Service(object):
                 pass
 
     def _sendSignalSubscribe(self, signalName):
-        pkg = bytearray(4)
-        pkg.extend(createFrameHeader(self._signalConnectionLinkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=self._client_hash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
-        payload = ric_pb2.SignalSubscribe()
-        payload.signal = signalName
-        payload.signaller = self._servicename
-        payload.subscriber = self._client_name
-        msgData = payload.SerializeToString()
-        pkg.extend(createMessage(RICON_RIC_MESSAGE_SIGNAL, RICON_RIC_MESSAGE_TYPE_SIGNAL_SUBSCRIBE, 0, msgData))
-        updateFrameSize(pkg)
-        sendFrame(self._signalConnection, pkg)
+        pkg = createSignalRequest(self._signalConnectionLinkId, self._client_hash, RICON_RIC_MESSAGE_TYPE_SIGNAL_SUBSCRIBE, signalName, self._servicename, self._client_name)
+        with self._signalConnectionLock:
+            sendFrame(self._signalConnection, pkg)
 
     def _sendSignalUnsubscribe(self, signalName):
-        pkg = bytearray(4)
-        pkg.extend(createFrameHeader(self._signalConnectionLinkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=self._client_hash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
-        payload = ric_pb2.SignalUnsubscribe()
-        payload.signal = signalName
-        payload.signaller = self._servicename
-        payload.subscriber = self._client_name
-        msgData = payload.SerializeToString()
-        pkg.extend(createMessage(RICON_RIC_MESSAGE_SIGNAL, RICON_RIC_MESSAGE_TYPE_SIGNAL_UNSUBSCRIBE, 0, msgData))
-        updateFrameSize(pkg)
-        sendFrame(self._signalConnection, pkg)
+        pkg = createSignalRequest(self._signalConnectionLinkId, self._client_hash, RICON_RIC_MESSAGE_TYPE_SIGNAL_UNSUBSCRIBE, signalName, self._servicename, self._client_name)
+        with self._signalConnectionLock:
+            sendFrame(self._signalConnection, pkg)
 
     def callFunction(self, name, inputs=None, inputTransfers=None, numOutputTransfers=0, timeout=-1):
         """Call service function.
@@ -764,75 +1240,32 @@ class Service(object):
                               4 seconds then this call will not time out even though it took 8 seconds.
                               If not timeout is specified or the timeout is smaller than 1 then the
                               default timeout is used. None can be used to disable all request timeouts."""
-        self._checkInputs(inputs)
-        con, linkId, txnId = (None, None, None)
+        checkInputs(inputs)
+        timeout = checkTimeout(timeout)
+        channel, linkId, txnId = (None, None, None)
         with self._serviceLock:
-            con = self._serviceConnection
+            channel = self._serviceChannel
             linkId = self._serviceConnectionLinkId
-            self._txnId = ( self._txnId + 1 ) % (2**16)
-            txnId = self._txnId
-        if con is None:
+            txnId = nextTransactionId()
+        if channel is None:
             raise RuntimeError("Service connection not established.")
-        if timeout is not None and not isinstance(timeout, numbers.Number):
-            raise TypeError("Timeout must be numer.")
-        if timeout is not None and timeout < 1:
-            timeout =  CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS / 1000
-        request = ric_pb2.CallRequest()
-        request.command = name
-        request.num = 0
-        if inputs is not None:
-            request.num = len(inputs)
-            for v in inputs:
-                request.param.add().CopyFrom(v)
-        # create data package
-        requestMsgDomain = RICON_RIC_MESSAGE_SERVICE_REQUEST
-        if inputTransfers is not None or numOutputTransfers > 0:
-            requestMsgDomain = RICON_RIC_MESSAGE_SERVICE_REQUEST_WITH_TRANSFER
-        pkg = bytearray(4)
-        pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=self._client_hash, dstHash=self._servicenameHash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
-        pkg.extend(createMessage(requestMsgDomain, RICON_RIC_MESSAGE_TYPE_CALL_REQUEST, txnId))
-        pkg.extend(request.SerializeToString())
-        updateFrameSize(pkg)
-        # send request
-        sendFrame(self._serviceConnection, pkg)
-        if inputTransfers is not None:
-            self._sendRequestTransferBuffers(con, linkId, txnId, inputTransfers, timeout=timeout)
-        # wait for response
-        outputs = []
-        outputTransfers = []
-        if numOutputTransfers > 0:
-            outputTransfers = self._readResponseTransferBuffers(con, linkId, txnId, timeout=timeout)
-            if numOutputTransfers == 1 and len(outputTransfers) > 1:
-                b = bytearray()
-                for ot in outputTransfers:
-                    b.extend(ot)
-                outputTransfers = [bytes(b)]
-            if len(outputTransfers) > numOutputTransfers:
-                outputTransfers = outputTransfers[0:numOutputTransfers]
-            if len(outputTransfers) < numOutputTransfers:
-                outputTransfers.extend([bytes()]*(numOutputTransfers-len(outputTransfers)))
-        msgDomain, msgType, rxnId, msgData = readMessage(con, txnId=txnId, timeout=timeout)
-        # validate response
-        if not msgDomain in [RICON_RIC_MESSAGE_SERVICE_RESPONSE, RICON_RIC_MESSAGE_SERVICE_RESPONSE_WITH_ERROR]:
-            raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
-        if not msgType == RICON_RIC_MESSAGE_TYPE_CALL_RESPONSE:
-            raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
-        if rxnId != txnId:
-            raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
-        if msgData is not None:
-            response = ric_pb2.CallResponse()
-            response.ParseFromString(bytes(msgData))
-            if response.num > 0:
-                for i in range(0, response.num):
-                    outputs.append(response.param[i])
-            status = response.status
-            errMsg = response.errstr if response.HasField('errstr') else None
-            if status != 0:
-                if errMsg == "UNKNOWN_METHOD_COMMAND":
-                    raise UnknownMethodError()
-                else:
-                    raise ServiceError(status, errMsg)
-        return (outputs, outputTransfers)
+        pkg = createCallRequest(linkId, self._client_hash, self._servicenameHash, txnId, name, inputs,
+            inputTransfers is not None or numOutputTransfers > 0)
+        con = channel.begin(self._servicenameHash, txnId, timeout=timeout)
+        try:
+            # send request
+            sendFrame(con, pkg)
+            if inputTransfers is not None:
+                self._sendRequestTransferBuffers(con, linkId, txnId, inputTransfers, timeout=timeout)
+            # wait for response
+            outputTransfers = []
+            if numOutputTransfers > 0:
+                outputTransfers = joinTransferBuffers(
+                    self._readResponseTransferBuffers(con, linkId, txnId, timeout=timeout), numOutputTransfers)
+            message = readMessage(con, txnId=txnId, timeout=timeout)
+        finally:
+            channel.end(con)
+        return (parseCallResponse(message, txnId), outputTransfers)
 
     def getProperty(self, name, index=None, timeout=None):
         """Get value of service property.
@@ -842,65 +1275,24 @@ class Service(object):
              index (int)
              index (list(int)): property index (needed for arrays and matrices)
              timeout (float): see callFunction()"""
-        # parse property indices
-        idx0, idx1, idx2 = [0, 0, 0]
-        if index is not None:
-            if isinstance(index, int):
-                idx0 = index
-            elif isinstance(index, list) or isinstance(index, tuple):
-                indexLen = len(index)
-                idx0 = int(index[0] if indexLen > 0 else 0)
-                idx1 = int(index[1] if indexLen > 1 else 0)
-                idx2 = int(index[2] if indexLen > 2 else 0)
-                if idx0 < 0 or idx1 < 0 or idx2 < 0:
-                    raise ValueError("Index must be positive.")
-            else:
-                raise TypeError("Index must be an int of list of ints.")
-        if timeout is not None and not isinstance(timeout, numbers.Number):
-            raise TypeError("Timeout must be numer.")
-        if timeout is not None and timeout < 1:
-            timeout =  CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS / 1000
-        con, linkId, txnId = (None, None, None)
+        timeout = checkTimeout(timeout)
+        channel, linkId, txnId = (None, None, None)
         with self._serviceLock:
-            con = self._serviceConnection
+            channel = self._serviceChannel
             linkId = self._serviceConnectionLinkId
-            self._txnId = ( self._txnId + 1 ) % (2**16)
-            txnId = self._txnId
-        if con is None:
+            txnId = nextTransactionId()
+        if channel is None:
             raise RuntimeError("Service connection not established.")
-        request = ric_pb2.GetRequest()
-        request.command = name
-        request.index0 = idx0
-        request.index1 = idx1
-        request.index2 = idx2
-        # create data package
-        requestMsgDomain = RICON_RIC_MESSAGE_SERVICE_REQUEST
-        pkg = bytearray(4)
-        pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=self._client_hash, dstHash=self._servicenameHash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
-        pkg.extend(createMessage(requestMsgDomain, RICON_RIC_MESSAGE_TYPE_GET_REQUEST, txnId))
-        pkg.extend(request.SerializeToString())
-        updateFrameSize(pkg)
-        # send request
-        sendFrame(self._serviceConnection, pkg)
-        # wait for response
-        output = None
-        msgDomain, msgType, rxnId, msgData = readMessage(con, txnId=txnId, timeout=timeout)
-        # validate response
-        if not msgDomain in [RICON_RIC_MESSAGE_SERVICE_RESPONSE, RICON_RIC_MESSAGE_SERVICE_RESPONSE_WITH_ERROR]:
-            raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
-        if not msgType == RICON_RIC_MESSAGE_TYPE_GET_RESPONSE:
-            raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
-        if rxnId != txnId:
-            raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
-        if msgData is not None:
-            response = ric_pb2.GetResponse()
-            response.ParseFromString(bytes(msgData))
-            status = response.status
-            errMsg = response.errstr if response.HasField('errstr') else None
-            if status != 0:
-                raise ServiceError(status, errMsg)
-            output = response.value
-        return output
+        pkg = createGetRequest(linkId, self._client_hash, self._servicenameHash, txnId, name, index)
+        con = channel.begin(self._servicenameHash, txnId, timeout=timeout)
+        try:
+            # send request
+            sendFrame(con, pkg)
+            # wait for response
+            message = readMessage(con, txnId=txnId, timeout=timeout)
+        finally:
+            channel.end(con)
+        return parseGetResponse(message, txnId)
 
     def setProperty(self, name, value, index=None, timeout=None):
         """Set value of service property.
@@ -911,74 +1303,24 @@ class Service(object):
              index (int)
              index (list(int)): property index (needed for arrays and matrices)
              timeout (float): see callFunction()"""
-        if not isinstance(value, Value):
-            raise TypeError("Value must be a Value object.")
-        # parse property indices
-        idx0, idx1, idx2 = [0, 0, 0]
-        if index is not None:
-            if isinstance(index, int):
-                idx0 = index
-            elif isinstance(index, list) or isinstance(index, tuple):
-                indexLen = len(index)
-                idx0 = int(index[0] if indexLen > 0 else 0)
-                idx1 = int(index[1] if indexLen > 1 else 0)
-                idx2 = int(index[2] if indexLen > 2 else 0)
-                if idx0 < 0 or idx1 < 0 or idx2 < 0:
-                    raise ValueError("Index must be positive.")
-            else:
-                raise TypeError("Index must be an int of list of ints.")
-        if timeout is not None and not isinstance(timeout, numbers.Number):
-            raise TypeError("Timeout must be numer.")
-        if timeout is not None and timeout < 1:
-            timeout =  CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS / 1000
-        con, linkId, txnId = (None, None, None)
+        timeout = checkTimeout(timeout)
+        channel, linkId, txnId = (None, None, None)
         with self._serviceLock:
-            con = self._serviceConnection
+            channel = self._serviceChannel
             linkId = self._serviceConnectionLinkId
-            self._txnId = ( self._txnId + 1 ) % (2**16)
-            txnId = self._txnId
-        if con is None:
+            txnId = nextTransactionId()
+        if channel is None:
             raise RuntimeError("Service connection not established.")
-        request = ric_pb2.SetRequest()
-        request.command = name
-        request.index0 = idx0
-        request.index1 = idx1
-        request.index2 = idx2
-        request.value.CopyFrom(value)
-        # create data package
-        requestMsgDomain = RICON_RIC_MESSAGE_SERVICE_REQUEST
-        pkg = bytearray(4)
-        pkg.extend(createFrameHeader(linkId, RICON_SWL_FRAME_TYPE_DATA, srcHash=self._client_hash, dstHash=self._servicenameHash, protocol=RICON_SWL_PROTOCOL_TYPE_RIC))
-        pkg.extend(createMessage(requestMsgDomain, RICON_RIC_MESSAGE_TYPE_SET_REQUEST, txnId))
-        pkg.extend(request.SerializeToString())
-        updateFrameSize(pkg)
-        # send request
-        sendFrame(self._serviceConnection, pkg)
-        # wait for response
-        msgDomain, msgType, rxnId, msgData = readMessage(con, txnId=txnId, timeout=timeout)
-        # validate response
-        if not msgDomain in [RICON_RIC_MESSAGE_SERVICE_RESPONSE, RICON_RIC_MESSAGE_SERVICE_RESPONSE_WITH_ERROR]:
-            raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
-        if not msgType == RICON_RIC_MESSAGE_TYPE_SET_RESPONSE:
-            raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
-        if rxnId != txnId:
-            raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
-        if msgData is not None:
-            response = ric_pb2.SetResponse()
-            response.ParseFromString(bytes(msgData))
-            status = response.status
-            errMsg = response.errstr if response.HasField('errstr') else None
-            if status != 0:
-                raise ServiceError(status, errMsg)
-
-    def _checkInputs(self, inputs):
-        if inputs is None:
-            return
-        if not isinstance(inputs, list):
-            raise RuntimeError("Inputs must be a list of Value objects.")
-        for i in inputs:
-            if not isinstance(i, Value):
-                raise RuntimeError("Inputs must be a list of Value objects.")
+        pkg = createSetRequest(linkId, self._client_hash, self._servicenameHash, txnId, name, value, index)
+        con = channel.begin(self._servicenameHash, txnId, timeout=timeout)
+        try:
+            # send request
+            sendFrame(con, pkg)
+            # wait for response
+            message = readMessage(con, txnId=txnId, timeout=timeout)
+        finally:
+            channel.end(con)
+        parseSetResponse(message, txnId)
 
     def _sendRequestTransferBuffers(self, sock, linkId, txnId, buffers, timeout=None):
         srcHash = self._client_hash
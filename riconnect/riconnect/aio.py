@@ -0,0 +1,654 @@
+# pylint: disable=line-too-long
+# pylint: disable=too-many-instance-attributes
+# pylint: disable=too-many-arguments
+
+"""asyncio transport of the riconnect switch protocol.
+
+   AsyncService is the coroutine counterpart of riconnect.Service. All
+   async services opened with the same AsyncConnectionFactory share the
+   root, service and signal stream connections to an address. Heartbeats,
+   signal dispatching and the routing of service responses run as tasks of
+   the event loop instead of OS threads."""
+
+import os
+import sys
+import socket
+import struct
+import asyncio
+import weakref
+from .lookup3 import hashlittle
+from . import ricerror
+from . import (
+    RiconnectError,
+    RICON_HASH_INITVAL,
+    RICON_SWL_FRAME_TYPE_NO_ROUTE,
+    RICON_RIC_MESSAGE_ACK_REQ,
+    RICON_RIC_MESSAGE_TRANSFER,
+    RICON_RIC_MESSAGE_TYPE_TRANSFER_END,
+    RICON_RIC_MESSAGE_TYPE_TRANSFER_BINARY_DATA,
+    RICON_RIC_MESSAGE_TYPE_TRANSFER_ASCII_DATA,
+    RICON_RIC_MESSAGE_TYPE_TRANSFER_PROGRESS_DATA,
+    RICON_RIC_MESSAGE_TYPE_SIGNAL_SUBSCRIBE,
+    RICON_RIC_MESSAGE_TYPE_SIGNAL_UNSUBSCRIBE,
+    RICON_RIC_TRANSFER_MODE_C2S,
+    RICON_RIC_TRANSFER_MODE_S2C,
+    CONFIG_RIC_MAX_INFLIGHT_CALLS,
+    createMessageAcknowledgment,
+    checkMessageAcknowledgment,
+    createTransferStartRequest,
+    parseTransferStartResponse,
+    createTransferData,
+    createTransferEnd,
+    joinTransferBuffers,
+    createNameRequest,
+    parseNameResponse,
+    createHeartbeat,
+    checkHeartbeatAcknowledgment,
+    createSignalRequest,
+    parseSignal,
+    checkTimeout,
+    checkInputs,
+    createCallRequest,
+    createGetRequest,
+    createSetRequest,
+    parseCallResponse,
+    parseGetResponse,
+    parseSetResponse,
+    nextTransactionId,
+    setNoDelay,
+    createNodeRemoveRequest,
+    checkNodeRemoveResponse,
+    _parseAddress,
+    _linkCounter
+)
+
+async def readFrame(reader):
+    """Retrieve frame data from stream reader."""
+    try:
+        frameSize = struct.unpack("!I", await reader.readexactly(4))[0]
+        if frameSize <= 0:
+            raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
+        return await reader.readexactly(frameSize)
+    except asyncio.IncompleteReadError:
+        raise ConnectionResetError("socket connection closed")
+
+def _parseMessage(frameBuffer):
+    """Return frame header and message tuple of a frame, the message is None for frames without message."""
+    srcHash, dstHash, linkId, fType, proto = struct.unpack_from(
+        "!IIHBB", frameBuffer
+    )
+    if fType == RICON_SWL_FRAME_TYPE_NO_ROUTE:
+        raise RiconnectError(ricerror.RICON_NO_ROUTE_TO_DESTINATION_NODE)
+    message = memoryview(frameBuffer)[12:]
+    if len(message) < 4:
+        return (srcHash, dstHash, linkId, None)
+    msgDomain, msgType, rxnId = struct.unpack_from("!BBH", message)
+    return (srcHash, dstHash, linkId, (msgDomain, msgType, rxnId, message[4:]))
+
+class _AsyncConnection(object):
+    def __init__(self, reader, writer, linkId):
+        self.reader = reader
+        self.writer = writer
+        self.linkId = linkId
+        self.refs = 1
+        self.lock = asyncio.Lock()
+        self.task = None
+
+    async def send(self, data):
+        self.writer.write(data)
+        await self.writer.drain()
+
+    async def exchange(self, data, timeout=10):
+        """Send frame and return response frame, exchanges are serialized."""
+        async with self.lock:
+            await self.send(data)
+            return await asyncio.wait_for(readFrame(self.reader), timeout)
+
+    def close(self):
+        if self.task is not None:
+            self.task.stop()
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+class AsyncCallStream(object):
+    """Message stream of a single service call on an AsyncServiceChannel."""
+    def __init__(self, channel, key):
+        self._channel = channel
+        self.key = key
+        self._messages = asyncio.Queue()
+
+    async def send(self, data):
+        await self._channel.send(data)
+
+    def put(self, message):
+        self._messages.put_nowait(message)
+
+    async def readMessage(self, timeout=None):
+        try:
+            message = await asyncio.wait_for(self._messages.get(), timeout)
+        except asyncio.TimeoutError:
+            raise socket.timeout("service call timed out")
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+class AsyncServiceChannel(object):
+    """Multiplexed service connection.
+
+       A reader task routes the received messages by service name hash and
+       transaction id to the waiting calls (see riconnect.ServiceChannel)."""
+    def __init__(self, con, maxInFlight=CONFIG_RIC_MAX_INFLIGHT_CALLS):
+        self._con = con
+        self._calls = {}
+        self._window = asyncio.Semaphore(maxInFlight)
+        self._stopped = False
+        self._error = None
+        self._task = asyncio.ensure_future(self._run())
+
+    async def begin(self, serviceHash, txnId, timeout=None):
+        """Register call and return its message stream."""
+        try:
+            await asyncio.wait_for(self._window.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise socket.timeout("too many service calls in flight")
+        if self._error is not None:
+            self._window.release()
+            raise self._error
+        key = (serviceHash, txnId)
+        stream = AsyncCallStream(self, key)
+        self._calls[key] = stream
+        return stream
+
+    def end(self, stream):
+        """Unregister call, late messages of the call are dropped."""
+        if self._calls.pop(stream.key, None) is not None:
+            self._window.release()
+
+    async def send(self, data):
+        await self._con.send(data)
+
+    def inFlight(self):
+        return len(self._calls)
+
+    def is_alive(self):
+        return not self._task.done()
+
+    def stop(self):
+        self._stopped = True
+        self._task.cancel()
+
+    async def _run(self):
+        try:
+            while True:
+                self._dispatch(await readFrame(self._con.reader))
+        except asyncio.CancelledError:
+            self._fail(RuntimeError("Service connection closed."))
+        except Exception as err:
+            self._fail(err if not self._stopped else RuntimeError("Service connection closed."))
+
+    def _fail(self, err):
+        self._error = err
+        for stream in list(self._calls.values()):
+            stream.put(err)
+
+    def _dispatch(self, frameBuffer):
+        try:
+            srcHash, dstHash, linkId, message = _parseMessage(frameBuffer)
+        except RiconnectError as err:
+            # the frame does not tell which call failed, fail all calls
+            for stream in list(self._calls.values()):
+                stream.put(err)
+            return
+        if message is None:
+            return
+        msgDomain, msgType, rxnId, msgData = message
+        # check if message needs an acknowledgement
+        if (msgDomain & RICON_RIC_MESSAGE_ACK_REQ) > 0:
+            self._con.writer.write(createMessageAcknowledgment(linkId, dstHash, srcHash))
+            msgDomain = msgDomain & (~RICON_RIC_MESSAGE_ACK_REQ)
+        stream = self._calls.get((srcHash, rxnId))
+        if stream is not None:
+            stream.put((msgDomain, msgType, rxnId, msgData))
+
+class AsyncHeartbeat(object):
+    """Heartbeat task sending the heartbeats of all nodes registered on a root connection."""
+    def __init__(self, con, interval=5):
+        self._con = con
+        self._interval = interval
+        self._nodes = []
+        self._connected = True
+        self._task = asyncio.ensure_future(self._run())
+
+    def addNode(self, nodeNameHash):
+        self._nodes.append(nodeNameHash)
+
+    def removeNode(self, nodeNameHash):
+        if nodeNameHash in self._nodes:
+            self._nodes.remove(nodeNameHash)
+
+    def is_alive(self):
+        return not self._task.done()
+
+    def is_connected(self):
+        return self._connected
+
+    def stop(self):
+        self._task.cancel()
+
+    async def _run(self):
+        try:
+            while True:
+                for nodeNameHash in self._nodes[:]:
+                    frameBuffer = await self._con.exchange(createHeartbeat(self._con.linkId, nodeNameHash))
+                    checkHeartbeatAcknowledgment(frameBuffer, self._con.linkId, nodeNameHash)
+                await asyncio.sleep(self._interval)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            pass
+        finally:
+            self._connected = False
+
+class AsyncSignalDispatcher(object):
+    """Signal task dispatching the signals of a signal connection to the registered nodes."""
+    def __init__(self, con):
+        self._con = con
+        self._receivers = {}
+        self._task = asyncio.ensure_future(self._run())
+
+    def addReceiver(self, nodeNameHash, signalFunc):
+        self._receivers[nodeNameHash] = signalFunc
+
+    def removeReceiver(self, nodeNameHash):
+        self._receivers.pop(nodeNameHash, None)
+
+    def is_alive(self):
+        return not self._task.done()
+
+    def stop(self):
+        self._task.cancel()
+
+    async def _run(self):
+        try:
+            while True:
+                srcHash, dstHash, linkId, message = _parseMessage(await readFrame(self._con.reader))
+                if message is None:
+                    continue
+                msgDomain, msgType, rxnId, msgData = message
+                if (msgDomain & RICON_RIC_MESSAGE_ACK_REQ) > 0:
+                    self._con.writer.write(createMessageAcknowledgment(linkId, dstHash, srcHash))
+                    msgDomain = msgDomain & (~RICON_RIC_MESSAGE_ACK_REQ)
+                sigData = parseSignal((msgDomain, msgType, rxnId, msgData))
+                if sigData is not None:
+                    signalFunc = self._receivers.get(sigData.subscriber)
+                    if signalFunc:
+                        signalFunc(sigData)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            pass
+
+class AsyncConnectionFactory(object):
+    """Connection factory for stream connections.
+
+       All async services opened with the same factory share the root,
+       service and signal connections to an address, as well as one heartbeat
+       task, one signal task and one service channel task per address. The
+       factory must be used from a single event loop."""
+    def __init__(self, maxInFlight=CONFIG_RIC_MAX_INFLIGHT_CALLS):
+        self._lock = asyncio.Lock()
+        self._rootConnections = {}
+        self._serviceConnections = {}
+        self._signalConnections = {}
+        self._reconnects = 0
+        self._maxInFlight = maxInFlight
+    async def acquireRootConnection(self, address):
+        async with self._lock:
+            return await self._acquireConnection(self._rootConnections, address)
+    async def acquireServiceConnection(self, address):
+        async with self._lock:
+            return await self._acquireConnection(self._serviceConnections, address)
+    async def acquireSignalConnection(self, address):
+        async with self._lock:
+            return await self._acquireConnection(self._signalConnections, address)
+    async def releaseRootConnection(self, address, srcHash, con=None):
+        async with self._lock:
+            await self._releaseConnection(self._rootConnections, address, srcHash, con=con)
+    async def releaseServiceConnection(self, address, con=None):
+        async with self._lock:
+            await self._releaseConnection(self._serviceConnections, address, con=con)
+    async def releaseSignalConnection(self, address, con=None):
+        async with self._lock:
+            await self._releaseConnection(self._signalConnections, address, con=con)
+    def serviceChannel(self, address, con):
+        """Return multiplexed channel of the service connection."""
+        if self._serviceConnections.get(address) is not con:
+            raise RuntimeError("Service connection not established.")
+        if con.task is None:
+            con.task = AsyncServiceChannel(con, maxInFlight=self._maxInFlight)
+        return con.task
+    def registerNode(self, address, nodeNameHash, signalFunc):
+        """Start sending heartbeats and dispatching signals for a node."""
+        root = self._rootConnections[address]
+        if root.task is None:
+            root.task = AsyncHeartbeat(root)
+        root.task.addNode(nodeNameHash)
+        sig = self._signalConnections[address]
+        if sig.task is None:
+            sig.task = AsyncSignalDispatcher(sig)
+        sig.task.addReceiver(nodeNameHash, signalFunc)
+    def unregisterNode(self, address, nodeNameHash, rootCon=None, signalCon=None):
+        """Stop sending heartbeats and dispatching signals for a node."""
+        root = self._rootConnections.get(address)
+        if root is not None and root.task is not None and (rootCon is None or root is rootCon):
+            root.task.removeNode(nodeNameHash)
+        sig = self._signalConnections.get(address)
+        if sig is not None and sig.task is not None and (signalCon is None or sig is signalCon):
+            sig.task.removeReceiver(nodeNameHash)
+    def isConnected(self, address, rootCon=None):
+        """Return true if the root connection to the address is alive."""
+        root = self._rootConnections.get(address)
+        if root is None or (rootCon is not None and root is not rootCon):
+            return False
+        service = self._serviceConnections.get(address)
+        if service is not None and service.task is not None and not service.task.is_alive():
+            return False
+        return root.task is None or (root.task.is_alive() and root.task.is_connected())
+    async def invalidate(self, address):
+        """Close all connections to the address."""
+        async with self._lock:
+            for cache in (self._rootConnections, self._serviceConnections, self._signalConnections):
+                con = cache.pop(address, None)
+                if con is not None:
+                    con.close()
+            self._reconnects += 1
+    def getStatistics(self):
+        """Return number of open connections, running tasks, calls in flight and reconnects."""
+        connections = 0
+        tasks = 0
+        inFlight = 0
+        for cache in (self._rootConnections, self._serviceConnections, self._signalConnections):
+            connections += len(cache)
+            for con in cache.values():
+                if con.task is not None and con.task.is_alive():
+                    tasks += 1
+        for con in self._serviceConnections.values():
+            if con.task is not None:
+                inFlight += con.task.inFlight()
+        return {
+            'sockets': connections,
+            'tasks': tasks,
+            'in_flight': inFlight,
+            'reconnects': self._reconnects
+        }
+    async def _acquireConnection(self, cache, address):
+        con = cache.get(address)
+        if con is None:
+            linkId = _linkCounter.next()
+            endpoint = _parseAddress(address)
+            if endpoint['family'] in (socket.AF_INET, socket.AF_INET6):
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(endpoint['host'], endpoint['port']), 20)
+                # asyncio enables TCP_NODELAY on TCP transports itself, not relied upon here
+                setNoDelay(writer.get_extra_info('socket'))
+            else:
+                reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(endpoint['node']), 20)
+            con = _AsyncConnection(reader, writer, linkId)
+            cache[address] = con
+        else:
+            con.refs += 1
+        return con
+    async def _releaseConnection(self, cache, address, srcHash=None, con=None):
+        r = cache.get(address)
+        if r is not None and (con is None or r is con):
+            if r.refs > 1:
+                r.refs -= 1
+            else:
+                del cache[address]
+                if r.task is not None:
+                    r.task.stop()
+                    r.task = None
+                try:
+                    if srcHash is not None:
+                        checkNodeRemoveResponse(await r.exchange(createNodeRemoveRequest(r.linkId, srcHash), timeout=5))
+                except Exception:
+                    pass
+                r.close()
+
+class AsyncService(object):
+    """Coroutine counterpart of riconnect.Service.
+
+       Example:
+         svc = riconnect.aio.AsyncService("SCANNER")
+         await svc.open("127.0.0.1:20000")
+         print("Indentifier: " + (await svc.getProperty("INST_IDENT")).s)
+         await svc.close()"""
+    def __init__(self, name, connectionFactory=None):
+        """Create new service instance.
+
+           Arguments:
+             name (str): service name"""
+        self._factory = AsyncConnectionFactory() if connectionFactory is None else connectionFactory
+        self._servicename = name
+        self._servicenameHash = hashlittle(name, initval=RICON_HASH_INITVAL)
+        self._rootConnection = None
+        self._serviceConnection = None
+        self._signalConnection = None
+        self._serviceChannel = None
+        self._client_name = name + "-client"
+        self._client_hash = hashlittle(self._client_name, initval=RICON_HASH_INITVAL)
+        self._subscriptions = {}
+        # use program name as node description
+        self._node_description = "DefaultNodeDesc"
+        try:
+            if sys.argv:
+                self._node_description = os.path.splitext(os.path.basename(sys.argv[0]))[0]
+        except Exception:
+            self._node_description = "DefaultNodeDesc"
+        self._address = None
+
+    async def open(self, address):
+        """Open service connection.
+
+           Arguments:
+             address (str): service address consisting of hostname/IP-address and port number
+                            e.g. 127.0.0.1:20000
+        """
+        if self._address is not None:
+            return
+        self._rootConnection = await self._factory.acquireRootConnection(address)
+        self._serviceConnection = await self._factory.acquireServiceConnection(address)
+        self._signalConnection = await self._factory.acquireSignalConnection(address)
+        self._serviceChannel = self._factory.serviceChannel(address, self._serviceConnection)
+        self._address = address
+        frameBuffer = await self._rootConnection.exchange(
+            createNameRequest(self._rootConnection.linkId, self._client_name, self._node_description))
+        recNodeName = parseNameResponse(frameBuffer, self._rootConnection.linkId)
+        if recNodeName is not None:
+            self._client_name = recNodeName
+            self._client_hash = hashlittle(self._client_name, initval=RICON_HASH_INITVAL)
+        self._factory.registerNode(address, self._client_hash, self._onSignalReceived)
+
+    async def close(self):
+        """Close service connection."""
+        if self._address is not None:
+            address = self._address
+            self._address = None
+            self._subscriptions = {}
+            self._factory.unregisterNode(address, self._client_hash, self._rootConnection, self._signalConnection)
+            await self._factory.releaseSignalConnection(address, self._signalConnection)
+            self._signalConnection = None
+            await self._factory.releaseServiceConnection(address, self._serviceConnection)
+            self._serviceConnection = None
+            self._serviceChannel = None
+            await self._factory.releaseRootConnection(address, self._client_hash, self._rootConnection)
+            self._rootConnection = None
+
+    def isConnected(self):
+        """Return true if the service connection is established and alive."""
+        if self._address is None:
+            return False
+        return self._factory.isConnected(self._address, self._rootConnection)
+
+    def subscribe(self, signalName, cbFunc):
+        """Subscribe to service signal.
+
+           The callback function is called from the event loop with the payload
+           (bytes) of the signal, coroutine functions are scheduled as tasks.
+
+           Arguments:
+             signalName (str): name of service signal
+             cbFunc (function): callback function with one argument"""
+        if self._rootConnection is None:
+            raise RuntimeError("Service connection not established.")
+        sigHash = hashlittle(signalName, initval=RICON_HASH_INITVAL)
+        subscribers = self._subscriptions.setdefault(sigHash, [])
+        if len(subscribers) == 0:
+            self._signalConnection.writer.write(createSignalRequest(
+                self._signalConnection.linkId, self._client_hash, RICON_RIC_MESSAGE_TYPE_SIGNAL_SUBSCRIBE,
+                signalName, self._servicename, self._client_name))
+        subscribers.append(cbFunc)
+
+    def unsubscribe(self, signalName, cbFunc):
+        """Unsubscribe from service signal.
+
+           Arguments:
+             signalName (str): name of service signal
+             cbFunc (function): callback function with one argument"""
+        sigHash = hashlittle(signalName, initval=RICON_HASH_INITVAL)
+        subscribers = self._subscriptions.get(sigHash)
+        if (subscribers is not None) and (cbFunc in subscribers):
+            subscribers.remove(cbFunc)
+            if len(subscribers) == 0 and self._signalConnection is not None:
+                self._signalConnection.writer.write(createSignalRequest(
+                    self._signalConnection.linkId, self._client_hash, RICON_RIC_MESSAGE_TYPE_SIGNAL_UNSUBSCRIBE,
+                    signalName, self._servicename, self._client_name))
+
+    def _onSignalReceived(self, sigData):
+        if sigData.signaller != self._servicenameHash:
+            return
+        if sigData.subscriber != self._client_hash:
+            return
+        for sub in self._subscriptions.get(sigData.signal, [])[:]:
+            try:
+                fn = sub() if isinstance(sub, weakref.WeakMethod) else sub
+                if fn is None:
+                    continue
+                r = fn(sigData.data)
+                if asyncio.iscoroutine(r):
+                    asyncio.ensure_future(r)
+            except Exception:
+                pass
+
+    def _channel(self):
+        if self._serviceChannel is None:
+            raise RuntimeError("Service connection not established.")
+        return self._serviceChannel
+
+    async def callFunction(self, name, inputs=None, inputTransfers=None, numOutputTransfers=0, timeout=-1):
+        """Call service function.
+
+           Arguments:
+             name (str): function name
+             inputs (list(Value)): function arguments
+             inputTransfers (list(bytes)): function transfer buffers
+             numOutputTransfers (int): number of output transfer buffers returned by the service function
+             timeout (float): see riconnect.Service.callFunction()"""
+        checkInputs(inputs)
+        timeout = checkTimeout(timeout)
+        channel = self._channel()
+        linkId = self._serviceConnection.linkId
+        txnId = nextTransactionId()
+        pkg = createCallRequest(linkId, self._client_hash, self._servicenameHash, txnId, name, inputs,
+            inputTransfers is not None or numOutputTransfers > 0)
+        con = await channel.begin(self._servicenameHash, txnId, timeout=timeout)
+        try:
+            # send request
+            await con.send(pkg)
+            if inputTransfers is not None:
+                await self._sendRequestTransferBuffers(con, linkId, txnId, inputTransfers, timeout=timeout)
+            # wait for response
+            outputTransfers = []
+            if numOutputTransfers > 0:
+                outputTransfers = joinTransferBuffers(
+                    await self._readResponseTransferBuffers(con, linkId, txnId, timeout=timeout), numOutputTransfers)
+            message = await con.readMessage(timeout=timeout)
+        finally:
+            channel.end(con)
+        return (parseCallResponse(message, txnId), outputTransfers)
+
+    async def getProperty(self, name, index=None, timeout=None):
+        """Get value of service property.
+
+           Arguments:
+             name (str): property name
+             index (int)
+             index (list(int)): property index (needed for arrays and matrices)
+             timeout (float): see callFunction()"""
+        timeout = checkTimeout(timeout)
+        channel = self._channel()
+        txnId = nextTransactionId()
+        pkg = createGetRequest(self._serviceConnection.linkId, self._client_hash, self._servicenameHash, txnId, name, index)
+        con = await channel.begin(self._servicenameHash, txnId, timeout=timeout)
+        try:
+            await con.send(pkg)
+            message = await con.readMessage(timeout=timeout)
+        finally:
+            channel.end(con)
+        return parseGetResponse(message, txnId)
+
+    async def setProperty(self, name, value, index=None, timeout=None):
+        """Set value of service property.
+
+           Arguments:
+             name (str): property name
+             value (Value): new property value
+             index (int)
+             index (list(int)): property index (needed for arrays and matrices)
+             timeout (float): see callFunction()"""
+        timeout = checkTimeout(timeout)
+        channel = self._channel()
+        txnId = nextTransactionId()
+        pkg = createSetRequest(self._serviceConnection.linkId, self._client_hash, self._servicenameHash, txnId, name, value, index)
+        con = await channel.begin(self._servicenameHash, txnId, timeout=timeout)
+        try:
+            await con.send(pkg)
+            message = await con.readMessage(timeout=timeout)
+        finally:
+            channel.end(con)
+        parseSetResponse(message, txnId)
+
+    async def _sendRequestTransferBuffers(self, con, linkId, txnId, buffers, timeout=None):
+        srcHash = self._client_hash
+        dstHash = self._servicenameHash
+        # begin transfer buffer data exchange
+        await con.send(createTransferStartRequest(linkId, txnId, srcHash, dstHash, RICON_RIC_TRANSFER_MODE_C2S))
+        bufferSize = parseTransferStartResponse(await con.readMessage(timeout=timeout), RICON_RIC_TRANSFER_MODE_C2S)[0]
+        # send transfer buffer data
+        for databuffer in buffers:
+            for offset in range(0, len(databuffer), bufferSize):
+                await con.send(createTransferData(linkId, txnId, srcHash, dstHash, databuffer[offset:offset+bufferSize]))
+                checkMessageAcknowledgment(await con.readMessage(timeout=timeout))
+        # end transfer buffer data exchange
+        await con.send(createTransferEnd(linkId, txnId, srcHash, dstHash))
+        checkMessageAcknowledgment(await con.readMessage(timeout=timeout))
+
+    async def _readResponseTransferBuffers(self, con, linkId, txnId, progressHandler=None, timeout=None):
+        dataBuffers = []
+        # begin transfer buffer data exchange
+        await con.send(createTransferStartRequest(linkId, txnId, self._client_hash, self._servicenameHash, RICON_RIC_TRANSFER_MODE_S2C))
+        parseTransferStartResponse(await con.readMessage(timeout=timeout), RICON_RIC_TRANSFER_MODE_S2C)
+        # read transfer buffer packages
+        while True:
+            msgDomain, msgType, rxnId, msgData = await con.readMessage(timeout=timeout)
+            if msgDomain != RICON_RIC_MESSAGE_TRANSFER:
+                raise RiconnectError(ricerror.RICON_UNEXPECTED_MESSAGE)
+            if msgType == RICON_RIC_MESSAGE_TYPE_TRANSFER_END:
+                break
+            elif msgType in (RICON_RIC_MESSAGE_TYPE_TRANSFER_BINARY_DATA, RICON_RIC_MESSAGE_TYPE_TRANSFER_ASCII_DATA):
+                dataBuffers.append(msgData)
+            elif msgType == RICON_RIC_MESSAGE_TYPE_TRANSFER_PROGRESS_DATA:
+                if len(msgData) == 4 and progressHandler is not None:
+                    progressHandler(struct.unpack("!f", msgData)[0])
+        return dataBuffers
@@ -0,0 +1,111 @@
+#!/bin/env python3
+
+import os
+import sys
+import argparse
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'riegl_vz'))
+
+from pointcloud import (
+    XYZR_ATTRIBUTES,
+    XyzrBuilder,
+    countPoints,
+    lodPointStep
+)
+
+class AttributeBuffer(object):
+    def __init__(self, data):
+        self.data = data
+
+class PointChunk(object):
+    """Minimal stand-in for riegl.rdb.pointbuffer.PointBuffer."""
+    def __init__(self, xyz, reflectance):
+        self.buffers = {
+            'riegl.xyz': AttributeBuffer(xyz),
+            'riegl.reflectance': AttributeBuffer(reflectance)
+        }
+
+    def __len__(self):
+        return len(self.buffers['riegl.reflectance'].data)
+
+    def __getitem__(self, item):
+        return self.buffers[item]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield {name: buffer.data[i] for name, buffer in self.buffers.items()}
+
+def syntheticChunks(numPoints, chunkSize):
+    rng = np.random.default_rng(0)
+    for start in range(0, numPoints, chunkSize):
+        n = min(chunkSize, numPoints - start)
+        yield PointChunk(
+            rng.uniform(-100.0, 100.0, (n, 3)),
+            rng.uniform(-20.0, 40.0, n).astype(np.float32))
+
+def legacyXyzrData(chunks, lod):
+    """Point by point loop as used by RieglVz.getPointCloud up to version 1.4.0."""
+    dtype = np.float32
+    numTotalPoints = 0
+    numPoints = 0
+    data = bytearray()
+    pointStep = lodPointStep(lod)
+    for points in chunks:
+        for point in points:
+            if not (numTotalPoints % pointStep):
+                data.extend(point['riegl.xyz'].astype(dtype).tobytes())
+                data.extend(point['riegl.reflectance'].astype(dtype).tobytes())
+                numPoints += 1
+            numTotalPoints += 1
+    return data, numPoints
+
+def vectorizedXyzrData(chunks, numTotalPoints, lod):
+    builder = XyzrBuilder(numTotalPoints, lod)
+    for points in chunks:
+        builder.addChunk(points)
+    return builder.finish()
+
+def run(name, fn):
+    start = time.perf_counter()
+    data, numPoints = fn()
+    duration = time.perf_counter() - start
+    print("{0:<12} {1:>10} points  {2:>9.3f} s  {3:>12.0f} points/s".format(
+        name, numPoints, duration, numPoints / duration if duration > 0 else 0))
+    return data, duration
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare point cloud data generation of per-point loop and vectorized builder.')
+    parser.add_argument('--rdbx',
+        help='rdbx file to read points from (default: synthetic points)')
+    parser.add_argument('--filter', default='',
+        help='rdb point filter (only used with --rdbx)')
+    parser.add_argument('--points', type=int, default=1000000,
+        help='number of synthetic points (default=1000000)')
+    parser.add_argument('--chunk-size', type=int, default=100000,
+        help='number of points per chunk (default=100000)')
+    parser.add_argument('--lod', type=int, default=0,
+        help='level of detail (default=0)')
+    args = parser.parse_args()
+
+    if args.rdbx:
+        import riegl.rdb
+        with riegl.rdb.rdb_open(args.rdbx) as rdb:
+            numTotalPoints = countPoints(rdb, args.filter, args.chunk_size)
+            legacy, tLegacy = run('loop', lambda: legacyXyzrData(
+                rdb.select(args.filter, chunk_size=args.chunk_size), args.lod))
+            vectorized, tVectorized = run('vectorized', lambda: vectorizedXyzrData(
+                rdb.select(args.filter, attributes=XYZR_ATTRIBUTES, chunk_size=args.chunk_size),
+                numTotalPoints, args.lod))
+    else:
+        chunks = list(syntheticChunks(args.points, args.chunk_size))
+        legacy, tLegacy = run('loop', lambda: legacyXyzrData(chunks, args.lod))
+        vectorized, tVectorized = run('vectorized', lambda: vectorizedXyzrData(chunks, args.points, args.lod))
+
+    print("identical: {}".format(bytes(legacy) == bytes(vectorized)))
+    if tVectorized > 0:
+        print("speedup: {:.1f}x".format(tLegacy / tVectorized))
+
+if __name__ == "__main__":
+    main()
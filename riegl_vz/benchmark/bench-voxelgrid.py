@@ -0,0 +1,113 @@
+#!/bin/env python3
+
+import os
+import sys
+import argparse
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'riegl_vz'))
+
+from pointcloud import (
+    XYZR_ATTRIBUTES,
+    XYZR_DTYPE,
+    XyzrBuilder,
+    VoxelGridBuilder,
+    countPoints
+)
+
+class AttributeBuffer(object):
+    def __init__(self, data):
+        self.data = data
+
+class PointChunk(object):
+    """Minimal stand-in for riegl.rdb.pointbuffer.PointBuffer."""
+    def __init__(self, xyz, reflectance):
+        self.buffers = {
+            'riegl.xyz': AttributeBuffer(xyz),
+            'riegl.reflectance': AttributeBuffer(reflectance)
+        }
+
+    def __len__(self):
+        return len(self.buffers['riegl.reflectance'].data)
+
+    def __getitem__(self, item):
+        return self.buffers[item]
+
+def syntheticChunks(numPoints, chunkSize):
+    """Points of a terrestrial scan: uniform in angle, so the density decreases with the range."""
+    rng = np.random.default_rng(0)
+    for start in range(0, numPoints, chunkSize):
+        n = min(chunkSize, numPoints - start)
+        theta = rng.uniform(0.5, np.pi / 2, n)
+        phi = rng.uniform(0.0, 2 * np.pi, n)
+        # targets on the ground plane 2 m below the scanner, up to 200 m away
+        distance = np.minimum(2.0 / np.cos(theta), 200.0)
+        xyz = np.column_stack((
+            distance * np.sin(theta) * np.cos(phi),
+            distance * np.sin(theta) * np.sin(phi),
+            -distance * np.cos(theta)))
+        yield PointChunk(xyz, rng.uniform(-20.0, 40.0, n).astype(np.float32))
+
+def lodXyzrData(chunks, numTotalPoints, lod):
+    builder = XyzrBuilder(numTotalPoints, lod)
+    for points in chunks:
+        builder.addChunk(points)
+    return builder.finish()
+
+def voxelGridXyzrData(chunks, voxelSize, mode):
+    builder = VoxelGridBuilder(voxelSize, mode)
+    for points in chunks:
+        builder.addChunk(points)
+    return builder.finish()
+
+def densityRatio(data, cellSize=10.0):
+    """Ratio of the maximum and median number of points per occupied 10 m cell."""
+    points = np.frombuffer(data, dtype=XYZR_DTYPE)
+    if len(points) == 0:
+        return 0.0
+    cells = np.floor(points['xyz'][:, :2] / cellSize).astype(np.int64)
+    _, counts = np.unique(cells, axis=0, return_counts=True)
+    return counts.max() / np.median(counts)
+
+def run(name, numInputPoints, fn):
+    start = time.perf_counter()
+    data, numPoints = fn()
+    duration = time.perf_counter() - start
+    print("{0:<18} {1:>10} points  {2:>9.3f} s  {3:>12.0f} input points/s  density max/median {4:>8.1f}".format(
+        name, numPoints, duration, numInputPoints / duration if duration > 0 else 0, densityRatio(data)))
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare point cloud reduction by level of detail and voxel grid downsampling.')
+    parser.add_argument('--rdbx',
+        help='rdbx file to read points from (default: synthetic points)')
+    parser.add_argument('--filter', default='',
+        help='rdb point filter (only used with --rdbx)')
+    parser.add_argument('--points', type=int, default=5000000,
+        help='number of synthetic points (default=5000000)')
+    parser.add_argument('--chunk-size', type=int, default=100000,
+        help='number of points per chunk (default=100000)')
+    parser.add_argument('--lod', type=int, default=4,
+        help='level of detail (default=4)')
+    parser.add_argument('--voxel-size', type=float, default=0.1,
+        help='voxel grid cell size in meter (default=0.1)')
+    args = parser.parse_args()
+
+    if args.rdbx:
+        import riegl.rdb
+        with riegl.rdb.rdb_open(args.rdbx) as rdb:
+            numTotalPoints = countPoints(rdb, args.filter, args.chunk_size)
+            chunks = lambda: rdb.select(args.filter, attributes=XYZR_ATTRIBUTES, chunk_size=args.chunk_size)
+            run('lod {}'.format(args.lod), numTotalPoints, lambda: lodXyzrData(chunks(), numTotalPoints, args.lod))
+            for mode in ('mean', 'first'):
+                run('voxel {} {}'.format(args.voxel_size, mode), numTotalPoints,
+                    lambda: voxelGridXyzrData(chunks(), args.voxel_size, mode))
+    else:
+        chunks = list(syntheticChunks(args.points, args.chunk_size))
+        run('lod {}'.format(args.lod), args.points, lambda: lodXyzrData(chunks, args.points, args.lod))
+        for mode in ('mean', 'first'):
+            run('voxel {} {}'.format(args.voxel_size, mode), args.points,
+                lambda: voxelGridXyzrData(chunks, args.voxel_size, mode))
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import sys
+import os
+import threading
 from datetime import datetime
 import numpy as np
 
@@ -7,6 +9,8 @@ from std_srvs.srv import (
     SetBool
 )
 from sensor_msgs.msg import (
+    Image,
+    Imu,
     PointCloud2,
     NavSatFix
 )
@@ -24,11 +28,12 @@ from diagnostic_msgs.msg import (
     DiagnosticStatus
 )
 from diagnostic_updater import Updater
-from tf2_ros import TransformBroadcaster
+from tf2_ros import TransformBroadcaster, StaticTransformBroadcaster
 from tf2_ros.buffer import Buffer
 from tf2_ros.transform_listener import TransformListener
 from riegl_vz_interfaces.msg import (
-    Voxels
+    Voxels,
+    PointCloudChunk
 )
 from riegl_vz_interfaces.srv import (
     GetPointCloud,
@@ -44,13 +49,25 @@ from riegl_vz_interfaces.srv import (
 import rclpy
 from rclpy.node import Node
 from rclpy.logging import LoggingSeverity
+from vzi_services.registry import getServiceRegistry
 from .riegl_vz import (
     ScanPattern,
     RieglVz
 )
+from .imu import RieglVzImu
 from .pose import (
     getTransformFromArray
 )
+from .cache import (
+    FileCache
+)
+from .octree import (
+    OctreeCache
+)
+from .ssh import (
+    SSHConnectionPool,
+    ChunkedDownloader
+)
 from .utils import (
     SubProcess
 )
@@ -68,6 +85,21 @@ class RieglVzWrapper(Node):
         self.declare_parameter('working_dir', '/tmp/ros_riegl_vz')
         self.declare_parameter('ssh_user', 'user')
         self.declare_parameter('ssh_password', 'user')
+        self.declare_parameter('ssh_download_channels', 4)
+        self.declare_parameter('ssh_download_chunk_size', 8)
+        self.declare_parameter('file_cache_size', 4096)
+        self.declare_parameter('pointcloud_cache_size', 4096)
+        self.declare_parameter('pointcloud_cache_max_age', 30.0)
+        self.declare_parameter('scan_stages_subprocess', False)
+        self.declare_parameter('scan_queue_depth', 0)
+        self.declare_parameter('imu_publish', False)
+        self.declare_parameter('imu_gyro_scale', 0.001065264)
+        self.declare_parameter('imu_acc_scale', 0.002394202)
+        self.declare_parameter('imu_systime_scale', 0.000001)
+        self.declare_parameter('preview_publish', False)
+        self.declare_parameter('preview_mode', 'rgb')
+        self.declare_parameter('preview_rate', 1.0)
+        self.declare_parameter('status_poll_interval', 10.0)
         self.declare_parameter('project_name', '')
         self.declare_parameter('storage_media', 0)
         self.declare_parameter('scan_pattern', [30.0,130.0,0.1,0.0,360.0,0.5])
@@ -77,6 +109,10 @@ class RieglVzWrapper(Node):
         self.declare_parameter('voxel_publish', False)
         self.declare_parameter('scan_publish_filter', '')
         self.declare_parameter('scan_publish_lod', 0)
+        self.declare_parameter('scan_publish_chunk_size', 0)
+        self.declare_parameter('scan_publish_voxel_size', 0.0)
+        self.declare_parameter('scan_publish_frame', 'riegl_vz_socs')
+        self.declare_parameter('scan_publish_origin', [0.0, 0.0, 0.0])
         self.declare_parameter('scan_register', True)
         self.declare_parameter('scan_registration_mode', 1)
         self.declare_parameter('pose_publish', True)
@@ -107,18 +143,97 @@ class RieglVzWrapper(Node):
         self.get_logger().info("projectName = {}".format(self.projectName))
         self.get_logger().info("storageMedia = {}".format(self.storageMedia))
 
+        # persistent ssh connection, shared by all scanner file transfers and commands..
+        self.sshConnectionPool = SSHConnectionPool(self.hostname, self.sshUser, self.sshPwd)
+        sshDownloadChannels = int(self.get_parameter('ssh_download_channels').value)
+        self.get_logger().info("sshDownloadChannels = {}".format(sshDownloadChannels))
+        sshDownloadChunkSize = int(self.get_parameter('ssh_download_chunk_size').value)
+        self.get_logger().info("sshDownloadChunkSize = {}".format(sshDownloadChunkSize))
+        self.sshDownloader = ChunkedDownloader(
+            self.sshConnectionPool,
+            chunkSize=sshDownloadChunkSize * 1024 * 1024,
+            numChannels=sshDownloadChannels,
+            logger=self.get_logger())
+
+        # cache of files downloaded from the scanner..
+        fileCacheSize = int(self.get_parameter('file_cache_size').value)
+        self.get_logger().info("fileCacheSize = {}".format(fileCacheSize))
+        self.fileCache = FileCache(
+            os.path.join(self.workingDir, 'cache'),
+            fileCacheSize * 1024 * 1024,
+            logger=self.get_logger())
+
+        # persistent octrees of the scan position point clouds for the get_pointcloud service..
+        pointcloudCacheSize = int(self.get_parameter('pointcloud_cache_size').value)
+        self.get_logger().info("pointcloudCacheSize = {}".format(pointcloudCacheSize))
+        pointcloudCacheMaxAge = float(self.get_parameter('pointcloud_cache_max_age').value)
+        self.get_logger().info("pointcloudCacheMaxAge = {}".format(pointcloudCacheMaxAge))
+        self.octreeCache = None
+        if pointcloudCacheSize > 0:
+            self.octreeCache = OctreeCache(
+                os.path.join(self.workingDir, 'octree'),
+                pointcloudCacheSize * 1024 * 1024,
+                pointcloudCacheMaxAge * 86400.0,
+                logger=self.get_logger())
+
+        # run scan stages as python3 subprocesses instead of in-process..
+        self.scanStagesSubprocess = bool(self.get_parameter('scan_stages_subprocess').value)
+        self.get_logger().info("scanStagesSubprocess = {}".format(self.scanStagesSubprocess))
+
+        # number of scan positions processed while the next data acquisition is running..
+        self.scanQueueDepth = int(self.get_parameter('scan_queue_depth').value)
+        self.get_logger().info("scanQueueDepth = {}".format(self.scanQueueDepth))
+
+        # publishing of the scanner internal imu measurements..
+        self.imuPublish = bool(self.get_parameter('imu_publish').value)
+        self.get_logger().info("imuPublish = {}".format(self.imuPublish))
+        self.imuGyroScale = float(self.get_parameter('imu_gyro_scale').value)
+        self.imuAccScale = float(self.get_parameter('imu_acc_scale').value)
+        self.imuSystimeScale = float(self.get_parameter('imu_systime_scale').value)
+
+        # publishing of the scan preview image during data acquisition..
+        self.previewPublish = bool(self.get_parameter('preview_publish').value)
+        self.get_logger().info("previewPublish = {}".format(self.previewPublish))
+        self.previewMode = str(self.get_parameter('preview_mode').value)
+        if self.previewMode not in ('rgb', 'reflectance'):
+            self.get_logger().warning("Unsupported preview mode '{}', using 'rgb'!".format(self.previewMode))
+            self.previewMode = 'rgb'
+        self.get_logger().info("previewMode = {}".format(self.previewMode))
+        self.previewRate = float(self.get_parameter('preview_rate').value)
+        self.get_logger().info("previewRate = {}".format(self.previewRate))
+
+        # fallback polling of the scanner status, which is updated on scanner service signals..
+        self.statusPollInterval = float(self.get_parameter('status_poll_interval').value)
+        self.get_logger().info("statusPollInterval = {}".format(self.statusPollInterval))
+
         self.scanPublishFilter = str(self.get_parameter('scan_publish_filter').value)
         self.get_logger().info("scanPublishFilter = {}".format(self.scanPublishFilter))
         self.scanPublishLOD = int(self.get_parameter('scan_publish_lod').value)
         self.get_logger().info("scanPublishLOD = {}".format(self.scanPublishLOD))
+        self.scanPublishVoxelSize = float(self.get_parameter('scan_publish_voxel_size').value)
+        self.get_logger().info("scanPublishVoxelSize = {}".format(self.scanPublishVoxelSize))
+        # number of points per chunk of the point cloud published on 'pointcloud_chunks'..
+        self.scanPublishChunkSize = int(self.get_parameter('scan_publish_chunk_size').value)
+        self.get_logger().info("scanPublishChunkSize = {}".format(self.scanPublishChunkSize))
+        # frame and local origin of the published point clouds..
+        self._setScanPublishFrame()
+        self.get_logger().info("scanPublishFrame = {}".format(self.scanPublishFrame))
+        self.get_logger().info("scanPublishOrigin = {}".format(self.scanPublishOrigin))
 
         # create topics..
         self.pointCloudPublisher = self.create_publisher(PointCloud2, 'pointcloud', 2)
+        self.pointCloudChunksPublisher = self.create_publisher(PointCloudChunk, 'pointcloud_chunks', 10)
         self.voxelsPublisher = self.create_publisher(Voxels, 'voxels', 2)
         self.posePublisher = self.create_publisher(PoseStamped, 'pose', 10)
         self.pathPublisher = self.create_publisher(Path, 'path', 10)
         self.odomPublisher = self.create_publisher(Odometry, 'odom', 10)
         self.gnssFixPublisher = self.create_publisher(NavSatFix, 'gnss', 10)
+        self._imu = None
+        if self.imuPublish:
+            self.imuPublisher = self.create_publisher(Imu, 'imu', 1000)
+            self._imu = RieglVzImu(self)
+        if self.previewPublish:
+            self.previewPublisher = self.create_publisher(Image, 'preview', 2)
         self.setPoseTopic = str(self.get_parameter('set_pose_topic').value)
         if self.setPoseTopic != "":
             self.get_logger().info("setPoseTopic = {}".format(self.setPoseTopic))
@@ -133,7 +248,13 @@ class RieglVzWrapper(Node):
 
         # tf2 message broadcaster..
         self.transformBroadcaster = TransformBroadcaster(self)
+        # latched (transient local) publisher of static frames on /tf_static
+        self.staticTransformBroadcaster = StaticTransformBroadcaster(self)
+        self._staticTransforms = {}
+        self._staticTransformsLock = threading.Lock()
         self._broadcastTfRobotProjectTransform()
+        self._publishOriginTransformKeys = []
+        self._broadcastTfPublishOriginTransform()
 
         # tf2 listener..
         self.transformBuffer = Buffer()
@@ -173,6 +294,19 @@ class RieglVzWrapper(Node):
         self._statusUpdater.add('gnss', self._produceGnssDiagnostics)
         self._statusUpdater.add('errors', self._produceErrorDiagnostics)
         self._statusUpdater.add('camera', self._produceCameraDiagnostics)
+        self._statusUpdater.add('ssh', self._produceSshDiagnostics)
+        self._statusUpdater.add('download', self._produceDownloadDiagnostics)
+        self._statusUpdater.add('cache', self._produceCacheDiagnostics)
+        if self.octreeCache is not None:
+            self._statusUpdater.add('pointcloud_cache', self._producePointcloudCacheDiagnostics)
+        self._statusUpdater.add('riconnect', self._produceRiconnectDiagnostics)
+        self._statusUpdater.add('pipeline', self._producePipelineDiagnostics)
+        self._statusUpdater.add('scan_queue', self._produceScanQueueDiagnostics)
+        self._statusUpdater.add('project_cache', self._produceProjectCacheDiagnostics)
+        if self._imu is not None:
+            self._statusUpdater.add('imu', self._produceImuDiagnostics)
+        if self._rieglVz.preview is not None:
+            self._statusUpdater.add('preview', self._producePreviewDiagnostics)
 
         self._gnssFixTimer = self.create_timer(1.0, self._publishGnssFix)
 
@@ -192,13 +326,47 @@ class RieglVzWrapper(Node):
                     self.robotProjectTransform[3],
                     self.robotProjectTransform[4],
                     self.robotProjectTransform[5]))
-            self.transformBroadcaster.sendTransform(
+            self.sendStaticTransforms([
                 getTransformFromArray(
                     self.get_clock().now(),
                     self.robotProjectFrameId,
                     'riegl_vz_prcs',
                     self.robotProjectTransform
-                ))
+                )])
+
+    def _setScanPublishFrame(self):
+        self.scanPublishFrame = str(self.get_parameter('scan_publish_frame').value)
+        if self.scanPublishFrame not in ('riegl_vz_socs', 'riegl_vz_vocs', 'riegl_vz_prcs'):
+            self.get_logger().warning("Unsupported scan publish frame '{}', using 'riegl_vz_socs'!".format(self.scanPublishFrame))
+            self.scanPublishFrame = 'riegl_vz_socs'
+        self.scanPublishOrigin = [float(v) for v in self.get_parameter('scan_publish_origin').value]
+
+    def _broadcastTfPublishOriginTransform(self):
+        # local origin frame of the published point clouds
+        transforms = []
+        if any(self.scanPublishOrigin):
+            transforms.append(getTransformFromArray(
+                self.get_clock().now(),
+                self.scanPublishFrame,
+                'riegl_vz_origin',
+                self.scanPublishOrigin + [0.0, 0.0, 0.0]))
+        remove = self._publishOriginTransformKeys
+        self._publishOriginTransformKeys = [(t.header.frame_id, t.child_frame_id) for t in transforms]
+        if transforms or remove:
+            self.sendStaticTransforms(transforms, remove)
+
+    def sendStaticTransforms(self, transforms, remove=[]):
+        """Publish transforms together with all previously sent static frames on /tf_static.
+
+        The latched message of the static broadcaster holds the last sent transforms
+        only, so the complete set of frames is sent every time. The frames are keyed by
+        (parent frame id, child frame id), frames with a key in 'remove' are dropped."""
+        with self._staticTransformsLock:
+            for key in remove:
+                self._staticTransforms.pop(key, None)
+            for transform in transforms:
+                self._staticTransforms[(transform.header.frame_id, transform.child_frame_id)] = transform
+            self.staticTransformBroadcaster.sendTransform(list(self._staticTransforms.values()))
 
     def _produceScannerDiagnostics(self, diag):
         status = self._rieglVz.getScannerStatus()
@@ -311,6 +479,123 @@ class RieglVzWrapper(Node):
         diag.add('cam_avail', str(status.avail))
         return diag
 
+    def _produceSshDiagnostics(self, diag):
+        stats = self.sshConnectionPool.getStatistics()
+
+        diag.summary(DiagnosticStatus.OK, 'ok')
+        diag.add('handshakes', str(stats['handshakes']))
+        diag.add('requests', str(stats['requests']))
+        diag.add('reuse_ratio', '{:.2f}'.format(stats['reuse_ratio']))
+        return diag
+
+    def _produceDownloadDiagnostics(self, diag):
+        stats = self.sshDownloader.getStatistics()
+
+        if stats['verify_failures'] > 0:
+            diag.summary(DiagnosticStatus.WARN, 'verification failures')
+        else:
+            diag.summary(DiagnosticStatus.OK, 'ok')
+        diag.add('downloads', str(stats['downloads']))
+        diag.add('bytes', str(stats['bytes']))
+        diag.add('resumed_bytes', str(stats['resumed_bytes']))
+        diag.add('retries', str(stats['retries']))
+        diag.add('verify_failures', str(stats['verify_failures']))
+        diag.add('throughput', '{:.1f}'.format(stats['throughput'] / 1e6))
+        return diag
+
+    def _produceCacheDiagnostics(self, diag):
+        stats = self.fileCache.getStatistics()
+
+        diag.summary(DiagnosticStatus.OK, 'ok')
+        diag.add('hits', str(stats['hits']))
+        diag.add('misses', str(stats['misses']))
+        diag.add('hit_ratio', '{:.2f}'.format(stats['hit_ratio']))
+        diag.add('evictions', str(stats['evictions']))
+        diag.add('files', str(stats['files']))
+        diag.add('bytes', str(stats['bytes']))
+        return diag
+
+    def _producePointcloudCacheDiagnostics(self, diag):
+        stats = self.octreeCache.getStatistics()
+
+        diag.summary(DiagnosticStatus.OK, 'ok')
+        diag.add('hits', str(stats['hits']))
+        diag.add('misses', str(stats['misses']))
+        diag.add('hit_ratio', '{:.2f}'.format(stats['hit_ratio']))
+        diag.add('evictions', str(stats['evictions']))
+        diag.add('octrees', str(stats['octrees']))
+        diag.add('bytes', str(stats['bytes']))
+        return diag
+
+    def _produceRiconnectDiagnostics(self, diag):
+        stats = getServiceRegistry().getStatistics()
+
+        diag.summary(DiagnosticStatus.OK, 'ok')
+        diag.add('services', str(stats['services']))
+        diag.add('sockets', str(stats['sockets']))
+        diag.add('threads', str(stats['threads']))
+        diag.add('in_flight', str(stats['in_flight']))
+        diag.add('reconnects', str(stats['reconnects']))
+        return diag
+
+    def _producePipelineDiagnostics(self, diag):
+        timings = self._rieglVz.getPipelineTimings()
+
+        diag.summary(DiagnosticStatus.OK, 'ok')
+        for name, state, offset, duration in timings:
+            diag.add(name, '{0} {1:.3f} s'.format(state, duration) if duration is not None else state)
+        products = [offset + duration for name, state, offset, duration in timings
+            if name in ('pose', 'pointcloud', 'voxels') and state == 'done']
+        if products:
+            diag.add('first_product', '{:.3f} s'.format(min(products)))
+        return diag
+
+    def _produceScanQueueDiagnostics(self, diag):
+        stats = self._rieglVz.getScanQueueStatistics()
+
+        diag.summary(DiagnosticStatus.OK, 'ok')
+        diag.add('depth', str(stats['depth']))
+        diag.add('acquiring', str(stats['acquiring']))
+        diag.add('processing', str(stats['processing']))
+        diag.add('completed', str(stats['completed']))
+        diag.add('failed', str(stats['failed']))
+        diag.add('stopped', str(stats['stopped']))
+        if stats['last_latency'] is not None:
+            diag.add('last_latency', '{:.3f} s'.format(stats['last_latency']))
+            diag.add('mean_latency', '{:.3f} s'.format(stats['mean_latency']))
+        return diag
+
+    def _produceProjectCacheDiagnostics(self, diag):
+        stats = self._rieglVz.getProjectCacheStatistics()
+
+        diag.summary(DiagnosticStatus.OK, 'ok')
+        diag.add('hits', str(stats['hits']))
+        diag.add('misses', str(stats['misses']))
+        diag.add('hit_ratio', '{:.2f}'.format(stats['hit_ratio']))
+        diag.add('invalidations', str(stats['invalidations']))
+        diag.add('entries', str(stats['entries']))
+        return diag
+
+    def _produceImuDiagnostics(self, diag):
+        stats = self._imu.getStatistics()
+
+        if stats['connected']:
+            diag.summary(DiagnosticStatus.OK, 'ok')
+        else:
+            diag.summary(DiagnosticStatus.WARN, 'not connected')
+        diag.add('packages', str(stats['packages']))
+        diag.add('samples', str(stats['samples']))
+        return diag
+
+    def _producePreviewDiagnostics(self, diag):
+        stats = self._rieglVz.preview.getStatistics()
+
+        diag.summary(DiagnosticStatus.OK, 'ok')
+        diag.add('frames', str(stats['frames']))
+        diag.add('skipped', str(stats['skipped']))
+        diag.add('errors', str(stats['errors']))
+        return diag
+
     def _publishGnssFix(self):
             self._rieglVz.publishGnssFix()
 
@@ -427,6 +712,10 @@ class RieglVzWrapper(Node):
         self.scanPublish = bool(self.get_parameter('scan_publish').value)
         self.scanPublishFilter = str(self.get_parameter('scan_publish_filter').value)
         self.scanPublishLOD = int(self.get_parameter('scan_publish_lod').value)
+        self.scanPublishChunkSize = int(self.get_parameter('scan_publish_chunk_size').value)
+        self.scanPublishVoxelSize = float(self.get_parameter('scan_publish_voxel_size').value)
+        self._setScanPublishFrame()
+        self._broadcastTfPublishOriginTransform()
         self.voxelPublish = bool(self.get_parameter('voxel_publish').value)
         self.scanRegister = bool(self.get_parameter('scan_register').value)
         self.scanRegistrationMode = int(self.get_parameter('scan_registration_mode').value)
@@ -459,6 +748,10 @@ class RieglVzWrapper(Node):
             scanPublishFilter = self.scanPublishFilter,
             scanPublish = self.scanPublish,
             scanPublishLOD = self.scanPublishLOD,
+            scanPublishVoxelSize = self.scanPublishVoxelSize,
+            scanPublishChunkSize = self.scanPublishChunkSize,
+            scanPublishFrame = self.scanPublishFrame,
+            scanPublishOrigin = self.scanPublishOrigin,
             voxelPublish = self.voxelPublish,
             scanRegister = self.scanRegister,
             scanRegistrationMode = self.scanRegistrationMode,
@@ -474,8 +767,8 @@ class RieglVzWrapper(Node):
             if not self._setResponseStatus(response, *self._checkExecConditions())[0]:
                 return response
 
-            if self._rieglVz.getScannerOpstate() != 'waiting':
-                self_.setResponseStatus(response, False, 'device is busy')
+            if not self._rieglVz.canScan():
+                self._setResponseStatus(response, False, 'device is busy')
                 self._logger.warning("Device is busy at the moument.")
                 return response
 
@@ -489,14 +782,19 @@ class RieglVzWrapper(Node):
 
         return response
 
-    def getPointCloud(self, scanpos, pointcloud):
+    def getPointCloud(self, scanpos, pointcloud, request = None):
         if not self.projectValid:
             self.setProject(self.projectName)
         if scanpos == 0:
             scanposition = self._rieglVz.getCurrentScanpos(self.projectName, self.storageMedia)
         else:
             scanposition = str(scanpos)
-        return self._rieglVz.getPointCloud(scanposition, pointcloud, False)
+        query = None
+        if request is not None:
+            ok, query = self._rieglVz.getPointCloudQuery(scanposition, request)
+            if not ok:
+                return False, pointcloud
+        return self._rieglVz.getPointCloud(scanposition, pointcloud, False, cached=True, query=query)
 
     def _getPointCloudCallback(self, request, response):
         self.get_logger().info("Service Request: get_pointcloud")
@@ -504,7 +802,7 @@ class RieglVzWrapper(Node):
             if not self._setResponseStatus(response, *self._checkExecConditions())[0]:
                 return response
 
-            ok, response.pointcloud = self.getPointCloud(request.seq, response.pointcloud)
+            ok, response.pointcloud = self.getPointCloud(request.seq, response.pointcloud, request)
             if not ok:
                 self._setResponseExecError(response)
                 return response
@@ -614,7 +912,7 @@ class RieglVzWrapper(Node):
 
             response.project = self.projectName
 
-            ok, sopvs = self.getAllSopv()
+            ok, sopvs, vop, pop = self._rieglVz.getScanPoses()
             if not ok:
                 self._setResponseExecError(response)
                 return response
@@ -622,15 +920,9 @@ class RieglVzWrapper(Node):
             for sopv in sopvs:
                 response.scanposes.append(sopv)
 
-            ok, vop = self.getVop()
-            if not ok:
-                self._setResponseExecError(response)
-                return response
-
             response.vop = vop
 
-            ok, pop = self.getPop()
-            if ok:
+            if pop is not None:
                 response.pop = pop
             else:
                 response.pop = PoseStamped()
@@ -854,7 +1146,11 @@ class RieglVzWrapper(Node):
     def shutdown(self):
         self._shutdownReq = True
         self.stop()
+        if self._imu is not None:
+            self._imu.shutdown()
         self._rieglVz.shutdown()
+        self.sshConnectionPool.close()
+        getServiceRegistry().close()
 
     def _shutdownCallback(self, request, response):
         self.get_logger().info("Service Request: shutdown")
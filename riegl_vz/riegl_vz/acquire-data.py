@@ -6,8 +6,7 @@ import sys
 import argparse
 import json
 import signal
-import time
-from threading import Event
+from threading import Event, Condition, RLock
 from vzi_services.scannerservice import ScannerService, RectScanPattern
 from vzi_services.controlservice import ControlService, ReflectorSearchSettings, ReflectorScanSettings
 from vzi_services.dataprocservice import DataprocService
@@ -17,11 +16,24 @@ appBinDir = appDir = os.path.dirname(os.path.abspath(__file__))
 class SignalHandler(object):
     def __init__(self):
         self.canceled = False
+        # reentrant, the signal handler runs in the thread which may hold the lock
+        self._cond = Condition(RLock())
         signal.signal(signal.SIGINT, self._handleSignal)
         signal.signal(signal.SIGTERM, self._handleSignal)
 
     def _handleSignal(self, signal_number, frame):
         self.canceled = True
+        self.wakeup()
+
+    def wakeup(self):
+        """Wake up waitUntil() to re-evaluate its predicate."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def waitUntil(self, predicate):
+        """Block until predicate() is true or canceled."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.canceled or predicate())
 
 def acquireData(
     sigHandler, scanSvc, ctrlSvc, procSvc,
@@ -41,6 +53,7 @@ def acquireData(
     finishedEvent = Event()
     def onDataAcquisitionFinished(arg0):
         finishedEvent.set()
+        sigHandler.wakeup()
 
     dataprocStarted = Event()
     def onDataProcessingStarted():
@@ -74,44 +87,44 @@ def acquireData(
     ctrlSvc.startAcquisition(flags)
 
     # wait until acquisition is done
-    while not sigHandler.canceled:
-        if finishedEvent.is_set():
-            break
-        time.sleep(0.2)
+    sigHandler.waitUntil(finishedEvent.is_set)
     sigcon.disconnect()
     sigcon2.disconnect()
 
     acqInfo = ctrlSvc.lastAcquisition()
     if not acqInfo.success:
-        raise RuntimeError("Data acquisition failed. {1}".format(acqInfo.errorMessage))
+        raise RuntimeError("Data acquisition failed. {0}".format(acqInfo.errorMessage))
 
     return False if acqInfo.canceled else True
 
-def extractReflectorSearchSettings(filepath):
+def reflectorSearchSettings(obj):
+    """Return reflector search settings of dictionary (None if search mode is not supported)."""
     rss = None
-    with open(filepath, 'r') as f:
-        obj = json.load(f)
-        searchMode = obj.get('searchMode')
-        if searchMode == 'model':
-            rss = ReflectorSearchSettings()
-            rss.mode = searchMode
-            for model in obj.get('searchModels'):
-                rss.models.append(model)
-        elif searchMode == 'simple':
-            rss = ReflectorSearchSettings()
-            rss.mode = searchMode
-            rss.minReflectance = obj['searchReflectance']
-            rss.minDiameter = obj['searchMinDiameter']
-            rss.maxDiameter = obj['searchMaxDiameter']
-        if rss:
-            # shared configuration
-            rss.resolveMta = obj.get('searchResolveMta', False)
-            if obj.get('searchMinRange') is not None:
-                rss.minRange = obj.get('searchMinRange')
-            if obj.get('searchMaxRange') is not None:
-                rss.maxRange = obj.get('searchMaxRange')
+    searchMode = obj.get('searchMode')
+    if searchMode == 'model':
+        rss = ReflectorSearchSettings()
+        rss.mode = searchMode
+        for model in obj.get('searchModels'):
+            rss.models.append(model)
+    elif searchMode == 'simple':
+        rss = ReflectorSearchSettings()
+        rss.mode = searchMode
+        rss.minReflectance = obj['searchReflectance']
+        rss.minDiameter = obj['searchMinDiameter']
+        rss.maxDiameter = obj['searchMaxDiameter']
+    if rss:
+        # shared configuration
+        rss.resolveMta = obj.get('searchResolveMta', False)
+        if obj.get('searchMinRange') is not None:
+            rss.minRange = obj.get('searchMinRange')
+        if obj.get('searchMaxRange') is not None:
+            rss.maxRange = obj.get('searchMaxRange')
     return rss
 
+def extractReflectorSearchSettings(filepath):
+    with open(filepath, 'r') as f:
+        return reflectorSearchSettings(json.load(f))
+
 def createArgumentParser():
     parser = argparse.ArgumentParser(description='Perform data acquisition.')
     parser.add_argument('--connectionstring',
@@ -0,0 +1,169 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+class FileCache(object):
+    """Content addressed cache of files downloaded from the scanner.
+
+    Cached files are identified by remote path, size and modification time,
+    so a changed remote file is downloaded again while an unchanged file is
+    served from the local copy. The cache keeps at most maxBytes of data and
+    evicts the least recently used files first. The index is persisted in
+    the cache directory and thus survives node restarts."""
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cacheDir: str, maxBytes: int, logger = None):
+        self.cacheDir = cacheDir
+        self.maxBytes = maxBytes
+        self._logger = logger
+        self._entries = OrderedDict()
+        self._keyLocks = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._threadLock = threading.Lock()
+        if not os.path.exists(self.cacheDir):
+            os.makedirs(self.cacheDir)
+        self._loadIndex()
+
+    def _lock(self):
+        self._threadLock.acquire()
+
+    def _unlock(self):
+        self._threadLock.release()
+
+    def _logDebug(self, msg):
+        if self._logger is not None:
+            self._logger.debug(msg)
+
+    @staticmethod
+    def key(remoteFile: str, size: int, mtime: int):
+        """Return cache key of a remote file version."""
+        return hashlib.sha1('{}\0{}\0{}'.format(remoteFile, size, mtime).encode()).hexdigest()
+
+    def path(self, key: str, remoteFile: str):
+        """Return local file path of a cache entry."""
+        return os.path.join(self.cacheDir, key + os.path.splitext(remoteFile)[1])
+
+    def _loadIndex(self):
+        try:
+            with open(os.path.join(self.cacheDir, self.INDEX_FILE), 'r') as f:
+                entries = json.load(f)
+        except Exception:
+            entries = []
+        for entry in entries:
+            if os.path.exists(self.path(entry['key'], entry['remote_file'])):
+                self._entries[entry['key']] = entry
+
+    def _saveIndex(self):
+        indexFile = os.path.join(self.cacheDir, self.INDEX_FILE)
+        tmpFile = indexFile + '.tmp'
+        with open(tmpFile, 'w') as f:
+            json.dump(list(self._entries.values()), f)
+        os.replace(tmpFile, indexFile)
+
+    def _usedBytes(self):
+        return sum(entry['size'] for entry in self._entries.values())
+
+    def _evict(self, keep: str):
+        """Remove least recently used entries until the byte budget is met."""
+        usedBytes = self._usedBytes()
+        for key in list(self._entries.keys()):
+            if usedBytes <= self.maxBytes:
+                break
+            if key == keep:
+                continue
+            entry = self._entries.pop(key)
+            usedBytes -= entry['size']
+            self._evictions += 1
+            try:
+                os.remove(self.path(key, entry['remote_file']))
+            except OSError:
+                pass
+            self._logDebug("Evicted {} from file cache".format(entry['remote_file']))
+
+    def _acquireKeyLock(self, key: str):
+        """Acquire the download lock of a key, locks are removed when no thread uses them."""
+        self._lock()
+        keyLock = self._keyLocks.get(key)
+        if keyLock is None:
+            keyLock = self._keyLocks[key] = [threading.Lock(), 0]
+        keyLock[1] += 1
+        self._unlock()
+        keyLock[0].acquire()
+
+    def _releaseKeyLock(self, key: str):
+        self._lock()
+        keyLock = self._keyLocks[key]
+        keyLock[0].release()
+        keyLock[1] -= 1
+        if keyLock[1] == 0:
+            del self._keyLocks[key]
+        self._unlock()
+
+    def _lookup(self, key: str):
+        self._lock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if os.path.exists(self.path(key, entry['remote_file'])):
+                self._entries.move_to_end(key)
+                entry['atime'] = time.time()
+                self._hits += 1
+            else:
+                # local file has been removed, download it again
+                del self._entries[key]
+                self._saveIndex()
+                entry = None
+        self._unlock()
+        return entry
+
+    def fetch(self, remoteFile: str, size: int, mtime: int, download):
+        """Return local path of the cached remote file.
+
+        On a cache miss download(remoteFile, localFile) is called to fetch
+        the file. Concurrent fetches of the same file download it only once."""
+        key = self.key(remoteFile, size, mtime)
+        localFile = self.path(key, remoteFile)
+        if self._lookup(key) is not None:
+            return localFile
+        self._acquireKeyLock(key)
+        try:
+            if self._lookup(key) is not None:
+                return localFile
+            tmpFile = localFile + '.download'
+            download(remoteFile, tmpFile)
+            os.replace(tmpFile, localFile)
+            self._lock()
+            self._misses += 1
+            self._entries[key] = {
+                'key': key,
+                'remote_file': remoteFile,
+                'size': size,
+                'mtime': mtime,
+                'atime': time.time()
+            }
+            self._evict(key)
+            self._saveIndex()
+            self._unlock()
+        finally:
+            self._releaseKeyLock(key)
+        return localFile
+
+    def getStatistics(self):
+        """Return number of hits, misses, evictions, cached files and cached bytes."""
+        self._lock()
+        requests = self._hits + self._misses
+        stats = {
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_ratio': (self._hits / requests) if requests > 0 else 0.0,
+            'evictions': self._evictions,
+            'files': len(self._entries),
+            'bytes': self._usedBytes()
+        }
+        self._unlock()
+        return stats
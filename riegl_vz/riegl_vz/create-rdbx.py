@@ -6,8 +6,7 @@ import sys
 import argparse
 import json
 import signal
-import time
-from threading import Event
+from threading import Event, Condition, RLock
 from vzi_services.projectservice import ProjectService
 from vzi_services.controlservice import ControlService
 from vzi_services.dataprocservice import DataprocService
@@ -15,11 +14,24 @@ from vzi_services.dataprocservice import DataprocService
 class SignalHandler(object):
     def __init__(self):
         self.canceled = False
+        # reentrant, the signal handler runs in the thread which may hold the lock
+        self._cond = Condition(RLock())
         signal.signal(signal.SIGINT, self._handleSignal)
         signal.signal(signal.SIGTERM, self._handleSignal)
 
     def _handleSignal(self, signal_number, frame):
         self.canceled = True
+        self.wakeup()
+
+    def wakeup(self):
+        """Wake up waitUntil() to re-evaluate its predicate."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def waitUntil(self, predicate):
+        """Block until predicate() is true or canceled."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.canceled or predicate())
 
 def mediaString(projSvc):
     """Return string representation of active storage media (used by ControlService)."""
@@ -32,6 +44,11 @@ def mediaString(projSvc):
         return 'NAS'
     return 'SSD'
 
+def actualScan(procSvc):
+    """Return name of the scan recorded by the last data acquisition."""
+    scanId = procSvc.actualFile(0)
+    return os.path.basename(scanId).replace('.rxp', '')[0:13]
+
 def createRdbx(sigHandler, ctrlSvc,
     storMedia: str,
     projectName: str,
@@ -45,6 +62,7 @@ def createRdbx(sigHandler, ctrlSvc,
         obj = json.loads(arg0)
         if obj.get('id') == taskId:
             taskFinishedEvent.set()
+            sigHandler.wakeup()
 
     sigcon = ctrlSvc.backgroundTaskRemoved().connect(onBackgroundTaskRemoved)
 
@@ -55,10 +73,8 @@ def createRdbx(sigHandler, ctrlSvc,
         scan
     )
 
-    while not sigHandler.canceled:
-        if taskFinishedEvent.is_set():
-            break
-        time.sleep(0.2)
+    sigHandler.waitUntil(taskFinishedEvent.is_set)
+    sigcon.disconnect()
     if sigHandler.canceled:
         try:
             if taskId:
@@ -67,8 +83,6 @@ def createRdbx(sigHandler, ctrlSvc,
             pass
         return False
 
-    sigcon.disconnect()
-
     return True
 
 def createArgumentParser():
@@ -105,8 +119,7 @@ def main():
     if args.scan:
         scan = args.scan
     else:
-        scanId = procSvc.actualFile(0)
-        scan: str = os.path.basename(scanId).replace('.rxp', '')[0:13]
+        scan = actualScan(procSvc)
     storMedia = mediaString(projSvc)
     if not createRdbx(
         sigHandler, ctrlSvc,
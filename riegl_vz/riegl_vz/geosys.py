@@ -4,6 +4,7 @@ import threading
 from rclpy.node import Node
 
 from vzi_services.geosysservice import GeoSysService
+from vzi_services.registry import getService
 
 class RieglVzGeoSys():
     def __init__(self, node):
@@ -22,14 +23,17 @@ class RieglVzGeoSys():
         self._threadLock.release()
 
     def _connect(self):
-        if not self._geosysSvc:
-            try:
-                self._geosysSvc = GeoSysService(self._connectionString)
-                self._geosysSvc.reloadCoordinateSystems()
-            except:
+        # the registry replaces the service client after a connection loss
+        try:
+            geosysSvc = getService(GeoSysService, self._connectionString)
+            if geosysSvc is not self._geosysSvc:
                 self._geosysSvc = None
-                self._logger.error("GeoSysService is not available!")
-                return False
+                geosysSvc.reloadCoordinateSystems()
+                self._geosysSvc = geosysSvc
+        except:
+            self._geosysSvc = None
+            self._logger.error("GeoSysService is not available!")
+            return False
         return True
 
     def transformToWgs84(self, cs, coord1, coord2, coord3):
@@ -0,0 +1,125 @@
+import time
+import threading
+import numpy as np
+
+from rclpy.node import Node
+
+from sensor_msgs.msg import Imu
+from geometry_msgs.msg import Vector3
+import std_msgs.msg as std_msgs
+import builtin_interfaces.msg as builtin_msgs
+
+from vzi_services.scannereventsservice import ScannereventsService
+from vzi_services.registry import getService
+
+class RieglVzImu():
+    """Publisher of the measurements of the scanner internal IMU.
+
+       The IPCIRQ_IRQ_IMU_DATA signal packages are decoded into NumPy arrays,
+       scaling to SI units and timestamping is done for all measurements of a
+       package at once. The last measurement of a package is stamped with the
+       receive time, the other measurements relative to it by their scanner
+       system time."""
+    def __init__(self, node):
+        self._node = node
+        self._hostname = node.hostname
+        self._connectionString = self._hostname + ':20000'
+        self._logger = node.get_logger()
+        self._gyroScale = node.imuGyroScale
+        self._accScale = node.imuAccScale
+        self._systimeScale = node.imuSystimeScale
+        self._sigcon = None
+        self._shutdownReq = False
+        self._packages = 0
+        self._samples = 0
+        self._threadLock = threading.Lock()
+
+        self._connectThread = threading.Thread(target=self._connectFunction, args=())
+        self._connectThread.daemon = True
+        self._connectThread.start()
+
+    def _lock(self):
+        self._threadLock.acquire()
+
+    def _unlock(self):
+        self._threadLock.release()
+
+    def _connectFunction(self):
+        # the registry replaces the service client after a connection loss,
+        # the signal has to be connected again on the new client then
+        evtSvc = None
+        while not self._shutdownReq:
+            try:
+                svc = getService(ScannereventsService, self._connectionString)
+                if svc is not evtSvc:
+                    self._disconnect()
+                    if evtSvc is not None:
+                        self._logger.warning("IMU data connection lost, reconnecting.")
+                    evtSvc = svc
+                    sigcon = evtSvc.IPCIRQ_IRQ_IMU_DATA_ARRAY().connect(self._onImuData)
+                    self._lock()
+                    self._sigcon = sigcon
+                    self._unlock()
+                    self._logger.info("IMU data publishing started.")
+            except:
+                evtSvc = None
+            time.sleep(1.0)
+        self._disconnect()
+
+    def _disconnect(self):
+        self._lock()
+        sigcon = self._sigcon
+        self._sigcon = None
+        self._unlock()
+        if sigcon is not None:
+            try:
+                sigcon.disconnect()
+            except:
+                pass
+
+    def _onImuData(self, data):
+        meas = data.measurements
+        count = len(meas)
+        if count == 0:
+            return
+        now = self._node.get_clock().now().nanoseconds
+
+        # system time differences in unsigned 32 bit arithmetic are not affected by a wrap-around
+        age = (meas['systime'][-1] - meas['systime']).astype(np.float64) * self._systimeScale
+        stamps = now - np.rint(age * 1e9).astype(np.int64)
+        secs = (stamps // 1000000000).tolist()
+        nanosecs = (stamps % 1000000000).tolist()
+        gyro = (np.column_stack((meas['gyro_x'], meas['gyro_y'], meas['gyro_z'])) * self._gyroScale).tolist()
+        acc = (np.column_stack((meas['acc_x'], meas['acc_y'], meas['acc_z'])) * self._accScale).tolist()
+
+        publisher = self._node.imuPublisher
+        for i in range(count):
+            msg = Imu(
+                header = std_msgs.Header(
+                    frame_id = 'riegl_vz_socs',
+                    stamp = builtin_msgs.Time(sec = secs[i], nanosec = nanosecs[i])),
+                angular_velocity = Vector3(x = gyro[i][0], y = gyro[i][1], z = gyro[i][2]),
+                linear_acceleration = Vector3(x = acc[i][0], y = acc[i][1], z = acc[i][2]))
+            # orientation is not provided
+            msg.orientation_covariance[0] = -1.0
+            publisher.publish(msg)
+
+        self._lock()
+        self._packages += 1
+        self._samples += count
+        self._unlock()
+
+    def getStatistics(self):
+        """Return number of received packages and published samples."""
+        self._lock()
+        stats = {
+            'connected': self._sigcon is not None,
+            'packages': self._packages,
+            'samples': self._samples
+        }
+        self._unlock()
+        return stats
+
+    def shutdown(self):
+        self._shutdownReq = True
+        self._disconnect()
@@ -0,0 +1,225 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class ScanJob(object):
+    """Scan position job.
+
+       State machine:
+         queued -> acquiring -> processing -> done
+       A job leaves acquiring or processing to 'stopped' on a stop request
+       and to 'failed' on an error. Entry times of the states are recorded
+       in 'times' (monotonic clock). 'previousJob' is the job submitted
+       before, it is released when that job is finished. 'registered' is set
+       when the registration of the job is finished, failed or not done at
+       all, at the latest when the job is finished."""
+    FINAL_STATES = ('done', 'stopped', 'failed')
+
+    def __init__(self, jobId: int, scanposition: str, settings: dict):
+        self.id = jobId
+        self.scanposition = scanposition
+        self.settings = settings
+        self.state = 'queued'
+        self.times = {'queued': time.monotonic()}
+        self.stopReq = False
+        self.finished = threading.Event()
+        self.registered = threading.Event()
+        self.previousJob = None
+        self.position = None
+        self.yawAngle = None
+        self.imuPoses = None
+
+    def __getattr__(self, name):
+        # scan settings are accessible as attributes, e.g. job.scanPublish
+        settings = self.__dict__.get('settings')
+        if settings is not None and name in settings:
+            return settings[name]
+        raise AttributeError(name)
+
+    def setState(self, state: str):
+        self.state = state
+        self.times[state] = time.monotonic()
+
+    def isFinished(self):
+        return self.state in self.FINAL_STATES
+
+    def duration(self, fromState: str, toState: str):
+        if fromState not in self.times or toState not in self.times:
+            return None
+        return self.times[toState] - self.times[fromState]
+
+    def latency(self):
+        """Return time from submission to the final state in seconds (None if not finished)."""
+        if not self.isFinished():
+            return None
+        return self.times[self.state] - self.times['queued']
+
+class ScanJobQueue(object):
+    """Queue of scan position jobs.
+
+       One job acquires data at a time. As soon as the acquisition of a job
+       is finished, the job is processed by a bounded pool of workers and
+       the next job can start its acquisition. Jobs are refused while an
+       acquisition is running or 'depth' jobs are processed (backpressure),
+       a depth of 0 disables queueing and refuses jobs until the previous
+       job is finished.
+
+       Arguments:
+         depth (int): maximum number of jobs being processed
+         acquireFn (function): acquisition of a job, returns False if stopped
+         processFn (function): processing of a job, returns False if stopped
+         onChange (function): called with the queue locked after every job state change
+         logger: node logger"""
+    def __init__(self, depth: int, acquireFn, processFn, onChange=None, logger=None):
+        self._depth = max(0, depth)
+        self._acquireFn = acquireFn
+        self._processFn = processFn
+        self._onChange = onChange
+        self._logger = logger
+        self._workers = ThreadPoolExecutor(max_workers=max(1, self._depth))
+        self._jobs = []
+        self._lastJobId = 0
+        self._lastJob = None
+        self._completed = 0
+        self._failed = 0
+        self._stopped = 0
+        self._latencies = []
+        self._cond = threading.Condition()
+
+    def _lock(self):
+        self._cond.acquire()
+
+    def _unlock(self):
+        self._cond.release()
+
+    def _accepting(self):
+        if any(job.state in ('queued', 'acquiring') for job in self._jobs):
+            return False
+        return len(self._jobs) < self._depth if self._depth > 0 else len(self._jobs) == 0
+
+    def accepting(self):
+        """Return true if a new job would be accepted."""
+        self._lock()
+        accepting = self._accepting()
+        self._unlock()
+        return accepting
+
+    def submit(self, scanposition: str, settings: dict):
+        """Start acquisition of new job, returns the job or None if the queue is full."""
+        self._lock()
+        if not self._accepting():
+            self._unlock()
+            return None
+        self._lastJobId += 1
+        job = ScanJob(self._lastJobId, scanposition, settings)
+        if self._lastJob is not None and not self._lastJob.isFinished():
+            job.previousJob = self._lastJob
+        self._lastJob = job
+        self._jobs.append(job)
+        job.setState('acquiring')
+        self._changed()
+        self._unlock()
+        thread = threading.Thread(target=self._acquire, args=(job,))
+        thread.daemon = True
+        thread.start()
+        return job
+
+    def _changed(self):
+        if self._onChange is not None:
+            self._onChange()
+
+    def _run(self, job: ScanJob, fn):
+        try:
+            return fn(job) is not False and not job.stopReq
+        except Exception as e:
+            if self._logger:
+                self._logger.error("Scan position {0} failed! {1}".format(job.scanposition, e))
+            self._finish(job, 'failed')
+            return None
+
+    def _acquire(self, job: ScanJob):
+        ok = self._run(job, self._acquireFn)
+        if ok is None:
+            return
+        if not ok:
+            self._finish(job, 'stopped')
+            return
+        self._lock()
+        job.setState('processing')
+        self._changed()
+        self._cond.notify_all()
+        self._unlock()
+        self._workers.submit(self._process, job)
+
+    def _process(self, job: ScanJob):
+        ok = self._run(job, self._processFn)
+        if ok is None:
+            return
+        self._finish(job, 'done' if ok else 'stopped')
+
+    def _finish(self, job: ScanJob, state: str):
+        self._lock()
+        job.setState(state)
+        job.previousJob = None
+        self._jobs.remove(job)
+        if state == 'done':
+            self._completed += 1
+            self._latencies = (self._latencies + [job.latency()])[-100:]
+        elif state == 'failed':
+            self._failed += 1
+        else:
+            self._stopped += 1
+        self._changed()
+        self._cond.notify_all()
+        self._unlock()
+        job.registered.set()
+        job.finished.set()
+        if self._logger:
+            self._logger.info("Scan position {0} {1}, latency = {2:.3f} s (acquisition = {3}, processing = {4})".format(
+                job.scanposition, state, job.latency(),
+                '{:.3f} s'.format(job.duration('acquiring', 'processing')) if 'processing' in job.times else '-',
+                '{:.3f} s'.format(job.duration('processing', state)) if 'processing' in job.times else '-'))
+
+    def stop(self):
+        """Request stop of all jobs."""
+        self._lock()
+        for job in self._jobs:
+            job.stopReq = True
+        self._unlock()
+
+    def isAcquiring(self):
+        self._lock()
+        acquiring = any(job.state == 'acquiring' for job in self._jobs)
+        self._unlock()
+        return acquiring
+
+    def isProcessing(self):
+        self._lock()
+        processing = any(job.state == 'processing' for job in self._jobs)
+        self._unlock()
+        return processing
+
+    def waitUntilIdle(self, timeout=None):
+        """Block until all jobs are finished, returns False on timeout."""
+        self._lock()
+        try:
+            return self._cond.wait_for(lambda: len(self._jobs) == 0, timeout)
+        finally:
+            self._unlock()
+
+    def getStatistics(self):
+        """Return queue depth, number of jobs in processing, job counters and latencies in seconds."""
+        self._lock()
+        latencies = list(self._latencies)
+        stats = {
+            'depth': self._depth,
+            'acquiring': sum(1 for job in self._jobs if job.state == 'acquiring'),
+            'processing': sum(1 for job in self._jobs if job.state == 'processing'),
+            'completed': self._completed,
+            'failed': self._failed,
+            'stopped': self._stopped,
+            'last_latency': latencies[-1] if latencies else None,
+            'mean_latency': sum(latencies) / len(latencies) if latencies else None
+        }
+        self._unlock()
+        return stats
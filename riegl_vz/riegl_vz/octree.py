@@ -0,0 +1,541 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+
+from .pointcloud import (
+    XYZR_ATTRIBUTES,
+    XYZR_DTYPE,
+    countPoints,
+    chunkAttribute,
+    lodPointStep
+)
+
+# node table of the octree, point range of a cell at cell level within a point level
+OCTREE_NODE_DTYPE = np.dtype([
+    ('level', np.uint8),
+    ('cell', np.int32, (3,)),
+    ('start', np.int64),
+    ('count', np.int64)
+])
+
+def _part1by2(v):
+    """Spread the lower 21 bits of v to every third bit."""
+    v = v & 0x1fffff
+    v = (v | (v << 32)) & 0x1f00000000ffff
+    v = (v | (v << 16)) & 0x1f0000ff0000ff
+    v = (v | (v << 8)) & 0x100f00f00f00f00f
+    v = (v | (v << 4)) & 0x10c30c30c30c30c3
+    v = (v | (v << 2)) & 0x1249249249249249
+    return v
+
+def _compact1by2(v):
+    """Inverse of _part1by2."""
+    v = v & 0x1249249249249249
+    v = (v | (v >> 2)) & 0x10c30c30c30c30c3
+    v = (v | (v >> 4)) & 0x100f00f00f00f00f
+    v = (v | (v >> 8)) & 0x1f0000ff0000ff
+    v = (v | (v >> 16)) & 0x1f00000000ffff
+    v = (v | (v >> 32)) & 0x1fffff
+    return v
+
+def mortonEncode(cells):
+    """Return morton codes (int64) of integer cell coordinates (n x 3)."""
+    cells = cells.astype(np.int64)
+    return (_part1by2(cells[:, 0]) << 2) | (_part1by2(cells[:, 1]) << 1) | _part1by2(cells[:, 2])
+
+def mortonDecode(codes):
+    """Return integer cell coordinates (n x 3) of morton codes."""
+    return np.column_stack((_compact1by2(codes >> 2), _compact1by2(codes >> 1), _compact1by2(codes)))
+
+# maximum number of points sorted in memory at once by buildOctree (approximately)
+SORT_BUCKET_POINTS = 4000000
+
+def _firstOfRuns(keys):
+    """Return boolean array marking the first element of every run of equal keys."""
+    first = np.empty(len(keys), dtype=bool)
+    first[:1] = True
+    np.not_equal(keys[1:], keys[:-1], out=first[1:])
+    return first
+
+def _stageArray(octreeDir: str, name: str, dtype, shape):
+    return np.lib.format.open_memmap(
+        os.path.join(octreeDir, name + '.stage.npy'), mode='w+', dtype=dtype, shape=shape)
+
+def _removeStage(octreeDir: str, name: str):
+    os.remove(os.path.join(octreeDir, name + '.stage.npy'))
+
+def _distribute(octreeDir: str, name: str, sources, bucketIds, numBuckets: int, chunkSize: int):
+    """Stable counting sort of staged arrays by bucket id, chunk by chunk.
+
+    bucketIds(start, end) returns the bucket ids of a range of points.
+    Returns the staged arrays in bucket order and the bucket offsets."""
+    numPoints = len(sources[0])
+    counts = np.zeros(numBuckets, dtype=np.int64)
+    for start in range(0, numPoints, chunkSize):
+        counts += np.bincount(bucketIds(start, start + chunkSize), minlength=numBuckets)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    cursor = offsets[:-1].copy()
+    targets = [_stageArray(octreeDir, '{}-{}'.format(name, i), source.dtype, source.shape)
+        for i, source in enumerate(sources)]
+    for start in range(0, numPoints, chunkSize):
+        ids = bucketIds(start, start + chunkSize)
+        order = np.argsort(ids, kind='stable')
+        ids = ids[order]
+        chunkCounts = np.bincount(ids, minlength=numBuckets)
+        positions = cursor[ids] + np.arange(len(ids)) - (np.cumsum(chunkCounts) - chunkCounts)[ids]
+        for source, target in zip(sources, targets):
+            target[positions] = source[start:start + chunkSize][order]
+        cursor += chunkCounts
+    return targets, offsets.tolist()
+
+def buildOctree(octreeDir: str, rdb, selection: str = '', extraAttributes = (), depth: int = 16, nodeDepth: int = None, chunkSize: int = 100000):
+    """Build multi-resolution octree of the points of a rdb point cloud in octreeDir.
+
+    The points are sorted by octree level and within a level in morton
+    order. Level l holds one point of each cell of edge length size / 2^l,
+    which is not represented by a coarser level yet, the last level 'depth'
+    holds all remaining points. So the points of the levels up to any level
+    are a spatially uniform subsample of the point cloud. The node table
+    holds the point range of every occupied cell of every level, the cells
+    of levels deeper than nodeDepth are grouped by their cell at nodeDepth
+    to keep the node table small (default: about 256 points per node).
+
+    The point data, morton codes and the sort permutation are staged in
+    memory mapped files, the points are sorted in buckets of consecutive
+    morton codes, so the memory usage is bounded by SORT_BUCKET_POINTS.
+
+    Files (numpy .npy format, memory mappable):
+      points.npy ... float32 x, y, z, reflectance (XYZR_DTYPE)
+      attr-<name>.npy ... extra point attributes, same order
+      nodes.npy ... node table (OCTREE_NODE_DTYPE)
+      meta.json ... number of points, depth, bounding cube, level offsets"""
+    if depth < 1 or depth > 21:
+        raise ValueError("octree depth must be in range 1 to 21")
+    os.makedirs(octreeDir, exist_ok=True)
+    numPoints = countPoints(rdb, selection, chunkSize)
+
+    # stage the points in files to bound the memory usage
+    stagePoints = _stageArray(octreeDir, 'points', XYZR_DTYPE, (numPoints,))
+    stageAttributes = {}
+    numRead = 0
+    attributes = XYZR_ATTRIBUTES + [a for a in extraAttributes if a not in XYZR_ATTRIBUTES]
+    for points in rdb.select(selection, attributes=attributes, chunk_size=chunkSize):
+        count = min(len(points), numPoints - numRead)
+        stagePoints['xyz'][numRead:numRead + count] = chunkAttribute(points, 'riegl.xyz')[:count]
+        stagePoints['r'][numRead:numRead + count] = chunkAttribute(points, 'riegl.reflectance')[:count]
+        for name in extraAttributes:
+            data = chunkAttribute(points, name)
+            if name not in stageAttributes:
+                stageAttributes[name] = _stageArray(octreeDir, 'attr-{}'.format(name),
+                    data.dtype, (numPoints,) + data.shape[1:])
+            stageAttributes[name][numRead:numRead + count] = data[:count]
+        numRead += count
+    numPoints = numRead
+    stagePoints = stagePoints[:numPoints]
+
+    if nodeDepth is None:
+        nodeDepth = max(1, int(np.log(max(numPoints / 256.0, 1.0)) / np.log(8.0)))
+
+    # bounding cube
+    if numPoints > 0:
+        bbMin = np.array([stagePoints['xyz'][:, i].min() for i in range(3)], dtype=np.float64)
+        bbMax = np.array([stagePoints['xyz'][:, i].max() for i in range(3)], dtype=np.float64)
+    else:
+        bbMin = bbMax = np.zeros(3)
+    size = max(float((bbMax - bbMin).max()), 1e-3) * (1.0 + 1e-6)
+
+    # morton codes of the cells at the deepest level
+    codes = _stageArray(octreeDir, 'codes', np.int64, (numPoints,))
+    indices = _stageArray(octreeDir, 'indices', np.int64, (numPoints,))
+    maxCell = (1 << depth) - 1
+    for start in range(0, numPoints, chunkSize):
+        xyz = stagePoints['xyz'][start:start + chunkSize].astype(np.float64)
+        cells = np.clip(np.floor((xyz - bbMin) / size * (1 << depth)), 0, maxCell)
+        codes[start:start + len(xyz)] = mortonEncode(cells)
+        indices[start:start + len(xyz)] = np.arange(start, start + len(xyz))
+
+    # distribute the points to buckets of consecutive morton codes of about equal size
+    numBuckets = max(1, -(-numPoints // SORT_BUCKET_POINTS))
+    sample = np.sort(codes[::max(1, numPoints // 100000)])
+    bounds = sample[(np.arange(1, numBuckets) * len(sample)) // numBuckets]
+    (codes, indices), bucketOffsets = _distribute(octreeDir, 'bucket', [codes, indices],
+        lambda start, end, codes=codes: np.searchsorted(bounds, codes[start:end], side='right'), numBuckets, chunkSize)
+    _removeStage(octreeDir, 'codes')
+    _removeStage(octreeDir, 'indices')
+
+    # sort the buckets, level of every point: the first remaining point of a cell represents the cell
+    levels = _stageArray(octreeDir, 'levels', np.uint8, (numPoints,))
+    # key of the last represented cell of every level, carried over from the previous bucket
+    lastKeys = np.full(depth, -1, dtype=np.int64)
+    for bucket in range(numBuckets):
+        begin, end = bucketOffsets[bucket], bucketOffsets[bucket + 1]
+        order = np.argsort(codes[begin:end], kind='stable')
+        bucketCodes = codes[begin:end][order]
+        codes[begin:end] = bucketCodes
+        indices[begin:end] = indices[begin:end][order]
+        del order
+        bucketLevels = np.full(end - begin, depth, dtype=np.uint8)
+        remaining = np.arange(end - begin)
+        for level in range(depth):
+            if len(remaining) == 0:
+                break
+            keys = bucketCodes[remaining] >> (3 * (depth - level))
+            first = _firstOfRuns(keys)
+            if keys[0] == lastKeys[level]:
+                first[0] = False
+            represented = remaining[first]
+            if len(represented) > 0:
+                bucketLevels[represented] = level
+                lastKeys[level] = keys[first][-1]
+            remaining = remaining[~first]
+        levels[begin:end] = bucketLevels
+        del bucketCodes, bucketLevels, remaining
+
+    # level major order, morton order within a level
+    (codes, order), levelOffsets = _distribute(octreeDir, 'level', [codes, indices],
+        lambda start, end: levels[start:end], depth + 1, chunkSize)
+    del indices, levels
+    for name in ('bucket-0', 'bucket-1', 'levels'):
+        _removeStage(octreeDir, name)
+
+    # node table
+    nodes = []
+    for level in range(depth + 1):
+        begin, end = levelOffsets[level], levelOffsets[level + 1]
+        if begin == end:
+            continue
+        shift = 3 * (depth - min(level, nodeDepth))
+        nodeKeys = []
+        nodeStarts = []
+        lastKey = None
+        for start in range(begin, end, chunkSize):
+            keys = codes[start:min(start + chunkSize, end)] >> shift
+            first = _firstOfRuns(keys)
+            if keys[0] == lastKey:
+                first[0] = False
+            nodeKeys.append(keys[first])
+            nodeStarts.append(start + np.flatnonzero(first))
+            lastKey = keys[-1]
+        nodeKeys = np.concatenate(nodeKeys)
+        nodeStarts = np.concatenate(nodeStarts)
+        levelNodes = np.empty(len(nodeStarts), dtype=OCTREE_NODE_DTYPE)
+        levelNodes['level'] = min(level, nodeDepth)
+        levelNodes['cell'] = mortonDecode(nodeKeys)
+        levelNodes['start'] = nodeStarts
+        levelNodes['count'] = np.diff(np.append(nodeStarts, end))
+        nodes.append(levelNodes)
+    nodes = np.concatenate(nodes) if nodes else np.empty(0, dtype=OCTREE_NODE_DTYPE)
+    np.save(os.path.join(octreeDir, 'nodes.npy'), nodes)
+    del codes
+    _removeStage(octreeDir, 'level-0')
+
+    # reorder the staged point data
+    def reorder(stage, fileName):
+        out = np.lib.format.open_memmap(
+            os.path.join(octreeDir, fileName), mode='w+', dtype=stage.dtype, shape=(numPoints,) + stage.shape[1:])
+        for start in range(0, numPoints, 1000000):
+            out[start:start + 1000000] = stage[order[start:start + 1000000]]
+        out.flush()
+        del out
+    reorder(stagePoints, 'points.npy')
+    del stagePoints
+    _removeStage(octreeDir, 'points')
+    for name in list(stageAttributes.keys()):
+        reorder(stageAttributes.pop(name)[:numPoints], 'attr-{}.npy'.format(name))
+        _removeStage(octreeDir, 'attr-{}'.format(name))
+    del order
+    _removeStage(octreeDir, 'level-1')
+
+    meta = {
+        'num_points': numPoints,
+        'depth': depth,
+        'origin': bbMin.tolist(),
+        'size': size,
+        'level_offsets': levelOffsets,
+        'attributes': list(extraAttributes),
+        'selection': selection
+    }
+    with open(os.path.join(octreeDir, 'meta.json'), 'w') as f:
+        json.dump(meta, f)
+    return meta
+
+class PointCloudOctree(object):
+    """Memory mapped multi-resolution octree of a point cloud (see buildOctree)."""
+    def __init__(self, octreeDir: str):
+        self.octreeDir = octreeDir
+        with open(os.path.join(octreeDir, 'meta.json'), 'r') as f:
+            self.meta = json.load(f)
+        self.numPoints = self.meta['num_points']
+        self.depth = self.meta['depth']
+        self.origin = np.array(self.meta['origin'])
+        self.size = self.meta['size']
+        self.levelOffsets = self.meta['level_offsets']
+        self.points = np.load(os.path.join(octreeDir, 'points.npy'), mmap_mode='r')
+        self.nodes = np.load(os.path.join(octreeDir, 'nodes.npy'), mmap_mode='r')
+        self._attributes = {}
+
+    def attribute(self, name: str):
+        """Return memory mapped extra point attribute."""
+        if name not in self._attributes:
+            self._attributes[name] = np.load(
+                os.path.join(self.octreeDir, 'attr-{}.npy'.format(name)), mmap_mode='r')
+        return self._attributes[name]
+
+    def lodCount(self, lod: int = 0):
+        """Return number of points of level of detail, every 2^lod-th point on average."""
+        return -(-self.numPoints // lodPointStep(lod))
+
+    def _lodLevel(self, lod: int):
+        """Return start, number of points and number of selected points of the level cut by the level of detail.
+
+        A level of detail consists of all points of the coarser levels and
+        an evenly strided subset of the morton ordered points of the level
+        cut by it, a prefix would select the first octants only."""
+        count = self.lodCount(lod)
+        level = int(np.searchsorted(self.levelOffsets, count, side='right')) - 1
+        start = self.levelOffsets[level]
+        if count == start:
+            return start, 0, 0
+        return start, self.levelOffsets[level + 1] - start, count - start
+
+    def select(self, lod: int = 0, box = None):
+        """Return slice or index array of the points of a level of detail within a box.
+
+        Arguments:
+          lod: level of detail, see lodCount()
+          box: (min xyz, max xyz) or None"""
+        levelStart, levelCount, levelSelected = self._lodLevel(lod)
+        if box is None:
+            if levelSelected == 0:
+                return slice(0, levelStart)
+            return np.concatenate((
+                np.arange(levelStart, dtype=np.int64),
+                levelStart + (np.arange(levelSelected, dtype=np.int64) * levelCount) // levelSelected))
+        limit = levelStart + levelCount
+        boxMin = np.asarray(box[0], dtype=np.float64)
+        boxMax = np.asarray(box[1], dtype=np.float64)
+        nodes = self.nodes
+        cellSize = self.size / (2.0 ** nodes['level'].astype(np.float64))
+        cellMin = self.origin + nodes['cell'] * cellSize[:, None]
+        cellMax = cellMin + cellSize[:, None]
+        mask = np.all((cellMax >= boxMin) & (cellMin <= boxMax), axis=1) & (nodes['start'] < limit)
+        starts = nodes['start'][mask]
+        counts = np.minimum(nodes['count'][mask], limit - starts)
+        # concatenated index ranges of the selected nodes
+        total = int(counts.sum())
+        offsets = np.cumsum(counts) - counts
+        indices = np.arange(total, dtype=np.int64) + np.repeat(starts - offsets, counts)
+        if levelSelected > 0:
+            # strided subset of the cut level, index k is selected if k = floor(j * count / selected)
+            k = indices - levelStart
+            j = -(-k * levelSelected // levelCount)
+            indices = indices[(k < 0) | ((j * levelCount) // levelSelected == k)]
+        xyz = self.points['xyz'][indices]
+        inside = np.all((xyz >= boxMin) & (xyz <= boxMax), axis=1)
+        return indices[inside]
+
+    def query(self, lod: int = 0, box = None, attributes = ()):
+        """Return points (XYZR_DTYPE) and dictionary of extra attributes of a level of detail within a box."""
+        selection = self.select(lod, box)
+        return self.points[selection], {name: self.attribute(name)[selection] for name in attributes}
+
+class OctreeCache(object):
+    """Persistent cache of the point cloud octrees of the scan positions.
+
+    Octrees are identified by remote rdbx file path, size, modification time
+    and rdb point filter and stored in subdirectories of the cache
+    directory, so a changed rdbx file is not served from a stale octree. Octrees older than
+    maxAge seconds are evicted, the cache keeps at most maxBytes of data
+    and evicts the least recently used octrees first. The index is persisted
+    in the cache directory and thus survives node restarts."""
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cacheDir: str, maxBytes: int, maxAge: float = 0, logger = None):
+        self.cacheDir = cacheDir
+        self.maxBytes = maxBytes
+        self.maxAge = maxAge
+        self._logger = logger
+        self._entries = OrderedDict()
+        self._octrees = {}
+        self._keyLocks = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._threadLock = threading.Lock()
+        if not os.path.exists(self.cacheDir):
+            os.makedirs(self.cacheDir)
+        self._loadIndex()
+        self._lock()
+        self._evict(None)
+        self._saveIndex()
+        self._unlock()
+
+    def _lock(self):
+        self._threadLock.acquire()
+
+    def _unlock(self):
+        self._threadLock.release()
+
+    def _logDebug(self, msg):
+        if self._logger is not None:
+            self._logger.debug(msg)
+
+    @staticmethod
+    def key(remoteFile: str, size: int, mtime: int, selection: str = ''):
+        """Return cache key of the octree of a remote rdbx file version and point filter."""
+        return hashlib.sha1('{}\0{}\0{}\0{}'.format(remoteFile, size, mtime, selection).encode()).hexdigest()
+
+    def path(self, key: str):
+        """Return octree directory of a cache entry."""
+        return os.path.join(self.cacheDir, key)
+
+    def _loadIndex(self):
+        try:
+            with open(os.path.join(self.cacheDir, self.INDEX_FILE), 'r') as f:
+                entries = json.load(f)
+        except Exception:
+            entries = []
+        for entry in entries:
+            if os.path.exists(os.path.join(self.path(entry['key']), 'meta.json')):
+                self._entries[entry['key']] = entry
+
+    def _saveIndex(self):
+        indexFile = os.path.join(self.cacheDir, self.INDEX_FILE)
+        tmpFile = indexFile + '.tmp'
+        with open(tmpFile, 'w') as f:
+            json.dump(list(self._entries.values()), f)
+        os.replace(tmpFile, indexFile)
+
+    def _usedBytes(self):
+        return sum(entry['bytes'] for entry in self._entries.values())
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self._octrees.pop(key, None)
+        self._evictions += 1
+        shutil.rmtree(self.path(key), ignore_errors=True)
+        self._logDebug("Evicted octree of {} from cache".format(entry['remote_file']))
+
+    def _evict(self, keep: str):
+        """Remove expired entries and least recently used entries until the byte budget is met."""
+        if self.maxAge > 0:
+            expired = time.time() - self.maxAge
+            for key in [k for k, e in self._entries.items() if e['created'] < expired and k != keep]:
+                self._remove(key)
+        usedBytes = self._usedBytes()
+        for key in list(self._entries.keys()):
+            if usedBytes <= self.maxBytes:
+                break
+            if key == keep:
+                continue
+            usedBytes -= self._entries[key]['bytes']
+            self._remove(key)
+
+    def _acquireKeyLock(self, key: str):
+        """Acquire the build lock of a key, locks are removed when no thread uses them."""
+        self._lock()
+        keyLock = self._keyLocks.get(key)
+        if keyLock is None:
+            keyLock = self._keyLocks[key] = [threading.Lock(), 0]
+        keyLock[1] += 1
+        self._unlock()
+        keyLock[0].acquire()
+
+    def _releaseKeyLock(self, key: str):
+        self._lock()
+        keyLock = self._keyLocks[key]
+        keyLock[0].release()
+        keyLock[1] -= 1
+        if keyLock[1] == 0:
+            del self._keyLocks[key]
+        self._unlock()
+
+    def _lookup(self, key: str):
+        self._lock()
+        octree = None
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            entry['atime'] = time.time()
+            self._hits += 1
+            octree = self._octrees.get(key)
+            if octree is None:
+                octree = self._octrees[key] = PointCloudOctree(self.path(key))
+        self._unlock()
+        return octree
+
+    def get(self, remoteFile: str, size: int, mtime: int, selection: str = ''):
+        """Return cached octree or None."""
+        return self._lookup(self.key(remoteFile, size, mtime, selection))
+
+    def fetch(self, remoteFile: str, size: int, mtime: int, selection: str, build):
+        """Return octree of a remote rdbx file version and point filter.
+
+        On a cache miss build(octreeDir) is called to build the octree (see
+        buildOctree), octrees of other versions of the file are removed.
+        Concurrent fetches of the same octree build it only once."""
+        key = self.key(remoteFile, size, mtime, selection)
+        octree = self._lookup(key)
+        if octree is not None:
+            return octree
+        self._acquireKeyLock(key)
+        try:
+            octree = self._lookup(key)
+            if octree is not None:
+                return octree
+            octreeDir = self.path(key)
+            tmpDir = octreeDir + '.build'
+            shutil.rmtree(tmpDir, ignore_errors=True)
+            try:
+                build(tmpDir)
+                shutil.rmtree(octreeDir, ignore_errors=True)
+                os.replace(tmpDir, octreeDir)
+            except:
+                shutil.rmtree(tmpDir, ignore_errors=True)
+                raise
+            numBytes = sum(os.path.getsize(os.path.join(octreeDir, f)) for f in os.listdir(octreeDir))
+            self._lock()
+            self._misses += 1
+            now = time.time()
+            for staleKey in [k for k, e in self._entries.items()
+                    if e['remote_file'] == remoteFile and e['selection'] == selection]:
+                self._remove(staleKey)
+            self._entries[key] = {
+                'key': key,
+                'remote_file': remoteFile,
+                'size': size,
+                'mtime': mtime,
+                'selection': selection,
+                'bytes': numBytes,
+                'created': now,
+                'atime': now
+            }
+            octree = self._octrees[key] = PointCloudOctree(octreeDir)
+            self._evict(key)
+            self._saveIndex()
+            self._unlock()
+            self._logDebug("Built octree of {0} ({1} points, {2} bytes)".format(remoteFile, octree.numPoints, numBytes))
+        finally:
+            self._releaseKeyLock(key)
+        return octree
+
+    def getStatistics(self):
+        """Return number of hits, misses, evictions, cached octrees and cached bytes."""
+        self._lock()
+        requests = self._hits + self._misses
+        stats = {
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_ratio': (self._hits / requests) if requests > 0 else 0.0,
+            'evictions': self._evictions,
+            'octrees': len(self._entries),
+            'bytes': self._usedBytes()
+        }
+        self._unlock()
+        return stats
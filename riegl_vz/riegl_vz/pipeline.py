@@ -0,0 +1,125 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class PipelineStage(object):
+    def __init__(self, name: str, fn, dependencies):
+        self.name = name
+        self.fn = fn
+        self.dependencies = dependencies
+        self.state = 'pending'
+        self.startTime = None
+        self.endTime = None
+        self.error = None
+
+    def duration(self):
+        if self.startTime is None or self.endTime is None:
+            return None
+        return self.endTime - self.startTime
+
+class Pipeline(object):
+    """Scheduler of a directed acyclic graph of pipeline stages.
+
+       A stage is started as soon as all of its dependencies are done, so
+       independent stages run at the same time. A stage function returns
+       False if the pipeline has to be stopped (e.g. stage canceled), no
+       further stages are started then. Stages depending on a failed stage
+       are skipped, the first error is raised by run() after all running
+       stages have finished.
+
+       Example:
+         pipeline = Pipeline()
+         pipeline.add('rdbx', createRdbx)
+         pipeline.add('register', registerScan)
+         pipeline.add('pose', publishPose, ['register'])
+         pipeline.run()"""
+    def __init__(self, maxWorkers: int = 4, logger=None):
+        self._maxWorkers = maxWorkers
+        self._logger = logger
+        self._stages = {}
+        self._order = []
+        self._stopped = False
+        self._startTime = None
+        self._cond = threading.Condition()
+
+    def add(self, name: str, fn, dependencies=None):
+        """Add stage, the dependencies must have been added before."""
+        if dependencies is None:
+            dependencies = []
+        for dep in dependencies:
+            if dep not in self._stages:
+                raise ValueError("Unknown pipeline stage '{}'".format(dep))
+        stage = PipelineStage(name, fn, list(dependencies))
+        self._stages[name] = stage
+        self._order.append(name)
+        return stage
+
+    def stop(self):
+        """Do not start any further stages."""
+        with self._cond:
+            self._stopped = True
+
+    def stopped(self):
+        with self._cond:
+            return self._stopped
+
+    def _runStage(self, stage: PipelineStage):
+        stage.startTime = time.monotonic()
+        if self._logger:
+            self._logger.debug("Pipeline stage '{}' started".format(stage.name))
+        state = 'done'
+        try:
+            if stage.fn() is False:
+                self.stop()
+                state = 'stopped'
+        except Exception as e:
+            stage.error = e
+            state = 'failed'
+        stage.endTime = time.monotonic()
+        if self._logger:
+            self._logger.info("Pipeline stage '{0}' {1} after {2:.3f} s".format(stage.name, state, stage.duration()))
+        with self._cond:
+            stage.state = state
+            self._cond.notify_all()
+
+    def _nextStages(self):
+        """Return stages ready to start and mark stages with a failed dependency as skipped."""
+        ready = []
+        for name in self._order:
+            stage = self._stages[name]
+            if stage.state != 'pending':
+                continue
+            depStates = [self._stages[dep].state for dep in stage.dependencies]
+            if any(s in ('failed', 'skipped', 'stopped') for s in depStates) or self._stopped:
+                stage.state = 'skipped'
+            elif all(s == 'done' for s in depStates):
+                ready.append(stage)
+        return ready
+
+    def run(self):
+        """Run all stages, blocks until the pipeline is finished or stopped.
+
+           Returns True if all stages are done."""
+        self._startTime = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self._maxWorkers) as executor:
+            with self._cond:
+                while True:
+                    for stage in self._nextStages():
+                        stage.state = 'running'
+                        executor.submit(self._runStage, stage)
+                    if not any(s.state == 'running' for s in self._stages.values()):
+                        break
+                    self._cond.wait()
+        for name in self._order:
+            if self._stages[name].error is not None:
+                raise self._stages[name].error
+        return all(s.state == 'done' for s in self._stages.values())
+
+    def getTimings(self):
+        """Return list of (name, state, start offset, duration) of the stages in seconds."""
+        timings = []
+        for name in self._order:
+            stage = self._stages[name]
+            offset = stage.startTime - self._startTime if stage.startTime is not None and self._startTime is not None else None
+            timings.append((name, stage.state, offset, stage.duration()))
+        return timings
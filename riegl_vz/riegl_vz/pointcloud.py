@@ -0,0 +1,443 @@
+import numpy as np
+
+XYZR_ATTRIBUTES = ['riegl.xyz', 'riegl.reflectance']
+
+# float32 x, y, z, r
+XYZR_DTYPE = np.dtype([
+    ('xyz', np.float32, (3,)),
+    ('r', np.float32)
+])
+
+# packed layout of the voxel point fields, see RieglVz.getVoxels
+VOXEL_DTYPE = np.dtype([
+    ('xyz', np.float64, (3,)),
+    ('r', np.float32),
+    ('point_count', np.uint32),
+    ('pca_axis_min', np.float32, (3,)),
+    ('pca_axis_max', np.float32, (3,)),
+    ('pca_extents', np.float32, (3,)),
+    ('shape_id', np.uint8)
+])
+
+# voxel data field name -> rdb point attribute
+VOXEL_ATTRIBUTES = {
+    'xyz': 'riegl.xyz',
+    'r': 'riegl.reflectance',
+    'point_count': 'riegl.point_count',
+    'pca_axis_min': 'riegl.pca_axis_min',
+    'pca_axis_max': 'riegl.pca_axis_max',
+    'pca_extents': 'riegl.pca_extents',
+    'shape_id': 'riegl.shape_id'
+}
+
+def lodPointStep(lod: int):
+    """Return point step for level of detail (every 2^lod-th point is used)."""
+    return 2 ** lod if lod > 0 else 1
+
+def countPoints(rdb, selection: str = '', chunkSize: int = 100000):
+    """Return number of points in rdb point cloud matching the selection."""
+    if not selection:
+        return rdb.stat.point_count_total
+    numPoints = 0
+    # a select query without bound buffers only counts the points
+    with rdb.select(selection, attributes=[], chunk_size=chunkSize) as query:
+        while True:
+            count = query.next(chunkSize)
+            if count == 0:
+                break
+            numPoints += count
+    return numPoints
+
+def chunkAttribute(points, name: str):
+    """Return attribute data of a rdb point chunk as numpy array."""
+    return points[name].data[:len(points)]
+
+class PointDataBuilder(object):
+    """Builds packed point data of a numpy structured data type.
+
+    The point data buffer is allocated once from the expected number of
+    points and filled chunk by chunk with column assignments."""
+    def __init__(self, dtype, numPoints: int):
+        self.dtype = np.dtype(dtype)
+        self.pointStep = self.dtype.itemsize
+        self.numPoints = 0
+        self.data = bytearray(self.pointStep * numPoints)
+        self._points = np.frombuffer(self.data, dtype=self.dtype)
+
+    def _reserve(self, numPoints):
+        if numPoints > len(self._points):
+            # more points than expected, release view before resizing
+            self._points = None
+            self.data.extend(bytearray(self.pointStep * numPoints - len(self.data)))
+            self._points = np.frombuffer(self.data, dtype=self.dtype)
+
+    def _next(self, count):
+        """Return structured array view for the next count points."""
+        self._reserve(self.numPoints + count)
+        points = self._points[self.numPoints:self.numPoints + count]
+        self.numPoints += count
+        return points
+
+    def finish(self):
+        """Return point data and number of points."""
+        self._points = None
+        del self.data[self.pointStep * self.numPoints:]
+        return self.data, self.numPoints
+
+class XyzrBuilder(PointDataBuilder):
+    """Builds interleaved float32 x, y, z, reflectance point data.
+
+    The level of detail is applied as stride slice with respect to the
+    running point index, so the result equals selecting every 2^lod-th
+    point of the whole point cloud."""
+    itemsize = np.dtype(np.float32).itemsize
+
+    def __init__(self, numTotalPoints: int, lod: int = 0):
+        self.step = lodPointStep(lod)
+        self.numTotalPoints = 0
+        super().__init__(XYZR_DTYPE, -(-numTotalPoints // self.step))
+
+    def add(self, xyz, reflectance):
+        """Add chunk of points to point data."""
+        numChunkPoints = len(reflectance)
+        first = (-self.numTotalPoints) % self.step
+        count = len(range(first, numChunkPoints, self.step))
+        self.numTotalPoints += numChunkPoints
+        if count == 0:
+            return 0
+        points = self._next(count)
+        points['xyz'] = xyz[first::self.step]
+        points['r'] = reflectance[first::self.step]
+        return count
+
+    def addChunk(self, points):
+        """Add rdb point chunk (riegl.rdb.pointbuffer.PointBuffer) to point data."""
+        return self.add(
+            chunkAttribute(points, 'riegl.xyz'),
+            chunkAttribute(points, 'riegl.reflectance'))
+
+class VoxelBuilder(PointDataBuilder):
+    """Builds packed voxel point data (see VOXEL_DTYPE)."""
+    def __init__(self, numPoints: int):
+        super().__init__(VOXEL_DTYPE, numPoints)
+
+    def addChunk(self, points):
+        """Add rdb point chunk (riegl.rdb.pointbuffer.PointBuffer) to voxel data."""
+        count = len(points)
+        voxels = self._next(count)
+        for name, attribute in VOXEL_ATTRIBUTES.items():
+            voxels[name] = chunkAttribute(points, attribute)
+        return count
+
+class VoxelGridBuilder(object):
+    """Builds float32 x, y, z, reflectance point data with one point per voxel grid cell.
+
+    The points are assigned to the cells of a regular grid with edge length
+    voxelSize. A point chunk is reduced to its cells first, the reduced cells
+    are merged with the accumulated cells when their number exceeds the
+    number of accumulated cells, so memory is bounded by the number of
+    occupied cells and not by the number of points.
+
+    Modes:
+      'mean' ... mean coordinates and reflectance of the points of a cell
+      'first' ... first point of a cell
+
+    Cells are keyed by the 21 bit integer cell coordinates, cells further
+    than 2^20 * voxelSize from the origin are aliased."""
+    KEY_BITS = 21
+    MIN_MERGE_CELLS = 1000000
+
+    def __init__(self, voxelSize: float, mode: str = 'mean'):
+        if voxelSize <= 0:
+            raise ValueError("voxel size must be greater than 0")
+        if mode not in ('mean', 'first'):
+            raise ValueError("unknown voxel grid mode '{}'".format(mode))
+        self.voxelSize = voxelSize
+        self.mode = mode
+        self.numTotalPoints = 0
+        self._keys = np.empty(0, dtype=np.int64)
+        self._values = np.empty((0, 4), dtype=np.float64)
+        self._counts = np.empty(0, dtype=np.int64)
+        self._pending = []
+        self._numPending = 0
+
+    def _cellKeys(self, xyz):
+        mask = (1 << self.KEY_BITS) - 1
+        cells = np.floor(xyz / self.voxelSize).astype(np.int64) & mask
+        return (cells[:, 0] << (2 * self.KEY_BITS)) | (cells[:, 1] << self.KEY_BITS) | cells[:, 2]
+
+    def _reduce(self, keys, values, counts):
+        """Return keys, values and counts with one entry per cell, sorted by key."""
+        # stable sort keeps the first point of a cell in front
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        first = np.empty(len(keys), dtype=bool)
+        first[:1] = True
+        np.not_equal(keys[1:], keys[:-1], out=first[1:])
+        starts = np.flatnonzero(first)
+        if self.mode == 'mean':
+            values = np.add.reduceat(values[order], starts, axis=0)
+        else:
+            values = values[order][starts]
+        counts = np.add.reduceat(counts[order], starts)
+        return keys[starts], values, counts
+
+    def _merge(self):
+        if not self._pending:
+            return
+        keys, values, counts = zip(*self._pending)
+        self._keys, self._values, self._counts = self._reduce(
+            np.concatenate((self._keys,) + keys),
+            np.concatenate((self._values,) + values),
+            np.concatenate((self._counts,) + counts))
+        self._pending = []
+        self._numPending = 0
+
+    def add(self, xyz, reflectance):
+        """Add chunk of points to the voxel grid."""
+        numChunkPoints = len(reflectance)
+        self.numTotalPoints += numChunkPoints
+        if numChunkPoints == 0:
+            return
+        values = np.empty((numChunkPoints, 4), dtype=np.float64)
+        values[:, :3] = xyz
+        values[:, 3] = reflectance
+        cells = self._reduce(self._cellKeys(values[:, :3]), values, np.ones(numChunkPoints, dtype=np.int64))
+        self._pending.append(cells)
+        self._numPending += len(cells[0])
+        if self._numPending >= max(len(self._keys), self.MIN_MERGE_CELLS):
+            self._merge()
+
+    def addChunk(self, points):
+        """Add rdb point chunk (riegl.rdb.pointbuffer.PointBuffer) to the voxel grid."""
+        return self.add(
+            chunkAttribute(points, 'riegl.xyz'),
+            chunkAttribute(points, 'riegl.reflectance'))
+
+    def finish(self):
+        """Return interleaved xyzr data and number of points (one point per cell)."""
+        self._merge()
+        values = self._values
+        if self.mode == 'mean':
+            values = values / self._counts[:, None]
+        builder = PointDataBuilder(XYZR_DTYPE, len(values))
+        points = builder._next(len(values))
+        points['xyz'] = values[:, :3]
+        points['r'] = values[:, 3]
+        del points
+        self._keys = np.empty(0, dtype=np.int64)
+        self._values = np.empty((0, 4), dtype=np.float64)
+        self._counts = np.empty(0, dtype=np.int64)
+        return builder.finish()
+
+class PointCloudQuery(object):
+    """Region of interest and range gate of a point cloud request.
+
+    Points are selected within an axis aligned box of the query frame,
+    within a radius around a center point, within a range interval from
+    the scanner origin and within a reflectance window. frameToSocs is the
+    4x4 matrix transforming query frame coordinates to SOCS (None if the
+    query frame is SOCS), so the box may be an oriented box in SOCS.
+
+    The axis aligned SOCS bounds of all conditions and the reflectance
+    window are passed to the rdb select filter, so the rdb library skips
+    the points outside, the exact tests are vectorized with NumPy."""
+    def __init__(self, frameToSocs = None):
+        self.frameToSocs = None if frameToSocs is None else np.asarray(frameToSocs, dtype=np.float64)
+        self.box = None
+        self.center = None
+        self.radius = 0.0
+        self.minRange = 0.0
+        self.maxRange = 0.0
+        self.reflectance = None
+
+    def _toSocs(self, xyz):
+        xyz = np.asarray(xyz, dtype=np.float64)
+        if self.frameToSocs is None:
+            return xyz
+        return xyz @ self.frameToSocs[:3, :3].T + self.frameToSocs[:3, 3]
+
+    def _toFrame(self, xyz):
+        xyz = np.asarray(xyz, dtype=np.float64)
+        if self.frameToSocs is None:
+            return xyz
+        # inverse of the rigid transformation
+        return (xyz - self.frameToSocs[:3, 3]) @ self.frameToSocs[:3, :3]
+
+    def setBox(self, boxMin, boxMax):
+        """Select points within axis aligned box of the query frame."""
+        self.box = (np.minimum(boxMin, boxMax).astype(np.float64), np.maximum(boxMin, boxMax).astype(np.float64))
+
+    def setRadius(self, center, radius: float):
+        """Select points within radius around center point of the query frame."""
+        self.center = self._toSocs(center)
+        self.radius = float(radius)
+
+    def setRange(self, minRange: float, maxRange: float):
+        """Select points within range interval, a maximum range of 0 is no limit."""
+        self.minRange = float(minRange)
+        self.maxRange = float(maxRange)
+
+    def setReflectance(self, minReflectance: float, maxReflectance: float):
+        """Select points within reflectance window in dB."""
+        self.reflectance = (float(min(minReflectance, maxReflectance)), float(max(minReflectance, maxReflectance)))
+
+    def isEmpty(self):
+        """Return True if no condition is set."""
+        return (self.box is None and self.center is None and self.reflectance is None
+            and self.minRange <= 0 and self.maxRange <= 0)
+
+    def bounds(self):
+        """Return axis aligned bounds (min xyz, max xyz) of the region in SOCS or None."""
+        boxMin = np.full(3, -np.inf)
+        boxMax = np.full(3, np.inf)
+        if self.box is not None:
+            corners = np.array([[self.box[i][0], self.box[j][1], self.box[k][2]]
+                for i in (0, 1) for j in (0, 1) for k in (0, 1)])
+            corners = self._toSocs(corners)
+            boxMin = np.maximum(boxMin, corners.min(axis=0))
+            boxMax = np.minimum(boxMax, corners.max(axis=0))
+        if self.center is not None:
+            boxMin = np.maximum(boxMin, self.center - self.radius)
+            boxMax = np.minimum(boxMax, self.center + self.radius)
+        if self.maxRange > 0:
+            boxMin = np.maximum(boxMin, -self.maxRange)
+            boxMax = np.minimum(boxMax, self.maxRange)
+        if not np.any(np.isfinite(boxMin) | np.isfinite(boxMax)):
+            return None
+        return boxMin, boxMax
+
+    def selection(self, selection: str = ''):
+        """Return rdb point filter of the selection combined with the bounds and the reflectance window."""
+        conditions = ['({})'.format(selection)] if selection else []
+        bounds = self.bounds()
+        if bounds is not None:
+            for i in range(3):
+                if np.isfinite(bounds[0][i]):
+                    conditions.append('(riegl.xyz[{0}] >= {1!r})'.format(i, float(bounds[0][i])))
+                if np.isfinite(bounds[1][i]):
+                    conditions.append('(riegl.xyz[{0}] <= {1!r})'.format(i, float(bounds[1][i])))
+        if self.reflectance is not None:
+            conditions.append('(riegl.reflectance >= {!r})'.format(self.reflectance[0]))
+            conditions.append('(riegl.reflectance <= {!r})'.format(self.reflectance[1]))
+        return ' && '.join(conditions)
+
+    def mask(self, xyz, reflectance):
+        """Return boolean array of the points matching all conditions."""
+        mask = np.ones(len(reflectance), dtype=bool)
+        if len(reflectance) == 0:
+            return mask
+        xyz = np.asarray(xyz, dtype=np.float64)
+        if self.box is not None:
+            frameXyz = self._toFrame(xyz)
+            mask &= np.all((frameXyz >= self.box[0]) & (frameXyz <= self.box[1]), axis=1)
+        if self.center is not None:
+            d = xyz - self.center
+            mask &= np.einsum('ij,ij->i', d, d) <= self.radius * self.radius
+        if self.minRange > 0 or self.maxRange > 0:
+            rangeSq = np.einsum('ij,ij->i', xyz, xyz)
+            if self.minRange > 0:
+                mask &= rangeSq >= self.minRange * self.minRange
+            if self.maxRange > 0:
+                mask &= rangeSq <= self.maxRange * self.maxRange
+        if self.reflectance is not None:
+            mask &= (reflectance >= self.reflectance[0]) & (reflectance <= self.reflectance[1])
+        return mask
+
+    def apply(self, xyz, reflectance):
+        """Return coordinates and reflectance of the points matching all conditions."""
+        mask = self.mask(xyz, reflectance)
+        return xyz[mask], reflectance[mask]
+
+def buildXyzrVoxelGridData(rdb, selection: str = '', voxelSize: float = 0.1, mode: str = 'mean', chunkSize: int = 100000, query: PointCloudQuery = None):
+    """Read points from rdb point cloud and return voxel grid downsampled xyzr data and number of points."""
+    builder = VoxelGridBuilder(voxelSize, mode)
+    if query is not None:
+        selection = query.selection(selection)
+    for points in rdb.select(selection, attributes=XYZR_ATTRIBUTES, chunk_size=chunkSize):
+        if query is None:
+            builder.addChunk(points)
+        else:
+            builder.add(*query.apply(
+                chunkAttribute(points, 'riegl.xyz'),
+                chunkAttribute(points, 'riegl.reflectance')))
+    return builder.finish()
+
+def transformXyzrData(data, numPoints: int, matrix, chunkPoints: int = 1000000):
+    """Transform coordinates of interleaved xyzr data in place with a 4x4 matrix.
+
+    Each chunk of points is transformed with one matrix multiplication in
+    float64 and rounded to float32 once, so large translations do not
+    accumulate float32 errors."""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    rotation = matrix[:3, :3].T
+    translation = matrix[:3, 3]
+    points = np.frombuffer(data, dtype=XYZR_DTYPE, count=numPoints)
+    for start in range(0, numPoints, chunkPoints):
+        xyz = points['xyz'][start:start + chunkPoints]
+        xyz[...] = xyz.astype(np.float64) @ rotation + translation
+        del xyz
+    del points
+
+def splitXyzrData(data, numPoints: int, chunkPoints: int):
+    """Yield xyzr data in chunks of at most chunkPoints points (data, number of points)."""
+    pointStep = XYZR_DTYPE.itemsize
+    for start in range(0, numPoints, chunkPoints):
+        count = min(chunkPoints, numPoints - start)
+        yield data[start * pointStep:(start + count) * pointStep], count
+
+def buildXyzrData(rdb, selection: str = '', lod: int = 0, chunkSize: int = 100000, query: PointCloudQuery = None):
+    """Read points from rdb point cloud and return interleaved xyzr data and number of points.
+
+    With a query the level of detail is applied to the points matching the query."""
+    if query is not None:
+        selection = query.selection(selection)
+    builder = XyzrBuilder(countPoints(rdb, selection, chunkSize), lod)
+    for points in rdb.select(selection, attributes=XYZR_ATTRIBUTES, chunk_size=chunkSize):
+        if query is None:
+            builder.addChunk(points)
+        else:
+            builder.add(*query.apply(
+                chunkAttribute(points, 'riegl.xyz'),
+                chunkAttribute(points, 'riegl.reflectance')))
+    return builder.finish()
+
+def countXyzrChunks(rdb, selection: str = '', lod: int = 0, chunkPoints: int = 1000000, chunkSize: int = 100000):
+    """Return number of chunks yielded by iterXyzrChunks."""
+    numPoints = -(-countPoints(rdb, selection, chunkSize) // lodPointStep(lod))
+    return -(-numPoints // chunkPoints)
+
+def iterXyzrChunks(rdb, selection: str = '', lod: int = 0, chunkPoints: int = 1000000, chunkSize: int = 100000):
+    """Read points from rdb point cloud and yield interleaved xyzr data in chunks.
+
+    Yields (data, number of points) with at most chunkPoints points per
+    chunk while the rdb query is running, so only one chunk is held in
+    memory. The level of detail is applied as in XyzrBuilder."""
+    step = lodPointStep(lod)
+    numTotalPoints = 0
+    builder = PointDataBuilder(XYZR_DTYPE, chunkPoints)
+    for points in rdb.select(selection, attributes=XYZR_ATTRIBUTES, chunk_size=chunkSize):
+        first = (-numTotalPoints) % step
+        numTotalPoints += len(points)
+        xyz = chunkAttribute(points, 'riegl.xyz')[first::step]
+        reflectance = chunkAttribute(points, 'riegl.reflectance')[first::step]
+        while len(reflectance) > 0:
+            count = min(len(reflectance), chunkPoints - builder.numPoints)
+            chunk = builder._next(count)
+            chunk['xyz'] = xyz[:count]
+            chunk['r'] = reflectance[:count]
+            del chunk
+            xyz = xyz[count:]
+            reflectance = reflectance[count:]
+            if builder.numPoints == chunkPoints:
+                yield builder.finish()
+                builder = PointDataBuilder(XYZR_DTYPE, chunkPoints)
+    if builder.numPoints > 0:
+        yield builder.finish()
+
+def buildVoxelData(rdb, chunkSize: int = 100000):
+    """Read voxels from rdb point cloud and return packed voxel data and number of voxels."""
+    builder = VoxelBuilder(countPoints(rdb, '', chunkSize))
+    for points in rdb.select('', attributes=list(VOXEL_ATTRIBUTES.values()), chunk_size=chunkSize):
+        builder.addChunk(points)
+    return builder.finish()
@@ -210,39 +210,39 @@ def readPop(popPath):
 
     return pop
 
-def extractSopv(data, logger = None):
-    """Extract scanposition information from all_sopv.csv data entry."""
+def parseSopv(data):
+    """Return (seq, x, y, z, roll, pitch, yaw) of all_sopv.csv data entry, angles in radians."""
     deg = math.pi / 180.0
-    obj = {
-        'name': data[0],
-        'x': float(data[1]),
-        'y': float(data[2]),
-        'z': float(data[3]),
-        'roll': float(data[4])*deg,
-        'pitch': float(data[5])*deg,
-        'yaw': float(data[6])*deg
-    }
-    if logger is not None:
-        logger.debug("sopv (x y z yaw pitch roll)= {0} {1} {2} {3} {4} {5}".format(
-            obj['x'],
-            obj['y'],
-            obj['z'],
-            obj['yaw'],
-            obj['pitch'],
-            obj['roll']))
+    return (
+        int(data[0]),
+        float(data[1]),
+        float(data[2]),
+        float(data[3]),
+        float(data[4])*deg,
+        float(data[5])*deg,
+        float(data[6])*deg)
+
+def buildSopv(seq, x, y, z, roll, pitch, yaw):
+    """Return scanposition pose message in VOCS."""
     pose = PoseStamped()
     pose.header = Header(
         frame_id = 'riegl_vz_vocs',
         stamp = builtin_msgs.Time(sec = 0, nanosec = 0)
         )
     pose.pose = Pose(
-        position = Point(x=float(obj['x']), y=float(obj['y']), z=float(obj['z'])),
-        orientation = quaternionFromEuler(float(obj['roll']), float(obj['pitch']), float(obj['yaw']))
+        position = Point(x=float(x), y=float(y), z=float(z)),
+        orientation = quaternionFromEuler(float(roll), float(pitch), float(yaw))
         )
 
-    sopv = ScanPose(seq = int(obj['name']), pose = pose)
+    return ScanPose(seq = int(seq), pose = pose)
 
-    return sopv
+def extractSopv(data, logger = None):
+    """Extract scanposition information from all_sopv.csv data entry."""
+    seq, x, y, z, roll, pitch, yaw = parseSopv(data)
+    if logger is not None:
+        logger.debug("sopv (x y z yaw pitch roll)= {0} {1} {2} {3} {4} {5}".format(
+            x, y, z, yaw, pitch, roll))
+    return buildSopv(seq, x, y, z, roll, pitch, yaw)
 
 def readAllSopv(sopvFilepath, logger = None):
     """Return information of all registered scanposes in VOCS."""
@@ -256,6 +256,79 @@ def readAllSopv(sopvFilepath, logger = None):
             sopvs.append(extractSopv(line.split(','), logger))
     return sopvs
 
+class ScanPoseTable(object):
+    """Scan position poses in VOCS stored in a NumPy table.
+
+       The rows (seq, x, y, z, roll, pitch, yaw with angles in radians) are
+       indexed by the scan position number, ScanPose messages are built on
+       demand only."""
+    dtype = np.dtype([
+        ('seq', np.int32),
+        ('x', np.float64),
+        ('y', np.float64),
+        ('z', np.float64),
+        ('roll', np.float64),
+        ('pitch', np.float64),
+        ('yaw', np.float64)
+    ])
+
+    def __init__(self):
+        self._data = np.empty(16, dtype=self.dtype)
+        self._size = 0
+        self._index = {}
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def table(self):
+        """Return view of the rows."""
+        return self._data[:self._size]
+
+    def truncate(self, size: int):
+        """Remove rows from index size on."""
+        if size >= self._size:
+            return
+        removed = set(int(seq) for seq in self._data['seq'][size:self._size])
+        self._size = size
+        for seq in removed:
+            rows = np.flatnonzero(self.table['seq'] == seq)
+            if len(rows):
+                self._index[seq] = int(rows[-1])
+            else:
+                del self._index[seq]
+
+    def append(self, rows):
+        """Append list of (seq, x, y, z, roll, pitch, yaw) tuples."""
+        if not rows:
+            return
+        size = self._size + len(rows)
+        if size > len(self._data):
+            data = np.empty(max(size, 2 * len(self._data)), dtype=self.dtype)
+            data[:self._size] = self._data[:self._size]
+            self._data = data
+        self._data[self._size:size] = rows
+        for i, row in enumerate(rows, self._size):
+            self._index[row[0]] = i
+        self._size = size
+
+    def _build(self, i):
+        row = self._data[i]
+        return buildSopv(row['seq'], row['x'], row['y'], row['z'], row['roll'], row['pitch'], row['yaw'])
+
+    def get(self, seq: int):
+        """Return ScanPose of scan position number or None."""
+        i = self._index.get(seq)
+        return self._build(i) if i is not None else None
+
+    def last(self):
+        """Return ScanPose of the last row or None."""
+        return self._build(self._size - 1) if self._size > 0 else None
+
+    def all(self):
+        """Return list of ScanPose of all rows."""
+        return [self._build(i) for i in range(self._size)]
+
 def readTpl(tplFilepath, logger = None):
     """Return information of all tie points in a scanposition."""
     tpl = []
@@ -305,6 +378,20 @@ def getTransformFromArray(ts, parent_frame_id, child_frame_id, pose):
     t.transform.rotation = quaternionFromEuler(pose[3], pose[4], pose[5])
     return t
 
+def getMatrixFromPose(pose):
+    """Return 4x4 transformation matrix of pose (geometry_msgs/Pose)."""
+    M = np.eye(4)
+    M[:3, :3] = quaternionToRotationMatrix(pose.orientation)
+    M[:3, 3] = [pose.position.x, pose.position.y, pose.position.z]
+    return M
+
+def getMatrixFromTransform(transform):
+    """Return 4x4 transformation matrix of tf2 transform (geometry_msgs/Transform)."""
+    M = np.eye(4)
+    M[:3, :3] = quaternionToRotationMatrix(transform.rotation)
+    M[:3, 3] = [transform.translation.x, transform.translation.y, transform.translation.z]
+    return M
+
 def calcRelativePose(pose1, pose2):
     # Wenn wir die 4x4-Matrizen (S1, S2) hätten, würde man die relative Pose wie folgt erhalten:
     # M_rel = (S1)^(-1) * S2
@@ -0,0 +1,153 @@
+import array
+import zlib
+import threading
+
+from sensor_msgs.msg import Image
+import std_msgs.msg as std_msgs
+
+import riconnect
+from vzi_services.previewgenservice import PreviewgenService
+
+class RieglVzPreview():
+    """Publisher of the scan preview image during data acquisition.
+
+       The preview is fetched from the PreviewgenService at the configured
+       rate while the scanner is scanning. The service client is connected
+       with a connection factory of its own instead of the shared service
+       registry, so the image transfers do not delay the service calls of the
+       scan thread. Frames which have not changed since the last published
+       frame are skipped. The preview generation is started at the begin of
+       the acquisition if it is not running yet. After an error the
+       connection is closed and reopened with an increasing delay.
+
+       Modes:
+         'rgb' ... preview image, encoding 'rgb8'
+         'reflectance' ... reflectance values 0-250, 254 for reflectors and
+                           255 for no echo, encoding 'mono8'"""
+    def __init__(self, node, status):
+        self._node = node
+        self._hostname = node.hostname
+        self._connectionString = self._hostname + ':20000'
+        self._logger = node.get_logger()
+        self._status = status
+        self._mode = node.previewMode
+        self._period = 1.0 / node.previewRate if node.previewRate > 0 else 1.0
+        self._previewSvc = None
+        self._lastCrc = None
+        self._frames = 0
+        self._skipped = 0
+        self._errors = 0
+        self._shutdownReq = threading.Event()
+        self._threadLock = threading.Lock()
+
+        self._thread = threading.Thread(target=self._threadFunc, args=())
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _lock(self):
+        self._threadLock.acquire()
+
+    def _unlock(self):
+        self._threadLock.release()
+
+    def _connect(self):
+        if self._previewSvc is None:
+            self._previewSvc = PreviewgenService(self._connectionString, connectionFactory=riconnect.ConnectionFactory())
+        return self._previewSvc
+
+    def _disconnect(self):
+        previewSvc = self._previewSvc
+        self._previewSvc = None
+        if previewSvc is not None:
+            try:
+                previewSvc._svc.close()
+            except:
+                pass
+
+    def _startPreview(self):
+        previewSvc = self._connect()
+        if not previewSvc.isRunning():
+            self._logger.debug("Starting scan preview generation.")
+            previewSvc.generatePreview()
+
+    def _fetch(self):
+        self._connect()
+        if self._mode == 'reflectance':
+            width, height, widthScale, heightScale, data = self._previewSvc.getReflectance(0)
+            return 'mono8', 1, width, height, data
+        width, height, widthScale, heightScale, data = self._previewSvc.getPreview(0)
+        return 'rgb8', 3, width, height, data
+
+    def _publishFrame(self):
+        encoding, bytesPerPixel, width, height, data = self._fetch()
+        if width == 0 or height == 0 or len(data) < width * height * bytesPerPixel:
+            return
+        crc = zlib.crc32(data)
+        self._lock()
+        unchanged = (crc == self._lastCrc)
+        self._lastCrc = crc
+        if unchanged:
+            self._skipped += 1
+        else:
+            self._frames += 1
+        self._unlock()
+        if unchanged:
+            return
+        # an array.array is taken over by the message without per element conversion,
+        # bytes would be checked and converted element by element by the message
+        pixels = array.array('B')
+        pixels.frombytes(data)
+        msg = Image(
+            header = std_msgs.Header(frame_id = 'riegl_vz_socs', stamp = self._node.get_clock().now().to_msg()),
+            height = height,
+            width = width,
+            encoding = encoding,
+            is_bigendian = 0,
+            step = width * bytesPerPixel)
+        msg.data = pixels
+        self._node.previewPublisher.publish(msg)
+
+    def _threadFunc(self):
+        while not self._shutdownReq.is_set():
+            if not self._status.waitForOpstate(lambda opstate: opstate == 'scanning', timeout=1.0):
+                continue
+            self._lock()
+            self._lastCrc = None
+            self._unlock()
+            started = False
+            failures = 0
+            while not self._shutdownReq.is_set():
+                scanning = (self._status.getScannerStatus().opstate == 'scanning')
+                try:
+                    if not started:
+                        self._startPreview()
+                        started = True
+                    self._publishFrame()
+                    failures = 0
+                except:
+                    self._disconnect()
+                    failures += 1
+                    self._lock()
+                    self._errors += 1
+                    self._unlock()
+                    self._logger.debug("Scan preview is not available!")
+                # the final preview is published after the acquisition
+                if not scanning:
+                    break
+                # back off while the preview service is not available
+                self._shutdownReq.wait(min(self._period * 2 ** failures, 10.0))
+
+    def getStatistics(self):
+        """Return number of published and skipped unchanged preview frames and errors."""
+        self._lock()
+        stats = {
+            'frames': self._frames,
+            'skipped': self._skipped,
+            'errors': self._errors
+        }
+        self._unlock()
+        return stats
+
+    def shutdown(self):
+        self._shutdownReq.set()
+        self._disconnect()
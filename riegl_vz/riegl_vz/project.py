@@ -1,15 +1,23 @@
 import sys
 import os
 import time
+import threading
 from os.path import join, basename
 
 from rclpy.node import Node
 
 from vzi_services.projectservice import ProjectService
 from vzi_services.dataprocservice import DataprocService
+from vzi_services.registry import getService
 from .ssh import RieglVzSSH
 
 class RieglVzProject():
+    """Access to the projects on the scanner.
+
+       The active project path, the storage media, the project paths and the
+       scan ids of the scan positions are cached. The cache is invalidated by
+       the projectChanged, scanpositionChanged and storageMediaChanged signals
+       of the project service and by loadProject() and createProject()."""
     def __init__(self, node):
         self._node = node
         self._hostname = node.hostname
@@ -18,31 +26,154 @@ class RieglVzProject():
 
         self._ssh: RieglVzSSH = RieglVzSSH(self._node)
 
+        self._cache = {}
+        self._cacheSvc = None
+        self._cacheSigcons = []
+        self._cacheHits = 0
+        self._cacheMisses = 0
+        self._cacheInvalidations = 0
+        self._threadLock = threading.Lock()
+
+    def _lock(self):
+        self._threadLock.acquire()
+
+    def _unlock(self):
+        self._threadLock.release()
+
+    def _onProjectChanged(self, arg0):
+        self._logger.debug("project changed: {}".format(arg0))
+        self.invalidate()
+
+    def _onStorageMediaChanged(self, arg0):
+        self._logger.debug("storage media changed: {}".format(arg0))
+        self.invalidate()
+
+    def _onScanpositionChanged(self, arg0):
+        self._logger.debug("scan position changed: {}".format(arg0))
+        self.invalidate(scanIdsOnly=True)
+
+    def _connectCache(self, projSvc):
+        """Subscribe the invalidation signals, returns False if values must not be cached.
+
+           The cache is reset if the project service client has been replaced,
+           signals of the previous connection may have been missed."""
+        if projSvc is self._cacheSvc:
+            return True
+        for sigcon in self._cacheSigcons:
+            sigcon.disconnect()
+        self._cacheSigcons = []
+        self._cache = {}
+        self._cacheSvc = None
+        try:
+            self._cacheSigcons = [
+                projSvc.projectChanged().connect(self._onProjectChanged),
+                projSvc.storageMediaChanged().connect(self._onStorageMediaChanged),
+                projSvc.scanpositionChanged().connect(self._onScanpositionChanged)
+            ]
+            self._cacheSvc = projSvc
+        except:
+            self._logger.warning("Project service signals are not available, project data is not cached!")
+            for sigcon in self._cacheSigcons:
+                sigcon.disconnect()
+            self._cacheSigcons = []
+            return False
+        return True
+
+    def _cached(self, key, fn):
+        """Return cached value of key or the result of fn(), which is cached unless it is None."""
+        projSvc = getService(ProjectService, self._connectionString)
+        self._lock()
+        cacheable = self._connectCache(projSvc)
+        if cacheable and key in self._cache:
+            self._cacheHits += 1
+            value = self._cache[key]
+            self._unlock()
+            return value
+        self._cacheMisses += 1
+        generation = self._cacheInvalidations
+        self._unlock()
+        value = fn(projSvc)
+        self._lock()
+        # a value fetched during an invalidation may already be outdated
+        if cacheable and value is not None and generation == self._cacheInvalidations:
+            self._cache[key] = value
+        self._unlock()
+        return value
+
+    def invalidate(self, scanIdsOnly: bool = False, scanposition: str = None):
+        """Clear cached project data.
+
+           Arguments:
+             scanIdsOnly: clear the scan ids of the scan positions only
+             scanposition: clear the scan id of this scan position only"""
+        self._lock()
+        if scanposition is not None:
+            self._cache.pop(('scanId', scanposition), None)
+        elif scanIdsOnly:
+            self._cache = {k: v for k, v in self._cache.items() if k[0] != 'scanId'}
+        else:
+            self._cache = {}
+        self._cacheInvalidations += 1
+        self._unlock()
+
+    def getCacheStatistics(self):
+        """Return hits, misses and invalidations of the project data cache."""
+        self._lock()
+        lookups = self._cacheHits + self._cacheMisses
+        stats = {
+            'hits': self._cacheHits,
+            'misses': self._cacheMisses,
+            'hit_ratio': self._cacheHits / lookups if lookups else 0.0,
+            'invalidations': self._cacheInvalidations,
+            'entries': len(self._cache)
+        }
+        self._unlock()
+        return stats
+
     def loadProject(self, projectName: str, storageMedia: int):
+        self.invalidate()
         try:
-            projSvc = ProjectService(self._connectionString)
+            projSvc = getService(ProjectService, self._connectionString)
             projSvc.setStorageMedia(storageMedia)
             projSvc.loadProject(projectName);
         except:
             self._logger.error("Loading of project '{}' failed!".format(projectName))
             return False
+        finally:
+            self.invalidate()
         return True
 
     def createProject(self, projectName: str, storageMedia: int):
+        self.invalidate()
         try:
-            projSvc = ProjectService(self._connectionString)
+            projSvc = getService(ProjectService, self._connectionString)
             projSvc.setStorageMedia(storageMedia)
             projSvc.createProject(projectName)
             projSvc.loadProject(projectName);
         except:
             self._logger.error("Creating project '{}' failed!".format(projectName))
             return False
+        finally:
+            self.invalidate()
+        return True
+
+    def selectScanposition(self, scanposName: str):
+        """Create scan position in the active project if necessary and select it."""
+        try:
+            projSvc = getService(ProjectService, self._connectionString)
+            projSvc.createScanposition(scanposName)
+            projSvc.selectScanposition(scanposName)
+        except:
+            self._logger.error("Selecting scan position '{}' failed!".format(scanposName))
+            return False
+        finally:
+            self.invalidate(scanIdsOnly=True)
         return True
 
     def getProjectName(self):
         projectName = None
         try:
-            projSvc = ProjectService(self._connectionString)
+            projSvc = getService(ProjectService, self._connectionString)
             projectName = projSvc.projectName()
         except:
             self._logger.error("Get project name failed!")
@@ -60,20 +191,18 @@ class RieglVzProject():
         return path
 
     def getActiveProjectPath(self):
-        projSvc = ProjectService(self._connectionString)
-        path = projSvc.projectPath()
+        path = self._cached(('projectPath',), lambda projSvc: projSvc.projectPath())
         #self._logger.info("getActiveProjectPath = {}".format(path))
         return path
 
     def _getProjectPath(self, projectName: str, storageMedia: int):
-        projSvc = ProjectService(self._connectionString)
-        projectPath = projSvc.projectPath(storageMedia, projectName)
-        return projectPath
+        return self._cached(('projectPath', storageMedia, projectName),
+            lambda projSvc: projSvc.projectPath(storageMedia, projectName))
 
     def _getCurrentScanpos(self, projectName: str, storageMedia: int):
         self._logger.debug("get next scanpos: projectName={}, storageMedia={}".format(projectName, storageMedia))
         cmd = ["ls -1", self._getProjectPath(projectName, storageMedia), " | sort -n", " | grep '.SCNPOS'", " | sed 's/.SCNPOS//g'", " | sed 's/ScanPos//g'", " | tail -n 1"]
-        response = self._ssh.executeCommand(' '.join(cmd))
+        response = self._ssh.executeCommand(' '.join(cmd), retry=True)
 
         if len(response) == 0:
             return 0
@@ -95,14 +224,16 @@ class RieglVzProject():
 
     def getScanId(self, scanposName: str):
         if int(scanposName) == 0:
-            procSvc = DataprocService(self._connectionString)
+            procSvc = getService(DataprocService, self._connectionString)
             return procSvc.actualFile(0)
 
-        scanposPath = self.getActiveScanposPath(scanposName) + '/scans'
-        cmd = ["ls -t", scanposPath + "/*.rxp"]
-        response = self._ssh.executeCommand(' '.join(cmd))
-
-        if len(response) == 0:
-            return 'null'
+        def lookup(projSvc):
+            scanposPath = self.getActiveScanposPath(scanposName) + '/scans'
+            cmd = ["ls -t", scanposPath + "/*.rxp"]
+            response = self._ssh.executeCommand(' '.join(cmd), retry=True)
+            if len(response) == 0:
+                return None
+            return (scanposPath + '/' + os.path.basename(response[0]).split('.')[0] + '.rxp').replace('/media/', '')
 
-        return (scanposPath + '/' + os.path.basename(response[0]).split('.')[0] + '.rxp').replace('/media/', '')
+        scanId = self._cached(('scanId', scanposName), lookup)
+        return scanId if scanId is not None else 'null'
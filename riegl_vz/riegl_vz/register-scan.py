@@ -4,19 +4,31 @@ import sys
 import argparse
 import json
 import signal
-import time
-from threading import Event
+from threading import Event, Condition, RLock
 from vzi_services.projectservice import ProjectService
 from vzi_services.controlservice import ControlService
 
 class SignalHandler(object):
     def __init__(self):
         self.canceled = False
+        # reentrant, the signal handler runs in the thread which may hold the lock
+        self._cond = Condition(RLock())
         signal.signal(signal.SIGINT, self._handleSignal)
         signal.signal(signal.SIGTERM, self._handleSignal)
 
     def _handleSignal(self, signal_number, frame):
         self.canceled = True
+        self.wakeup()
+
+    def wakeup(self):
+        """Wake up waitUntil() to re-evaluate its predicate."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def waitUntil(self, predicate):
+        """Block until predicate() is true or canceled."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.canceled or predicate())
 
 def registerScanposition(sigHandler, ctrlSvc, media, project, scanposition, mode, waitUntilFinished = True):
     """Register scanposition. Blocks until registration is finished."""
@@ -28,13 +40,12 @@ def registerScanposition(sigHandler, ctrlSvc, media, project, scanposition, mode
             obj = json.loads(arg0)
             if obj.get('id') == taskId:
                 finishedEvent.set()
+                sigHandler.wakeup()
 
         sigcon = ctrlSvc.backgroundTaskRemoved().connect(onBackgroundTaskRemoved)
         taskId = ctrlSvc.addRegistrationTask(media, project, scanposition, mode)
-        while not sigHandler.canceled:
-            if finishedEvent.is_set():
-                break
-            time.sleep(0.2)
+        sigHandler.waitUntil(finishedEvent.is_set)
+        sigcon.disconnect()
         if sigHandler.canceled:
             try:
                 if taskId:
@@ -42,8 +53,6 @@ def registerScanposition(sigHandler, ctrlSvc, media, project, scanposition, mode
             except Exception:
                 pass
             return False
-
-        sigcon.disconnect()
     else:
         ctrlSvc.addRegistrationTask(media, project, scanposition, mode)
 
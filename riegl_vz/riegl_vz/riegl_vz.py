@@ -1,10 +1,9 @@
 import sys
 import os
-import time
 import json
 import math
+import copy
 from datetime import datetime
-import subprocess
 import threading
 import numpy as np
 from os.path import join, dirname, basename, abspath
@@ -35,6 +34,7 @@ import std_msgs.msg as std_msgs
 import builtin_interfaces.msg as builtin_msgs
 
 from rclpy.node import Node
+from rclpy.time import Time
 
 import riegl.rdb
 
@@ -43,16 +43,19 @@ from vzi_services.interfaceservice import InterfaceService
 from vzi_services.projectservice import ProjectService
 from vzi_services.scannerservice import ScannerService
 from vzi_services.geosysservice import GeoSysService
+from vzi_services.registry import getService
 
 from riegl_vz_interfaces.msg import (
-    Voxels
+    Voxels,
+    PointCloudChunk
 )
 from .pose import (
     readVop,
     readPop,
-    readAllSopv,
     readTpl,
     getTransformFromPose,
+    getMatrixFromPose,
+    getMatrixFromTransform,
     calcRelativePose,
     calcRelativeCovariances,
     eulerFromQuaternion, quaternionFromEuler
@@ -60,12 +63,30 @@ from .pose import (
 from .tf2_geometry_msgs import (
     do_transform_pose
 )
+from .pointcloud import (
+    XyzrBuilder,
+    buildXyzrData,
+    buildXyzrVoxelGridData,
+    countXyzrChunks,
+    iterXyzrChunks,
+    splitXyzrData,
+    transformXyzrData,
+    VoxelGridBuilder,
+    PointCloudQuery,
+    buildVoxelData
+)
 from .project import RieglVzProject
 from .status import RieglVzStatus
 from .geosys import RieglVzGeoSys
+from .preview import RieglVzPreview
 from .ssh import RieglVzSSH
+from .cache import FileCache
+from .octree import buildOctree
+from .sopv import SopvReader
+from .stages import RieglVzStages
+from .pipeline import Pipeline
+from .jobs import ScanJobQueue
 from .utils import (
-    SubProcess,
     parseCSV
 )
 
@@ -81,6 +102,17 @@ class ScanPattern(object):
         self.frameIncrement = 0.04
         self.measProgram = 3
 
+class PointCloudSettings(object):
+    """Settings of the point clouds of a scan position, fixed when the scan is submitted."""
+    def __init__(self, filter: str = '', lod: int = 0, voxelSize: float = 0.0, chunkSize: int = 0,
+                 frame: str = 'riegl_vz_socs', origin = (0.0, 0.0, 0.0)):
+        self.filter = filter
+        self.lod = max(lod, 0)
+        self.voxelSize = voxelSize
+        self.chunkSize = chunkSize
+        self.frame = frame
+        self.origin = list(origin)
+
 class PositionWithCovariance(object):
     def __init__(self, position, covariance):
         self.position = position
@@ -147,34 +179,105 @@ class RieglVz():
         self._yawAngle = None
         self._position = None
         self._imuRelPose = ImuRelativePose()
-        self._stopReq = False
         self._shutdownReq = False
         self._project: RieglVzProject = RieglVzProject(self._node)
         self._status: RieglVzStatus = RieglVzStatus(self._node)
         self.geosys: RieglVzGeoSys = RieglVzGeoSys(self._node)
+        self.preview: RieglVzPreview = RieglVzPreview(self._node, self._status.status) if node.previewPublish else None
         self._ssh: RieglVzSSH = RieglVzSSH(self._node)
-
-        self.scanposition = None
-
-        self.scanPublishFilter = node.scanPublishFilter
-        self.scanPublishLOD = node.scanPublishLOD
+        self._stages: RieglVzStages = RieglVzStages(self._node)
+        self._cache: FileCache = node.fileCache
+        self._octreeCache = node.octreeCache
+        self._sopvReader: SopvReader = SopvReader(self._ssh, self._logger)
+        self._poseFiles = {}
+        self._staticTransformKeys = []
+        self._pipelineTimings = []
+        self._threadLock = threading.Lock()
+        self._jobs: ScanJobQueue = ScanJobQueue(
+            node.scanQueueDepth, self._acquireJob, self._processJob, self._updateJobsOpstate, self._logger)
 
         if not os.path.exists(self._workingDir):
             os.mkdir(self._workingDir)
 
+    def _lock(self):
+        self._threadLock.acquire()
+
+    def _unlock(self):
+        self._threadLock.release()
+
+    def _fetchFiles(self, remoteFiles, large: bool = False):
+        """Return dictionary of remote file path to local cached copy of the existing remote files."""
+        download = self._ssh.downloadLargeFile if large else self._ssh.downloadFile
+        localFiles = {}
+        for remoteFile, (size, mtime) in self._ssh.statFiles(remoteFiles).items():
+            localFiles[remoteFile] = self._cache.fetch(remoteFile, size, mtime, download)
+        return localFiles
+
+    def _fetchFile(self, remoteFile: str, large: bool = False):
+        """Return local cached copy of remote file."""
+        localFiles = self._fetchFiles([remoteFile], large)
+        if remoteFile not in localFiles:
+            raise FileNotFoundError("Remote file '{}' not found".format(remoteFile))
+        return localFiles[remoteFile]
+
+    def _getPopFile(self):
+        return self._project.getActiveProjectPath() + '/project.pop'
+
+    def _getVopFile(self):
+        return self._project.getActiveProjectPath() + '/Voxels1.VPP/VPP.vop'
+
+    def _getSopvFile(self):
+        return self._project.getActiveProjectPath() + '/Voxels1.VPP/all_sopv.csv'
+
+    def _readPoseFiles(self, readFns):
+        """Return dictionary of remote file path to pose of the existing remote files.
+
+        The files are looked up with one remote stat command and parsed with the
+        read function of the remote file. A parsed pose is kept in memory until
+        the remote file size or modification time changes."""
+        poses = {}
+        for remoteFile, (size, mtime) in self._ssh.statFiles(list(readFns.keys())).items():
+            self._lock()
+            cached = self._poseFiles.get(remoteFile)
+            self._unlock()
+            if cached is None or cached[0] != (size, mtime):
+                localFile = self._cache.fetch(remoteFile, size, mtime, self._ssh.downloadFile)
+                cached = ((size, mtime), readFns[remoteFile](localFile))
+                self._lock()
+                self._poseFiles[remoteFile] = cached
+                self._unlock()
+            # callers may modify the returned message
+            poses[remoteFile] = copy.deepcopy(cached[1])
+        return poses
+
+    def _sendStaticTransforms(self, transforms):
+        """Replace the project frames on /tf_static."""
+        self._lock()
+        remove = self._staticTransformKeys
+        self._staticTransformKeys = [(t.header.frame_id, t.child_frame_id) for t in transforms]
+        self._unlock()
+        self._node.sendStaticTransforms(transforms, remove)
+
     def _broadcastTfTransforms(self, ts: datetime.time):
-        ok, pop = self.getPop()
-        if ok:
-            self._node.transformBroadcaster.sendTransform(getTransformFromPose(ts, 'riegl_vz_prcs', pop))
-        ok, vop = self.getVop()
+        transforms = []
+        popFile = vopFile = None
+        try:
+            popFile = self._getPopFile()
+            vopFile = self._getVopFile()
+            poses = self._readPoseFiles({popFile: readPop, vopFile: readVop})
+        except Exception as e:
+            poses = {}
+        if popFile in poses:
+            transforms.append(getTransformFromPose(ts, 'riegl_vz_prcs', poses[popFile]))
+        ok = vopFile in poses
         if ok:
-            self._node.transformBroadcaster.sendTransform(getTransformFromPose(ts, 'riegl_vz_vocs', vop))
+            transforms.append(getTransformFromPose(ts, 'riegl_vz_vocs', poses[vopFile]))
             ok, sopv = self.getSopv()
             if ok:
-                self._node.transformBroadcaster.sendTransform(getTransformFromPose(ts, 'riegl_vz_socs', sopv.pose))
-            else:
-                return False, None
-        else:
+                transforms.append(getTransformFromPose(ts, 'riegl_vz_socs', sopv.pose))
+        if transforms:
+            self._sendStaticTransforms(transforms)
+        if not ok:
             return False, None
         return True, sopv
 
@@ -201,6 +304,9 @@ class RieglVz():
 
     def loadProject(self, projectName: str, storageMedia: int, scanRegisterAndPublish: bool):
         ok = self._project.loadProject(projectName, storageMedia)
+        if ok:
+            # frames of the previous project
+            self._sendStaticTransforms([])
         if ok and scanRegisterAndPublish:
             ts = self._node.get_clock().now()
             self._broadcastTfTransforms(ts)
@@ -210,6 +316,7 @@ class RieglVz():
 
     def createProject(self, projectName: str, storageMedia: int):
         if self._project.createProject(projectName, storageMedia):
+            self._sendStaticTransforms([])
             self._path = Path();
             self._imuRelPose.reset()
             return True
@@ -227,10 +334,16 @@ class RieglVz():
     #    #self._logger.debug("dateTime = {}".format(dateTime))
     #    return int(dateTime.strftime("%s"))
 
-    def _setPositionEstimate(self, position=None, yawAngle=None):
-        scanposPath = self._project.getActiveScanposPath(self.scanposition)
+    def _scanposWorkingDir(self, scanposition: str):
+        """Return local working directory of a scan position, files of queued scan positions must not collide."""
+        path = join(self._workingDir, 'scanpos', scanposition)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _setPositionEstimate(self, scanposition: str, position=None, yawAngle=None):
+        scanposPath = self._project.getActiveScanposPath(scanposition)
         remoteFile = scanposPath + '/final.pose'
-        localFile = self._workingDir + '/final.pose'
+        localFile = self._scanposWorkingDir(scanposition) + '/final.pose'
         self._ssh.downloadFile(remoteFile, localFile)
         with open(localFile, 'r') as f:
             finalPose = json.load(f)
@@ -253,21 +366,21 @@ class RieglVz():
             f.write('\n')
         self._ssh.uploadFile([localFile], scanposPath)
 
-    def _prepareImuRelativePose(self):
+    def _prepareImuRelativePose(self, scanposition: str):
         # This will create a dummy 'imu_relative.pose' file in the scan position directory.
         # The trajectory service will not overwrite this file, instead it will create a file
         # 'imu_relative01.pose' (if scanner has been moved) which will not be used then.
-        scanposPath = self._project.getActiveScanposPath(self.scanposition)
-        localFile = self._workingDir + '/imu_relative.pose'
+        scanposPath = self._project.getActiveScanposPath(scanposition)
+        localFile = self._scanposWorkingDir(scanposition) + '/imu_relative.pose'
         with open(localFile, 'w') as f:
             f.write('{}\n')
         self._ssh.uploadFile([localFile], scanposPath)
 
-    def _setImuRelativePose(self, posePrevious, poseCurrent):
+    def _setImuRelativePose(self, scanposition: str, posePrevious, poseCurrent):
         # This will create the file 'imu_relative.pose' with date from the external imu
         # and mode set to 'imu_external'.
-        scanposPath = self._project.getActiveScanposPath(self.scanposition)
-        localFile = self._workingDir + '/imu_relative.pose'
+        scanposPath = self._project.getActiveScanposPath(scanposition)
+        localFile = self._scanposWorkingDir(scanposition) + '/imu_relative.pose'
         pos_x, pos_y, pos_z, pos_roll, pos_pitch, pos_yaw = calcRelativePose(posePrevious.pose.pose.pose, poseCurrent.pose.pose.pose)
         cov_x, cov_y, cov_z, cov_roll, cov_pitch, cov_yaw = calcRelativeCovariances(posePrevious.pose.pose.covariance, poseCurrent.pose.pose.covariance)
         imuRelative = {
@@ -351,108 +464,273 @@ class RieglVz():
                     f.write("{},{},{},{},{}\n".format(item[0], coordSystem, item[1], item[2], item[3]))
             self._ssh.uploadFile([localDstCpsFile], projectPath)
 
-    def getPointCloud(self, scanposition: str, pointcloud: PointCloud2, ts: bool = True):
-        self._logger.debug("Downloading rdbx file..")
-        self._status.status.setActiveTask('download rdbx file')
+    def _getRdbxRemoteFile(self, scanposition: str):
+        """Return remote path of the rdbx file of scan position or None."""
         scanId = self._project.getScanId(scanposition)
         self._logger.debug("scan id = {}".format(scanId))
         if scanId == 'null':
             self._logger.error("Scan id is null!")
-            return False, pointcloud
+            return None
 
         scanposPath = self._project.getActiveScanposPath(scanposition)
         self._logger.debug("scanpos path = {}".format(scanposPath))
         scan = os.path.basename(scanId).replace('.rxp', '')[0:13]
         self._logger.debug("scan = {}".format(scan))
-        remoteFile = scanposPath + '/scans/' + scan + '.rdbx'
-        localFile = self._workingDir + '/scan.rdbx'
-        self._ssh.downloadFile(remoteFile, localFile)
+        return scanposPath + '/scans/' + scan + '.rdbx'
+
+    def _fetchRdbxFile(self, scanposition: str):
+        """Download rdbx file of scan position, returns local file path or None."""
+        self._logger.debug("Downloading rdbx file..")
+        self._status.status.setActiveTask('download rdbx file')
+        remoteFile = self._getRdbxRemoteFile(scanposition)
+        if remoteFile is None:
+            return None
+        return self._fetchFile(remoteFile, large=True)
+
+    def _getOctree(self, scanposition: str, settings: PointCloudSettings):
+        """Return octree of the scan position point cloud from the octree cache, built on first use."""
+        remoteFile = self._getRdbxRemoteFile(scanposition)
+        if remoteFile is None:
+            return None
+        stats = self._ssh.statFiles([remoteFile])
+        if remoteFile not in stats:
+            self._logger.error("Rdbx file {} not found!".format(remoteFile))
+            return None
+        size, mtime = stats[remoteFile]
+        selection = settings.filter
+
+        def build(octreeDir):
+            self._status.status.setActiveTask('download rdbx file')
+            localFile = self._fetchFile(remoteFile, large=True)
+            self._logger.debug("Build point cloud octree..")
+            self._status.status.setActiveTask('build point cloud octree')
+            with riegl.rdb.rdb_open(localFile) as rdb:
+                buildOctree(octreeDir, rdb, selection)
+
+        return self._octreeCache.fetch(remoteFile, size, mtime, selection, build)
+
+    def _getOctreePointData(self, scanposition: str, settings: PointCloudSettings, query: PointCloudQuery = None):
+        """Return xyzr data and number of points of the level of detail or voxel grid from the octree cache.
+
+        Only the octree nodes within the bounds of the query are read."""
+        octree = self._getOctree(scanposition, settings)
+        if octree is None:
+            return False, None, 0
+        box = query.bounds() if query is not None else None
+        self._status.status.setActiveTask('generate point cloud data')
+        if settings.voxelSize > 0:
+            points, _ = octree.query(box=box)
+            builder = VoxelGridBuilder(settings.voxelSize)
+            for start in range(0, len(points), 1000000):
+                chunk = points[start:start + 1000000]
+                if query is None:
+                    builder.add(chunk['xyz'], chunk['r'])
+                else:
+                    builder.add(*query.apply(chunk['xyz'], chunk['r']))
+            data, numPoints = builder.finish()
+        else:
+            points, _ = octree.query(settings.lod, box)
+            if query is not None:
+                points = points[query.mask(points['xyz'], points['r'])]
+            data, numPoints = bytearray(np.ascontiguousarray(points)), len(points)
+        return True, data, numPoints
+
+    def _getFrameToSocs(self, scanposition: str, frameId: str):
+        """Return 4x4 matrix transforming coordinates of frame to SOCS of scan position, None for SOCS.
+
+        Frames other than VOCS are transformed to VOCS with tf2, the SOPV of
+        the scan position transforms SOCS to VOCS."""
+        if frameId == '' or frameId == 'riegl_vz_socs':
+            return None
+        ok, sopv = self.getSopv(int(scanposition))
+        if not ok:
+            raise RuntimeError("Pose of scan position {} is not available".format(scanposition))
+        frameToVocs = np.eye(4)
+        if frameId != 'riegl_vz_vocs':
+            t = self._node.transformBuffer.lookup_transform('riegl_vz_vocs', frameId, Time())
+            frameToVocs = getMatrixFromTransform(t.transform)
+        return np.linalg.inv(getMatrixFromPose(sopv.pose.pose)) @ frameToVocs
+
+    def getPointCloudQuery(self, scanposition: str, request):
+        """Return point cloud query of the region of interest of a GetPointCloud service request.
+
+        The query is None if the request does not restrict the point cloud."""
+        try:
+            query = PointCloudQuery(self._getFrameToSocs(scanposition, request.frame_id))
+        except Exception as e:
+            self._logger.error("Transformation of frame '{0}' to SOCS of scan position {1} failed: {2}".format(request.frame_id, scanposition, e))
+            return False, None
+        boxMin = [request.box_min.x, request.box_min.y, request.box_min.z]
+        boxMax = [request.box_max.x, request.box_max.y, request.box_max.z]
+        if boxMin != boxMax:
+            query.setBox(boxMin, boxMax)
+        if request.radius > 0:
+            query.setRadius([request.center.x, request.center.y, request.center.z], request.radius)
+        query.setRange(request.min_range, request.max_range)
+        if request.min_reflectance != request.max_reflectance:
+            query.setReflectance(request.min_reflectance, request.max_reflectance)
+        if query.isEmpty():
+            query = None
+        return True, query
+
+    def _getPublishTransform(self, scanposition: str, settings: PointCloudSettings):
+        """Return frame id and 4x4 matrix transforming SOCS of scan position to the point cloud publish frame.
+
+        The matrix is None for point clouds in SOCS. The registered SOPV
+        transforms to VOCS, together with the VOP to PRCS. With a local
+        origin the coordinates are relative to the 'riegl_vz_origin' frame."""
+        frameId = settings.frame
+        if frameId == 'riegl_vz_socs' and not any(settings.origin):
+            return frameId, None
+        matrix = np.eye(4)
+        try:
+            if frameId != 'riegl_vz_socs':
+                ok, sopv = self.getSopv(int(scanposition))
+                if not ok:
+                    raise RuntimeError("no registered pose")
+                matrix = getMatrixFromPose(sopv.pose.pose)
+            if frameId == 'riegl_vz_prcs':
+                ok, vop = self.getVop()
+                if not ok:
+                    raise RuntimeError("no VOP")
+                matrix = getMatrixFromPose(vop.pose) @ matrix
+        except Exception as e:
+            self._logger.warning("Pose of scan position {0} is not available ({1}), point cloud is published in SOCS!".format(scanposition, e))
+            return 'riegl_vz_socs', None
+        if any(settings.origin):
+            matrix[:3, 3] -= settings.origin
+            frameId = 'riegl_vz_origin'
+        return frameId, matrix
+
+    def _getPointCloudStamp(self, ts: bool = True):
+        if ts:
+            return self._node.get_clock().now().to_msg()
+        return builtin_msgs.Time(sec = 0, nanosec = 0)
+
+    def _getPointCloudMessage(self, data, numPoints: int, stamp, frameId: str = 'riegl_vz_socs'):
+        rosDtype = PointField.FLOAT32
+        itemsize = XyzrBuilder.itemsize
+
+        fields = [PointField(
+            name = n, offset = i*itemsize, datatype = rosDtype, count = 1)
+            for i, n in enumerate('xyzr')]
+
+        header = std_msgs.Header(frame_id = frameId, stamp = stamp)
+
+        return PointCloud2(
+            header = header,
+            height = 1,
+            width = numPoints,
+            is_dense = False,
+            is_bigendian = False,
+            fields = fields,
+            point_step = (itemsize * 4),
+            row_step = (itemsize * 4 * numPoints),
+            data = data
+        )
+
+    def getPointCloudSettings(self):
+        """Return point cloud settings of the current node parameters."""
+        node = self._node
+        return PointCloudSettings(node.scanPublishFilter, node.scanPublishLOD, node.scanPublishVoxelSize,
+            node.scanPublishChunkSize, node.scanPublishFrame, node.scanPublishOrigin)
+
+    def getPointCloud(self, scanposition: str, pointcloud: PointCloud2, ts: bool = True, cached: bool = False,
+                      query: PointCloudQuery = None, settings: PointCloudSettings = None):
+        """Return point cloud of scan position.
+
+           With cached=True the point cloud is served from the octree cache
+           (if enabled), only the first request of a scan position downloads
+           the rdbx file and builds the octree. With a query only the points
+           within the region of interest are returned. Without settings the
+           current node parameters are used."""
+        if settings is None:
+            settings = self.getPointCloudSettings()
+        if cached and self._octreeCache is not None:
+            ok, data, numPoints = self._getOctreePointData(scanposition, settings, query)
+            if not ok:
+                self._status.status.setActiveTask('')
+                return False, pointcloud
+            frameId, matrix = self._getPublishTransform(scanposition, settings)
+            if matrix is not None:
+                transformXyzrData(data, numPoints, matrix)
+            self._status.status.setActiveTask('')
+            return True, self._getPointCloudMessage(data, numPoints, self._getPointCloudStamp(ts), frameId)
+
+        localFile = self._fetchRdbxFile(scanposition)
+        if localFile is None:
+            return False, pointcloud
 
         self._logger.debug("Generate point cloud..")
         self._status.status.setActiveTask('generate point cloud data')
+        # repeated requests are served by the octree cache, the point data is not kept
         with riegl.rdb.rdb_open(localFile) as rdb:
-            rosDtype = PointField.FLOAT32
-            dtype = np.float32
-            itemsize = np.dtype(dtype).itemsize
-
-            numTotalPoints = 0
-            numPoints = 0
-            data = bytearray()
-            scanPublishLOD = self.scanPublishLOD
-            if self.scanPublishLOD < 0:
-                scanPublishLOD = 0
-            for points in rdb.select(
-                self.scanPublishFilter,
-                chunk_size=100000
-                ):
-                pointStep = 2 ** scanPublishLOD
-                for point in points:
-                    if not (numTotalPoints % pointStep):
-                        data.extend(point['riegl.xyz'].astype(dtype).tobytes())
-                        data.extend(point['riegl.reflectance'].astype(dtype).tobytes())
-                        numPoints += 1
-                    numTotalPoints += 1
-
-            fields = [PointField(
-                name = n, offset = i*itemsize, datatype = rosDtype, count = 1)
-                for i, n in enumerate('xyzr')]
-
-            if ts:
-                stamp = self._node.get_clock().now().to_msg()
+            if settings.voxelSize > 0:
+                data, numPoints = buildXyzrVoxelGridData(rdb, settings.filter, settings.voxelSize, query=query)
             else:
-                stamp = builtin_msgs.Time(sec = 0, nanosec = 0)
+                data, numPoints = buildXyzrData(rdb, settings.filter, settings.lod, query=query)
 
-            header = std_msgs.Header(frame_id = 'riegl_vz_socs', stamp = stamp)
-
-            pointcloud = PointCloud2(
-                header = header,
-                height = 1,
-                width = numPoints,
-                is_dense = False,
-                is_bigendian = False,
-                fields = fields,
-                point_step = (itemsize * 4),
-                row_step = (itemsize * 4 * numPoints),
-                data = data
-            )
-            #for point in rdb.points():
-            #    self._logger.debug("{0}".format(point.riegl_xyz))
+        frameId, matrix = self._getPublishTransform(scanposition, settings)
+        if matrix is not None:
+            transformXyzrData(data, numPoints, matrix)
+        pointcloud = self._getPointCloudMessage(data, numPoints, self._getPointCloudStamp(ts), frameId)
         self._status.status.setActiveTask('')
         self._logger.debug("Point cloud generated.")
 
         return True, pointcloud
 
+    def publishPointCloudChunks(self, scanposition: str, settings: PointCloudSettings):
+        """Publish point cloud of scan position in chunks of at most settings.chunkSize points.
+
+           The chunks are published on the 'pointcloud_chunks' topic while the
+           points are read from the rdbx file, all chunks have the same stamp.
+           A voxel grid downsampled point cloud is split into chunks after
+           all points have been read."""
+        localFile = self._fetchRdbxFile(scanposition)
+        if localFile is None:
+            return False
+
+        self._status.status.setActiveTask('publish point cloud data')
+        chunkPoints = settings.chunkSize
+        stamp = self._node.get_clock().now().to_msg()
+        frameId, matrix = self._getPublishTransform(scanposition, settings)
+        with riegl.rdb.rdb_open(localFile) as rdb:
+            if settings.voxelSize > 0:
+                data, numPoints = buildXyzrVoxelGridData(rdb, settings.filter, settings.voxelSize)
+                count = -(-numPoints // chunkPoints)
+                chunks = splitXyzrData(data, numPoints, chunkPoints)
+            else:
+                count = countXyzrChunks(rdb, settings.filter, settings.lod, chunkPoints)
+                chunks = iterXyzrChunks(rdb, settings.filter, settings.lod, chunkPoints)
+            for index, (data, numPoints) in enumerate(chunks):
+                if matrix is not None:
+                    transformXyzrData(data, numPoints, matrix)
+                self._node.pointCloudChunksPublisher.publish(PointCloudChunk(
+                    scanposition = scanposition,
+                    index = index,
+                    count = count,
+                    pointcloud = self._getPointCloudMessage(data, numPoints, stamp, frameId)))
+        self._status.status.setActiveTask('')
+        self._logger.debug("Point cloud published in {} chunks.".format(count))
+        return True
+
     def getVoxels(self, voxels: Voxels, scanposition: str = '0', ts: bool = True):
         self._logger.debug("Downloading vxls file..")
         self._status.status.setActiveTask('download vxls file')
         remoteFile = ''
-        localFile = ''
         projectPath = self._project.getActiveProjectPath()
         self._logger.debug("project path = {}".format(projectPath))
         if scanposition != '1000000':
             remoteFile = projectPath + '/Voxels1.VPP/' + self._project.getScanposName(scanposition) + '.vxls'
-            localFile = self._workingDir + '/scan.vxls'
         else:
             remoteFile = projectPath + '/Voxels1.VPP/project.vxls'
-            localFile = self._workingDir + '/project.vxls'
-        self._ssh.downloadFile(remoteFile, localFile)
+        localFile = self._fetchFile(remoteFile, large=True)
 
         self._logger.debug("Generate voxels..")
         self._status.status.setActiveTask('generate voxel data')
         with riegl.rdb.rdb_open(localFile) as rdb:
             voxelSize = objs = float(json.loads(rdb.meta_data['riegl.voxel_info'])['size'])
-            numTotalPoints = 0
-            data = bytearray()
-            for points in rdb.select('', chunk_size=100000):
-                for point in points:
-                    data.extend(point['riegl.xyz'].astype(np.float64).tobytes())
-                    data.extend(point['riegl.reflectance'].astype(np.float32).tobytes())
-                    data.extend(point['riegl.point_count'].astype(np.uint32).tobytes())
-                    data.extend(point['riegl.pca_axis_min'].astype(np.float32).tobytes())
-                    data.extend(point['riegl.pca_axis_max'].astype(np.float32).tobytes())
-                    data.extend(point['riegl.pca_extents'].astype(np.float32).tobytes())
-                    data.extend(point['riegl.shape_id'].astype(np.uint8).tobytes())
-                    numTotalPoints += 1
+            data, numTotalPoints = buildVoxelData(rdb)
 
             fields = []
             fieldsize = 0
@@ -502,207 +780,266 @@ class RieglVz():
 
         return True, voxels
 
-    def _scanThreadFunc(self):
-        self._status.status.setOpstate('scanning', 'scan data acquisition')
-        self._status.status.setProgress(0)
-
-        self._logger.info("Starting data acquisition..")
-        self._logger.info("project name = {}".format(self.projectName))
-        scanposName = self._project.getScanposName(self.scanposition)
-        self._logger.info("scanpos name = {0} ({1})".format(self.scanposition, scanposName))
-        self._logger.info("storage media = {}".format(self.storageMedia))
-        self._logger.info("scan pattern = {0}, {1}, {2}, {3}, {4}, {5}".format(
-            self.scanPattern.lineStart,
-            self.scanPattern.lineStop,
-            self.scanPattern.lineIncrement,
-            self.scanPattern.frameStart,
-            self.scanPattern.frameStop,
-            self.scanPattern.frameIncrement))
-        self._logger.info("meas program = {}".format(self.scanPattern.measProgram))
-        self._logger.info("scan publish = {}".format(self.scanPublish))
-        self._logger.info("scan publish filter = '{}'".format(self.scanPublishFilter))
-        self._logger.info("scan publish LOD = {}".format(self.scanPublishLOD))
-        self._logger.info("voxel publish = {}".format(self.voxelPublish))
-        self._logger.info("scan register = {}".format(self.scanRegister))
-        self._logger.info("scan register mode = {}".format(self.scanRegistrationMode))
-        self._logger.info("pose publish = {}".format(self.posePublish))
-        if self.reflSearchSettings:
-            self._logger.info("reflector search = {}".format(self.reflSearchSettings))
-        self._logger.info("image capture = {}".format(self.captureImages))
-        self._logger.info("image capture mode = {}".format(self.captureMode))
-        self._logger.info("image capture overlap = {}".format(self.imageOverlap))
-
-        # prepare project
+    def _setPositionEstimateStage(self, job):
+        if job.position is not None:
+            self._status.status.setActiveTask('set position estimate')
+        if job.yawAngle is not None:
+            self._status.status.setActiveTask('set yaw angle estimate')
+        if job.position is not None and job.scanposition == '1':
+            self._logger.info("Set project position.")
+            projSvc = getService(ProjectService, self._connectionString)
+            projSvc.setProjectLocation(job.position.position.header.frame_id, job.position.position.point.x, job.position.position.point.y, job.position.position.point.z)
+        self._logger.info("Set scan position and/or yaw angle estimate..")
         try:
-            projSvc = ProjectService(self._connectionString)
-            projSvc.setStorageMedia(self.storageMedia)
-            projSvc.createProject(self.projectName)
-            projSvc.loadProject(self.projectName)
-            projSvc.createScanposition(scanposName)
-            projSvc.selectScanposition(scanposName)
-            posePrevious = self._imuRelPose.previous()
-            if posePrevious.isValid():
-                self._prepareImuRelativePose()
+            self._setPositionEstimate(job.scanposition, job.position, job.yawAngle)
+            self._logger.info("Set position and/or yaw angle estimate finished")
         except:
-            self._logger.error("Project and scan position prepare failed!")
-
-        scriptPath = join(appDir, 'acquire-data.py')
-        cmd = [
-            'python3', scriptPath,
-            '--connectionstring', self._connectionString]
-        if self.reflSearchSettings:
-            rssFilePath = join(self._workingDir, 'reflsearchsettings.json')
-            with open(rssFilePath, 'w') as f:
-                json.dump(self.reflSearchSettings, f)
-            cmd.append('--reflsearch')
-            cmd.append(rssFilePath)
-        if self.scanPattern:
-            cmd.extend([
-                '--line-start', str(self.scanPattern.lineStart),
-                '--line-stop', str(self.scanPattern.lineStop),
-                '--line-incr', str(self.scanPattern.lineIncrement),
-                '--frame-start', str(self.scanPattern.frameStart),
-                '--frame-stop', str(self.scanPattern.frameStop),
-                '--frame-incr', str(self.scanPattern.frameIncrement),
-                '--measprog', str(self.scanPattern.measProgram)
-            ])
-        captureImages = (self.captureImages != 0)
-        if self.captureImages == 2:
-            if not self.getCameraStatus().avail:
-                captureImages = False
-        if captureImages:
-            cmd.extend([
-                '--capture-images',
-                '--capture-mode', str(self.captureMode),
-                '--image-overlap', str(self.imageOverlap)
-            ])
-        self._logger.debug("CMD = {}".format(' '.join(cmd)))
-        subproc = SubProcess(subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE))
-        self._logger.debug("Subprocess started.")
-        subproc.waitFor(errorMessage='Data acquisition failed.', block=True)
-        if self._stopReq:
-            self._stopReq = False
-            self._status.status.setOpstate('waiting')
-            self._logger.info("Scan stopped")
-            return
-        self._logger.info("Data acquisition finished")
+            self._logger.error("Set position and/or yaw angle estimate failed!")
 
-        self._status.status.setOpstate('processing')
-
-        if self._position is not None or self._yawAngle is not None:
-            if self._position is not None:
-                self._status.status.setActiveTask('set position estimate')
-            if self._yawAngle is not None:
-                self._status.status.setActiveTask('set yaw angle estimate')
-            if self._position is not None and self.scanposition == '1':
-                self._logger.info("Set project position.")
-                projSvc = ProjectService(self._connectionString)
-                projSvc.setProjectLocation(self._position.position.header.frame_id, self._position.position.point.x, self._position.position.point.y, self._position.position.point.z)
-            self._logger.info("Set scan position and/or yaw angle estimate..")
-            try:
-                self._setPositionEstimate(self._position, self._yawAngle)
-                self._logger.info("Set position and/or yaw angle estimate finished")
-            except:
-                self._logger.error("Set position and/or yaw angle estimate failed!")
-            self._position = None
-
-        poseCurrent, posePrevious = self._imuRelPose.get(self._project.getScanposName(self.scanposition))
+    def _setImuRelativePoseStage(self, job):
+        poseCurrent, posePrevious = job.imuPoses
         if poseCurrent.isValid():
             self._logger.info("Set relative imu pose (current available).")
             if posePrevious.isValid():
                 self._logger.info("Set relative imu pose (previous available).")
                 self._status.status.setActiveTask('set relative imu pose')
                 try:
-                    self._setImuRelativePose(posePrevious, poseCurrent)
+                    self._setImuRelativePose(job.scanposition, posePrevious, poseCurrent)
                     self._logger.info("Set relative imu pose finished")
                 except:
                     self._logger.error("Set relative imu pose failed!")
             self._logger.info("Set relative imu pose (previous = current).")
 
-        if self.scanPublish:
-            self._logger.info("Converting RXP to RDBX..")
-            self._status.status.setActiveTask('convert rxp to rdbx')
-            scriptPath = join(appDir, 'create-rdbx.py')
-            cmd = [
-                'python3', scriptPath,
-                '--connectionstring', self._connectionString,
-                '--project', self.projectName,
-                '--scanposition', scanposName]
-            self._logger.debug("CMD = {}".format(' '.join(cmd)))
-            subproc = SubProcess(subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE))
-            self._logger.debug("Subprocess started.")
-            subproc.waitFor('RXP to RDBX conversion failed.')
-            if self._stopReq:
-                self._stopReq = False
-                self._status.status.setOpstate('waiting')
-                self._logger.info("Scan stopped")
-                return
-            self._logger.info("RXP to RDBX conversion finished")
-
-        if self.scanRegister:
+    def _createRdbxStage(self, job):
+        self._logger.info("Converting RXP to RDBX..")
+        self._status.status.setActiveTask('convert rxp to rdbx')
+        self._stages.createRdbx(job.projectName, job.scanposName, job.scan)
+        if job.stopReq:
+            return False
+        self._logger.info("RXP to RDBX conversion finished")
+
+    def _registerStage(self, job):
+        try:
+            # scan positions are registered in the order of their acquisition,
+            # the publishing stages of the previous scan position are not waited for
+            previousJob = job.previousJob
+            if previousJob is not None:
+                self._logger.info("Waiting for scan position {} to be registered..".format(previousJob.scanposition))
+                previousJob.registered.wait()
+            if job.stopReq:
+                return False
             self._logger.info("Starting registration..")
             self._status.status.setActiveTask('scan position registration')
-            scriptPath = os.path.join(appDir, 'register-scan.py')
-            cmd = [
-                'python3', scriptPath,
-                '--connectionstring', self._connectionString,
-                '--project', self.projectName,
-                '--scanposition', scanposName,
-                '--registrationmode', str(self.scanRegistrationMode)]
-            if self.posePublish:
-                cmd.append('--wait-until-finished')
-            self._logger.debug("CMD = {}".format(' '.join(cmd)))
-            subproc = SubProcess(subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE))
-            subproc.waitFor(errorMessage='Registration failed.', block=True)
-            if self._stopReq:
-                self._stopReq = False
-                self._status.status.setOpstate('waiting')
-                self._logger.info("Scan stopped")
-                return
+            # stages using the registered pose need the finished registration
+            waitUntilFinished = job.posePublish or job.voxelPublish or job.pointCloudSettings.frame != 'riegl_vz_socs'
+            self._stages.registerScanposition(
+                job.projectName, job.scanposName, job.scanRegistrationMode, waitUntilFinished=waitUntilFinished)
+            if job.stopReq:
+                return False
             self._logger.info("Registration finished")
-
-            if self.posePublish:
-                self._logger.info("Downloading and publishing pose..")
-                self._status.status.setActiveTask('publish registered scan position')
-                ts = self._node.get_clock().now()
-                ok, sopv = self._broadcastTfTransforms(ts)
-                if ok:
-                    # update sopv timestamp
-                    sopv.pose.header.stamp = ts.to_msg()
-                    # publish pose
-                    self._node.posePublisher.publish(sopv.pose)
-                    # publish path
-                    self._path.header = sopv.pose.header
-                    self._path.poses.append(sopv.pose)
-                    self._node.pathPublisher.publish(self._path)
-                    # publish odometry
-                    odom = Odometry(
-                        header = Header(stamp = ts.to_msg(), frame_id = 'riegl_vz_vocs'),
-                        child_frame_id = 'riegl_vz_socs',
-                        pose = PoseWithCovariance(pose = sopv.pose.pose)
-                    )
-                    self._node.odomPublisher.publish(odom)
-                self._logger.info("Pose published")
-
-        if self.scanPublish:
-            self._logger.info("Downloading and publishing point cloud..")
-            pointcloud: PointCloud2 = PointCloud2()
-            ok, pointcloud = self.getPointCloud(self.scanposition, pointcloud)
-            if ok:
-                self._status.status.setActiveTask('publish point cloud data')
-                self._node.pointCloudPublisher.publish(pointcloud)
+        finally:
+            job.registered.set()
+
+    def _publishPoseStage(self, job):
+        self._logger.info("Downloading and publishing pose..")
+        self._status.status.setActiveTask('publish registered scan position')
+        ts = self._node.get_clock().now()
+        ok, sopv = self._broadcastTfTransforms(ts)
+        if ok:
+            # update sopv timestamp
+            sopv.pose.header.stamp = ts.to_msg()
+            # publish pose
+            self._node.posePublisher.publish(sopv.pose)
+            # publish path
+            self._path.header = sopv.pose.header
+            self._path.poses.append(sopv.pose)
+            self._node.pathPublisher.publish(self._path)
+            # publish odometry
+            odom = Odometry(
+                header = Header(stamp = ts.to_msg(), frame_id = 'riegl_vz_vocs'),
+                child_frame_id = 'riegl_vz_socs',
+                pose = PoseWithCovariance(pose = sopv.pose.pose)
+            )
+            self._node.odomPublisher.publish(odom)
+        self._logger.info("Pose published")
+
+    def _publishPointCloudStage(self, job):
+        self._logger.info("Downloading and publishing point cloud..")
+        settings = job.pointCloudSettings
+        if settings.chunkSize > 0:
+            self.publishPointCloudChunks(job.scanposition, settings)
             self._logger.info("Point cloud published")
+            return
+        pointcloud: PointCloud2 = PointCloud2()
+        ok, pointcloud = self.getPointCloud(job.scanposition, pointcloud, settings=settings)
+        if ok:
+            self._status.status.setActiveTask('publish point cloud data')
+            self._node.pointCloudPublisher.publish(pointcloud)
+        self._logger.info("Point cloud published")
+
+    def _publishVoxelsStage(self, job):
+        self._logger.info("Downloading and publishing voxel data..")
+        voxels: Voxels = Voxels()
+        ok, voxels = self.getVoxels(voxels, job.scanposition)
+        if ok:
+            self._status.status.setActiveTask('publish voxel data')
+            self._node.voxelsPublisher.publish(voxels)
+        self._logger.info("Voxels published")
 
-        if self.voxelPublish and self.scanRegister:
-            self._logger.info("Downloading and publishing voxel data..")
-            voxels: Voxels = Voxels()
-            ok, voxels = self.getVoxels(voxels, self.scanposition)
-            if ok:
-                self._status.status.setActiveTask('publish voxel data')
-                self._node.voxelsPublisher.publish(voxels)
-            self._logger.info("Voxels published")
+    def _setPipelineTimings(self, timings):
+        self._lock()
+        self._pipelineTimings = timings
+        self._unlock()
+        products = [offset + duration for name, state, offset, duration in timings
+            if name in ('pose', 'pointcloud', 'voxels') and state == 'done']
+        if products:
+            self._logger.info("time to first product = {:.3f} s".format(min(products)))
 
-        self._status.status.setOpstate('waiting')
+    def getPipelineTimings(self):
+        """Return list of (name, state, start offset, duration) of the post-acquisition stages of the last scan."""
+        self._lock()
+        timings = self._pipelineTimings
+        self._unlock()
+        return timings
+
+    def _acquireJob(self, job):
+        """Acquire data of a scan position job, returns False if stopped."""
+        job.scanposName = self._project.getScanposName(job.scanposition)
+        self._logger.info("Starting data acquisition..")
+        self._logger.info("project name = {}".format(job.projectName))
+        self._logger.info("scanpos name = {0} ({1})".format(job.scanposition, job.scanposName))
+        self._logger.info("storage media = {}".format(job.storageMedia))
+        self._logger.info("scan pattern = {0}, {1}, {2}, {3}, {4}, {5}".format(
+            job.scanPattern.lineStart,
+            job.scanPattern.lineStop,
+            job.scanPattern.lineIncrement,
+            job.scanPattern.frameStart,
+            job.scanPattern.frameStop,
+            job.scanPattern.frameIncrement))
+        self._logger.info("meas program = {}".format(job.scanPattern.measProgram))
+        self._logger.info("scan publish = {}".format(job.scanPublish))
+        self._logger.info("scan publish filter = '{}'".format(job.pointCloudSettings.filter))
+        self._logger.info("scan publish LOD = {}".format(job.pointCloudSettings.lod))
+        self._logger.info("scan publish voxel size = {}".format(job.pointCloudSettings.voxelSize))
+        self._logger.info("scan publish frame = {}".format(job.pointCloudSettings.frame))
+        self._logger.info("voxel publish = {}".format(job.voxelPublish))
+        self._logger.info("scan register = {}".format(job.scanRegister))
+        self._logger.info("scan register mode = {}".format(job.scanRegistrationMode))
+        self._logger.info("pose publish = {}".format(job.posePublish))
+        if job.reflSearchSettings:
+            self._logger.info("reflector search = {}".format(job.reflSearchSettings))
+        self._logger.info("image capture = {}".format(job.captureImages))
+        self._logger.info("image capture mode = {}".format(job.captureMode))
+        self._logger.info("image capture overlap = {}".format(job.imageOverlap))
+
+        # prepare project, through the project object to keep its cache consistent
+        if self._project.createProject(job.projectName, job.storageMedia) and self._project.selectScanposition(job.scanposName):
+            try:
+                posePrevious = self._imuRelPose.previous()
+                if posePrevious.isValid():
+                    self._prepareImuRelativePose(job.scanposition)
+            except:
+                self._logger.error("Project and scan position prepare failed!")
+        else:
+            self._logger.error("Project and scan position prepare failed!")
+
+        captureImages = (job.captureImages != 0)
+        if job.captureImages == 2:
+            if not self.getCameraStatus().avail:
+                captureImages = False
+        self._stages.acquireData(
+            job.scanPattern,
+            reflSearchSettings=job.reflSearchSettings,
+            captureImages=captureImages,
+            captureMode=job.captureMode,
+            imageOverlap=job.imageOverlap)
+        if job.stopReq:
+            self._logger.info("Scan stopped")
+            return False
+        self._logger.info("Data acquisition finished")
+        # the scan position may have been scanned before
+        self._project.invalidate(scanposition=job.scanposition)
+
+        # take over the data of this scan position before the next acquisition may start
+        job.scan = None
+        if job.scanPublish:
+            try:
+                job.scan = self._stages.actualScan()
+            except:
+                self._logger.warning("Scan of the data acquisition is not available!")
+        self._lock()
+        job.position = self._position
+        self._position = None
+        job.yawAngle = self._yawAngle
+        self._unlock()
+        job.imuPoses = self._imuRelPose.get(job.scanposName)
+
+    def _processJob(self, job):
+        """Run the post-acquisition stages of a scan position job, returns False if stopped."""
+        # independent post-acquisition stages run concurrently
+        pipeline = Pipeline(logger=self._logger)
+
+        def addStage(name, stageFn, dependencies=None):
+            def run():
+                try:
+                    return stageFn(job)
+                finally:
+                    # the task of a stage is reported while the stage is running only
+                    self._status.status.setActiveTask('')
+            pipeline.add(name, run, dependencies)
+
+        registerDeps = []
+        if job.position is not None or job.yawAngle is not None:
+            addStage('estimate', self._setPositionEstimateStage)
+            registerDeps.append('estimate')
+        addStage('imupose', self._setImuRelativePoseStage)
+        registerDeps.append('imupose')
+        if job.scanRegister:
+            addStage('register', self._registerStage, registerDeps)
+        else:
+            job.registered.set()
+        if job.scanPublish:
+            addStage('rdbx', self._createRdbxStage)
+            pointCloudDeps = ['rdbx']
+            # point clouds in VOCS or PRCS are transformed with the pose of this registration
+            if job.scanRegister and job.pointCloudSettings.frame != 'riegl_vz_socs':
+                pointCloudDeps.append('register')
+            addStage('pointcloud', self._publishPointCloudStage, pointCloudDeps)
+        if job.scanRegister:
+            if job.posePublish:
+                addStage('pose', self._publishPoseStage, ['register'])
+            if job.voxelPublish:
+                addStage('voxels', self._publishVoxelsStage, ['register'])
+        try:
+            ok = pipeline.run()
+        finally:
+            self._setPipelineTimings(pipeline.getTimings())
+        if job.stopReq:
+            self._logger.info("Scan stopped")
+        return ok
+
+    def _updateJobsOpstate(self):
+        if self._jobs.isAcquiring():
+            self._status.status.setOpstate('scanning', 'scan data acquisition')
+        elif self._jobs.isProcessing():
+            self._status.status.setOpstate('processing')
+        else:
+            self._status.status.setOpstate('waiting')
+
+    def getProjectCacheStatistics(self):
+        """Return statistics of the project data cache."""
+        return self._project.getCacheStatistics()
+
+    def getScanQueueStatistics(self):
+        """Return statistics of the scan position job queue."""
+        return self._jobs.getStatistics()
+
+    def canScan(self):
+        """Return true if a new scan position would be accepted by scan()."""
+        opstate = self.getScannerOpstate()
+        if opstate == 'processing':
+            return self._jobs.accepting()
+        return opstate == 'waiting' and self._jobs.accepting()
 
     def scan(
         self,
@@ -713,6 +1050,10 @@ class RieglVz():
         scanPublish: bool = True,
         scanPublishFilter: str = '',
         scanPublishLOD: int = 1,
+        scanPublishVoxelSize: float = 0.0,
+        scanPublishChunkSize: int = 0,
+        scanPublishFrame: str = 'riegl_vz_socs',
+        scanPublishOrigin = (0.0, 0.0, 0.0),
         voxelPublish: bool = False,
         scanRegister: bool = True,
         scanRegistrationMode: int = 1,
@@ -723,6 +1064,9 @@ class RieglVz():
         imageOverlap: int = 25):
         """Acquire data at scan position.
 
+        With a scan queue depth > 0 the data acquisition starts while previous
+        scan positions are still processed, False is returned if the queue is full.
+
         Args:
           projectName ... the project name
           scanposition ... the name of the new scan position
@@ -730,44 +1074,41 @@ class RieglVz():
           scanPattern ... the scan pattern
           reflSearchSettings ... reflector search settings"""
 
-        if self.isBusy(block=False):
+        if not self.canScan():
             return False
 
-        self.projectName = projectName
-        self.scanposition = scanposition
-        self.storageMedia = storageMedia
-        self.scanPattern = scanPattern
-        self.scanPublish = scanPublish
-        self.scanPublishFilter = scanPublishFilter
-        self.scanPublishLOD = scanPublishLOD
-        self.voxelPublish = voxelPublish
-        self.scanRegister = scanRegister
-        self.scanRegistrationMode = scanRegistrationMode
-        self.posePublish = posePublish
-        self.reflSearchSettings = reflSearchSettings
-        self.captureImages = captureImages
-        self.captureMode = captureMode
-        self.imageOverlap = imageOverlap
-
-        thread = threading.Thread(target=self._scanThreadFunc, args=())
-        thread.daemon = True
-        thread.start()
-
-        while not self.isScanning(block=False):
-            time.sleep(0.2)
+        self._status.status.setProgress(0)
 
-        return True
+        # the opstate is set to 'scanning' by the queue before the acquisition
+        # thread starts, so a caller of isScanning()/isBusy() never sees a stale state
+        job = self._jobs.submit(scanposition, {
+            'projectName': projectName,
+            'storageMedia': storageMedia,
+            'scanPattern': scanPattern,
+            'scanPublish': scanPublish,
+            # the point clouds of a job are built with the settings of its submission
+            'pointCloudSettings': PointCloudSettings(scanPublishFilter, scanPublishLOD, scanPublishVoxelSize,
+                scanPublishChunkSize, scanPublishFrame, scanPublishOrigin),
+            'voxelPublish': voxelPublish,
+            'scanRegister': scanRegister,
+            'scanRegistrationMode': scanRegistrationMode,
+            'posePublish': posePublish,
+            'reflSearchSettings': reflSearchSettings,
+            'captureImages': captureImages,
+            'captureMode': captureMode,
+            'imageOverlap': imageOverlap
+        })
+
+        return job is not None
 
     def isScanning(self, block = True):
         if block:
-            while self.getScannerOpstate() == 'scanning':
-                time.sleep(0.2)
+            self._status.status.waitForOpstate(lambda opstate: opstate != 'scanning')
         return True if self.getScannerOpstate() == 'scanning' else False
 
     def isBusy(self, block = True):
         if block:
-            while self.getScannerOpstate() != 'waiting':
-                time.sleep(0.2)
+            self._status.status.waitForOpstate(lambda opstate: opstate == 'waiting')
         return False if self.getScannerOpstate() == 'waiting' else True
 
     def setPosition(self, position, covariance):
@@ -833,54 +1174,61 @@ class RieglVz():
             )
             self.setPosition(position, [cov[0][0].item(), cov[1][1].item(), cov[2][2].item()])
 
+    def getScanPoses(self):
+        """Return all scan position poses, voxel project pose and project pose.
+
+        The pose files are looked up with one remote stat command, only the
+        appended part of the scan position poses is read."""
+        try:
+            vopFile = self._getVopFile()
+            popFile = self._getPopFile()
+            poses = self._readPoseFiles({vopFile: readVop, popFile: readPop})
+            vop = poses[vopFile]
+            pop = poses.get(popFile)
+            sopvs = self._sopvReader.getAll(self._getSopvFile())
+        except Exception as e:
+            return False, None, None, None
+
+        return True, sopvs, vop, pop
+
     def getAllSopv(self):
         try:
-            sopvFileName = 'all_sopv.csv'
-            remoteFile = self._project.getActiveProjectPath() + '/Voxels1.VPP/' + sopvFileName
-            localFile = self._workingDir + '/' + sopvFileName
-            self._ssh.downloadFile(remoteFile, localFile)
             ok = True
-            sopvs = readAllSopv(localFile, self._logger)
+            sopvs = self._sopvReader.getAll(self._getSopvFile())
         except Exception as e:
             ok = False
             sopvs = None
 
         return ok, sopvs
 
-    def getSopv(self):
-        ok, sopvs = self.getAllSopv()
-        if ok and len(sopvs):
-            sopv = sopvs[-1]
-        else:
+    def getSopv(self, seq: int = None):
+        """Return pose of the last or the given registered scan position."""
+        try:
+            if seq is None:
+                sopv = self._sopvReader.getLast(self._getSopvFile())
+            else:
+                sopv = self._sopvReader.get(self._getSopvFile(), seq)
+        except Exception as e:
             sopv = None
-            ok = False
 
-        return ok, sopv
+        return sopv is not None, sopv
 
     def getVop(self):
         try:
-            sopvFileName = 'VPP.vop'
-            remoteFile = self._project.getActiveProjectPath() + '/Voxels1.VPP/' + sopvFileName
-            localFile = self._workingDir + '/' + sopvFileName
-            self._ssh.downloadFile(remoteFile, localFile)
+            remoteFile = self._getVopFile()
+            vop = self._readPoseFiles({remoteFile: readVop})[remoteFile]
         except Exception as e:
             return False, None
 
-        vop = readVop(localFile)
-
         return True, vop
 
     def getPop(self):
         try:
-            popFileName = 'project.pop'
-            remoteFile = self._project.getActiveProjectPath() + '/' + popFileName
-            localFile = self._workingDir + '/' + popFileName
-            self._ssh.downloadFile(remoteFile, localFile)
+            remoteFile = self._getPopFile()
+            pop = self._readPoseFiles({remoteFile: readPop})[remoteFile]
         except Exception as e:
             return False, None
 
-        pop = readPop(localFile)
-
         return True, pop
 
     def getTpl(self, scanposition: str):
@@ -896,8 +1244,7 @@ class RieglVz():
             scan = os.path.basename(scanId).replace('.rxp', '')[0:13]
             self._logger.debug("scan = {}".format(scan))
             remoteFile = scanposPath + '/' + scan + '.tpl'
-            localFile = self._workingDir + '/scan.tpl'
-            self._ssh.downloadFile(remoteFile, localFile)
+            localFile = self._fetchFile(remoteFile)
 
             ok = True
             tpl = readTpl(localFile, self._logger)
@@ -908,10 +1255,11 @@ class RieglVz():
         return ok, tpl
 
     def stop(self):
-        self._stopReq = True
+        self._jobs.stop()
+        self._stages.cancel()
 
         if self.isScannerAvailable():
-            ctrlSvc = ControlService(self._connectionString)
+            ctrlSvc = getService(ControlService, self._connectionString)
             ctrlSvc.stop()
             self.isBusy()
 
@@ -922,22 +1270,19 @@ class RieglVz():
                 return False
             self._status.trigStarted = True
 
-        intfSvc = InterfaceService(self._connectionString)
+        intfSvc = getService(InterfaceService, self._connectionString)
         intfSvc.triggerInputEvent('ACQ_START_STOP')
 
         if not trigStartedPrev and self._status.trigStarted:
-            startTime = time.time()
-            while not self.isScanning(block=False):
-                time.sleep(0.2)
-                if (time.time() - startTime) > 5:
-                    self._status.trigStarted = False
-                    return False
+            if not self._status.status.waitForOpstate(lambda opstate: opstate == 'scanning', timeout=5):
+                self._status.trigStarted = False
+                return False
 
         return True
 
     def getScanPatterns(self):
         patterns: str = []
-        ctrlSvc = ControlService(self._connectionString)
+        ctrlSvc = getService(ControlService, self._connectionString)
         for pattern in json.loads(ctrlSvc.scanPatternsDetailed()):
             patterns.append(pattern['name'])
         #instIdentLower = self._status.status.scannerStatus.instIdent.lower()
@@ -948,7 +1293,7 @@ class RieglVz():
         return True, patterns
 
     def getScanPattern(self, patternName):
-        ctrlSvc = ControlService(self._connectionString)
+        ctrlSvc = getService(ControlService, self._connectionString)
         for p in json.loads(ctrlSvc.scanPatternsDetailed()):
             if p['name'] == patternName:
                 pattern: ScanPattern = ScanPattern()
@@ -964,7 +1309,7 @@ class RieglVz():
 
     def getReflectorModels(self):
         models: str = []
-        ctrlSvc = ControlService(self._connectionString)
+        ctrlSvc = getService(ControlService, self._connectionString)
         for model in json.loads(ctrlSvc.supportedReflectorSearchModels()):
             models.append(model['name'])
         return True, models
@@ -974,7 +1319,9 @@ class RieglVz():
 
     def shutdown(self):
         self._status.shutdown()
+        if self.preview is not None:
+            self.preview.shutdown()
         self.stop()
         if self.isScannerAvailable():
-            scnSvc = ScannerService(self._connectionString)
+            scnSvc = getService(ScannerService, self._connectionString)
             scnSvc.shutdown()
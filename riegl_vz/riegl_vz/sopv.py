@@ -0,0 +1,128 @@
+import hashlib
+import threading
+
+from .pose import (
+    ScanPoseTable,
+    parseSopv
+)
+
+class SopvReader(object):
+    """Incremental reader of the all_sopv.csv file of a project.
+
+       Only the bytes appended to the remote file since the last read are
+       transferred and parsed. The remote file size, inode, full resolution
+       modification time and the md5 checksum of the last CHECK_BYTES of the
+       already read part are queried with a single remote command. If the
+       already read part has been changed (e.g. by a new registration of all
+       scan positions) or another file is read, the whole file is read
+       again."""
+    CHECK_BYTES = 64 * 1024
+
+    def __init__(self, ssh, logger = None):
+        self._ssh = ssh
+        self._logger = logger
+        self._remoteFile = None
+        self._stat = None
+        self._offset = 0
+        self._tail = b''
+        self._table = ScanPoseTable()
+        self._rows = 0
+        self._threadLock = threading.Lock()
+
+    def _lock(self):
+        self._threadLock.acquire()
+
+    def _unlock(self):
+        self._threadLock.release()
+
+    def _logDebug(self, msg):
+        if self._logger is not None:
+            self._logger.debug(msg)
+
+    def _reset(self, remoteFile: str):
+        self._remoteFile = remoteFile
+        self._stat = None
+        self._offset = 0
+        self._tail = b''
+        self._table = ScanPoseTable()
+        self._rows = 0
+
+    def _remoteState(self, remoteFile: str):
+        """Return (size, inode, mtime) and md5 checksum of the bytes before the read offset.
+
+           Only the last CHECK_BYTES before the read offset are hashed, so the
+           check does not depend on the file size."""
+        cmd = "stat -c '%s %i %y' '{}'".format(remoteFile)
+        if self._offset > 0:
+            cmd += " && tail -c +{0} '{1}' | head -c {2} | md5sum".format(
+                self._offset - len(self._tail) + 1, remoteFile, len(self._tail))
+        response = self._ssh.executeCommand(cmd, retry=True)
+        if len(response) == 0:
+            raise FileNotFoundError("Remote file '{}' not found".format(remoteFile))
+        values = response[0].rstrip('\n').split(' ', 2)
+        if len(values) != 3:
+            raise FileNotFoundError("Remote file '{}' not found".format(remoteFile))
+        stat = (int(values[0]), int(values[1]), values[2])
+        md5 = response[1].split()[0] if len(response) > 1 else None
+        return stat, md5
+
+    def _parse(self, data: bytes):
+        """Append rows of complete lines, returns number of consumed bytes."""
+        end = data.rfind(b'\n') + 1
+        lines = data[:end].decode().splitlines()
+        if self._offset == 0 and lines:
+            # skip csv header
+            lines = lines[1:]
+        self._table.append([parseSopv(line.split(',')) for line in lines if line.strip()])
+        self._rows = len(self._table)
+        # a last line without line feed is parsed but read again next time
+        rest = data[end:].decode()
+        if rest.strip() and not (self._offset == 0 and end == 0):
+            self._table.append([parseSopv(rest.split(','))])
+        return end
+
+    def read(self, remoteFile: str):
+        """Update the pose table from the remote file."""
+        self._lock()
+        try:
+            if remoteFile != self._remoteFile:
+                self._reset(remoteFile)
+            stat, md5 = self._remoteState(remoteFile)
+            if stat == self._stat:
+                return
+            if stat[0] < self._offset or (md5 is not None and md5 != hashlib.md5(self._tail).hexdigest()):
+                self._logDebug("Remote file {} has been rewritten".format(remoteFile))
+                self._reset(remoteFile)
+            data = self._ssh.readFile(remoteFile, self._offset)
+            self._table.truncate(self._rows)
+            consumed = self._parse(data)
+            self._tail = (self._tail + data[:consumed])[-self.CHECK_BYTES:]
+            self._offset += consumed
+            self._stat = stat
+            self._logDebug("Read {0} bytes of {1}, {2} scan poses".format(len(data), remoteFile, len(self._table)))
+        finally:
+            self._unlock()
+
+    def getAll(self, remoteFile: str):
+        """Return list of ScanPose of all scan positions."""
+        self.read(remoteFile)
+        self._lock()
+        sopvs = self._table.all()
+        self._unlock()
+        return sopvs
+
+    def getLast(self, remoteFile: str):
+        """Return ScanPose of the last scan position or None."""
+        self.read(remoteFile)
+        self._lock()
+        sopv = self._table.last()
+        self._unlock()
+        return sopv
+
+    def get(self, remoteFile: str, seq: int):
+        """Return ScanPose of scan position number or None."""
+        self.read(remoteFile)
+        self._lock()
+        sopv = self._table.get(seq)
+        self._unlock()
+        return sopv
@@ -1,7 +1,13 @@
 """Client to handle connections and actions executed against a remote host."""
+import os
+import json
+import time
+import queue
+import hashlib
+import threading
 from typing import List
 
-from paramiko import AutoAddPolicy, SSHClient
+from paramiko import AutoAddPolicy, SSHClient, SSHException
 from scp import SCPClient
 
 class RemoteClient:
@@ -11,40 +17,81 @@ class RemoteClient:
         self,
         host: str,
         user: str,
-        password: str
+        password: str,
+        keepalive: int = 0
     ):
         self.host = host
         self.user = user
         self.password = password
+        self.keepalive = keepalive
         self.client = None
+        self.handshakes = 0
 
     @property
     def connection(self):
-        """Open SSH connection to remote host."""
+        """Return open SSH connection to remote host.
+
+        A closed connection is not re-established here, which is done by
+        connect() only, see SSHConnectionPool.acquire()."""
         if self.client:
-            return self.client
+            transport = self.client.get_transport()
+            if transport is not None and transport.is_active():
+                return self.client
+        raise SSHException("SSH connection to {} is not established".format(self.host))
+
+    def connect(self):
+        """Open SSH connection to remote host, reconnect if it has been closed."""
+        if self.client:
+            transport = self.client.get_transport()
+            if transport is not None and transport.is_active():
+                return self.client
+            # transport has been closed, reconnect
+            self.disconnect()
         try:
             self.client = SSHClient()
             self.client.load_system_host_keys()
             self.client.set_missing_host_key_policy(AutoAddPolicy())
+            self.handshakes += 1
             self.client.connect(
                 self.host,
                 username=self.user,
                 password=self.password,
                 timeout=5000
             )
+            if self.keepalive > 0:
+                self.client.get_transport().set_keepalive(self.keepalive)
             return self.client
         except Exception as e:
+            self.client = None
             raise e
 
+    def isConnected(self):
+        """Check if SSH transport is established and still responding."""
+        if not self.client:
+            return False
+        transport = self.client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            transport.send_ignore()
+        except Exception:
+            return False
+        return True
+
     @property
     def scp(self) -> SCPClient:
         return SCPClient(self.connection.get_transport())
 
+    @property
+    def sftp(self):
+        """Open SFTP session on a new channel of the SSH transport."""
+        return self.connection.open_sftp()
+
     def disconnect(self):
         """Close SSH connection."""
         if self.client:
             self.client.close()
+            self.client = None
 
     def uploadFile(self, localpath: str, remotepath: str):
         """
@@ -86,6 +133,342 @@ class RemoteClient:
             stdout.channel.recv_exit_status()
             response = stdout.readlines()
 
+class SSHConnectionPool:
+    """Keeps an authenticated SSH connection to a remote host alive.
+
+    All SCP, SFTP and command executions are multiplexed as separate channels
+    over the one SSH transport, so the TCP and SSH handshake including the
+    password authentication is only done once. The connection is checked
+    before it is reused after being idle and is re-established transparently
+    if it has been dropped."""
+
+    def __init__(
+        self,
+        host: str,
+        user: str,
+        password: str,
+        keepalive: int = 30,
+        idleCheckInterval: float = 10.0
+    ):
+        self._client = RemoteClient(host=host, user=user, password=password, keepalive=keepalive)
+        self._idleCheckInterval = idleCheckInterval
+        self._lastUse = 0
+        self._requests = 0
+        self._reuses = 0
+        self._threadLock = threading.Lock()
+
+    def _lock(self):
+        self._threadLock.acquire()
+
+    def _unlock(self):
+        self._threadLock.release()
+
+    def acquire(self):
+        """Return connected remote client."""
+        self._lock()
+        try:
+            self._requests += 1
+            if self._client.client is not None:
+                idle = (time.time() - self._lastUse) > self._idleCheckInterval
+                if not idle or self._client.isConnected():
+                    self._reuses += 1
+                else:
+                    self._client.disconnect()
+            self._client.connect()
+            self._lastUse = time.time()
+        finally:
+            self._unlock()
+        return self._client
+
+    def invalidate(self):
+        """Drop the pooled connection if it is broken, it is re-established on the next use."""
+        self._lock()
+        if not self._client.isConnected():
+            self._client.disconnect()
+        self._unlock()
+
+    def run(self, func, retry: bool = False):
+        """Execute func(client) with a pooled remote client.
+
+        If the connection is broken the remote client is reconnected on the
+        next use. With retry enabled func is executed again on the new
+        connection, which is only allowed for idempotent functions like file
+        reads and queries, func may have been executed partially on the
+        remote host before the connection broke."""
+        client = self.acquire()
+        try:
+            return func(client)
+        except (SSHException, EOFError, OSError) as e:
+            if client.isConnected():
+                raise e
+            self.invalidate()
+            if not retry:
+                raise e
+        return func(self.acquire())
+
+    def close(self):
+        """Close pooled SSH connection."""
+        self._lock()
+        self._client.disconnect()
+        self._unlock()
+
+    def getStatistics(self):
+        """Return handshake count, number of requests and connection reuse ratio."""
+        self._lock()
+        stats = {
+            'handshakes': self._client.handshakes,
+            'requests': self._requests,
+            'reuses': self._reuses,
+            'reuse_ratio': (self._reuses / self._requests) if self._requests > 0 else 0.0
+        }
+        self._unlock()
+        return stats
+
+class ChunkedDownloader:
+    """Downloads large files in byte ranges over parallel SFTP channels.
+
+    The file is split into chunks which are fetched by several workers, each
+    with its own SFTP channel on the pooled SSH transport. Completed chunks
+    are recorded in a sidecar state file, so an interrupted download resumes
+    with the missing chunks only. The result is verified against the remote
+    file size, modification time and md5 checksum."""
+
+    def __init__(
+        self,
+        pool: SSHConnectionPool,
+        chunkSize: int = 8 * 1024 * 1024,
+        numChannels: int = 4,
+        maxRetries: int = 5,
+        logger = None
+    ):
+        self._pool = pool
+        self.chunkSize = max(chunkSize, 1)
+        self.numChannels = max(numChannels, 1)
+        self.maxRetries = maxRetries
+        self._logger = logger
+        self._downloads = 0
+        self._bytes = 0
+        self._retries = 0
+        self._resumedBytes = 0
+        self._verifyFailures = 0
+        self._lastThroughput = 0.0
+        self._threadLock = threading.Lock()
+
+    def _lock(self):
+        self._threadLock.acquire()
+
+    def _unlock(self):
+        self._threadLock.release()
+
+    def _logDebug(self, msg):
+        if self._logger is not None:
+            self._logger.debug(msg)
+
+    def _logWarning(self, msg):
+        if self._logger is not None:
+            self._logger.warning(msg)
+
+    def _remoteStat(self, remoteFile: str):
+        def stat(ssh):
+            sftp = ssh.sftp
+            try:
+                return sftp.stat(remoteFile)
+            finally:
+                sftp.close()
+        attr = self._pool.run(stat, retry=True)
+        return attr.st_size, int(attr.st_mtime)
+
+    def _remoteChecksum(self, remoteFile: str, result: dict):
+        try:
+            resp = self._pool.run(lambda ssh: ssh.executeCommand("md5sum '{}'".format(remoteFile)), retry=True)
+            if len(resp) > 0:
+                result['md5'] = resp[0].split()[0]
+        except Exception as e:
+            result['error'] = e
+
+    def _loadState(self, stateFile: str, partFile: str, remoteFile: str, size: int, mtime: int):
+        """Return set of already downloaded chunks of a matching partial download."""
+        try:
+            with open(stateFile, 'r') as f:
+                state = json.load(f)
+            if (state['remote_file'] == remoteFile and state['size'] == size
+                    and state['mtime'] == mtime and state['chunk_size'] == self.chunkSize
+                    and os.path.getsize(partFile) == size):
+                return set(state['chunks'])
+        except Exception:
+            pass
+        return set()
+
+    def _saveState(self, stateFile: str, remoteFile: str, size: int, mtime: int, chunks):
+        state = {
+            'remote_file': remoteFile,
+            'size': size,
+            'mtime': mtime,
+            'chunk_size': self.chunkSize,
+            'chunks': sorted(chunks)
+        }
+        tmpFile = stateFile + '.tmp'
+        with open(tmpFile, 'w') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmpFile, stateFile)
+
+    def _worker(self, remoteFile: str, partFile: str, size: int, pending, onChunkDone, errors):
+        sftp = None
+        rf = None
+        fd = os.open(partFile, os.O_WRONLY)
+        try:
+            while not errors:
+                try:
+                    index = pending.get_nowait()
+                except queue.Empty:
+                    break
+                offset = index * self.chunkSize
+                length = min(self.chunkSize, size - offset)
+                retries = 0
+                while True:
+                    try:
+                        if rf is None:
+                            sftp = self._pool.acquire().sftp
+                            rf = sftp.open(remoteFile, 'rb')
+                        data = next(rf.readv([(offset, length)]))
+                        if len(data) != length:
+                            raise EOFError("short read at offset {}".format(offset))
+                        os.pwrite(fd, data, offset)
+                        # the chunk is recorded as done in the state file, it has to be on disk before
+                        os.fdatasync(fd)
+                        break
+                    except Exception as e:
+                        for obj in (rf, sftp):
+                            try:
+                                if obj is not None:
+                                    obj.close()
+                            except Exception:
+                                pass
+                        rf = sftp = None
+                        retries += 1
+                        self._lock()
+                        self._retries += 1
+                        self._unlock()
+                        if retries > self.maxRetries or errors:
+                            raise e
+                        self._logWarning("Chunk {} download failed ({}), retry {}/{}".format(
+                            index, e, retries, self.maxRetries))
+                        self._pool.invalidate()
+                        time.sleep(min(0.5 * 2 ** retries, 10.0))
+                onChunkDone(index, length)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            os.close(fd)
+            for obj in (rf, sftp):
+                try:
+                    if obj is not None:
+                        obj.close()
+                except Exception:
+                    pass
+
+    def download(self, remoteFile: str, localFile: str):
+        """Download remote file to local file, resuming a previous partial download."""
+        startTime = time.time()
+        size, mtime = self._remoteStat(remoteFile)
+        partFile = localFile + '.part'
+        stateFile = localFile + '.part.json'
+
+        # remote checksum is calculated on the scanner while downloading
+        checksum = {}
+        checksumThread = threading.Thread(target=self._remoteChecksum, args=(remoteFile, checksum), daemon=True)
+        checksumThread.start()
+
+        done = self._loadState(stateFile, partFile, remoteFile, size, mtime)
+        if not done:
+            with open(partFile, 'wb') as f:
+                f.truncate(size)
+        numChunks = -(-size // self.chunkSize)
+        resumedBytes = sum(min(self.chunkSize, size - i * self.chunkSize) for i in done)
+        if resumedBytes > 0:
+            self._logDebug("Resuming download of {} at {} of {} bytes".format(remoteFile, resumedBytes, size))
+        self._saveState(stateFile, remoteFile, size, mtime, done)
+
+        pending = queue.Queue()
+        for index in range(numChunks):
+            if index not in done:
+                pending.put(index)
+        stateLock = threading.Lock()
+
+        def onChunkDone(index, length):
+            with stateLock:
+                done.add(index)
+                self._saveState(stateFile, remoteFile, size, mtime, done)
+
+        errors = []
+        workers = [threading.Thread(
+            target=self._worker,
+            args=(remoteFile, partFile, size, pending, onChunkDone, errors))
+            for _ in range(min(self.numChannels, max(pending.qsize(), 1)))]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        if errors:
+            # keep partial file and state for resuming the download
+            raise errors[0]
+
+        checksumThread.join()
+        self._verify(remoteFile, partFile, stateFile, size, mtime, checksum)
+        os.replace(partFile, localFile)
+        os.utime(localFile, (mtime, mtime))
+        os.remove(stateFile)
+
+        duration = time.time() - startTime
+        transferred = size - resumedBytes
+        self._lock()
+        self._downloads += 1
+        self._bytes += transferred
+        self._resumedBytes += resumedBytes
+        self._lastThroughput = (transferred / duration) if duration > 0 else 0.0
+        self._unlock()
+        self._logDebug("Downloaded {} bytes in {:.1f} s".format(transferred, duration))
+
+    def _verify(self, remoteFile: str, partFile: str, stateFile: str, size: int, mtime: int, checksum: dict):
+        error = None
+        if os.path.getsize(partFile) != size:
+            error = "size mismatch"
+        elif self._remoteStat(remoteFile) != (size, mtime):
+            error = "remote file modified during download"
+        elif 'md5' in checksum:
+            md5 = hashlib.md5()
+            with open(partFile, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    md5.update(block)
+            if md5.hexdigest() != checksum['md5']:
+                error = "checksum mismatch"
+        else:
+            self._logWarning("Remote checksum of {} not available, skipping checksum verification".format(remoteFile))
+        if error is not None:
+            self._lock()
+            self._verifyFailures += 1
+            self._unlock()
+            for f in (partFile, stateFile):
+                if os.path.exists(f):
+                    os.remove(f)
+            raise RuntimeError("Download of {} failed: {}".format(remoteFile, error))
+
+    def getStatistics(self):
+        """Return number of downloads, transferred bytes, retries and last throughput."""
+        self._lock()
+        stats = {
+            'downloads': self._downloads,
+            'bytes': self._bytes,
+            'resumed_bytes': self._resumedBytes,
+            'retries': self._retries,
+            'verify_failures': self._verifyFailures,
+            'throughput': self._lastThroughput
+        }
+        self._unlock()
+        return stats
+
 class RieglVzSSH:
     def __init__(self, node):
         self._node = node
@@ -93,38 +476,70 @@ class RieglVzSSH:
         self._sshUser = node.sshUser
         self._sshPwd = node.sshPwd
         self._logger = node.get_logger()
+        self._pool: SSHConnectionPool = node.sshConnectionPool
+        self._downloader: ChunkedDownloader = node.sshDownloader
 
     def downloadFile(self, remoteFile: str, localFile: str):
         self._logger.debug("Downloading file..")
         self._logger.debug("remote file = {}".format(remoteFile))
         self._logger.debug("local file  = {}".format(localFile))
-        ssh = RemoteClient(host=self._hostname, user=self._sshUser, password=self._sshPwd)
-        ssh.downloadFile(filepath=remoteFile, localpath=localFile)
-        ssh.disconnect()
+        self._pool.run(lambda ssh: ssh.downloadFile(filepath=remoteFile, localpath=localFile), retry=True)
+        self._logger.debug("File download finished")
+
+    def downloadLargeFile(self, remoteFile: str, localFile: str):
+        """Download file in parallel byte ranges, resuming an interrupted download."""
+        self._logger.debug("Downloading file in chunks..")
+        self._logger.debug("remote file = {}".format(remoteFile))
+        self._logger.debug("local file  = {}".format(localFile))
+        self._downloader.download(remoteFile, localFile)
         self._logger.debug("File download finished")
 
     def uploadFile(self, localFile: str, remoteDir: str):
         self._logger.debug("Uploading file..")
         self._logger.debug("local file = {}".format(localFile))
         self._logger.debug("remote dir = {}".format(remoteDir))
-        ssh = RemoteClient(host=self._hostname, user=self._sshUser, password=self._sshPwd)
-        ssh.uploadFile(localpath=localFile, remotepath=remoteDir)
-        ssh.disconnect()
+        self._pool.run(lambda ssh: ssh.uploadFile(localpath=localFile, remotepath=remoteDir))
         self._logger.debug("File upload finished")
 
-    def executeCommand(self, cmd):
+    def executeCommand(self, cmd, retry: bool = False):
+        """Execute remote command, retry is for commands without side effects only."""
         self._logger.debug("CMD = {}".format(cmd))
-        ssh = RemoteClient(host=self._hostname, user=self._sshUser, password=self._sshPwd)
-        response = ssh.executeCommand(cmd)
-        ssh.disconnect()
+        response = self._pool.run(lambda ssh: ssh.executeCommand(cmd), retry=retry)
         self._logger.debug("RESP = {}".format(' '.join(response)))
         return response
 
+    def readFile(self, remoteFile: str, offset: int = 0):
+        """Return content of remote file from byte offset on, read over SFTP."""
+        def read(ssh):
+            sftp = ssh.sftp
+            try:
+                with sftp.open(remoteFile, 'rb') as f:
+                    f.seek(offset)
+                    return f.read()
+            finally:
+                sftp.close()
+        self._logger.debug("Reading file {0} from offset {1}..".format(remoteFile, offset))
+        return self._pool.run(read, retry=True)
+
+    def statFiles(self, remoteFiles: List[str]):
+        """Return dictionary of remote file path to (size, mtime) of existing files.
+
+        All files are queried with a single remote stat command."""
+        if len(remoteFiles) == 0:
+            return {}
+        cmd = "stat -c '%s %Y %n' " + ' '.join("'{}'".format(f) for f in remoteFiles) + ' 2>/dev/null'
+        stats = {}
+        for line in self.executeCommand(cmd, retry=True):
+            values = line.rstrip('\n').split(' ', 2)
+            if len(values) == 3:
+                stats[values[2]] = (int(values[0]), int(values[1]))
+        return stats
+
     def listFiles(self, remotePath, filter):
         if (len(filter) == 0):
             filter = '*'
         cmd = 'ls -1d ' + remotePath + '/' + filter
-        files = self.executeCommand(cmd)
+        files = self.executeCommand(cmd, retry=True)
         if len(files) == 0 or (len(files) == 1 and files[0].find('No such file or directory')):
             files = []
         filesStripped = []
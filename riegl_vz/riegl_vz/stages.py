@@ -0,0 +1,229 @@
+import json
+import subprocess
+import threading
+import importlib.util
+from os.path import join, dirname, abspath
+
+from vzi_services.controlservice import ControlService
+from vzi_services.dataprocservice import DataprocService
+from vzi_services.projectservice import ProjectService
+from vzi_services.scannerservice import ScannerService, RectScanPattern
+from vzi_services.registry import getService
+
+from .utils import SubProcess
+
+appDir = dirname(abspath(__file__))
+
+_scripts = {}
+_scriptsLock = threading.Lock()
+
+def loadScript(name: str):
+    """Return module of a stage script (e.g. 'acquire-data'), loaded once per process."""
+    with _scriptsLock:
+        module = _scripts.get(name)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(
+                'riegl_vz_' + name.replace('-', '_'), join(appDir, name + '.py'))
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _scripts[name] = module
+        return module
+
+class CancelToken(object):
+    """Cancellation flag passed to the stage functions instead of the SIGTERM handler of the scripts."""
+    def __init__(self):
+        self.canceled = False
+        self._cond = threading.Condition()
+
+    def cancel(self):
+        with self._cond:
+            self.canceled = True
+            self._cond.notify_all()
+
+    def wakeup(self):
+        """Wake up waitUntil() to re-evaluate its predicate."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def waitUntil(self, predicate):
+        """Block until predicate() is true or canceled."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.canceled or predicate())
+
+class RieglVzStages():
+    """Runner of the data acquisition, RDBX creation and registration stages.
+
+       The stage functions of the scripts acquire-data.py, create-rdbx.py and
+       register-scan.py are called in-process on the service clients of the
+       service registry. With the subprocess fallback enabled the scripts are
+       run as separate python3 processes instead.
+
+       Stages may run concurrently. A stage returns True if it is completed and False if it has been
+       canceled with cancel(). A failing stage raises RuntimeError."""
+    def __init__(self, node):
+        self._node = node
+        self._logger = node.get_logger()
+        self._connectionString = node.hostname + ':20000'
+        self._workingDir = node.workingDir
+        self._subprocess = node.scanStagesSubprocess
+        self._active = []
+        self._threadLock = threading.Lock()
+
+    def _lock(self):
+        self._threadLock.acquire()
+
+    def _unlock(self):
+        self._threadLock.release()
+
+    def _begin(self, active):
+        self._lock()
+        self._active.append(active)
+        self._unlock()
+
+    def _end(self, active):
+        self._lock()
+        self._active.remove(active)
+        self._unlock()
+
+    def cancel(self):
+        """Cancel all active stages."""
+        self._lock()
+        for active in self._active:
+            active.cancel()
+        self._unlock()
+
+    def _runSubprocess(self, cmd, errorMessage: str):
+        self._logger.debug("CMD = {}".format(' '.join(cmd)))
+        subproc = SubProcess(subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE))
+        self._begin(subproc)
+        self._logger.debug("Subprocess started.")
+        try:
+            subproc.waitFor(errorMessage=errorMessage, block=True)
+        finally:
+            self._end(subproc)
+        return not subproc.canceled
+
+    def _runInProcess(self, fn, errorMessage: str):
+        token = CancelToken()
+        self._begin(token)
+        try:
+            return fn(token)
+        except Exception as e:
+            raise RuntimeError(''.join([errorMessage + '\n', str(e)]))
+        finally:
+            self._end(token)
+
+    def acquireData(
+        self,
+        scanPattern,
+        reflSearchSettings: dict = None,
+        captureImages: bool = False,
+        captureMode: int = 1,
+        imageOverlap: int = 25):
+        """Perform data acquisition. Blocks until acquisition is finished."""
+        errorMessage = 'Data acquisition failed.'
+        if self._subprocess:
+            cmd = [
+                'python3', join(appDir, 'acquire-data.py'),
+                '--connectionstring', self._connectionString]
+            if reflSearchSettings:
+                rssFilePath = join(self._workingDir, 'reflsearchsettings.json')
+                with open(rssFilePath, 'w') as f:
+                    json.dump(reflSearchSettings, f)
+                cmd.append('--reflsearch')
+                cmd.append(rssFilePath)
+            if scanPattern:
+                cmd.extend([
+                    '--line-start', str(scanPattern.lineStart),
+                    '--line-stop', str(scanPattern.lineStop),
+                    '--line-incr', str(scanPattern.lineIncrement),
+                    '--frame-start', str(scanPattern.frameStart),
+                    '--frame-stop', str(scanPattern.frameStop),
+                    '--frame-incr', str(scanPattern.frameIncrement),
+                    '--measprog', str(scanPattern.measProgram)
+                ])
+            if captureImages:
+                cmd.extend([
+                    '--capture-images',
+                    '--capture-mode', str(captureMode),
+                    '--image-overlap', str(imageOverlap)
+                ])
+            return self._runSubprocess(cmd, errorMessage)
+
+        script = loadScript('acquire-data')
+        # defaults of the script's command line options
+        rectScanPattern = RectScanPattern()
+        rectScanPattern.thetaStart = 30.0
+        rectScanPattern.thetaStop = 130.0
+        rectScanPattern.thetaIncrement = 0.04
+        rectScanPattern.phiStart = 0.0
+        rectScanPattern.phiStop = 360.0
+        rectScanPattern.phiIncrement = 0.04
+        measProg = 3
+        if scanPattern:
+            rectScanPattern.thetaStart = scanPattern.lineStart
+            rectScanPattern.thetaStop = scanPattern.lineStop
+            rectScanPattern.thetaIncrement = scanPattern.lineIncrement
+            rectScanPattern.phiStart = scanPattern.frameStart
+            rectScanPattern.phiStop = scanPattern.frameStop
+            rectScanPattern.phiIncrement = scanPattern.frameIncrement
+            measProg = scanPattern.measProgram
+        reflSearch = script.reflectorSearchSettings(reflSearchSettings) if reflSearchSettings else None
+        return self._runInProcess(lambda token: script.acquireData(
+            token,
+            getService(ScannerService, self._connectionString),
+            getService(ControlService, self._connectionString),
+            getService(DataprocService, self._connectionString),
+            rectScanPattern, measProg,
+            reflSearch=reflSearch,
+            captureImage=captureImages,
+            captureMode=captureMode,
+            imageOverlap=imageOverlap), errorMessage)
+
+    def actualScan(self):
+        """Return name of the scan recorded by the last data acquisition."""
+        return loadScript('create-rdbx').actualScan(getService(DataprocService, self._connectionString))
+
+    def createRdbx(self, projectName: str, scanposName: str, scan: str = None):
+        """Create rdbx from rxp of the given scan or the last data acquisition. Blocks until conversion is finished."""
+        errorMessage = 'RXP to RDBX conversion failed.'
+        if self._subprocess:
+            cmd = [
+                'python3', join(appDir, 'create-rdbx.py'),
+                '--connectionstring', self._connectionString,
+                '--project', projectName,
+                '--scanposition', scanposName]
+            if scan:
+                cmd.extend(['--scan', scan])
+            return self._runSubprocess(cmd, errorMessage)
+
+        script = loadScript('create-rdbx')
+        def run(token):
+            actualScan = scan if scan else script.actualScan(getService(DataprocService, self._connectionString))
+            storMedia = script.mediaString(getService(ProjectService, self._connectionString))
+            return script.createRdbx(
+                token, getService(ControlService, self._connectionString),
+                storMedia, projectName, scanposName, actualScan)
+        return self._runInProcess(run, errorMessage)
+
+    def registerScanposition(self, projectName: str, scanposName: str, mode: int, waitUntilFinished: bool = True):
+        """Register scan position. Blocks until registration is finished if requested."""
+        errorMessage = 'Registration failed.'
+        if self._subprocess:
+            cmd = [
+                'python3', join(appDir, 'register-scan.py'),
+                '--connectionstring', self._connectionString,
+                '--project', projectName,
+                '--scanposition', scanposName,
+                '--registrationmode', str(mode)]
+            if waitUntilFinished:
+                cmd.append('--wait-until-finished')
+            return self._runSubprocess(cmd, errorMessage)
+
+        script = loadScript('register-scan')
+        def run(token):
+            media = script.mediaString(getService(ProjectService, self._connectionString))
+            return script.registerScanposition(
+                token, getService(ControlService, self._connectionString),
+                media, projectName, scanposName, mode, waitUntilFinished)
+        return self._runInProcess(run, errorMessage)
@@ -1,4 +1,5 @@
 import time
+import copy
 import json
 import math
 import threading
@@ -12,6 +13,7 @@ from vzi_services.gnssbaseservice import GnssBaseService
 from vzi_services.riconnectswitch import RiconnectSwitch
 from vzi_services.cameraservice import CameraService
 from vzi_services.geosysservice import GeoSysService
+from vzi_services.registry import getService, getGeneration
 
 class ScannerStatus(object):
     def __init__(self):
@@ -63,39 +65,95 @@ class CameraStatus(object):
         self.avail = False
 
 class StatusMaintainer(object):
+    """Thread safe store of the scanner status.
+
+       The status objects are replaced on every change (copy on write), so an
+       object returned by one of the get methods is an immutable snapshot,
+       which is never modified afterwards.
+
+       The active task is the task of the operating state followed by the
+       tasks of the threads currently working on the scanner data, e.g. the
+       concurrently running post-acquisition stages."""
     def __init__(self):
         self._scannerStatus: ScannerStatus = ScannerStatus()
         self._memoryStatus: MemoryStatus = MemoryStatus()
         self._gnssStatus: GnssStatus = GnssStatus()
         self._errorStatus: ErrorStatus = ErrorStatus()
         self._cameraStatus: CameraStatus = CameraStatus()
-        self._threadLock = threading.Lock()
+        self._opstateTask = ''
+        self._threadTasks = {}
+        self._opstateCond = threading.Condition()
 
     def _lock(self):
-        self._threadLock.acquire()
+        self._opstateCond.acquire()
 
     def _unlock(self):
-        self._threadLock.release()
+        self._opstateCond.release()
+
+    def _updateScannerStatus(self, **values):
+        status = copy.copy(self._scannerStatus)
+        for key, value in values.items():
+            setattr(status, key, value)
+        self._scannerStatus = status
+
+    def _activeTask(self):
+        # tasks of finished threads have ended
+        for thread in [t for t in self._threadTasks if not t.is_alive()]:
+            del self._threadTasks[thread]
+        tasks = [self._opstateTask] if self._opstateTask else []
+        tasks += self._threadTasks.values()
+        return ', '.join(tasks)
 
     def setOpstate(self, opstate, task = ''):
         self._lock()
-        self._scannerStatus.opstate = opstate
-        self._scannerStatus.activeTask = task
+        self._opstateTask = task
+        self._updateScannerStatus(opstate=opstate, activeTask=self._activeTask())
+        self._opstateCond.notify_all()
         self._unlock()
 
+    def waitForOpstate(self, predicate, timeout = None):
+        """Block until predicate(opstate) is true, returns False on timeout.
+
+           Waiters are woken by every opstate change."""
+        self._lock()
+        try:
+            return self._opstateCond.wait_for(lambda: predicate(self._scannerStatus.opstate), timeout)
+        finally:
+            self._unlock()
+
     def setActiveTask(self, task):
+        """Set task of the calling thread, an empty task ends it."""
+        thread = threading.current_thread()
         self._lock()
-        self._scannerStatus.activeTask = task
+        if task:
+            self._threadTasks[thread] = task
+        else:
+            self._threadTasks.pop(thread, None)
+        self._updateScannerStatus(activeTask=self._activeTask())
         self._unlock()
 
     def setProgress(self, progress):
         self._lock()
-        self._scannerStatus.progress = progress
+        self._updateScannerStatus(progress=progress)
         self._unlock()
 
     def setLaserOn(self, state):
         self._lock()
-        self._scannerStatus.laserOn = state
+        self._updateScannerStatus(laserOn=state)
+        self._unlock()
+
+    def setInstrumentInfo(self, instIdent, serialNumber):
+        self._lock()
+        self._updateScannerStatus(instIdent=instIdent, serialNumber=serialNumber)
+        self._unlock()
+
+    def setServiceError(self, name):
+        """Flag communication error of status 'scanner', 'memory', 'gnss', 'error' or 'camera'."""
+        attr = '_' + name + 'Status'
+        self._lock()
+        status = copy.copy(getattr(self, attr))
+        status.err = True
+        setattr(self, attr, status)
         self._unlock()
 
     def getScannerStatus(self):
@@ -153,12 +211,24 @@ class StatusMaintainer(object):
         return status
 
 class RieglVzStatus():
+    """Maintenance of the scanner status.
+
+       The status is updated on the change signals of the scanner services
+       (syserror, camera discovered/lost, GNSS statusChanged/positionUpdate,
+       measurement started/finished, storage interface changes). The signal
+       handlers only request an update, the service calls are done by a
+       dedicated worker thread, which also polls all status values with the
+       slow fallback interval '~status_poll_interval'. Without the GNSS
+       positionUpdate signal the GNSS status is polled once per second."""
+    POLL_GROUPS = ('memory', 'gnss', 'errors', 'camera', 'laser')
+
     def __init__(self, node):
         self._node = node
         self._logger = node.get_logger()
         self._hostname = node.hostname
         self._connectionString = self._hostname + ':20000'
         self._node.storageMedia = 0
+        self._pollInterval = max(1.0, node.statusPollInterval)
         self._ctrlSvc = None
         self._scanSvc = None
         self._intfSvc = None
@@ -166,107 +236,233 @@ class RieglVzStatus():
         self._camSvc = None
         self._riconSw = None
         self._geoSvc = None
+        self._generation = 0
         self._shutdownReq = False
         self._gnssPosUpdateSigcon = None
+        self._gnssEnabled = True
+        self._sigcons = []
+        self._updateCond = threading.Condition()
+        self._updateRequests = set()
+        self._updateDue = {}
+        self._updateFns = {
+            'memory': self._updateMemoryStatus,
+            'gnss': self._updateGnssStatus,
+            'errors': self._updateErrorStatus,
+            'camera': self._updateCameraStatus,
+            'laser': self._updateLaserStatus
+        }
+
+        self.status: StatusMaintainer = StatusMaintainer()
+        self.trigStarted = False
 
         self._detectThread = threading.Thread(target=self._detectFunction, args=())
         self._detectThread.daemon = True
         self._detectThread.start()
 
-        self.status: StatusMaintainer = StatusMaintainer()
-        self.trigStarted = False
+    def requestUpdate(self, *groups):
+        """Request an update of status groups ('memory', 'gnss', 'errors', 'camera', 'laser')."""
+        with self._updateCond:
+            self._updateRequests.update(groups)
+            self._updateCond.notify_all()
 
-    def _detectFunction(self):
-        def onTaskProgress(arg0):
-            obj = json.loads(arg0)
-            self._logger.debug("scan progress: {0} % ({1}, {2})".format(obj['progress'], obj['id'], obj['progresstext']))
-            if obj['id'] == 1:
-                self.status.setProgress(obj['progress'])
+    def _onSysErrorChanged(self, *args):
+        self.requestUpdate('errors')
+
+    def _onCameraChanged(self, *args):
+        self.requestUpdate('camera')
+
+    def _onGnssStatusChanged(self, *args):
+        self.requestUpdate('gnss')
+
+    def _onMeasurementChanged(self, *args):
+        self.requestUpdate('laser')
+
+    def _onStorageChanged(self, *args):
+        self.requestUpdate('memory')
+
+    def _connectSignal(self, svc, signalName, fn):
+        if svc is None:
+            return
+        try:
+            self._sigcons.append(getattr(svc, signalName)().connect(fn))
+        except:
+            self._logger.debug("Signal '{}' is not available, status is polled.".format(signalName))
+
+    def _connectSignals(self):
+        self._connectSignal(self._riconSw, 'syserror', self._onSysErrorChanged)
+        self._connectSignal(self._riconSw, 'sysErrorAck', self._onSysErrorChanged)
+        self._connectSignal(self._camSvc, 'discovered', self._onCameraChanged)
+        self._connectSignal(self._camSvc, 'lost', self._onCameraChanged)
+        self._connectSignal(self._gnssSvc, 'statusChanged', self._onGnssStatusChanged)
+        self._connectSignal(self._scanSvc, 'measurementStarted', self._onMeasurementChanged)
+        self._connectSignal(self._scanSvc, 'measurementFinished', self._onMeasurementChanged)
+        self._connectSignal(self._intfSvc, 'storageInterfaceAdded', self._onStorageChanged)
+        self._connectSignal(self._intfSvc, 'storageInterfaceRemoved', self._onStorageChanged)
+        self._connectSignal(self._intfSvc, 'storageInterfaceEjected', self._onStorageChanged)
+        # scan data changes the free storage space
+        self._connectSignal(self._ctrlSvc, 'acquisitionFinished', self._onStorageChanged)
+
+    def _updateInterval(self, group):
+        if group == 'gnss' and self._gnssPosUpdateSigcon is None:
+            return 1.0
+        return self._pollInterval
+
+    def _updateFunction(self):
+        """Worker loop doing the requested and the due fallback status updates."""
+        self.requestUpdate(*self.POLL_GROUPS)
+        while not self._shutdownReq:
+            with self._updateCond:
+                now = time.monotonic()
+                groups = self._updateRequests | set(g for g, t in self._updateDue.items() if t <= now)
+                if not groups:
+                    timeout = min(self._updateDue.values()) - now if self._updateDue else None
+                    self._updateCond.wait(timeout)
+                    continue
+                self._updateRequests = set()
+                for group in groups:
+                    self._updateDue[group] = now + self._updateInterval(group)
+            if self._servicesReplaced():
+                if self._ctrlSvc is not None:
+                    self._logger.warning("Scanner connection lost, reconnecting status services.")
+                self._connectServices()
+            for group in self.POLL_GROUPS:
+                if group in groups:
+                    self._updateFns[group]()
+
+    def _onTaskProgress(self, arg0):
+        obj = json.loads(arg0)
+        self._logger.debug("scan progress: {0} % ({1}, {2})".format(obj['progress'], obj['id'], obj['progresstext']))
+        if obj['id'] == 1:
+            self.status.setProgress(obj['progress'])
+        self._node._statusUpdater.force_update()
+
+    def _onDataAcquisitionStarted(self, arg0):
+        if self.trigStarted:
+            self.status.setOpstate('scanning')
+            self._node._statusUpdater.force_update()
+            self._logger.debug("Data Acquisition Started!")
+
+    def _onDataAcquisitionFinished(self, arg0):
+        if self.trigStarted:
+            self.status.setOpstate('waiting')
+            self.trigStarted = False
             self._node._statusUpdater.force_update()
+            self._logger.debug("Data Acquisition Finished!")
+
+    def _onGnssPositionUpdate(self, arg0):
+        posInfo = json.loads(arg0)
+        gnssStatus = self._getGnssStatusFromPositionUpdate(posInfo)
+        gnssStatus.valid = True
+        self._node._rieglVz.publishGnssFix(gnssStatus)
+        # the stored status is for diagnostics only, the fix is published here
+        gnssStatus = copy.copy(gnssStatus)
+        gnssStatus.enabled = self._gnssEnabled
+        gnssStatus.publish = False
+        self.status.setGnssStatus(gnssStatus)
 
-        def onDataAcquisitionStarted(arg0):
-            if self.trigStarted:
-                self.status.setOpstate('scanning')
-                self._node._statusUpdater.force_update()
-                self._logger.debug("Data Acquisition Started!")
-
-        def onDataAcquisitionFinished(arg0):
-            if self.trigStarted:
-                self.status.setOpstate('waiting')
-                self.trigStarted = False
-                self._node._statusUpdater.force_update()
-                self._logger.debug("Data Acquisition Finished!")
-
-        def onGnssPositionUpdate(arg0):
-            posInfo = json.loads(arg0)
-            gnssStatus = self._getGnssStatusFromPositionUpdate(posInfo)
-            gnssStatus.valid = True
-            self._node._rieglVz.publishGnssFix(gnssStatus)
-
-        while self._ctrlSvc is None and not self._shutdownReq:
+    def _servicesReplaced(self):
+        """Return True if the service clients have to be acquired again.
+
+           The registry replaces all service clients of the scanner after a
+           connection loss, the signals of the previous clients never arrive
+           again then."""
+        try:
+            ctrlSvc = getService(ControlService, self._connectionString)
+        except:
+            return True
+        return ctrlSvc is not self._ctrlSvc or getGeneration(self._connectionString) != self._generation
+
+    def _disconnectSignals(self):
+        sigcons = self._sigcons
+        if self._gnssPosUpdateSigcon is not None:
+            sigcons.append(self._gnssPosUpdateSigcon)
+        self._sigcons = []
+        self._gnssPosUpdateSigcon = None
+        for sigcon in sigcons:
             try:
-                self._ctrlSvc = ControlService(self._connectionString)
-                self._taskProgress = self._ctrlSvc.taskProgress().connect(onTaskProgress)
-                self._acqStartedSigcon = self._ctrlSvc.acquisitionStarted().connect(onDataAcquisitionStarted)
-                self._acqFinishedSigcon = self._ctrlSvc.acquisitionFinished().connect(onDataAcquisitionFinished)
-                self.status.setOpstate('waiting')
+                sigcon.disconnect()
             except:
                 pass
-            time.sleep(1.0)
 
-        if not self._shutdownReq:
-            try:
-                self._scanSvc = ScannerService(self._connectionString)
-                ok, instInfoErr, instIdent, serialNumber = self._getInstInfo()
-                if ok:
-                    self.status._scannerStatus.instIdent = instIdent
-                    self.status._scannerStatus.serialNumber = serialNumber
-                    self._logger.info("{} {} is available now!".format(instIdent, serialNumber))
-            except:
-                self.status._scannerStatus.err = True
-                self._logger.error("ScannerService is not available!")
-            try:
-                self._intfSvc = InterfaceService(self._connectionString)
-            except:
-                self.status._memoryStatus.err = True
-                self._logger.error("InterfaceService is not available!")
+    def _connectServices(self):
+        """Acquire the service clients and connect their signals, returns False if the scanner is not available."""
+        self._disconnectSignals()
+        self._ctrlSvc = None
+        self._scanSvc = None
+        self._intfSvc = None
+        self._gnssSvc = None
+        self._camSvc = None
+        self._riconSw = None
+        try:
+            ctrlSvc = getService(ControlService, self._connectionString)
+            self._generation = getGeneration(self._connectionString)
+            self._sigcons = [
+                ctrlSvc.taskProgress().connect(self._onTaskProgress),
+                ctrlSvc.acquisitionStarted().connect(self._onDataAcquisitionStarted),
+                ctrlSvc.acquisitionFinished().connect(self._onDataAcquisitionFinished)
+            ]
+            self._ctrlSvc = ctrlSvc
+        except:
+            self._disconnectSignals()
+            return False
+        if self.status.getScannerStatus().opstate == 'unavailable':
+            self.status.setOpstate('waiting')
+
+        try:
+            self._scanSvc = getService(ScannerService, self._connectionString)
+            ok, instInfoErr, instIdent, serialNumber = self._getInstInfo()
+            if ok:
+                self.status.setInstrumentInfo(instIdent, serialNumber)
+                self._logger.info("{} {} is available now!".format(instIdent, serialNumber))
+        except:
+            self.status.setServiceError('scanner')
+            self._logger.error("ScannerService is not available!")
+        try:
+            self._intfSvc = getService(InterfaceService, self._connectionString)
+        except:
+            self.status.setServiceError('memory')
+            self._logger.error("InterfaceService is not available!")
+        try:
+            self._gnssSvc = getService(GnssBaseService, self._connectionString)
+        except:
+            self.status.setServiceError('gnss')
+            self._logger.error("GnssBaseService is not available!")
+        if self._gnssSvc is not None:
             try:
-                self._gnssSvc = GnssBaseService(self._connectionString)
-            except:
-                self.status._gnssStatus.err = True
-                self._logger.error("GnssBaseService is not available!")
-            if self._gnssSvc is not None:
-                try:
-                    ricSvc = RiconnectSwitch(self._connectionString)
-                    vstr = ricSvc.getMessages('version','GnssBaseService')
-                    self._logger.info("GnssBaseService version: {}".format(vstr[0].text))
-                    v = vstr[0].text.split(".")
-                    if int(v[0]) == 1 and int(v[1]) >= 11 and int(v[2]) >= 1:
-                        self._gnssPosUpdateSigcon = self._gnssSvc.positionUpdate().connect(onGnssPositionUpdate)
-                        self._logger.info("GnssBaseService with positionUpdate signal.")
-                    else:
-                        self._logger.info("GnssBaseService without positionUpdate signal!")
-                        self._gnssPosUpdateSigcon = None
-                except:
+                ricSvc = getService(RiconnectSwitch, self._connectionString)
+                vstr = ricSvc.getMessages('version','GnssBaseService')
+                self._logger.info("GnssBaseService version: {}".format(vstr[0].text))
+                v = vstr[0].text.split(".")
+                if int(v[0]) == 1 and int(v[1]) >= 11 and int(v[2]) >= 1:
+                    self._gnssPosUpdateSigcon = self._gnssSvc.positionUpdate().connect(self._onGnssPositionUpdate)
+                    self._logger.info("GnssBaseService with positionUpdate signal.")
+                else:
                     self._logger.info("GnssBaseService without positionUpdate signal!")
                     self._gnssPosUpdateSigcon = None
-            try:
-                self._camSvc = CameraService(self._connectionString)
-            except:
-                self.status._cameraStatus.err = True
-                self._logger.error("CameraService is not available!")
-            try:
-                self._riconSw = RiconnectSwitch(self._connectionString)
             except:
-                self.status._errorStatus.err = True
-                self._logger.error("RiconnectSwitch is not available!")
+                self._logger.info("GnssBaseService without positionUpdate signal!")
+                self._gnssPosUpdateSigcon = None
+        try:
+            self._camSvc = getService(CameraService, self._connectionString)
+        except:
+            self.status.setServiceError('camera')
+            self._logger.error("CameraService is not available!")
+        try:
+            self._riconSw = getService(RiconnectSwitch, self._connectionString)
+        except:
+            self.status.setServiceError('error')
+            self._logger.error("RiconnectSwitch is not available!")
 
-        self._shutdownReq = False
+        self._connectSignals()
+        # all status values may have changed while the signals were not connected
+        self.requestUpdate(*self.POLL_GROUPS)
+        return True
+
+    def _detectFunction(self):
+        while not self._shutdownReq and not self._connectServices():
+            time.sleep(1.0)
 
-        self._timer10sCallback()
-        self._node.create_timer(10.0, self._timer10sCallback)
-        self._timer1sCallback()
-        self._node.create_timer(1.0, self._timer1sCallback)
+        self._updateFunction()
 
     def _getInstInfo(self):
         ok = False
@@ -279,8 +475,7 @@ class RieglVzStatus():
             serialNumber = self._scanSvc.instrumentInformation().serialNumber
         return ok, err, instIdent, serialNumber
 
-    def _timer10sCallback(self):
-        # memory status
+    def _updateMemoryStatus(self):
         memoryStatus = MemoryStatus()
         try:
             if self._intfSvc:
@@ -364,8 +559,7 @@ class RieglVzStatus():
             ok, gnssStatus.longitude, gnssStatus.latitude, gnssStatus.altitude = self._node._rieglVz.geosys.transformToWgs84(gnssStatus.cs, gnssStatus.longitude, gnssStatus.latitude, gnssStatus.altitude)
         return gnssStatus
 
-    def _timer1sCallback(self):
-        # gnss status
+    def _updateGnssStatus(self):
         gnssStatus = GnssStatus()
         try:
             if self._gnssSvc:
@@ -374,13 +568,14 @@ class RieglVzStatus():
             if self._gnssPosUpdateSigcon is not None:
                 gnssStatus.publish = False
             if self._scanSvc:
-                gnssStatus.enabled = True if (self._scanSvc.gpsMode() != 0) else False
+                self._gnssEnabled = True if (self._scanSvc.gpsMode() != 0) else False
+                gnssStatus.enabled = self._gnssEnabled
         except:
             gnssStatus.publish = False
             gnssStatus.err = True
         self.status.setGnssStatus(gnssStatus)
 
-        # error status
+    def _updateErrorStatus(self):
         errorStatus = ErrorStatus()
         try:
             if self._riconSw:
@@ -394,7 +589,7 @@ class RieglVzStatus():
             errorStatus.err = True
         self.status.setErrorStatus(errorStatus)
 
-        # camera status
+    def _updateCameraStatus(self):
         cameraStatus = CameraStatus()
         try:
             if self._camSvc:
@@ -405,16 +600,17 @@ class RieglVzStatus():
             cameraStatus.err = True
         self.status.setCameraStatus(cameraStatus)
 
-        # laser status
+    def _updateLaserStatus(self):
         laserOn = False
         try:
             if self._scanSvc:
                 laserOn = self._scanSvc.isLaserOn()
         except:
-            self.status._scannerStatus.err = True
+            self.status.setServiceError('scanner')
         self.status.setLaserOn(laserOn)
 
     def shutdown(self):
-        self._shutdownReq = True
-        while self.shutdownReq:
-            time.sleep(0.1)
+        with self._updateCond:
+            self._shutdownReq = True
+            self._updateCond.notify_all()
+        self._disconnectSignals()
@@ -0,0 +1,229 @@
+#!/bin/env python3
+
+import os
+import sys
+import argparse
+import asyncio
+import importlib
+import logging
+import tempfile
+import threading
+import time
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'riconnect'))
+
+import riconnect
+
+from vzi_services.emulator import SwitchEmulator
+from vzi_services.registry import ServiceRegistry, getService, getServiceRegistry
+from vzi_services.projectservice import ProjectService
+from vzi_services.scannerservice import ScannerService
+from vzi_services.cameraservice import CameraService
+from vzi_services.aio import AsyncProjectService
+
+driverDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'riegl_vz', 'riegl_vz')
+
+def driverModule(name):
+    """Import a module of the riegl_vz package without the package's __init__, which requires ROS."""
+    if 'riegl_vz' not in sys.modules:
+        package = types.ModuleType('riegl_vz')
+        package.__path__ = [driverDir]
+        sys.modules['riegl_vz'] = package
+    return importlib.import_module('riegl_vz.' + name)
+
+def report(name, durations):
+    durations = sorted(durations)
+    n = len(durations)
+    print("{0:<40} {1:>6} runs  mean {2:>9.3f} ms  p50 {3:>9.3f} ms  p99 {4:>9.3f} ms".format(
+        name, n, sum(durations) / n * 1e3, durations[n // 2] * 1e3, durations[min(n - 1, int(n * 0.99))] * 1e3))
+
+def reportRate(name, numCalls, duration):
+    print("{0:<40} {1:>6} calls {2:>8.3f} s  {3:>9.1f} calls/s".format(
+        name, numCalls, duration, numCalls / duration if duration > 0 else 0))
+
+def measure(fn, repeat):
+    durations = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+def benchConnectionSetup(address, repeat):
+    def connect():
+        svc = ProjectService(address)
+        svc.projectName()
+        svc._svc.close()
+    report('connect (new connections)', measure(connect, repeat))
+
+    registry = ServiceRegistry()
+    def lookup():
+        registry.get(ProjectService, address).projectName()
+    report('connect (service registry)', measure(lookup, repeat))
+    registry.close()
+
+def benchRpc(address, repeat, numThreads):
+    registry = ServiceRegistry()
+    projSvc = registry.get(ProjectService, address)
+    scanSvc = registry.get(ScannerService, address)
+    cameraSvc = registry.get(CameraService, address)
+    report('ProjectService.projectName', measure(projSvc.projectName, repeat))
+    report('ScannerService.activeMeasurementProgram', measure(scanSvc.activeMeasurementProgram, repeat))
+    report('CameraService.list (transfer)', measure(cameraSvc.list, repeat))
+
+    def worker():
+        for i in range(repeat):
+            projSvc.projectName()
+    threads = [threading.Thread(target=worker) for i in range(numThreads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    reportRate('projectName ({} threads)'.format(numThreads), numThreads * repeat, time.perf_counter() - start)
+    registry.close()
+
+def benchAsyncRpc(address, repeat, numTasks):
+    async def run():
+        async with AsyncProjectService(address) as projSvc:
+            await projSvc.projectName()
+            start = time.perf_counter()
+            for i in range(repeat):
+                await asyncio.gather(*[projSvc.projectName() for j in range(numTasks)])
+            reportRate('async projectName ({} tasks)'.format(numTasks), numTasks * repeat, time.perf_counter() - start)
+    asyncio.run(run())
+
+class BenchmarkNode(object):
+    """Node attributes used by RieglVzStages."""
+    def __init__(self, workingDir):
+        self.hostname = '127.0.0.1'
+        self.workingDir = workingDir
+        self.scanStagesSubprocess = False
+        self._logger = logging.getLogger('riegl_vz')
+
+    def get_logger(self):
+        return self._logger
+
+def benchScanPipeline(address, repeat, depth, publishTime):
+    """Run scan positions through the scan job queue and the post-acquisition pipeline of the driver.
+
+       Acquisition, RDBX creation and registration are run by RieglVzStages
+       against the emulator. The publishing stages download the results over
+       SSH, which is not emulated, they are replaced by a sleep of 'publishTime'."""
+    stages = driverModule('stages')
+    pipelineModule = driverModule('pipeline')
+    jobsModule = driverModule('jobs')
+
+    node = BenchmarkNode(tempfile.gettempdir())
+    rieglVzStages = stages.RieglVzStages(node)
+    # the driver connects to port 20000 of the scanner, the emulator listens on any port
+    rieglVzStages._connectionString = address
+    projSvc = getService(ProjectService, address)
+    projSvc.createProject('BENCHMARK')
+    projSvc.loadProject('BENCHMARK')
+
+    productTimes = {}
+    productLock = threading.Lock()
+
+    def product(job):
+        with productLock:
+            if job.id not in productTimes:
+                productTimes[job.id] = time.monotonic() - job.times['queued']
+
+    def acquire(job):
+        projSvc.createScanposition(job.scanposName)
+        projSvc.selectScanposition(job.scanposName)
+        if not rieglVzStages.acquireData(None):
+            return False
+        job.scan = rieglVzStages.actualScan()
+
+    def register(job):
+        try:
+            if job.previousJob is not None:
+                job.previousJob.registered.wait()
+            return rieglVzStages.registerScanposition('BENCHMARK', job.scanposName, 1, waitUntilFinished=True)
+        finally:
+            job.registered.set()
+
+    def publish(job):
+        time.sleep(publishTime)
+        product(job)
+
+    def process(job):
+        # stages and dependencies of RieglVz._processJob for a registered point cloud in VOCS
+        pipeline = pipelineModule.Pipeline()
+        pipeline.add('register', lambda: register(job))
+        pipeline.add('rdbx', lambda: rieglVzStages.createRdbx('BENCHMARK', job.scanposName, job.scan))
+        pipeline.add('pointcloud', lambda: publish(job), ['rdbx', 'register'])
+        pipeline.add('pose', lambda: publish(job), ['register'])
+        return pipeline.run()
+
+    queue = jobsModule.ScanJobQueue(depth, acquire, process)
+    jobs = []
+    start = time.monotonic()
+    for i in range(repeat):
+        while not queue.accepting():
+            time.sleep(0.005)
+        jobs.append(queue.submit(str(i + 1), {'scanposName': 'DEPTH{0}-{1}'.format(depth, i + 1)}))
+    queue.waitUntilIdle()
+    duration = time.monotonic() - start
+    stats = queue.getStatistics()
+    if stats['completed'] != repeat:
+        print("scan pipeline (depth {0}): {1} of {2} scan positions failed".format(depth, repeat - stats['completed'], repeat))
+        return
+    report('scan pipeline (depth {}) first product'.format(depth), list(productTimes.values()))
+    report('scan pipeline (depth {}) latency'.format(depth), [job.latency() for job in jobs])
+    print("{0:<40} {1:>6} scans {2:>8.3f} s  {3:>9.3f} s/scan".format(
+        'scan pipeline (depth {}) throughput'.format(depth), repeat, duration, duration / repeat))
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure service connection setup, call latency and scan pipeline duration against the switch emulator.')
+    parser.add_argument('--connectionstring',
+        help='address of scanner services, runs the switch emulator if omitted')
+    parser.add_argument('--latency', type=float, default=1.0,
+        help='one-way latency of the emulated link in milliseconds (default=1.0)')
+    parser.add_argument('--bandwidth', type=float, default=0.0,
+        help='bandwidth of the emulated link in MB/s, 0 for unlimited (default=0)')
+    parser.add_argument('--acquisition-time', type=float, default=1.0,
+        help='duration of an emulated data acquisition in seconds (default=1.0)')
+    parser.add_argument('--task-time', type=float, default=0.5,
+        help='duration of an emulated background task in seconds (default=0.5)')
+    parser.add_argument('--repeat', type=int, default=200,
+        help='number of service calls per measurement (default=200)')
+    parser.add_argument('--threads', type=int, default=8,
+        help='number of concurrent callers (default=8)')
+    parser.add_argument('--scans', type=int, default=3,
+        help='number of scan positions per scan pipeline run (default=3)')
+    parser.add_argument('--queue-depth', type=int, default=2,
+        help='scan queue depth of the scan pipeline, compared with depth 0 (default=2)')
+    parser.add_argument('--publish-time', type=float, default=0.5,
+        help='duration of a stubbed publishing stage in seconds (default=0.5)')
+    args = parser.parse_args()
+
+    emulator = None
+    address = args.connectionstring
+    if address is None:
+        emulator = SwitchEmulator(
+            latency=args.latency / 1000,
+            bandwidth=args.bandwidth * 1e6 if args.bandwidth > 0 else None,
+            acquisitionTime=args.acquisition_time,
+            taskTime=args.task_time)
+        emulator.start()
+        address = emulator.address
+
+    benchConnectionSetup(address, max(1, args.repeat // 10))
+    benchRpc(address, args.repeat, args.threads)
+    benchAsyncRpc(address, max(1, args.repeat // args.threads), args.threads)
+    if emulator is not None:
+        # the scan pipeline would start real acquisitions on a scanner
+        benchScanPipeline(address, args.scans, 0, args.publish_time)
+        benchScanPipeline(address, args.scans, args.queue_depth, args.publish_time)
+        # the driver stages use the process wide service registry
+        getServiceRegistry().close()
+        print("emulator: {}".format(emulator.getStatistics()))
+        emulator.stop()
+
+if __name__ == "__main__":
+    main()
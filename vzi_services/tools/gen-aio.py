@@ -0,0 +1,192 @@
+#!/bin/env python3
+
+"""Generate the async service facades in vzi_services/aio from the service modules.
+
+   The methods of a service class doing requests, directly or by calling
+   other methods doing requests, are written as async def with the requests
+   awaited. All other methods (signal accessors and handlers) are copied
+   unchanged. Run again after the service modules have been regenerated."""
+
+import os
+import sys
+import ast
+import types
+import argparse
+import builtins
+import importlib
+
+baseDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, baseDir)
+sys.path.insert(0, os.path.join(baseDir, '..', 'riconnect'))
+
+SERVICES = [
+    ('cameraservice', 'CameraService'),
+    ('cloudstorageservice', 'CloudStorageService'),
+    ('controlservice', 'ControlService'),
+    ('dataprocservice', 'DataprocService'),
+    ('deviceservice', 'DeviceService'),
+    ('geosysservice', 'GeoSysService'),
+    ('gnssbaseservice', 'GnssBaseService'),
+    ('interfaceservice', 'InterfaceService'),
+    ('poseestimationservice', 'PoseEstimationService'),
+    ('previewgenservice', 'PreviewgenService'),
+    ('projectservice', 'ProjectService'),
+    ('riconnectswitch', 'RiconnectSwitch'),
+    ('scannereventsservice', 'ScannereventsService'),
+    ('scannerservice', 'ScannerService')
+]
+
+# requests of riconnect.Service, coroutines of riconnect.aio.AsyncService
+REQUESTS = ('callFunction', 'getProperty', 'setProperty')
+
+# parents of an awaited call which do not need parentheses around the await expression
+PLAIN_AWAIT_PARENTS = (ast.Assign, ast.AnnAssign, ast.AugAssign, ast.Return, ast.Expr)
+
+class ProbeService(object):
+    """Stand-in for riconnect.Service to create service signals without connection."""
+    def subscribe(self, signalName, cbFunc):
+        pass
+
+    def unsubscribe(self, signalName, cbFunc):
+        pass
+
+    def close(self):
+        pass
+
+def signalAccessors(module, serviceClass):
+    """Return names of the methods returning a service signal."""
+    probe = serviceClass.__new__(serviceClass)
+    probe._svc = ProbeService()
+    probe._initSignals()
+    return set(k[1:] for k, v in vars(probe).items() if isinstance(v, module.ServiceSignal))
+
+def awaitedCalls(node, coroutines):
+    """Return the calls of a method to await with their parent nodes."""
+    calls = []
+    for parent in ast.walk(node):
+        for child in ast.iter_child_nodes(parent):
+            if not isinstance(child, ast.Call) or not isinstance(child.func, ast.Attribute):
+                continue
+            obj = child.func.value
+            if isinstance(obj, ast.Name) and obj.id == 'self':
+                awaited = child.func.attr in coroutines
+            else:
+                awaited = (child.func.attr in REQUESTS and isinstance(obj, ast.Attribute) and obj.attr == '_svc'
+                    and isinstance(obj.value, ast.Name) and obj.value.id == 'self')
+            if awaited:
+                calls.append((child, parent))
+    return calls
+
+def coroutineMethods(methods, signals):
+    """Return names of the methods becoming coroutines."""
+    coroutines = set()
+    while True:
+        names = set(name for name, node in methods.items()
+            if name not in signals and awaitedCalls(node, coroutines))
+        if names == coroutines:
+            return coroutines
+        coroutines = names
+
+def insert(lines, lineno, col, text):
+    # column offsets of the ast are utf-8 byte offsets
+    line = lines[lineno].encode('utf-8')
+    lines[lineno] = (line[:col] + text.encode('utf-8') + line[col:]).decode('utf-8')
+
+def methodSource(sourceLines, node, coroutines):
+    """Return source lines of a method, written as coroutine if it is one."""
+    first = node.lineno - 1
+    lines = sourceLines[first:node.end_lineno]
+    if node.name not in coroutines:
+        return lines
+    edits = [(node.lineno, node.col_offset, 'async ')]
+    for call, parent in awaitedCalls(node, coroutines):
+        if isinstance(parent, PLAIN_AWAIT_PARENTS):
+            edits.append((call.lineno, call.col_offset, 'await '))
+        else:
+            edits.append((call.lineno, call.col_offset, '(await '))
+            edits.append((call.end_lineno, call.end_col_offset, ')'))
+    # insert from the end, so the offsets of the remaining edits stay valid
+    for lineno, col, text in sorted(edits, reverse=True):
+        insert(lines, lineno - 1 - first, col, text)
+    return lines
+
+def globalNames(nodes):
+    names = set()
+    for node in nodes:
+        for n in ast.walk(node):
+            if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load):
+                names.add(n.id)
+    return names
+
+def generate(moduleName, className):
+    module = importlib.import_module('vzi_services.' + moduleName)
+    serviceClass = getattr(module, className)
+    with open(module.__file__, encoding='utf-8') as f:
+        source = f.read()
+    sourceLines = source.splitlines(keepends=True)
+    classNode = next(n for n in ast.parse(source).body if isinstance(n, ast.ClassDef) and n.name == className)
+    methods = {}
+    for n in classNode.body:
+        if isinstance(n, ast.FunctionDef) and not n.name.startswith('__'):
+            methods[n.name] = n
+    coroutines = coroutineMethods(methods, signalAccessors(module, serviceClass))
+
+    # module globals used by the methods, modules are imported, all other names taken from the service module
+    imports = []
+    fromImports = [className]
+    for name in sorted(globalNames(methods.values())):
+        if name == className or name not in vars(module) or hasattr(builtins, name):
+            continue
+        value = vars(module)[name]
+        if isinstance(value, types.ModuleType):
+            imports.append('import {}'.format(value.__name__))
+        else:
+            fromImports.append(name)
+
+    out = []
+    out.append('# pylint: skip-file\n')
+    out.append('# Generated by tools/gen-aio.py from vzi_services/{}.py, do not edit.\n'.format(moduleName))
+    out.extend(line + '\n' for line in imports)
+    out.append('from ..{} import {}\n'.format(moduleName, ', '.join(fromImports)))
+    out.append('from .facade import AsyncServiceFacade\n')
+    out.append('\n')
+    out.append('class Async{}(AsyncServiceFacade):\n'.format(className))
+    doc = classNode.body[0]
+    if isinstance(doc, ast.Expr) and isinstance(doc.value, ast.Constant) and isinstance(doc.value.value, str):
+        out.extend(sourceLines[doc.lineno - 1:doc.end_lineno])
+    out.append('    SERVICE_CLASS = {}\n'.format(className))
+    for k, v in vars(serviceClass).items():
+        if not k.startswith('_') and not isinstance(v, types.FunctionType):
+            # enumerations and constants
+            out.append('    {0} = {1}.{0}\n'.format(k, className))
+    for n in classNode.body:
+        if isinstance(n, ast.FunctionDef) and n.name in methods:
+            out.append('\n')
+            out.extend(methodSource(sourceLines, n, coroutines))
+    code = ''.join(out)
+
+    # the generated methods have to match the source methods with the requests awaited
+    generated = next(n for n in ast.parse(code).body if isinstance(n, ast.ClassDef))
+    for n in generated.body:
+        if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if isinstance(n, ast.AsyncFunctionDef) != (n.name in coroutines):
+                raise RuntimeError("{}.{}: unexpected function type".format(className, n.name))
+            numAwaits = sum(1 for a in ast.walk(n) if isinstance(a, ast.Await))
+            if numAwaits != len(awaitedCalls(methods[n.name], coroutines)):
+                raise RuntimeError("{}.{}: unexpected number of awaits".format(className, n.name))
+    return code
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the async service facades in vzi_services/aio.')
+    parser.add_argument('--output', default=os.path.join(baseDir, 'vzi_services', 'aio'),
+        help='output directory (default=vzi_services/aio)')
+    args = parser.parse_args()
+
+    for moduleName, className in SERVICES:
+        code = generate(moduleName, className)
+        with open(os.path.join(args.output, moduleName + '.py'), 'w', encoding='utf-8') as f:
+            f.write(code)
+        print("{}.py written".format(moduleName))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Async counterparts of the service classes.
+
+   Every service class XyzService has an async facade AsyncXyzService with
+   the same methods declared as async def. The facade modules are generated
+   from the service modules by tools/gen-aio.py, with the requests awaited,
+   so the request encoding and response decoding are the ones of the service
+   class. The requests are sent with riconnect.aio.AsyncService, so all
+   services of one event loop share a few stream connections and no OS
+   threads.
+
+   Signal accessors are plain methods, the connected callback functions are
+   called from the event loop.
+
+   Example:
+     async with AsyncProjectService("127.0.0.1:20000") as projSvc:
+         print(await projSvc.projectPath())"""
+
+from riconnect.aio import AsyncConnectionFactory
+from .facade import AsyncServiceFacade
+from .cameraservice import AsyncCameraService
+from .cloudstorageservice import AsyncCloudStorageService
+from .controlservice import AsyncControlService
+from .dataprocservice import AsyncDataprocService
+from .deviceservice import AsyncDeviceService
+from .geosysservice import AsyncGeoSysService
+from .gnssbaseservice import AsyncGnssBaseService
+from .interfaceservice import AsyncInterfaceService
+from .poseestimationservice import AsyncPoseEstimationService
+from .previewgenservice import AsyncPreviewgenService
+from .projectservice import AsyncProjectService
+from .riconnectswitch import AsyncRiconnectSwitch
+from .scannereventsservice import AsyncScannereventsService
+from .scannerservice import AsyncScannerService
@@ -0,0 +1,1706 @@
+# pylint: skip-file
+# Generated by tools/gen-aio.py from vzi_services/controlservice.py, do not edit.
+import json
+import riconnect
+from ..controlservice import ControlService, AcquisitionInformation, PoseEstimationSettings, ReflectorScanSettings, ReflectorSearchSettings, ScanSequenceInformation, ServiceSignal, _controlservice_acquisitionfinished_decoder, _controlservice_acquisitionstarted_decoder, _controlservice_activesdcstoragedevicechanged_decoder, _controlservice_activeusbstoragedevicechanged_decoder, _controlservice_backgroundtaskadded_decoder, _controlservice_backgroundtaskchanged_decoder, _controlservice_backgroundtaskremoved_decoder, _controlservice_environmentsensorsenabledchanged_decoder, _controlservice_error_decoder, _controlservice_horizontalimageoverlapchanged_decoder, _controlservice_imagecapturemodechanged_decoder, _controlservice_poseestimationsettingschanged_decoder, _controlservice_reflectorscansettingschanged_decoder, _controlservice_reflectorsearchsettingschanged_decoder, _controlservice_registrationbranchpointchanged_decoder, _controlservice_registrationmodechanged_decoder, _controlservice_registrationresolvemtachanged_decoder, _controlservice_storemeasurementstreamchanged_decoder, _controlservice_storemonitorstreamchanged_decoder, _controlservice_taskfinished_decoder, _controlservice_taskmodechanged_decoder, _controlservice_taskprogress_decoder, _controlservice_taskstarted_decoder, _controlservice_taskstatechanged_decoder
+from .facade import AsyncServiceFacade
+
+class AsyncControlService(AsyncServiceFacade):
+    """The control service.
+       
+       The control service implements the logic of the data acquisition. It can be
+       used to execute a scan sequence consisting of different data acquisition
+       tasks like a pose estimation, scan data acquisition, reflector search,
+       reflector scans, and image acquisition. The control service does not
+       implement all of the necessary functionality itself but instead uses other
+       services like the PoseEstimationService or DataProcService to perform the
+       individual data acquisition tasks.
+       
+       Acquisition tasks can be in one of three modes (ON, OFF, AUTO_ON). When a task
+       is in mode ON then it will be executed or return with an error it can't be
+       executed. If a task is in OFF mode then it will not be executed.
+       
+       The AUTO_ON mode is slightly different for each task:
+           pose estimation:   executed if no pose estimation has been done for the
+                              active scanposition
+           reflector search:  executed if scan task is part of scan sequence
+           reflector scans:   executed if reflector search is part of scan sequence
+           image acquisition: executed if camera is detected and camera calibration
+                              is set
+       
+       Changelog v1.4:
+       ---------------
+       The modes IMAGE_FAST and IMAGE_FAST_AUTO_ON are experimental and can be used to
+       perform the image acquisition at the same time as the scan acquisition. The camera
+       exposure time gets clamped if necessary to ensure that the images can be triggered
+       at the right moment and also to minimize motion blur."""
+    SERVICE_CLASS = ControlService
+    AcquisitionMode = ControlService.AcquisitionMode
+    AcquisitionTask = ControlService.AcquisitionTask
+    AcquisitionTaskMode = ControlService.AcquisitionTaskMode
+    AcquisitionTaskState = ControlService.AcquisitionTaskState
+    ResultCode = ControlService.ResultCode
+    ImageAcquisitionCaptureMode = ControlService.ImageAcquisitionCaptureMode
+    AcquisitionFlags = ControlService.AcquisitionFlags
+    RegistrationMode = ControlService.RegistrationMode
+    ACM_SCANSEQUENCE = ControlService.ACM_SCANSEQUENCE
+    ACM_QUICKSCAN = ControlService.ACM_QUICKSCAN
+    ACT_SCAN = ControlService.ACT_SCAN
+    ACT_IMAGESEQUENCE = ControlService.ACT_IMAGESEQUENCE
+    ACT_POSEESTIMATION = ControlService.ACT_POSEESTIMATION
+    ACT_REFLSEARCH = ControlService.ACT_REFLSEARCH
+    ACT_REFLSCANS = ControlService.ACT_REFLSCANS
+    ACT_FINALIZATION = ControlService.ACT_FINALIZATION
+    ACTM_AUTO_ON = ControlService.ACTM_AUTO_ON
+    ACTM_ON = ControlService.ACTM_ON
+    ACTM_OFF = ControlService.ACTM_OFF
+    ACTM_IMAGE_FAST = ControlService.ACTM_IMAGE_FAST
+    ACTM_IMAGE_FAST_AUTO_ON = ControlService.ACTM_IMAGE_FAST_AUTO_ON
+    ACTS_NOT_RUNNING = ControlService.ACTS_NOT_RUNNING
+    ACTS_RUNNING = ControlService.ACTS_RUNNING
+    ACTS_PAUSED = ControlService.ACTS_PAUSED
+    RC_SUCCESS = ControlService.RC_SUCCESS
+    RC_CANCELED = ControlService.RC_CANCELED
+    RC_ERROR = ControlService.RC_ERROR
+    ICM_AUTOMATIC = ControlService.ICM_AUTOMATIC
+    ICM_INTERACTIVE = ControlService.ICM_INTERACTIVE
+    ACQ_SCAN = ControlService.ACQ_SCAN
+    ACQ_POSEESTIMATION_BEFORE_SCAN = ControlService.ACQ_POSEESTIMATION_BEFORE_SCAN
+    ACQ_REFLSEARCH = ControlService.ACQ_REFLSEARCH
+    ACQ_REFLSCANS = ControlService.ACQ_REFLSCANS
+    ACQ_IMAGES_AFTER_SCAN = ControlService.ACQ_IMAGES_AFTER_SCAN
+    ACQ_IMAGES_DURING_SCAN = ControlService.ACQ_IMAGES_DURING_SCAN
+    ACQ_FINALIZATION_IMU_DELAY = ControlService.ACQ_FINALIZATION_IMU_DELAY
+    REG_DISABLED = ControlService.REG_DISABLED
+    REG_AUTO = ControlService.REG_AUTO
+    REG_OUTDOOR_URBAN = ControlService.REG_OUTDOOR_URBAN
+    REG_OUTDOOR_NON_URBAN = ControlService.REG_OUTDOOR_NON_URBAN
+    REG_INDOOR_SMALL = ControlService.REG_INDOOR_SMALL
+    REG_INDOOR_LARGE = ControlService.REG_INDOOR_LARGE
+    REG_MINING_MEDIUM = ControlService.REG_MINING_MEDIUM
+    REG_MINING_LARGE = ControlService.REG_MINING_LARGE
+    SERVICE_NAME = ControlService.SERVICE_NAME
+
+    def _initSignals(self):
+        # service signals
+        self._error = ServiceSignal(self._svc, "error", decoderFn=_controlservice_error_decoder)
+        self._horizontalImageOverlapChanged = ServiceSignal(self._svc, "horizontalImageOverlapChanged", decoderFn=_controlservice_horizontalimageoverlapchanged_decoder)
+        self._imageCaptureModeChanged = ServiceSignal(self._svc, "imageCaptureModeChanged", decoderFn=_controlservice_imagecapturemodechanged_decoder)
+        self._taskModeChanged = ServiceSignal(self._svc, "taskModeChanged", decoderFn=_controlservice_taskmodechanged_decoder)
+        self._storeMeasurementStreamChanged = ServiceSignal(self._svc, "storeMeasurementStreamChanged", decoderFn=_controlservice_storemeasurementstreamchanged_decoder)
+        self._storeMonitorStreamChanged = ServiceSignal(self._svc, "storeMonitorStreamChanged", decoderFn=_controlservice_storemonitorstreamchanged_decoder)
+        self._activeUsbStorageDeviceChanged = ServiceSignal(self._svc, "activeUsbStorageDeviceChanged", decoderFn=_controlservice_activeusbstoragedevicechanged_decoder)
+        self._activeSdcStorageDeviceChanged = ServiceSignal(self._svc, "activeSdcStorageDeviceChanged", decoderFn=_controlservice_activesdcstoragedevicechanged_decoder)
+        self._reflectorSearchSettingsChanged = ServiceSignal(self._svc, "reflectorSearchSettingsChanged", decoderFn=_controlservice_reflectorsearchsettingschanged_decoder)
+        self._reflectorScanSettingsChanged = ServiceSignal(self._svc, "reflectorScanSettingsChanged", decoderFn=_controlservice_reflectorscansettingschanged_decoder)
+        self._poseEstimationSettingsChanged = ServiceSignal(self._svc, "poseEstimationSettingsChanged", decoderFn=_controlservice_poseestimationsettingschanged_decoder)
+        self._registrationModeChanged = ServiceSignal(self._svc, "registrationModeChanged", decoderFn=_controlservice_registrationmodechanged_decoder)
+        self._registrationResolveMtaChanged = ServiceSignal(self._svc, "registrationResolveMtaChanged", decoderFn=_controlservice_registrationresolvemtachanged_decoder)
+        self._environmentSensorsEnabledChanged = ServiceSignal(self._svc, "environmentSensorsEnabledChanged", decoderFn=_controlservice_environmentsensorsenabledchanged_decoder)
+        self._registrationBranchPointChanged = ServiceSignal(self._svc, "registrationBranchPointChanged", decoderFn=_controlservice_registrationbranchpointchanged_decoder)
+        self._acquisitionStarted = ServiceSignal(self._svc, "acquisitionStarted", decoderFn=_controlservice_acquisitionstarted_decoder)
+        self._acquisitionFinished = ServiceSignal(self._svc, "acquisitionFinished", decoderFn=_controlservice_acquisitionfinished_decoder)
+        self._taskStarted = ServiceSignal(self._svc, "taskStarted", decoderFn=_controlservice_taskstarted_decoder)
+        self._taskProgress = ServiceSignal(self._svc, "taskProgress", decoderFn=_controlservice_taskprogress_decoder)
+        self._taskFinished = ServiceSignal(self._svc, "taskFinished", decoderFn=_controlservice_taskfinished_decoder)
+        self._taskStateChanged = ServiceSignal(self._svc, "taskStateChanged", decoderFn=_controlservice_taskstatechanged_decoder)
+        self._backgroundTaskAdded = ServiceSignal(self._svc, "backgroundTaskAdded", decoderFn=_controlservice_backgroundtaskadded_decoder)
+        self._backgroundTaskChanged = ServiceSignal(self._svc, "backgroundTaskChanged", decoderFn=_controlservice_backgroundtaskchanged_decoder)
+        self._backgroundTaskRemoved = ServiceSignal(self._svc, "backgroundTaskRemoved", decoderFn=_controlservice_backgroundtaskremoved_decoder)
+
+    async def horizontalImageOverlap(self):
+        """Return horizontal image overlap in percent used during image acquisition.
+           
+           Returns: int"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("horizontalImageOverlap_8587ce50", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setHorizontalImageOverlap(self, value):
+        """Set horizontal image overlap used during image acquisition (in percent).
+           
+           Arguments:
+             value (int): the new horizontal image overlap"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].u32 = value
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setHorizontalImageOverlap_01b541b0", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def imageCaptureMode(self):
+        """Return the image capture mode used during image acquisition.
+           
+           Returns: ImageAcquisitionCaptureMode"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("imageCaptureMode_9344dcc5", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ControlService.ImageAcquisitionCaptureMode(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setImageCaptureMode(self, mode):
+        """Set the image capture mode used during image acquisition.
+           
+           Arguments:
+             mode (ImageAcquisitionCaptureMode): the new capture mode"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = int(mode)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setImageCaptureMode_1880b858", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def setTaskMode(self, task, mode):
+        """Set a task's execution mode.
+           
+           Arguments:
+             task (AcquisitionTask): the acquisition task
+             mode (AcquisitionTaskMode): the new task execution mode"""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].i32 = int(task)
+        inputs[1].i32 = int(mode)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setTaskMode_ff9d8b67", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def taskMode(self, task):
+        """Return the execution mode of a given task.
+           
+           Arguments:
+             task (AcquisitionTask): the acquisition task
+           
+           Returns: AcquisitionTaskMode"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = int(task)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("taskMode_880c8f3c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ControlService.AcquisitionTaskMode(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def monitorStreamUri(self):
+        """Return the monitor stream URI.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("monitorStreamUri_99c9f421", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def maxPreviewWidth(self):
+        """Return the maximum width of the scan preview image (in pixels).
+           
+           Returns: int"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("maxPreviewWidth_8eea7fc4", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setMaxPreviewWidth(self, value):
+        """Set the maximum width of the scan preview image (in pixels).
+           
+           If the horizontal field of view (FOV) of the scan is bigger than the vertical
+           FOV then this value is used as preview width. The preview height is calculated
+           using the aspect ratio of the FOV.
+           
+           Arguments:
+             value (int): the new maximum preview image width"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].u32 = value
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setMaxPreviewWidth_043a8433", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def maxPreviewHeight(self):
+        """Return the maximum height of the scan preview image (in pixels).
+           
+           Returns: int"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("maxPreviewHeight_a099ce70", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setMaxPreviewHeight(self, value):
+        """Set the maximum height of the scan preview image (in pixels).
+           
+           If the vertical field of view (FOV) of the scan is bigger than the horizontal
+           FOV then this value is used as preview height. The preview width is calculated
+           using the aspect ratio of the FOV.
+           
+           Arguments:
+             value (int): the new maximum preview image height"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].u32 = value
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setMaxPreviewHeight_4780c193", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def storeMeasurementStream(self):
+        """Return true if the scan measurement stream should be stored on the storage media, otherwise return false.
+           
+           Returns: bool"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("storeMeasurementStream_1e5e42f9", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setStoreMeasurementStream(self, value):
+        """Set whether the scan measurement stream should or should not be stored on the storage media.
+           
+           Arguments:
+             value (bool): """
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if value else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setStoreMeasurementStream_4408c4c0", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def storeMonitorStream(self):
+        """Return true if the scan monitor stream should be stored on the storage media, otherwise return false.
+           
+           Returns: bool"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("storeMonitorStream_3b2a8e81", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setStoreMonitorStream(self, value):
+        """Set whether the scan monitor stream should or should not be stored on the storage media.
+           
+           Arguments:
+             value (bool): """
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if value else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setStoreMonitorStream_76fbaa8a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def scanpatternDirFactory(self):
+        """Return the path of the directory where the factory scan patterns are located.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scanpatternDirFactory_fff019f9", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def scanpatternDirUser(self):
+        """Return the path of the directory where the user defined scan patterns are located.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scanpatternDirUser_bc3a97a1", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def startScanSequence(self, *args):
+        """
+           startScanSequence()
+               Start data acquisition for the active project and scanposition.
+               
+               This function is deprecated. Use startAcquisition() instead.
+
+           startScanSequence(doPoseEstimation, doScan, doReflectorSearch, doReflectorScans, doImageSequence)
+               Start data acquisition for the active project and scanposition.
+               
+               This function is deprecated. Use startAcquisition(...) instead.
+               
+               Arguments:
+                 doPoseEstimation (bool): 
+                 doScan (bool): 
+                 doReflectorSearch (bool): 
+                 doReflectorScans (bool): 
+                 doImageSequence (bool): 
+
+        """
+        if len(args) == 0:
+            await self._startScanSequence_33a8780a(*args)
+        elif len(args) == 5:
+            await self._startScanSequence_2b2b6b7c(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _startScanSequence_33a8780a(self):
+        """Start data acquisition for the active project and scanposition.
+           
+           This function is deprecated. Use startAcquisition() instead."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("startScanSequence_33a8780a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def _startScanSequence_2b2b6b7c(self, doPoseEstimation, doScan, doReflectorSearch, doReflectorScans, doImageSequence):
+        """Start data acquisition for the active project and scanposition.
+           
+           This function is deprecated. Use startAcquisition(...) instead.
+           
+           Arguments:
+             doPoseEstimation (bool): 
+             doScan (bool): 
+             doReflectorSearch (bool): 
+             doReflectorScans (bool): 
+             doImageSequence (bool): """
+        inputs = [riconnect.Value() for i in range(0, 5)]
+        inputs[0].i32 = 1 if doPoseEstimation else 0
+        inputs[1].i32 = 1 if doScan else 0
+        inputs[2].i32 = 1 if doReflectorSearch else 0
+        inputs[3].i32 = 1 if doReflectorScans else 0
+        inputs[4].i32 = 1 if doImageSequence else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("startScanSequence_2b2b6b7c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def startAcquisition(self, *args):
+        """
+           startAcquisition()
+               Start data acquisition for the active project and scanposition.
+               
+               Starts the execution of a sequence of data acquisition tasks and stores
+               the results in the directory of the active scan position. The number of
+               tasks executed depends on the currently set task execution modes.
+               
+               New in version 1.1.
+
+           startAcquisition(doPoseEstimation, doScan, doReflectorSearch, doReflectorScans, doImageSequence)
+               Start data acquisition for the active project and scanposition.
+               
+               This method executes the data acquisition with the specified tasks without
+               modifying the currently set task execution modes.
+               
+               Please note that starting an acquisition with this function does not
+               support the image acquisition during scan.
+               
+               New in version 1.1.
+               
+               Arguments:
+                 doPoseEstimation (bool): 
+                 doScan (bool): 
+                 doReflectorSearch (bool): 
+                 doReflectorScans (bool): 
+                 doImageSequence (bool): 
+
+           startAcquisition(flags)
+               Start data acquisition for the active project and scanposition.
+               
+               This method executes the data acquisition with the specified tasks without
+               modifying the currently set task execution modes.
+               
+               New in version 1.5.
+               
+               Arguments:
+                 flags (int): The tasks to execute (see AcquisitionFlags).
+
+        """
+        if len(args) == 0:
+            await self._startAcquisition_f6362f4d(*args)
+        elif len(args) == 5:
+            await self._startAcquisition_511a7f91(*args)
+        elif len(args) == 1:
+            await self._startAcquisition_2274d482(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _startAcquisition_f6362f4d(self):
+        """Start data acquisition for the active project and scanposition.
+           
+           Starts the execution of a sequence of data acquisition tasks and stores
+           the results in the directory of the active scan position. The number of
+           tasks executed depends on the currently set task execution modes.
+           
+           New in version 1.1."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("startAcquisition_f6362f4d", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def _startAcquisition_511a7f91(self, doPoseEstimation, doScan, doReflectorSearch, doReflectorScans, doImageSequence):
+        """Start data acquisition for the active project and scanposition.
+           
+           This method executes the data acquisition with the specified tasks without
+           modifying the currently set task execution modes.
+           
+           Please note that starting an acquisition with this function does not
+           support the image acquisition during scan.
+           
+           New in version 1.1.
+           
+           Arguments:
+             doPoseEstimation (bool): 
+             doScan (bool): 
+             doReflectorSearch (bool): 
+             doReflectorScans (bool): 
+             doImageSequence (bool): """
+        inputs = [riconnect.Value() for i in range(0, 5)]
+        inputs[0].i32 = 1 if doPoseEstimation else 0
+        inputs[1].i32 = 1 if doScan else 0
+        inputs[2].i32 = 1 if doReflectorSearch else 0
+        inputs[3].i32 = 1 if doReflectorScans else 0
+        inputs[4].i32 = 1 if doImageSequence else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("startAcquisition_511a7f91", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def _startAcquisition_2274d482(self, flags):
+        """Start data acquisition for the active project and scanposition.
+           
+           This method executes the data acquisition with the specified tasks without
+           modifying the currently set task execution modes.
+           
+           New in version 1.5.
+           
+           Arguments:
+             flags (int): The tasks to execute (see AcquisitionFlags)."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].u32 = flags
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("startAcquisition_2274d482", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def startQuickscan(self, *args):
+        """
+           startQuickscan()
+               Start a scan that will be stored in the quickscan directory.
+
+           startQuickscan(targetDir, basename)
+               Start a scan that will be stored in the specified directory using the specified file base name.
+               
+               New in version 1.3.
+               
+               Arguments:
+                 targetDir (str): absolute path to target directory
+                 basename (str): base name of files (e.g. myscan_01)
+
+        """
+        if len(args) == 0:
+            await self._startQuickscan_05c74ca9(*args)
+        elif len(args) == 2:
+            await self._startQuickscan_f6ca40e0(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _startQuickscan_05c74ca9(self):
+        """Start a scan that will be stored in the quickscan directory."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("startQuickscan_05c74ca9", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def _startQuickscan_f6ca40e0(self, targetDir, basename):
+        """Start a scan that will be stored in the specified directory using the specified file base name.
+           
+           New in version 1.3.
+           
+           Arguments:
+             targetDir (str): absolute path to target directory
+             basename (str): base name of files (e.g. myscan_01)"""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = targetDir
+        inputs[1].s = basename
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("startQuickscan_f6ca40e0", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def stop(self):
+        """Stop the running data acquisition."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("stop_ef399b2d", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def lastScanSequence(self):
+        """Return information about the last executed scan sequence.
+           
+           This function is deprecated. Use lastAcquisition() instead.
+           
+           Returns: ScanSequenceInformation"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("lastScanSequence_7ae59e14", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ScanSequenceInformation(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def lastAcquisition(self):
+        """Return information about the last executed data acquisition.
+           
+           New in version 1.1.
+           
+           Returns: AcquisitionInformation"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("lastAcquisition_d82874a9", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(AcquisitionInformation(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def pauseTask(self, task):
+        """Pause a running acquisition task.
+           
+           Returns false if the specified task is not running or can't be paused.
+           Please note that the task might not be paused immediately. The signal
+           taskStateChanged() will be emitted when the task's state changed.
+           
+           Arguments:
+             task (AcquisitionTask): the acquisition task to pause
+           
+           Returns: bool"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = int(task)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("pauseTask_b3536795", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def resumeTask(self, task):
+        """Resume a paused acquisition task.
+           
+           Returns false if the specified task is not running; otherwise returns true.
+           
+           Arguments:
+             task (AcquisitionTask): the paused acquisition task
+           
+           Returns: bool"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = int(task)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("resumeTask_6355a317", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def restartTask(self, task):
+        """Restart a running or paused acquisition task.
+           
+           Returns false if the specified task is not running or can't be restarted,
+           otherwise returns true.
+           
+           Arguments:
+             task (AcquisitionTask): the acquisition task to restart
+           
+           Returns: bool"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = int(task)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("restartTask_17a059a5", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def isBusy(self):
+        """Return true if any data acquisition task is running.
+           
+           Returns: bool"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("isBusy_3fa264f2", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def loadScanPattern(self, pattern):
+        """Load a scan pattern.
+           
+           Arguments:
+             pattern (str): the name of the pattern"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = pattern
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("loadScanPattern_39d52fa1", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def saveScanPattern(self, pattern):
+        """Save a scan pattern.
+           
+           If a pattern with the given name does already exist and is a user created
+           pattern then it will be replaced.
+           
+           Arguments:
+             pattern (str): the name of the pattern"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = pattern
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("saveScanPattern_3678c97a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def scanPatterns(self):
+        """Get list of available scan patterns.
+           
+           Returns: list(str)
+             the available scan patterns"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scanPatterns_3fa701bf", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=1)
+        outputs = []
+        _ot_patterns = []
+        _otsplits = rtransfers[0][0:-1].split(b"\0") if rtransfers[0] else []
+        for part in _otsplits:
+            _ot_patterns.append(part.decode())
+        outputs.append(_ot_patterns)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def scanPatternsDetailed(self):
+        """Return detailed information about the available scan patterns.
+           
+           The data is returned as JSON string in the following format:
+           [
+             {
+               "name": "Panorama_50",
+               "mode": "rectFov",
+               "phiIncrement": 0.05,
+               "phiStart": 0,
+               "phiStop": 360,
+               "thetaIncrement": 0.05,
+               "thetaStart": 30,
+               "thetaStop": 130
+             },
+             ...
+           ]
+           
+           New in version 1.3.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scanPatternsDetailed_50f86490", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def deleteScanPattern(self, pattern):
+        """Delete a scan pattern.
+           
+           Returns true if the scan pattern was successfully deleted.
+           Please note that only user defined scan patterns can be deleted.
+           
+           New in version 1.5.
+           
+           Arguments:
+             pattern (str): the name of the pattern
+           
+           Returns: bool"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = pattern
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("deleteScanPattern_1b142f83", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def acquisitionMode(self):
+        """Return the current data acquisition mode.
+           
+           Returns: AcquisitionMode"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("acquisitionMode_16d8b153", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ControlService.AcquisitionMode(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def activeUsbStorageDevice(self):
+        """Return the name of the active USB storage device.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("activeUsbStorageDevice_d9260b57", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setActiveUsbStorageDevice(self, name):
+        """Set the active USB storage device.
+           
+           Please refer to the InterfaceService to get a list of the
+           available USB devices.
+           
+           Arguments:
+             name (str): the name of the device"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setActiveUsbStorageDevice_4de43c16", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def activeSdcStorageDevice(self):
+        """Return the name of the active SD-Card storage device.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("activeSdcStorageDevice_5c85cca6", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setActiveSdcStorageDevice(self, name):
+        """Set the active SD-Card storage device.
+           
+           Please refer to the InterfaceService to get a list of the
+           available SD-Card devices.
+           
+           Arguments:
+             name (str): the name of device"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setActiveSdcStorageDevice_196e1a39", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def reflectorSearchSettings(self):
+        """Return the parameters used during reflector search.
+           
+           Returns: ReflectorSearchSettings"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("reflectorSearchSettings_00c081a3", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ReflectorSearchSettings(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setReflectorSearchSettings(self, settings):
+        """Set the parameters used during reflector search.
+           
+           The simple reflector search uses the search settings:
+             - minDiameter
+             - maxDiameter
+             - minRange
+             - maxRange
+             - minReflectance
+             - maxReflectors
+           
+           The model based reflector search (since version 1.8) uses the search settings:
+             - models
+           
+           Use supportedReflectorSearchModels() to get a list of supported search models.
+           
+           Arguments:
+             settings (ReflectorSearchSettings): the new settings"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = json.dumps(settings)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setReflectorSearchSettings_aed3e188", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def reflectorScanSettings(self):
+        """Return the parameters used during reflector scans.
+           
+           Returns: ReflectorScanSettings"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("reflectorScanSettings_fce6a68f", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ReflectorScanSettings(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setReflectorScanSettings(self, settings):
+        """Set the parameters used during reflector scans.
+           
+           Arguments:
+             settings (ReflectorScanSettings): the new settings"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = json.dumps(settings)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setReflectorScanSettings_5a6cd0d0", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def poseEstimationSettings(self):
+        """Return the parameters used during pose estimation.
+           
+           Returns: PoseEstimationSettings"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("poseEstimationSettings_a003c79a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(PoseEstimationSettings(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setPoseEstimationSettings(self, settings):
+        """Set the parameters used during pose estimation.
+           
+           Arguments:
+             settings (PoseEstimationSettings): the new settings"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = json.dumps(settings)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setPoseEstimationSettings_71b4a5ea", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def backgroundTasks(self):
+        """Return information about all queued background tasks.
+           
+           New in version 1.1.
+           
+           Returns: str
+             JSON array"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("backgroundTasks_ea7057eb", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def backgroundTask(self, taskId):
+        """Return information about a background task.
+           
+           New in version 1.1.
+           
+           Arguments:
+             taskId (int): ID of background task
+           
+           Returns: str
+             JSON object"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].u32 = taskId
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("backgroundTask_e5ee2edd", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def cancelBackgroundTask(self, taskId):
+        """Cancel background task.
+           
+           New in version 1.1.
+           
+           Arguments:
+             taskId (int): ID of background task"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].u32 = taskId
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("cancelBackgroundTask_712396dd", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def addRdbCreationTask(self, *args):
+        """
+           addRdbCreationTask(storageMedia, project, scanposition, scan)
+               Add a background task to create a point cloud (RDB) from raw scan data (RXP).
+               
+               During RDB creation the raw RXP data is read and each echo is moved to the most
+               likely MTA zone before it is added to the point cloud.
+               
+               New in version 1.1.
+               
+               Arguments:
+                 storageMedia (str): storage media (one of SSD, USB, SDCARD, NAS)
+                 project (str): project name
+                 scanposition (str): name of scan position
+                 scan (str): name of scan
+               
+               Returns: int
+                 ID of background task
+
+           addRdbCreationTask(storageMedia, project, scanposition, scan, resolveMta)
+               Add a background task to create a point cloud (RDB) from raw scan data (RXP).
+               
+               Overloaded method that allows to disable MTA resolution of scan.
+               
+               Creates point cloud from scan data.
+               
+               New in version 1.9.
+               
+               Arguments:
+                 storageMedia (str): storage media (one of SSD, USB, SDCARD, NAS)
+                 project (str): project name
+                 scanposition (str): name of scan position
+                 scan (str): name of scan
+                 resolveMta (bool): false to disable MTA resolution of scan
+               
+               Returns: int
+                 ID of background task
+
+        """
+        if len(args) == 4:
+            return await self._addRdbCreationTask_78ebb721(*args)
+        elif len(args) == 5:
+            return await self._addRdbCreationTask_8ce055e4(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _addRdbCreationTask_78ebb721(self, storageMedia, project, scanposition, scan):
+        """Add a background task to create a point cloud (RDB) from raw scan data (RXP).
+           
+           During RDB creation the raw RXP data is read and each echo is moved to the most
+           likely MTA zone before it is added to the point cloud.
+           
+           New in version 1.1.
+           
+           Arguments:
+             storageMedia (str): storage media (one of SSD, USB, SDCARD, NAS)
+             project (str): project name
+             scanposition (str): name of scan position
+             scan (str): name of scan
+           
+           Returns: int
+             ID of background task"""
+        inputs = [riconnect.Value() for i in range(0, 4)]
+        inputs[0].s = storageMedia
+        inputs[1].s = project
+        inputs[2].s = scanposition
+        inputs[3].s = scan
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("addRdbCreationTask_78ebb721", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _addRdbCreationTask_8ce055e4(self, storageMedia, project, scanposition, scan, resolveMta):
+        """Add a background task to create a point cloud (RDB) from raw scan data (RXP).
+           
+           Overloaded method that allows to disable MTA resolution of scan.
+           
+           Creates point cloud from scan data.
+           
+           New in version 1.9.
+           
+           Arguments:
+             storageMedia (str): storage media (one of SSD, USB, SDCARD, NAS)
+             project (str): project name
+             scanposition (str): name of scan position
+             scan (str): name of scan
+             resolveMta (bool): false to disable MTA resolution of scan
+           
+           Returns: int
+             ID of background task"""
+        inputs = [riconnect.Value() for i in range(0, 5)]
+        inputs[0].s = storageMedia
+        inputs[1].s = project
+        inputs[2].s = scanposition
+        inputs[3].s = scan
+        inputs[4].i32 = 1 if resolveMta else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("addRdbCreationTask_8ce055e4", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def addRegistrationTask(self, storageMedia, project, scanposition, mode):
+        """Add a background task to register a scan position.
+           
+           If the specified project does already have a registered scan position
+           then the mode of the already registered scan position is used instead
+           of the specified one.
+           
+           Creating a new registration task does also create an RDB creation task
+           if necessary.
+           
+           New in version 1.1.
+           
+           Arguments:
+             storageMedia (str): storage media (one of SSD, USB, SDCARD, NAS)
+             project (str): project name
+             scanposition (str): name of scan position
+             mode (RegistrationMode): the registration mode
+           
+           Returns: int
+             ID of background task"""
+        inputs = [riconnect.Value() for i in range(0, 4)]
+        inputs[0].s = storageMedia
+        inputs[1].s = project
+        inputs[2].s = scanposition
+        inputs[3].i32 = int(mode)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("addRegistrationTask_8bd9f793", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def registrationMode(self):
+        """Return point cloud registration mode used for automatic registration.
+           
+           New in version 1.1.
+           
+           Returns: RegistrationMode"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("registrationMode_d38f593e", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ControlService.RegistrationMode(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setRegistrationMode(self, mode):
+        """Set point cloud registration mode used for automatic registration.
+           
+           If the set registration mode is anything other than REG_DISABLED then
+           the first acquired scan of a scan position will be autoamatically queued
+           for registration after the acquisition of the scan finished successfully.
+           
+           New in version 1.1.
+           
+           Arguments:
+             mode (RegistrationMode): new registration mode"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = int(mode)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setRegistrationMode_4f1f5ddd", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def registrationResolveMta(self):
+        """Return true if MTA resolution is activated for automatic registration.
+           
+           New in version 1.9.
+           
+           Returns: bool"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("registrationResolveMta_ed9c3399", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setRegistrationResolveMta(self, enabled):
+        """Set MTA resolution for automatic registration.
+           
+           If automatic registration is enabled then the point cloud will be created
+           with or without MTA resolution depending on this setting.
+           
+           New in version 1.9.
+           
+           Arguments:
+             enabled (bool): true to enable MTA resolution"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if enabled else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setRegistrationResolveMta_dd1e43f5", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def unregisterProject(self, storageMedia, project):
+        """Unregister project.
+           
+           Cancel all pending registration tasks for the specified project and
+           reset the project to an unregistered state.
+           
+           New in version 1.1.
+           
+           Arguments:
+             storageMedia (str): storage media (one of SSD, USB, SDCARD, NAS)
+             project (str): project name"""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = storageMedia
+        inputs[1].s = project
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("unregisterProject_a8a1a86a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def registerProject(self, *args):
+        """
+           registerProject(storageMedia, project, mode)
+               Register all scan positions in a project.
+               
+               If the project does already have registered scan positions then
+               the registration is continued from the last registered scan position.
+               
+               New in version 1.1.
+               
+               Arguments:
+                 storageMedia (str): storage media (one of SSD, USB, SDCARD, NAS)
+                 project (str): project name
+                 mode (RegistrationMode): registration mode
+               
+               Returns: int
+                 ID of background task.
+
+           registerProject(storageMedia, project, mode, resolveMta)
+               Register all scan positions in a project.
+               
+               Overloaded method that allows to disable MTA resolution during project
+               registration.
+               
+               If the project does already have registered scan positions then
+               the registration is continued from the last registered scan position.
+               
+               New in version 1.9.
+               
+               Arguments:
+                 storageMedia (str): storage media (one of SSD, USB, SDCARD, NAS)
+                 project (str): project name
+                 mode (RegistrationMode): registration mode
+                 resolveMta (bool): false to disable MTA resolution of scans
+               
+               Returns: int
+                 ID of background task.
+
+        """
+        if len(args) == 3:
+            return await self._registerProject_a83df21e(*args)
+        elif len(args) == 4:
+            return await self._registerProject_c3b307a3(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _registerProject_a83df21e(self, storageMedia, project, mode):
+        """Register all scan positions in a project.
+           
+           If the project does already have registered scan positions then
+           the registration is continued from the last registered scan position.
+           
+           New in version 1.1.
+           
+           Arguments:
+             storageMedia (str): storage media (one of SSD, USB, SDCARD, NAS)
+             project (str): project name
+             mode (RegistrationMode): registration mode
+           
+           Returns: int
+             ID of background task."""
+        inputs = [riconnect.Value() for i in range(0, 3)]
+        inputs[0].s = storageMedia
+        inputs[1].s = project
+        inputs[2].i32 = int(mode)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("registerProject_a83df21e", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _registerProject_c3b307a3(self, storageMedia, project, mode, resolveMta):
+        """Register all scan positions in a project.
+           
+           Overloaded method that allows to disable MTA resolution during project
+           registration.
+           
+           If the project does already have registered scan positions then
+           the registration is continued from the last registered scan position.
+           
+           New in version 1.9.
+           
+           Arguments:
+             storageMedia (str): storage media (one of SSD, USB, SDCARD, NAS)
+             project (str): project name
+             mode (RegistrationMode): registration mode
+             resolveMta (bool): false to disable MTA resolution of scans
+           
+           Returns: int
+             ID of background task."""
+        inputs = [riconnect.Value() for i in range(0, 4)]
+        inputs[0].s = storageMedia
+        inputs[1].s = project
+        inputs[2].i32 = int(mode)
+        inputs[3].i32 = 1 if resolveMta else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("registerProject_c3b307a3", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def environmentSensorsEnabled(self):
+        """Returns true if the information of the environment sensors (temperature, humidity, pressure) are used during data acquisition.
+           
+           New in version 1.1.
+           
+           Returns: bool"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("environmentSensorsEnabled_30ad7a6c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setEnvironmentSensorsEnabled(self, enabled):
+        """Enable/Disable the usage of the environment sensor data during data acquisition.
+           
+           New in version 1.1.
+           
+           Arguments:
+             enabled (bool): """
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if enabled else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setEnvironmentSensorsEnabled_fc5ecab7", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def supportedReflectorSearchModels(self):
+        """Return list of supported reflector search models.
+           
+           The result is returned as JSON object in the following form:
+           
+           [
+             {
+               "name": "RIEGL flat reflector 50 mm",
+               "shape": "circular disk"
+             }
+           ]
+           
+           New in version 1.8.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("supportedReflectorSearchModels_6224229f", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setRegistrationBranchPoint(self, branchPoint, anchorPoint):
+        """Set a registration branch point for the active project.
+           
+           When working with scan positions without GNSS information it is often not possible to register
+           a scan position if the distance to the previous scan position is too large. In order to solve
+           such issues, an anchor point can be specified for a scan position (branch-point). An anchor
+           point in this context is a previously registered scan position that is closer to the branch
+           point, and therefore more likely to result in a successful registration.
+           
+           New in version 1.11
+           
+           Arguments:
+             branchPoint (str): name of scan position that should be marked as branch-point
+             anchorPoint (str): name of scan position that should be used as the corresponding anchor-point"""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = branchPoint
+        inputs[1].s = anchorPoint
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setRegistrationBranchPoint_4a6472d5", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def registrationBranchPoints(self):
+        """Return a JSON object with the specified branch points of the active project.
+           
+           The result is returned in the following form:
+           
+           {
+             "branchPoint1": {
+               "anchor": "anchorPoint1"
+            },
+             "branchPoint2": {
+               "anchor": "anchorPoint2"
+             }
+           }
+           
+           New in version 1.11
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("registrationBranchPoints_25199938", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def save(self):
+        """Save service properties."""
+        with self._lock:
+            await self._svc.callFunction("__risc__service_properties__save_fn")
+
+    async def restore(self):
+        """Restore service properties."""
+        with self._lock:
+            await self._svc.callFunction("__risc__service_properties__restore_fn")
+
+    def error(self):
+        """The error signal allows services to report problems that are
+           unrelated to service calls. It was intended to allow services
+           to report hardware related problems. But since most services
+           provide some kind of business logic, this signal is rarely used.
+           
+           Returns: ServiceSignal
+           Payload: dict"""
+        return self._error
+
+    def horizontalImageOverlapChanged(self):
+        """This signal is emitted when the horizontal image overlap changed.
+           
+           The signal payload is the new image overlap.
+           
+           Returns: ServiceSignal
+           Payload: int"""
+        return self._horizontalImageOverlapChanged
+
+    def imageCaptureModeChanged(self):
+        """This signal is emitted when the image capture mode changed.
+           
+           The signal payload is the new capture mode.
+           
+           Returns: ServiceSignal
+           Payload: ImageAcquisitionCaptureMode"""
+        return self._imageCaptureModeChanged
+
+    def taskModeChanged(self):
+        """This signal is emitted when a task's execution mode changed.
+           
+           The signal payload contains the task and new task mode.
+           
+           Returns: ServiceSignal
+           Payload: TaskModeChangedPayload"""
+        return self._taskModeChanged
+
+    def storeMeasurementStreamChanged(self):
+        """This signal is emitted when the measurement stream storage flag changed.
+           
+           Returns: ServiceSignal
+           Payload: bool"""
+        return self._storeMeasurementStreamChanged
+
+    def storeMonitorStreamChanged(self):
+        """This signal is emitted when the monitor stream storage flag changed.
+           
+           Returns: ServiceSignal
+           Payload: bool"""
+        return self._storeMonitorStreamChanged
+
+    def activeUsbStorageDeviceChanged(self):
+        """This signal is emitted when the active USB storage device changed.
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._activeUsbStorageDeviceChanged
+
+    def activeSdcStorageDeviceChanged(self):
+        """This signal is emitted when the active SD-Card storage device changed.
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._activeSdcStorageDeviceChanged
+
+    def reflectorSearchSettingsChanged(self):
+        """This signal is emitted when the reflector search parameters changed.
+           
+           Returns: ServiceSignal
+           Payload: ReflectorSearchSettings"""
+        return self._reflectorSearchSettingsChanged
+
+    def reflectorScanSettingsChanged(self):
+        """This signal is emitted when the reflector scan parameters changed.
+           
+           Returns: ServiceSignal
+           Payload: ReflectorScanSettings"""
+        return self._reflectorScanSettingsChanged
+
+    def poseEstimationSettingsChanged(self):
+        """This signal is emitted when the pose estimation parameters changed.
+           
+           Returns: ServiceSignal
+           Payload: PoseEstimationSettings"""
+        return self._poseEstimationSettingsChanged
+
+    def registrationModeChanged(self):
+        """This signal is emitted when the point cloud registration mode changed.
+           
+           New in version 1.1.
+           
+           Returns: ServiceSignal
+           Payload: RegistrationMode"""
+        return self._registrationModeChanged
+
+    def registrationResolveMtaChanged(self):
+        """This signal is emitted when the MTA resolution of the automatic registration changed.
+           
+           New in version 1.9.
+           
+           Returns: ServiceSignal
+           Payload: bool"""
+        return self._registrationResolveMtaChanged
+
+    def environmentSensorsEnabledChanged(self):
+        """This signal is emitted when the environment sensor usage changed.
+           
+           New in version 1.1.
+           
+           Returns: ServiceSignal
+           Payload: bool"""
+        return self._environmentSensorsEnabledChanged
+
+    def registrationBranchPointChanged(self):
+        """This signal is emitted when a registration branch point changed.
+           
+           The signal payload is a JSON object in the following form:
+           
+           {
+              "branchPoint": "ScanPos050",
+              "anchorPoint": "ScanPos012"
+           }
+           
+           New in version 1.11
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._registrationBranchPointChanged
+
+    def acquisitionStarted(self):
+        """This signal is emitted when the data acquisition started.
+           
+           Returns: ServiceSignal
+           Payload: AcquisitionMode"""
+        return self._acquisitionStarted
+
+    def acquisitionFinished(self):
+        """This signal is emitted when data acquisition finished.
+           
+           Returns: ServiceSignal
+           Payload: ResultCode"""
+        return self._acquisitionFinished
+
+    def taskStarted(self):
+        """This signal is emitted when an acquisition task started.
+           
+           The signal payload is a JSON object and contains (at least) the following
+           attributes. Additional information contained in the payload is task
+           dependent.
+           {
+              "id": 1,
+              "canPause": false,
+              "canRestart": false
+           }
+           
+           Attribute description:
+               id           the task identifier (see AcquisitionTask)
+               canPause     true if the task can be paused; otherwise false
+               canRestart   true if the task can be restarted; otherwise false
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._taskStarted
+
+    def taskProgress(self):
+        """This signal notifies about acquisition task progress changes.
+           
+           The signal payload is a JSON object and contains (at least) the following
+           attributes. Additional information contained in the payload is task
+           dependent.
+           {
+              "id": 1,
+              "progress": 90,
+              "progresstext": "Image 9 of 10"
+           }
+           
+           Attribute description:
+               id           the task identifier (see AcquisitionTask)
+               progress     the progress in percent
+               progresstext textual progress information (optional)
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._taskProgress
+
+    def taskFinished(self):
+        """This signal is emitted when an acquisition task finished.
+           
+           The signal payload is a JSON object and contains (at least) the following
+           attributes. Additional information contained in the payload is task
+           dependent.
+           {
+              "id": 1,
+              "resultcode": 0
+           }
+           
+           Attribute description:
+               id           the task identifier (see AcquisitionTask)
+               resultcode   the task's result code (see ResultCode)
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._taskFinished
+
+    def taskStateChanged(self):
+        """This signal is emitted when an acquisition task changes its state from running to paused and vice versa.
+           
+           The signal payload is a JSON object and contains the following attributes.
+           {
+              "id": 1,
+              "state": 1
+           }
+           
+           Attribute description:
+               id           the task identifier (see AcquisitionTask)
+               state        the new task state (see AcquisitionTaskState)
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._taskStateChanged
+
+    def backgroundTaskAdded(self):
+        """This signal is emitted when a new background task has been added.
+           
+           The signal payload is a JSON object and contains at least the following attributes.
+           {
+               "id": 1,
+               "type": "RdbCreation",
+               "state": "queued",
+               "createdAt": "2018-04-04 08:15:03"
+           }
+           
+           Attribute description (backgroundTaskAdded, backgroundTaskChanged, backgroundTaskRemoved):
+               id           ID of the background task. Each background task has a unique
+                            task identifier that gets assigned when the task is created.
+               type         the type of the background task
+                            Supported types:
+                                RdbCreation
+                                Registration
+                                ProjectRegistration
+               state        the task state.
+                            Available states:
+                                queued
+                                running  (used in backgroundTaskChanged)
+                                finished (used in backgroundTaskRemoved)
+                                failed   (used in backgroundTaskRemoved)
+           
+           It is guaranteed that for each backgroundTaskAdded signal there will be a
+           backgroundTaskRemoved signal. A task can emit multiple backgroundTaskChanged
+           signals. The backgroundTaskChanged signals will be emitted after the
+           backgroundTaskAdded signal and before the backgroundTaskRemoved signal.
+           
+           All signals belonging to the same background task can be identified by
+           the task id.
+           
+           Example:
+           {
+               "id": 3,
+               "type": "ProjectRegistration",
+               "state": "queued",
+               "createdAt": "2018-04-04 08:00:03",
+               "taskInfo": {
+                   "project": "Proj01",
+                   "storagemedia": "SSD"
+               }
+           }
+           
+           New in version 1.1.
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._backgroundTaskAdded
+
+    def backgroundTaskChanged(self):
+        """This signal is emitted when a background task changed.
+           
+           The signal payload is a JSON object containing the task's information.
+           
+           Example:
+           {
+               "id": 4,
+               "type": "RdbCreation",
+               "state": "running",
+               "createdAt": "2018-04-04 08:00:05",
+               "startedAt": "2018-04-04 08:02:03",
+               "progress": 3,
+               "taskInfo": {
+                   "project": "Proj01",
+                   "rxpFilePath": "/media/intern/projects/Proj01.PROJ/ScanPos001.SCNPOS/scans/170306_160828.rxp",
+                   "scan": "170306_160828",
+                   "scanposition": "ScanPos001",
+                   "storagemedia": "SSD"
+               }
+           }
+           
+           New in version 1.1.
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._backgroundTaskChanged
+
+    def backgroundTaskRemoved(self):
+        """This signal is emitted when a background task has been removed.
+           
+           The signal payload is a JSON object containing the task's information.
+           
+           Example:
+           {
+               "id": 5,
+               "type": "Registration",
+               "state": "finished",
+               "createdAt": "2018-04-04 08:06:10",
+               "startedAt": "2018-04-04 08:06:10",
+               "finishedAt": "2018-04-04 08:06:42",
+               "taskInfo": {
+                   "project": "Proj01",
+                   "rdbFilePath": "/media/intern/projects/Proj01.PROJ/ScanPos001.SCNPOS/scans/170414_133333.rdbx",
+                   "scan": "170414_133333",
+                   "scanposition": "ScanPos001",
+                   "storagemedia": "SSD"
+               }
+           }
+           
+           New in version 1.1.
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._backgroundTaskRemoved
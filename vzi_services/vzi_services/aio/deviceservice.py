@@ -0,0 +1,468 @@
+# pylint: skip-file
+# Generated by tools/gen-aio.py from vzi_services/deviceservice.py, do not edit.
+import json
+import riconnect
+from ..deviceservice import DeviceService, LicenseData, PowerSupplyConfig, PowerSupplyRestoreStatus, ServiceSignal, _deviceservice_displayautodimmingchanged_decoder, _deviceservice_displaybrightnesschanged_decoder, _deviceservice_displaystandbytimeoutchanged_decoder, _deviceservice_displaytouchenabledchanged_decoder, _deviceservice_error_decoder, _deviceservice_powersupplyconfigsynchronizationchanged_decoder, _deviceservice_powersupplyconfigurationchanged_decoder, _deviceservice_soundvolumechanged_decoder
+from .facade import AsyncServiceFacade
+
+class AsyncDeviceService(AsyncServiceFacade):
+    """Brief service description.
+       
+       Detailed service description."""
+    SERVICE_CLASS = DeviceService
+    Error = DeviceService.Error
+    PowerSupply = DeviceService.PowerSupply
+    ERROR_NONE = DeviceService.ERROR_NONE
+    ERROR_NO_LICENSE = DeviceService.ERROR_NO_LICENSE
+    ERROR_POWER_CONFIG_NOT_FOUND = DeviceService.ERROR_POWER_CONFIG_NOT_FOUND
+    ERROR_POWER_VOLTAGE_OUT_OF_RANGE = DeviceService.ERROR_POWER_VOLTAGE_OUT_OF_RANGE
+    ERROR_INVALID_POWER_SUPPLY = DeviceService.ERROR_INVALID_POWER_SUPPLY
+    POWER1 = DeviceService.POWER1
+    POWER2 = DeviceService.POWER2
+    SERVICE_NAME = DeviceService.SERVICE_NAME
+
+    def _initSignals(self):
+        # service signals
+        self._error = ServiceSignal(self._svc, "error", decoderFn=_deviceservice_error_decoder)
+        self._displayBrightnessChanged = ServiceSignal(self._svc, "displayBrightnessChanged", decoderFn=_deviceservice_displaybrightnesschanged_decoder)
+        self._displayAutoDimmingChanged = ServiceSignal(self._svc, "displayAutoDimmingChanged", decoderFn=_deviceservice_displayautodimmingchanged_decoder)
+        self._displayStandbyTimeoutChanged = ServiceSignal(self._svc, "displayStandbyTimeoutChanged", decoderFn=_deviceservice_displaystandbytimeoutchanged_decoder)
+        self._soundVolumeChanged = ServiceSignal(self._svc, "soundVolumeChanged", decoderFn=_deviceservice_soundvolumechanged_decoder)
+        self._licenseUpdate = ServiceSignal(self._svc, "licenseUpdate")
+        self._powerSupplyConfigurationChanged = ServiceSignal(self._svc, "powerSupplyConfigurationChanged", decoderFn=_deviceservice_powersupplyconfigurationchanged_decoder)
+        self._powerSupplyConfigSynchronizationChanged = ServiceSignal(self._svc, "powerSupplyConfigSynchronizationChanged", decoderFn=_deviceservice_powersupplyconfigsynchronizationchanged_decoder)
+        self._displayTouchEnabledChanged = ServiceSignal(self._svc, "displayTouchEnabledChanged", decoderFn=_deviceservice_displaytouchenabledchanged_decoder)
+
+    async def displayBrightness(self):
+        """Return the display brightness of the GUI.
+           
+           Returns: int"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("displayBrightness_629536f9", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setDisplayBrightness(self, value):
+        """Set the GUI display brightness.
+           
+           Arguments:
+             value (int): the new brightness (range 0 to 100)"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].u32 = value
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setDisplayBrightness_a4137c6a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def displayAutoDimming(self):
+        """Return true if display brightness auto dimming is enabled.
+           
+           Returns: bool"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("displayAutoDimming_22e2b25f", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setDisplayAutoDimming(self, enable):
+        """Enable/disable display brightness auto dimming.
+           
+           Arguments:
+             enable (bool): """
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if enable else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setDisplayAutoDimming_9cda73fa", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def displayStandbyTimeout(self):
+        """Return the display standby timeout in seconds.
+           
+           Returns: int"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("displayStandbyTimeout_880bd63b", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].i32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setDisplayStandbyTimeout(self, timeout):
+        """Set display standby timeout.
+           
+           A value smaller than five will disable the automatic display standby mode.
+           
+           Arguments:
+             timeout (int): new timeout in seconds"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = timeout
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setDisplayStandbyTimeout_4bf4ffb3", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def soundVolume(self):
+        """Return the sound volume of the integrated speaker.
+           
+           Returns: int"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("soundVolume_f79ac18e", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setSoundVolume(self, value):
+        """Set the sound volume of the integrated speaker.
+           
+           Arguments:
+             value (int): the new sound volume (range 0 to 100)"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].u32 = value
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setSoundVolume_8cc1bb2e", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def syncTime(self):
+        """Synchronize system time."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("syncTime_7dd4d5b5", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0, timeout=None)
+
+    async def setTimeZone(self, value):
+        """Set the current time zone.
+           
+           Arguments:
+             value (str): the new time zone e.g. "Europe/Vienna" """
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = value
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setTimeZone_2ddbb14a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def registerLicense(self, name, description):
+        """Register a software feature which requires a license for activation.
+           
+           Arguments:
+             name (str): the name of the licensed software feature
+             description (str): a detailed description of the licensed software feature"""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = name
+        inputs[1].s = description
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("registerLicense_eddd42d7", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def getLicenses(self):
+        """Return information about available licenses.
+           
+           The returned license information contain the name and description of the
+           licensed software feature, the license state, and in case of a trial
+           license, the seconds until it expires.
+           
+           Returns: list(LicenseData)"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getLicenses_d3ac0603", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([LicenseData(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def licenseIsValid(self, name):
+        """Check if a valid license is available for a particular software feature.
+           
+           Returns true if a valid license for the specified feature is available.
+           
+           Arguments:
+             name (str): the name of the licensed software feature
+           
+           Returns: bool"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("licenseIsValid_89cbaf5e", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def updateLicenses(self):
+        """Search for license files in the license folders, and update the state (expiration time) of the trial licenses."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("updateLicenses_b0eb3005", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def powerSupplyConfigurations(self):
+        """Return a list of available power supply configurations.
+           
+           Returns: list(PowerSupplyConfig)"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("powerSupplyConfigurations_a5e661f7", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([PowerSupplyConfig(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def powerSupplyConfiguration(self, ps):
+        """Get the power supply configuration for the specified power supply.
+           
+           Arguments:
+             ps (PowerSupply): 
+           
+           Returns: PowerSupplyConfig"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = int(ps)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("powerSupplyConfiguration_6f081bdf", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(PowerSupplyConfig(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setPowerSupplyConfiguration(self, ps, configName):
+        """Set the power supply configuration for the specified power supply.
+           
+           Arguments:
+             ps (PowerSupply): 
+             configName (str): """
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].i32 = int(ps)
+        inputs[1].s = configName
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setPowerSupplyConfiguration_038b3f47", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def powerSupplyRestoreStatus(self):
+        """Return the status of the last time the power supply configuration were restored (e.g. during service startup).
+           
+           Returns: PowerSupplyRestoreStatus"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("powerSupplyRestoreStatus_bdbc3087", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(PowerSupplyRestoreStatus(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def isPowerSupplyConfigSynchronizationEnabled(self):
+        """Return true if power supply configuration synchronization is enabled.
+           
+           Returns: bool"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("isPowerSupplyConfigSynchronizationEnabled_f3de3860", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setPowerSupplyConfigSynchronizationEnabled(self, value):
+        """Enable/Disable power supply configuration synchronization.
+           
+           If enabled then setting the power supply configuration of one power supply
+           will also set the same configuration for the other power supply.
+           
+           Arguments:
+             value (bool): """
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if value else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setPowerSupplyConfigSynchronizationEnabled_b07720ce", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def getAtmosTemperature(self):
+        """Returns atmospheric temperature.
+           
+           This returns the atmospheric temperature in celsius degree if sensor is available, else nan.
+           
+           Returns: float"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getAtmosTemperature_d13e60fc", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].f)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getAtmosRelHumidity(self):
+        """Returns atmospheric humidity.
+           
+           This returns the relative atmospheric humidity in percent if sensor is available, else nan.
+           
+           Returns: float"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getAtmosRelHumidity_37225b31", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].f)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getAtmosPressure(self):
+        """Returns atmospheric pressure.
+           
+           This returns the atmospheric pressure in mbar if sensor is available, else nan.
+           
+           Returns: float"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getAtmosPressure_294bcc6b", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].f)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def enableAtmosPressureAveraging(self, enable):
+        """Activate background thread for averaging of atmospheric pressure sensor values.
+           
+           Arguments:
+             enable (bool): Start (1) or stop (0) averaging thread"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if enable else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("enableAtmosPressureAveraging_1bf7df4e", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def getAtmosPressureAverage(self):
+        """Returns averaged atmospheric pressure value.
+           
+           This returns the averaged atmospheric pressure in mbar since start of averaging or last reading, else nan.
+           
+           Returns: float"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getAtmosPressureAverage_865d523d", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].f)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def displayTouchEnabled(self):
+        """Return true if the touch input of the display is enabled.
+           
+           New in version 1.8.
+           
+           Returns: bool"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("displayTouchEnabled_d375e626", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setDisplayTouchEnabled(self, enabled):
+        """Enable/disable display touch input.
+           
+           New in version 1.8.
+           
+           Arguments:
+             enabled (bool): true to enable touch input"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if enabled else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setDisplayTouchEnabled_4749cbb3", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def save(self):
+        """Save service properties."""
+        with self._lock:
+            await self._svc.callFunction("__risc__service_properties__save_fn")
+
+    async def restore(self):
+        """Restore service properties."""
+        with self._lock:
+            await self._svc.callFunction("__risc__service_properties__restore_fn")
+
+    def error(self):
+        """The error signal allows services to report problems that are
+           unrelated to service calls. It was intended to allow services
+           to report hardware related problems. But since most services
+           provide some kind of business logic, this signal is rarely used.
+           
+           Returns: ServiceSignal
+           Payload: dict"""
+        return self._error
+
+    def displayBrightnessChanged(self):
+        """This signal is emitted when the display brightness changed.
+           
+           Returns: ServiceSignal
+           Payload: int"""
+        return self._displayBrightnessChanged
+
+    def displayAutoDimmingChanged(self):
+        """This signal is emitted when the display brightness auto dimming state changed.
+           
+           Returns: ServiceSignal
+           Payload: bool"""
+        return self._displayAutoDimmingChanged
+
+    def displayStandbyTimeoutChanged(self):
+        """This signal is emitted when the display standby timeout changed.
+           
+           Returns: ServiceSignal
+           Payload: int"""
+        return self._displayStandbyTimeoutChanged
+
+    def soundVolumeChanged(self):
+        """This signal is emitted when the sound volume changed.
+           
+           Returns: ServiceSignal
+           Payload: int"""
+        return self._soundVolumeChanged
+
+    def licenseUpdate(self):
+        """This signal is emitted when the license information changed.
+           
+           A change of the license information can be caused by the registration of
+           a new feature or an update of the exiting licenses.
+           
+           Returns: ServiceSignal"""
+        return self._licenseUpdate
+
+    def powerSupplyConfigurationChanged(self):
+        """This signal is emitted when the power supply configuration changed.
+           
+           Returns: ServiceSignal
+           Payload: PowerSupplyConfigChangedPayload"""
+        return self._powerSupplyConfigurationChanged
+
+    def powerSupplyConfigSynchronizationChanged(self):
+        """This signal is emitted when the power supply configuration synchronization changed.
+           
+           Returns: ServiceSignal
+           Payload: bool"""
+        return self._powerSupplyConfigSynchronizationChanged
+
+    def displayTouchEnabledChanged(self):
+        """This signal is emitted when the display touch input enabled state changed.
+           
+           New in version 1.8.
+           
+           Returns: ServiceSignal
+           Payload: bool"""
+        return self._displayTouchEnabledChanged
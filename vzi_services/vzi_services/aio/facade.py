@@ -0,0 +1,45 @@
+from contextlib import nullcontext
+from riconnect.aio import AsyncService
+
+class AsyncServiceFacade(object):
+    """Base class of the async service facades.
+
+       The methods of a facade are coroutine counterparts of the service
+       class methods, generated by tools/gen-aio.py."""
+    SERVICE_CLASS = None
+
+    def __init__(self, address, connectionFactory=None):
+        """Create new async service instance, call connect() to open the connection.
+
+           Arguments:
+             address (str): service address consisting of hostname/IP-address and port number
+             connectionFactory (AsyncConnectionFactory): factory of the shared connections"""
+        self._address = address
+        self._svc = AsyncService(self.SERVICE_CLASS.SERVICE_NAME, connectionFactory=connectionFactory)
+        # requests of concurrent tasks are multiplexed by the async service
+        self._lock = nullcontext()
+
+    async def connect(self):
+        """Open service connection.
+
+           The service classes define open() and close() methods of their own
+           (e.g. CameraService.open), so the connection is opened with connect()
+           and closed with disconnect()."""
+        await self._svc.open(self._address)
+        # some service classes subscribe signals in _initSignals()
+        self._initSignals()
+        return self
+
+    async def disconnect(self):
+        """Close service connection."""
+        await self._svc.close()
+
+    def isConnected(self):
+        """Return true if the service connection is established and alive."""
+        return self._svc.isConnected()
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *args):
+        await self.disconnect()
@@ -0,0 +1,1160 @@
+# pylint: skip-file
+# Generated by tools/gen-aio.py from vzi_services/interfaceservice.py, do not edit.
+import json
+import riconnect
+from ..interfaceservice import InterfaceService, BluetoothDevice, BluetoothInterface, BluetoothSerialPortService, InetConnStatus, MobileDeviceInfo, MobileNetworkOperator, MobileNetworkStatus, NetworkInterface, NetworkInterfaceState, NetworkStorageConfig, ServiceSignal, StorageInterface, WIFIchannel, WIFInetwork, _interfaceservice_bluetoothconnectionchanged_decoder, _interfaceservice_bluetoothdevicescanfinished_decoder, _interfaceservice_bluetoothinterfacechanged_decoder, _interfaceservice_error_decoder, _interfaceservice_internetconnectionstatusupdate_decoder, _interfaceservice_mobilenetworkoperatorsearchfinished_decoder, _interfaceservice_mobilenetworkregistrationfinished_decoder, _interfaceservice_storageinterfaceadded_decoder, _interfaceservice_storageinterfaceejected_decoder, _interfaceservice_storageinterfaceremoved_decoder, _interfaceservice_storageinterfacewillbeejected_decoder
+from .facade import AsyncServiceFacade
+
+class AsyncInterfaceService(AsyncServiceFacade):
+    """Service for managing I/O interfaces."""
+    SERVICE_CLASS = InterfaceService
+    Error = InterfaceService.Error
+    SystemError = InterfaceService.SystemError
+    NetworkInterfaceType = InterfaceService.NetworkInterfaceType
+    WIFImode = InterfaceService.WIFImode
+    IPconfigMode = InterfaceService.IPconfigMode
+    WIFIencryptMode = InterfaceService.WIFIencryptMode
+    StorageInterfaceType = InterfaceService.StorageInterfaceType
+    StorageFsType = InterfaceService.StorageFsType
+    StorageInterfaceMountSpec = InterfaceService.StorageInterfaceMountSpec
+    NetworkStorageProtocol = InterfaceService.NetworkStorageProtocol
+    MobileNetworkRegistrationStatus = InterfaceService.MobileNetworkRegistrationStatus
+    MobileNetworkMode = InterfaceService.MobileNetworkMode
+    MobileSimSelect = InterfaceService.MobileSimSelect
+    ERROR_NONE = InterfaceService.ERROR_NONE
+    ERROR = InterfaceService.ERROR
+    ERROR_UNIMPLEMENTED = InterfaceService.ERROR_UNIMPLEMENTED
+    ERROR_NOT_FOUND = InterfaceService.ERROR_NOT_FOUND
+    ERROR_SYSTEM_CMD_EXEC_FAILED = InterfaceService.ERROR_SYSTEM_CMD_EXEC_FAILED
+    ERROR_NOT_AVAILABLE = InterfaceService.ERROR_NOT_AVAILABLE
+    ERROR_NO_NETWORKS = InterfaceService.ERROR_NO_NETWORKS
+    ERROR_NET_CONFIG_ERROR = InterfaceService.ERROR_NET_CONFIG_ERROR
+    ERROR_NO_NETIF_WIFI = InterfaceService.ERROR_NO_NETIF_WIFI
+    ERROR_MOBILE_SIM_DETECT_IP = InterfaceService.ERROR_MOBILE_SIM_DETECT_IP
+    ERROR_MOBILE_CMD_EXEC_FAILED = InterfaceService.ERROR_MOBILE_CMD_EXEC_FAILED
+    ERROR_MOBILE_PIN_IS_INVALID = InterfaceService.ERROR_MOBILE_PIN_IS_INVALID
+    ERROR_MOBILE_NETWORK_REG_FAILED = InterfaceService.ERROR_MOBILE_NETWORK_REG_FAILED
+    ERROR_MOBILE_NETWORK_REG_IP = InterfaceService.ERROR_MOBILE_NETWORK_REG_IP
+    ERROR_MOBILE_OPERATOR_SEARCH_FAILED = InterfaceService.ERROR_MOBILE_OPERATOR_SEARCH_FAILED
+    ERROR_MOBILE_OPERATOR_SEARCH_IP = InterfaceService.ERROR_MOBILE_OPERATOR_SEARCH_IP
+    ERROR_BT_ALREADY_CONNECTED = InterfaceService.ERROR_BT_ALREADY_CONNECTED
+    ERROR_BT_CONFIG_ERROR = InterfaceService.ERROR_BT_CONFIG_ERROR
+    ERROR_BT_SCAN_IP = InterfaceService.ERROR_BT_SCAN_IP
+    ERROR_BT_SCAN_FAILED = InterfaceService.ERROR_BT_SCAN_FAILED
+    ERROR_BT_DEVICE_NOT_AVAIL = InterfaceService.ERROR_BT_DEVICE_NOT_AVAIL
+    ERROR_BT_CONNECT_FAILED = InterfaceService.ERROR_BT_CONNECT_FAILED
+    MOBILE_PIN_IS_NOT_INTENDED_FOR_SIM = InterfaceService.MOBILE_PIN_IS_NOT_INTENDED_FOR_SIM
+    MOBILE_PIN_IS_INVALID = InterfaceService.MOBILE_PIN_IS_INVALID
+    MOBILE_MODULE_CONFIG_ERROR = InterfaceService.MOBILE_MODULE_CONFIG_ERROR
+    MOBILE_OPERATOR_SEARCH_FAILED = InterfaceService.MOBILE_OPERATOR_SEARCH_FAILED
+    MOBILE_NETWORK_REG_FAILED = InterfaceService.MOBILE_NETWORK_REG_FAILED
+    BLUETOOTH_DEVICE_SCAN_FAILED = InterfaceService.BLUETOOTH_DEVICE_SCAN_FAILED
+    NETIF_UNKNOWN = InterfaceService.NETIF_UNKNOWN
+    NETIF_LOOPBACK = InterfaceService.NETIF_LOOPBACK
+    NETIF_ETHERNET = InterfaceService.NETIF_ETHERNET
+    NETIF_WIFI = InterfaceService.NETIF_WIFI
+    NETIF_DATACARD = InterfaceService.NETIF_DATACARD
+    NETIF_BRIDGE = InterfaceService.NETIF_BRIDGE
+    NETIF_ANY = InterfaceService.NETIF_ANY
+    WIFI_MODE_UNKNOWN = InterfaceService.WIFI_MODE_UNKNOWN
+    WIFI_MODE_ACCESS_POINT = InterfaceService.WIFI_MODE_ACCESS_POINT
+    WIFI_MODE_STATION = InterfaceService.WIFI_MODE_STATION
+    WIFI_MODE_AD_HOC = InterfaceService.WIFI_MODE_AD_HOC
+    IPCONFIG_NONE = InterfaceService.IPCONFIG_NONE
+    IPCONFIG_DHCP = InterfaceService.IPCONFIG_DHCP
+    IPCONFIG_DHCP_SERVER = InterfaceService.IPCONFIG_DHCP_SERVER
+    IPCONFIG_STATIC = InterfaceService.IPCONFIG_STATIC
+    WIFI_ENCRYPT_UNKNOWN = InterfaceService.WIFI_ENCRYPT_UNKNOWN
+    WIFI_ENCRYPT_NONE = InterfaceService.WIFI_ENCRYPT_NONE
+    WIFI_ENCRYPT_WEP = InterfaceService.WIFI_ENCRYPT_WEP
+    WIFI_ENCRYPT_WPA = InterfaceService.WIFI_ENCRYPT_WPA
+    WIFI_ENCRYPT_WPA2 = InterfaceService.WIFI_ENCRYPT_WPA2
+    STORAGEIF_UNKNOWN = InterfaceService.STORAGEIF_UNKNOWN
+    STORAGEIF_SSD = InterfaceService.STORAGEIF_SSD
+    STORAGEIF_USB = InterfaceService.STORAGEIF_USB
+    STORAGEIF_SDCARD = InterfaceService.STORAGEIF_SDCARD
+    STORAGEIF_MMC = InterfaceService.STORAGEIF_MMC
+    STORAGEIF_NAS = InterfaceService.STORAGEIF_NAS
+    STORAGEIF_ANY = InterfaceService.STORAGEIF_ANY
+    STORAGEIF_FS_UNKNOWN = InterfaceService.STORAGEIF_FS_UNKNOWN
+    STORAGEIF_FS_NONE = InterfaceService.STORAGEIF_FS_NONE
+    STORAGEIF_FS_EXT2 = InterfaceService.STORAGEIF_FS_EXT2
+    STORAGEIF_FS_EXT3 = InterfaceService.STORAGEIF_FS_EXT3
+    STORAGEIF_FS_EXT4 = InterfaceService.STORAGEIF_FS_EXT4
+    STORAGEIF_FS_FAT32 = InterfaceService.STORAGEIF_FS_FAT32
+    STORAGEIF_FS_EXFAT = InterfaceService.STORAGEIF_FS_EXFAT
+    STORAGEIF_FS_NTFS = InterfaceService.STORAGEIF_FS_NTFS
+    STORAGEIF_MOUNT_RO = InterfaceService.STORAGEIF_MOUNT_RO
+    STORAGEIF_MOUNT_RW = InterfaceService.STORAGEIF_MOUNT_RW
+    STORAGEIF_NAS_PROTOCOL_UNKNOWN = InterfaceService.STORAGEIF_NAS_PROTOCOL_UNKNOWN
+    STORAGEIF_NAS_PROTOCOL_CIFS = InterfaceService.STORAGEIF_NAS_PROTOCOL_CIFS
+    STORAGEIF_NAS_PROTOCOL_NFS = InterfaceService.STORAGEIF_NAS_PROTOCOL_NFS
+    STORAGEIF_NAS_PROTOCOL_SFTP = InterfaceService.STORAGEIF_NAS_PROTOCOL_SFTP
+    MOBILEIF_STATUS_UNKNOWN = InterfaceService.MOBILEIF_STATUS_UNKNOWN
+    MOBILEIF_STATUS_NOT_REGISTERED = InterfaceService.MOBILEIF_STATUS_NOT_REGISTERED
+    MOBILEIF_STATUS_NOT_REGISTERED_BUT_SEARCHING = InterfaceService.MOBILEIF_STATUS_NOT_REGISTERED_BUT_SEARCHING
+    MOBILEIF_STATUS_REGISTERED_HOME = InterfaceService.MOBILEIF_STATUS_REGISTERED_HOME
+    MOBILEIF_STATUS_REGISTERED_ROAMING = InterfaceService.MOBILEIF_STATUS_REGISTERED_ROAMING
+    MOBILEIF_STATUS_REGISTRATION_DENIED = InterfaceService.MOBILEIF_STATUS_REGISTRATION_DENIED
+    MOBILEIF_MODE_NONE = InterfaceService.MOBILEIF_MODE_NONE
+    MOBILEIF_MODE_2G_GPRS = InterfaceService.MOBILEIF_MODE_2G_GPRS
+    MOBILEIF_MODE_2G_EDGE = InterfaceService.MOBILEIF_MODE_2G_EDGE
+    MOBILEIF_MODE_3G_WCDMA = InterfaceService.MOBILEIF_MODE_3G_WCDMA
+    MOBILEIF_MODE_3G_HSDPA = InterfaceService.MOBILEIF_MODE_3G_HSDPA
+    MOBILEIF_MODE_3G_HSUPA = InterfaceService.MOBILEIF_MODE_3G_HSUPA
+    MOBILEIF_MODE_3G_HSDPA_AND_HSUPA = InterfaceService.MOBILEIF_MODE_3G_HSDPA_AND_HSUPA
+    MOBILEIF_MODE_4G_LTE = InterfaceService.MOBILEIF_MODE_4G_LTE
+    MOBIF_SIM_FACTORY = InterfaceService.MOBIF_SIM_FACTORY
+    MOBIF_SIM_USER = InterfaceService.MOBIF_SIM_USER
+    SERVICE_NAME = InterfaceService.SERVICE_NAME
+
+    def _initSignals(self):
+        # service signals
+        self._error = ServiceSignal(self._svc, "error", decoderFn=_interfaceservice_error_decoder)
+        self._internetConnectionStatusUpdate = ServiceSignal(self._svc, "internetConnectionStatusUpdate", decoderFn=_interfaceservice_internetconnectionstatusupdate_decoder)
+        self._storageInterfaceAdded = ServiceSignal(self._svc, "storageInterfaceAdded", decoderFn=_interfaceservice_storageinterfaceadded_decoder)
+        self._storageInterfaceRemoved = ServiceSignal(self._svc, "storageInterfaceRemoved", decoderFn=_interfaceservice_storageinterfaceremoved_decoder)
+        self._storageInterfaceWillBeEjected = ServiceSignal(self._svc, "storageInterfaceWillBeEjected", decoderFn=_interfaceservice_storageinterfacewillbeejected_decoder)
+        self._storageInterfaceEjected = ServiceSignal(self._svc, "storageInterfaceEjected", decoderFn=_interfaceservice_storageinterfaceejected_decoder)
+        self._mobileNetworkOperatorSearchFinished = ServiceSignal(self._svc, "mobileNetworkOperatorSearchFinished", decoderFn=_interfaceservice_mobilenetworkoperatorsearchfinished_decoder)
+        self._mobileNetworkRegistrationFinished = ServiceSignal(self._svc, "mobileNetworkRegistrationFinished", decoderFn=_interfaceservice_mobilenetworkregistrationfinished_decoder)
+        self._bluetoothInterfaceChanged = ServiceSignal(self._svc, "bluetoothInterfaceChanged", decoderFn=_interfaceservice_bluetoothinterfacechanged_decoder)
+        self._bluetoothDeviceScanFinished = ServiceSignal(self._svc, "bluetoothDeviceScanFinished", decoderFn=_interfaceservice_bluetoothdevicescanfinished_decoder)
+        self._bluetoothConnectionChanged = ServiceSignal(self._svc, "bluetoothConnectionChanged", decoderFn=_interfaceservice_bluetoothconnectionchanged_decoder)
+
+    async def getNetworkInterface(self, name):
+        """Get the specified network Interface.
+
+           Arguments:
+             name (str):
+
+           Returns: NetworkInterface
+             A NetworkInterface on success. On error a NetworkInterface with an empty name is returned."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getNetworkInterface_71a78690", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(NetworkInterface(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getNetworkInterfaces(self, eType):
+        """Gets a list of network Interfaces.
+
+           Arguments:
+             eType (NetworkInterfaceType): Network interface type mask, e.g. NETIF_ETHERNET|NETIF_WIFI or NETIF_ANY etc.
+
+           Returns: list(NetworkInterface)
+                 A vector of netif objects to describe each network interface requested."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = int(eType)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getNetworkInterfaces_74629675", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([NetworkInterface(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getNetworkInterfaceState(self, name):
+        """Gets the current network interface state.
+
+           Arguments:
+             name (str): Interface name, as returned in a netif object from getNetworkInterfaces()
+
+           Returns: NetworkInterfaceState
+                    An object to describe the lan link status, lan link speed, wlan link quality, ..."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getNetworkInterfaceState_ef139fb8", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(NetworkInterfaceState(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def NetworkHostname(self):
+        """Get the machines network hostname.
+
+           Returns: str
+             The network hostname string."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("NetworkHostname_97d5a180", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def disableNetworkInterface(self, name, disable):
+        """Deactivate/Activate network interface.
+
+           Arguments:
+             name (str): Interface name, as returned in a netif object from getNetworkInterfaces()
+             disable (bool): Set inteface up/down.
+
+           Returns: Error
+             ERROR_NONE  On success."""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = name
+        inputs[1].i32 = 1 if disable else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("disableNetworkInterface_59f66dc0", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setNetworkInterfaceConfig(self, *args):
+        """
+           setNetworkInterfaceConfig(name, ipconfig)
+               Allows configuration of a network interface.
+
+               Arguments:
+                 name (str): Interface name, as returned in a netif object from getNetworkInterfaces();
+                 ipconfig (IPconfig): Configuration data for the interface's IP settings.
+
+               Returns: Error
+                    ERROR_NONE     On success.
+
+           setNetworkInterfaceConfig(name, ipconfig, wifiConfig)
+               Allows configuration of a WIFI network interface.
+
+               Arguments:
+                 name (str): Interface name, as returned in a netif object from getNetworkInterfaces();
+                 ipconfig (IPconfig): Configuration data for the interface's IP settings.
+                 wifiConfig (WIFIconfig):
+
+               Returns: Error
+                    ERROR_NONE     On success.
+
+        """
+        if len(args) == 2:
+            return await self._setNetworkInterfaceConfig_072f61ad(*args)
+        elif len(args) == 3:
+            return await self._setNetworkInterfaceConfig_ffcec136(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _setNetworkInterfaceConfig_072f61ad(self, name, ipconfig):
+        """Allows configuration of a network interface.
+
+           Arguments:
+             name (str): Interface name, as returned in a netif object from getNetworkInterfaces();
+             ipconfig (IPconfig): Configuration data for the interface's IP settings.
+
+           Returns: Error
+                ERROR_NONE     On success."""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = name
+        inputs[1].s = json.dumps(ipconfig)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setNetworkInterfaceConfig_072f61ad", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _setNetworkInterfaceConfig_ffcec136(self, name, ipconfig, wifiConfig):
+        """Allows configuration of a WIFI network interface.
+
+           Arguments:
+             name (str): Interface name, as returned in a netif object from getNetworkInterfaces();
+             ipconfig (IPconfig): Configuration data for the interface's IP settings.
+             wifiConfig (WIFIconfig):
+
+           Returns: Error
+                ERROR_NONE     On success."""
+        inputs = [riconnect.Value() for i in range(0, 3)]
+        inputs[0].s = name
+        inputs[1].s = json.dumps(ipconfig)
+        inputs[2].s = json.dumps(wifiConfig)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setNetworkInterfaceConfig_ffcec136", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getNetworkInterfaceConfig(self, name, eMode):
+        """Get the specified network interface configuration.
+
+           Arguments:
+             name (str): Interface name, as returned in a netif object from getNetworkInterfaces();
+             eMode (IPconfigMode): IP configuration mode.
+
+           Returns: NetworkInterface
+             A NetworkInterface on success. On error a NetworkInterface with an empty name is returned."""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = name
+        inputs[1].i32 = int(eMode)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getNetworkInterfaceConfig_67a19aec", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(NetworkInterface(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getNetworkInterfaceConfigs(self, eType, eMode):
+        """Returns configuration of network interfaces.
+
+           Arguments:
+             eType (NetworkInterfaceType): Network interface type mask, e.g. NETIF_ETHERNET|NETIF_WIFI or NETIF_ANY etc.
+             eMode (IPconfigMode): IP configuration mode.
+
+           Returns: list(NetworkInterface)
+                     A map of objects to describe each configured network interface."""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].i32 = int(eType)
+        inputs[1].i32 = int(eMode)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getNetworkInterfaceConfigs_dc48b07e", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([NetworkInterface(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def scanWifiNetworks(self, name):
+        """Gets a list of available WIFI Access Points.
+
+           Arguments:
+             name (str): Interface name, as returned in a netif object from getNetworkInterfaces();
+
+           Returns: list(WIFInetwork)
+                    A vector of available WIFI networks."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scanWifiNetworks_199de44b", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0, timeout=60.0)
+        outputs = []
+
+        outputs.append([WIFInetwork(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def listWifiNetworkChannels(self, name):
+        """Gets a list of available WIFI channels.
+
+           Arguments:
+             name (str): Interface name, as returned in a netif object from getNetworkInterfaces()
+
+           Returns: list(WIFIchannel)
+                    A vector of available WIFI channels."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("listWifiNetworkChannels_a54a8a10", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([WIFIchannel(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getNetworkIpForwarding(self):
+        """Get the IP forward system configuration.
+
+           Returns: bool
+                    IP forward mode - 1 if forwarding is enabled, 0 if not."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getNetworkIpForwarding_7fe33eec", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setNetworkIpForwarding(self, enable):
+        """Set the IP forward system configuratin.
+
+           Arguments:
+             enable (bool): Enable IP forwarding."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if enable else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setNetworkIpForwarding_bed0b705", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def getPreferredInternetRoute(self):
+        """Get the preferred interface for route to internet.
+
+           Returns: str
+                    The interface name."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getPreferredInternetRoute_c591e075", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setPreferredInternetRoute(self, name):
+        """Set the preferred interface for route to internet.
+
+           Arguments:
+             name (str): The interface name."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setPreferredInternetRoute_f8da77e6", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def getInternetConnectionStatus(self):
+        """Get the internet connection status.
+
+           Returns: InetConnStatus
+                    An object describing the internet connection, containing the connection state and the interface used for routing."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getInternetConnectionStatus_aaad00f6", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InetConnStatus(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setInternetProxy(self, server_name, port_number):
+        """Set http/shttp/ftp/rsync proxy.
+
+           Arguments:
+             server_name (str): The proxy server name or ip address, with optional user and password <user>:<password>@<name>:<port>. e.g. user:user@192.168.1.1
+             port_number (int): The proxy server port number."""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = server_name
+        inputs[1].u32 = port_number
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setInternetProxy_8069e116", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def setInternetProxyEnable(self, enable):
+        """Enable internet proxy server configuration.
+
+           Arguments:
+             enable (bool): Enable/disable proxy settings."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if enable else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setInternetProxyEnable_d7328bd2", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def getInternetProxyConfig(self):
+        """Get http/shttp/ftp/rsync proxy server configuration.
+
+           Returns: tuple(str, int, bool)
+             1: The proxy server name or ip address, with optional user and password <user>:<password>@<name>:<port>. e.g. user:user@192.168.1.1
+             2: The proxy server port number.
+             3: True if proxy configuration is enabled."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getInternetProxyConfig_b2e33bd5", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+        outputs.append(rvalues[0].s)
+        outputs.append(rvalues[1].u32)
+        outputs.append(True if rvalues[2].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setNetworkMtu(self, name, mtu):
+        """Set MTU (Maximum Transmission Unit) for network interface.
+
+           Arguments:
+             name (str): Interface name, as returned in a netif object from getNetworkInterfaces().
+             mtu (int): Maximum Transmission Unit.
+
+           Returns: Error"""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = name
+        inputs[1].u32 = mtu
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setNetworkMtu_20b0d0a9", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getNetworkMtu(self, name):
+        """Get MTU (Maximum Transmission Unit) for network interface.
+
+           Arguments:
+             name (str): Interface name, as returned in a netif object from getNetworkInterfaces().
+
+           Returns: int
+             Maximum Transmission Unit."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getNetworkMtu_9d90e3ed", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setNetworkControlPortsEnable(self, enable):
+        """Activates/Deactivates network control ports (20000/Riconnect, 20002/Rid-Interpreter).
+
+           Arguments:
+             enable (bool): Enable/disable network control ports.
+
+           Returns: Error"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if enable else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setNetworkControlPortsEnable_79c01398", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getNetworkControlPortsEnable(self):
+        """Check if network control ports (20000/Riconnect, 20002/Rid-Interpreter) are enabled.
+
+           Returns: bool
+             True if etwork control ports are enabled, otherwise false."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getNetworkControlPortsEnable_cecc6ec5", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getStorageInterfaces(self, eType):
+        """Get a list of the available storage interfaces.
+
+           Arguments:
+             eType (StorageInterfaceType): Filter the list by @see storageif_type. E.g. STORAGEIF_USB | STORAGEIF_SDCARD or STORAGEIF_ANY
+
+           Returns: list(StorageInterface)
+             List of storageif objects."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = int(eType)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getStorageInterfaces_0e074df9", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([StorageInterface(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getStorageInterface(self, name):
+        """Get a StorageInterface by its name.
+
+           Arguments:
+             name (str): Name of the storage interface to get.
+
+           Returns: StorageInterface
+             A StorageInterface on success, on Error the returned StorageInterface will have no name."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getStorageInterface_a8f363f3", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(StorageInterface(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setNetworkStorageConfig(self, config):
+        """Set network storage configuration.
+
+           Arguments:
+             config (NetworkStorageConfig): The network storage configuration data.
+
+           Returns: NetworkStorageConfig
+             The network storage configuration data."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = json.dumps(config)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setNetworkStorageConfig_0799b189", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+        outputs.append(NetworkStorageConfig(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getNetworkStorageConfig(self):
+        """Get network storage configuration.
+
+           return The network storage configuration data.
+
+           Returns: NetworkStorageConfig"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getNetworkStorageConfig_0a64159c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(NetworkStorageConfig(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def mountNetworkStorageInterface(self):
+        """Mount network storage interface.
+
+           Returns: Error
+             ERROR_NONE On success."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("mountNetworkStorageInterface_6590a455", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0, timeout=30.0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def unmountStorageInterface(self, mount_path):
+        """Unmount storage interface partition.
+
+           Arguments:
+             mount_path (str): Path of the mount-point.
+
+           Returns: Error
+             ERROR_NONE On success."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = mount_path
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("unmountStorageInterface_05e24e4c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def ejectStorageInterface(self, name):
+        """Eject storage interface device.
+
+           Arguments:
+             name (str):
+
+           Returns: Error
+             ERROR_NONE On success."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("ejectStorageInterface_4bd75402", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def mobileAPN(self):
+        """Set mobile APN (Access Point Name).
+
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("mobileAPN_889b996f", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setMobileAPN(self, apn):
+        """Arguments:
+             apn (str): """
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = apn
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setMobileAPN_fdae079c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def getMobileDeviceInfo(self):
+        """Read mobile device info (manufacturer, serial number, firmware version, ...).
+
+           Returns: tuple(Error, MobileDeviceInfo)
+             1: ERROR_NONE On success.
+             2: A reference to an object containing the resulting data."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getMobileDeviceInfo_ade54881", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        outputs.append(MobileDeviceInfo(json.loads(rvalues[1].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def detectMobileSIM(self):
+        """Detect if mobile SIM card has been inserted.
+
+           Returns: bool
+             True if detected."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("detectMobileSIM_eb1aa40c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setMobilePIN(self, pin, remember):
+        """Set PIN for mobile SIM.
+
+           Arguments:
+             pin (str): 4-digit PIN code.
+             remember (bool): Remember PIN across device reboots.
+
+           Returns: Error
+             ERROR_NONE On success."""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = pin
+        inputs[1].i32 = 1 if remember else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setMobilePIN_7814a793", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setMobilePUK(self, puk, newpin):
+        """Set PUK for mobile SIM. If a wrong PIN is given three times, the PUK must be inserted in place  of the PIN, followed by the <newpin> which replaces the old pin in the SIM.
+
+           Arguments:
+             puk (str): 4-digit PUK code.
+             newpin (str): New 4-digit PIN code, replaces the old PIN.
+
+           Returns: Error
+             ERROR_NONE On success."""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = puk
+        inputs[1].s = newpin
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setMobilePUK_d9b4c9a8", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getMobilePINStatus(self):
+        """Read mobile PIN/PUK status and attempt counters.
+
+           Returns: tuple(Error, str, int, int, int, int)
+             1: ERROR_NONE On success.
+             2: String identifying the mobile PIN status (READY, SIM PIN, SIM PUK, SIM PIN2, SIM PUK2)
+             3: Number of remaining attempts to enter PIN.
+             4: Number of remaining attempts to enter PIN2.
+             5: Number of remaining attempts to enter PUK.
+             6: Number of remaining attempts to enter PUK2."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getMobilePINStatus_2605c841", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        outputs.append(rvalues[1].s)
+        outputs.append(rvalues[2].i32)
+        outputs.append(rvalues[3].i32)
+        outputs.append(rvalues[4].i32)
+        outputs.append(rvalues[5].i32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def mobileNetworkOperatorName(self):
+        """Select the mobile network operator.
+
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("mobileNetworkOperatorName_68da4acf", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def mobileNetworkOperatorNumeric(self):
+        """Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("mobileNetworkOperatorNumeric_a3edaea0", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def mobileNetworkOperatorAutomatic(self):
+        """Returns: bool"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("mobileNetworkOperatorAutomatic_b80ad78c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setMobileNetworkOperator(self, automatic, numeric_oper):
+        """Arguments:
+             automatic (bool):
+             numeric_oper (str): """
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].i32 = 1 if automatic else 0
+        inputs[1].s = numeric_oper
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setMobileNetworkOperator_ffd4583f", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def mobileNetworkOperatorSearch(self, block):
+        """Mobile network operator search.
+
+           Arguments:
+             block (bool): Block until search has finished, or send a finished signal.
+
+           Returns: Error
+             ERROR_NONE On success."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if block else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("mobileNetworkOperatorSearch_9ac9149e", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0, timeout=240.0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getMobileNetworkOperators(self):
+        """Get a list of available network operators.
+
+           Returns: list(MobileNetworkOperator)
+             A list of network operator descriptors."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getMobileNetworkOperators_1751a8f3", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([MobileNetworkOperator(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def mobileNetworkRegistration(self, block):
+        """Mobile network registration.
+
+           Arguments:
+             block (bool): Block until registration has finished, or send a finished signal.
+
+           Returns: Error
+             ERROR_NONE On success."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if block else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("mobileNetworkRegistration_7b04a1ac", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0, timeout=150.0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getMobileNetworkStatus(self):
+        """Get the mobile network registration status.
+
+           Returns: tuple(Error, MobileNetworkStatus)
+             1: ERROR_NONE On success.
+             2: A reference to an object containing the resulting network status."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getMobileNetworkStatus_d9dbd396", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        outputs.append(MobileNetworkStatus(json.loads(rvalues[1].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getMobileSignalQuality(self):
+        """Get the received mobile signal quality.
+
+           Returns: tuple(Error, int)
+             1: ERROR_NONE On success.
+             2: Received Signal Quality in percent."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getMobileSignalQuality_cc980254", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        outputs.append(rvalues[1].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def mobileAirplaneMode(self):
+        """Activates mobile network airplane mode.
+
+           Returns: bool
+             ERROR_NONE On success."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("mobileAirplaneMode_9a45317c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setMobileAirplaneMode(self, enable):
+        """Arguments:
+             enable (bool):
+
+           Returns: Error"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if enable else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setMobileAirplaneMode_68fd06fa", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getMobileSimSelect(self):
+        """Get the selected mobile SIM card.
+
+           Returns: MobileSimSelect
+             The automatically at startup selected SIM card, either 1 = USER (if present) or 0 = FACTORY."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getMobileSimSelect_a68f7b28", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.MobileSimSelect(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getBluetoothInterface(self):
+        """Get the local bluetooth interface with description.
+
+           Returns: BluetoothInterface
+             Object describint the local bluetooth interface."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getBluetoothInterface_316ed5fe", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(BluetoothInterface(json.loads(rvalues[0].s)))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def bluetoothInterfaceDisable(self):
+        """Get bluetooth interface state.
+
+           Returns: bool
+             True if disabled, false if enabled."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("bluetoothInterfaceDisable_5a8c18ec", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setBluetoothInterfaceDisable(self, disable):
+        """Set bluetooth interface active or inactive.
+
+           Arguments:
+             disable (bool): De-/activate bluetooth interface.
+
+           Returns: Error
+             ERROR_NONE On success."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if disable else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setBluetoothInterfaceDisable_c96c5239", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def bluetoothDeviceScan(self, block):
+        """Start bluetooth device inquisition.
+
+           Arguments:
+             block (bool): Blocking or non-blocking mode.
+
+           Returns: Error
+             ERROR_NONE On success."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if block else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("bluetoothDeviceScan_d3f33af6", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getBluetoothDevices(self):
+        """Get list of discovered bluetooth devices.
+
+           Returns: list(BluetoothDevice)
+             Vector of bluetooth device objects."""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getBluetoothDevices_a5095609", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([BluetoothDevice(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def getBluetoothSerialPortServices(self, mac):
+        """Get list of provided serial port services of remote bluetooth device.
+
+           Arguments:
+             mac (str):
+
+           Returns: list(BluetoothSerialPortService)
+             Vector of bluetooth serial port service objects."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = mac
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getBluetoothSerialPortServices_dfc84d9b", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([BluetoothSerialPortService(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def bluetoothConnect(self, mac, remember):
+        """Connect to all supported services of remote bluetooth device.
+
+           Arguments:
+             mac (str): MAC address of the remote bluetooth device.
+             remember (bool): Remember connection settings across device power cycles.
+
+           Returns: Error
+             ERROR_NONE On success."""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = mac
+        inputs[1].i32 = 1 if remember else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("bluetoothConnect_f06c1cc2", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def bluetoothDisconnect(self, mac):
+        """Disconnect from all services fo a remote bluetooth device .
+
+           Arguments:
+             mac (str): MAC address of the remote bluetooth device.
+
+           Returns: Error
+             ERROR_NONE On success."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = mac
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("bluetoothDisconnect_236c71a6", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(InterfaceService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def triggerInputEvent(self, eventId):
+        """Trigger an input event.
+
+           Arguments:
+             eventId (str): Input event identifier, supported identfiers are: 'ACQ_START_STOP'."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = eventId
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("triggerInputEvent_26141877", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def savePasswords(self):
+        """"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("savePasswords_22687198", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def save(self):
+        """Save service properties."""
+        with self._lock:
+            await self._svc.callFunction("__risc__service_properties__save_fn")
+
+    async def restore(self):
+        """Restore service properties."""
+        with self._lock:
+            await self._svc.callFunction("__risc__service_properties__restore_fn")
+
+    def error(self):
+        """The error signal allows services to report problems that are
+           unrelated to service calls. It was intended to allow services
+           to report hardware related problems. But since most services
+           provide some kind of business logic, this signal is rarely used.
+
+           Returns: ServiceSignal
+           Payload: dict"""
+        return self._error
+
+    def internetConnectionStatusUpdate(self):
+        """Returns: ServiceSignal
+           Payload: InetConnStatus"""
+        return self._internetConnectionStatusUpdate
+
+    def storageInterfaceAdded(self):
+        """Returns: ServiceSignal
+           Payload: StorageInterface"""
+        return self._storageInterfaceAdded
+
+    def storageInterfaceRemoved(self):
+        """Returns: ServiceSignal
+           Payload: str"""
+        return self._storageInterfaceRemoved
+
+    def storageInterfaceWillBeEjected(self):
+        """Returns: ServiceSignal
+           Payload: str"""
+        return self._storageInterfaceWillBeEjected
+
+    def storageInterfaceEjected(self):
+        """Returns: ServiceSignal
+           Payload: str"""
+        return self._storageInterfaceEjected
+
+    def mobileNetworkOperatorSearchFinished(self):
+        """Returns: ServiceSignal
+           Payload: int"""
+        return self._mobileNetworkOperatorSearchFinished
+
+    def mobileNetworkRegistrationFinished(self):
+        """Returns: ServiceSignal
+           Payload: MobileNetworkStatus"""
+        return self._mobileNetworkRegistrationFinished
+
+    def bluetoothInterfaceChanged(self):
+        """Returns: ServiceSignal
+           Payload: BluetoothInterface"""
+        return self._bluetoothInterfaceChanged
+
+    def bluetoothDeviceScanFinished(self):
+        """Returns: ServiceSignal
+           Payload: int"""
+        return self._bluetoothDeviceScanFinished
+
+    def bluetoothConnectionChanged(self):
+        """Returns: ServiceSignal
+           Payload: BluetoothDevice"""
+        return self._bluetoothConnectionChanged
@@ -0,0 +1,973 @@
+# pylint: skip-file
+# Generated by tools/gen-aio.py from vzi_services/projectservice.py, do not edit.
+import riconnect
+from ..projectservice import ProjectService, ServiceSignal, _projectservice_error_decoder, _projectservice_projectchanged_decoder, _projectservice_scanpositionchanged_decoder, _projectservice_storagemediachanged_decoder
+from .facade import AsyncServiceFacade
+
+class AsyncProjectService(AsyncServiceFacade):
+    """The project service.
+       
+       The project service provides functionality to manage projects and scan
+       positions. It can be used to create and select a project or scan position
+       and retrieve information about existing projects."""
+    SERVICE_CLASS = ProjectService
+    StorageMedia = ProjectService.StorageMedia
+    Error = ProjectService.Error
+    SM_INTERNAL = ProjectService.SM_INTERNAL
+    SM_USB = ProjectService.SM_USB
+    SM_SDCARD = ProjectService.SM_SDCARD
+    SM_NAS = ProjectService.SM_NAS
+    SUCCESS = ProjectService.SUCCESS
+    UNIMPLEMENTED = ProjectService.UNIMPLEMENTED
+    PROJECT_DIR_NOT_FOUND = ProjectService.PROJECT_DIR_NOT_FOUND
+    PROJECT_NOT_FOUND = ProjectService.PROJECT_NOT_FOUND
+    PROJECT_EXISTS = ProjectService.PROJECT_EXISTS
+    PROJECT_CREATE_MKDIR_FAILED = ProjectService.PROJECT_CREATE_MKDIR_FAILED
+    INVALID_ARGUMENT = ProjectService.INVALID_ARGUMENT
+    NO_PROJECT_LOADED = ProjectService.NO_PROJECT_LOADED
+    NO_SCANPOSITION_LOADED = ProjectService.NO_SCANPOSITION_LOADED
+    SCANPOS_DIR_NOT_FOUND = ProjectService.SCANPOS_DIR_NOT_FOUND
+    SCANPOS_NOT_FOUND = ProjectService.SCANPOS_NOT_FOUND
+    SCANPOS_EXISTS = ProjectService.SCANPOS_EXISTS
+    SCANPOS_CREATE_MKDIR_FAILED = ProjectService.SCANPOS_CREATE_MKDIR_FAILED
+    INTERNAL_SERVER_ERROR = ProjectService.INTERNAL_SERVER_ERROR
+    SERVICE_NAME = ProjectService.SERVICE_NAME
+
+    def _initSignals(self):
+        # service signals
+        self._error = ServiceSignal(self._svc, "error", decoderFn=_projectservice_error_decoder)
+        self._storageMediaChanged = ServiceSignal(self._svc, "storageMediaChanged", decoderFn=_projectservice_storagemediachanged_decoder)
+        self._projectChanged = ServiceSignal(self._svc, "projectChanged", decoderFn=_projectservice_projectchanged_decoder)
+        self._scanpositionChanged = ServiceSignal(self._svc, "scanpositionChanged", decoderFn=_projectservice_scanpositionchanged_decoder)
+
+    async def setStorageMedia(self, value):
+        """Set the active storage media.
+           
+           If the new storage media is different then the active storage media then
+           the storageMediaChanged signal will be emitted. Changing the storage
+           media might also cause the active project and scanposition to change.
+           
+           Arguments:
+             value (StorageMedia): the new storage media"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = int(value)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setStorageMedia_b285ef5a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def storageMedia(self):
+        """Return the active storage media.
+           
+           Returns: StorageMedia"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("storageMedia_3b72af71", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ProjectService.StorageMedia(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def createProject(self, *args):
+        """
+           createProject(name)
+               Create a new project on the active storage media.
+               
+               Arguments:
+                 name (str): the name of the project
+               
+               Returns: Error
+
+           createProject(media, name)
+               Create a new project on the specified storage media.
+               
+               New in version 1.2
+               
+               Arguments:
+                 media (StorageMedia): the storage media
+                 name (str): the name of the project
+               
+               Returns: Error
+
+        """
+        if len(args) == 1:
+            return await self._createProject_556861f3(*args)
+        elif len(args) == 2:
+            return await self._createProject_0e87533a(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _createProject_556861f3(self, name):
+        """Create a new project on the active storage media.
+           
+           Arguments:
+             name (str): the name of the project
+           
+           Returns: Error"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("createProject_556861f3", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ProjectService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _createProject_0e87533a(self, media, name):
+        """Create a new project on the specified storage media.
+           
+           New in version 1.2
+           
+           Arguments:
+             media (StorageMedia): the storage media
+             name (str): the name of the project
+           
+           Returns: Error"""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].i32 = int(media)
+        inputs[1].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("createProject_0e87533a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ProjectService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def loadProject(self, name):
+        """Load the specified project, making it active.
+           
+           Arguments:
+             name (str): the name of the project
+           
+           Returns: Error"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("loadProject_288fb236", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ProjectService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def suggestProjectName(self):
+        """Return a suggestion for a new project name.
+           
+           The created suggestion is based on the active project. The base name
+           of the project is extracted and any available counter is incremented.
+           e.g.
+             activeProject    = Project001
+             suggestedProject = Project002
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("suggestProjectName_208f3ca0", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def logMessage(self, message):
+        """Add message to project log.
+           
+           The project log is a text file called 'project.log', located in the
+           project directory.
+           
+           Arguments:
+             message (str): the log message"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = message
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("logMessage_5e703234", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def createScanposition(self, *args):
+        """
+           createScanposition(name)
+               Create a new scanposition in the active project.
+               
+               Arguments:
+                 name (str): scanposition name
+               
+               Returns: Error
+
+           createScanposition(media, project, name)
+               Create a new scanposition in the specified project.
+               
+               New in version 1.2
+               
+               Arguments:
+                 media (StorageMedia): storage media
+                 project (str): project name
+                 name (str): scanposition name
+               
+               Returns: Error
+
+        """
+        if len(args) == 1:
+            return await self._createScanposition_0805a7bc(*args)
+        elif len(args) == 3:
+            return await self._createScanposition_13b2e54c(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _createScanposition_0805a7bc(self, name):
+        """Create a new scanposition in the active project.
+           
+           Arguments:
+             name (str): scanposition name
+           
+           Returns: Error"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("createScanposition_0805a7bc", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ProjectService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _createScanposition_13b2e54c(self, media, project, name):
+        """Create a new scanposition in the specified project.
+           
+           New in version 1.2
+           
+           Arguments:
+             media (StorageMedia): storage media
+             project (str): project name
+             name (str): scanposition name
+           
+           Returns: Error"""
+        inputs = [riconnect.Value() for i in range(0, 3)]
+        inputs[0].i32 = int(media)
+        inputs[1].s = project
+        inputs[2].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("createScanposition_13b2e54c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ProjectService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def selectScanposition(self, name):
+        """Select the specified scanposition, making it active.
+           
+           Arguments:
+             name (str): the name of the scanposition
+           
+           Returns: Error"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("selectScanposition_9af004bd", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(ProjectService.Error(rvalues[0].i32))
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def suggestScanpositionName(self):
+        """Return a suggestion for a new scanposition name.
+           
+           The created suggestion is based on the active scanposition. The base name
+           of the project is extracted and any available counter is incremented.
+           e.g.
+             activeScanposition    = ScanPos001
+             suggestedScanposition = ScanPos002
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("suggestScanpositionName_3f25ccde", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def projectName(self):
+        """Return the name of the active project.
+           
+           Returns an empty string if no project has been loaded.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("projectName_6be44560", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def scanpositionName(self):
+        """Return the name of the active scanposition.
+           
+           Returns an empty string if no scanposition has been selected.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scanpositionName_20e80977", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def projectPath(self, *args):
+        """
+           projectPath()
+               The absolute path of the project directory.
+               
+               Returns an empty string if no project has been loaded.
+               
+               Returns: str
+
+           projectPath(media, projectName)
+               Return the absolute path of the specified project.
+               
+               Arguments:
+                 media (StorageMedia): the storage media the project is stored on
+                 projectName (str): the name of the project
+               
+               Returns: str
+
+        """
+        if len(args) == 0:
+            return await self._projectPath_171034f7(*args)
+        elif len(args) == 2:
+            return await self._projectPath_451f6530(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _projectPath_171034f7(self):
+        """The absolute path of the project directory.
+           
+           Returns an empty string if no project has been loaded.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("projectPath_171034f7", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _projectPath_451f6530(self, media, projectName):
+        """Return the absolute path of the specified project.
+           
+           Arguments:
+             media (StorageMedia): the storage media the project is stored on
+             projectName (str): the name of the project
+           
+           Returns: str"""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].i32 = int(media)
+        inputs[1].s = projectName
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("projectPath_451f6530", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def scanpositionPath(self, *args):
+        """
+           scanpositionPath()
+               The path to the directory where scan position data should be stored.
+               
+               Returns an empty string if no scan position has been selected.
+               
+               Returns: str
+
+           scanpositionPath(media, projectName, scanpositionName)
+               Return the absolute path of the specified scan position.
+               
+               Arguments:
+                 media (StorageMedia): the storage media the project is stored on
+                 projectName (str): the name of the project
+                 scanpositionName (str): the name of the scanposition
+               
+               Returns: str
+
+        """
+        if len(args) == 0:
+            return await self._scanpositionPath_a2e217aa(*args)
+        elif len(args) == 3:
+            return await self._scanpositionPath_f2a1862a(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _scanpositionPath_a2e217aa(self):
+        """The path to the directory where scan position data should be stored.
+           
+           Returns an empty string if no scan position has been selected.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scanpositionPath_a2e217aa", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _scanpositionPath_f2a1862a(self, media, projectName, scanpositionName):
+        """Return the absolute path of the specified scan position.
+           
+           Arguments:
+             media (StorageMedia): the storage media the project is stored on
+             projectName (str): the name of the project
+             scanpositionName (str): the name of the scanposition
+           
+           Returns: str"""
+        inputs = [riconnect.Value() for i in range(0, 3)]
+        inputs[0].i32 = int(media)
+        inputs[1].s = projectName
+        inputs[2].s = scanpositionName
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scanpositionPath_f2a1862a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def projects(self, *args):
+        """
+           projects()
+               Return the project information of the projects on the active storage media.
+               
+               The data is returned as JSON string in the following format:
+               [
+                 {
+                   "name": "Project001",
+                   "description": "",
+                   "creationdate": "2015-10-31 09:39:00",
+                   "location": {
+                     "coordSystem": "",
+                     "coord1": 0,
+                     "coord2": 0,
+                     "coord3": 0
+                   }
+                 },
+                 ...
+               ]
+               
+               Returns: str
+
+           projects(media)
+               Return the project information of the projects on the specified storage media.
+               
+               The data is returned as JSON string, see projects().
+               
+               Arguments:
+                 media (StorageMedia): the storage media
+               
+               Returns: str
+
+        """
+        if len(args) == 0:
+            return await self._projects_35a2864c(*args)
+        elif len(args) == 1:
+            return await self._projects_db92a2a5(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _projects_35a2864c(self):
+        """Return the project information of the projects on the active storage media.
+           
+           The data is returned as JSON string in the following format:
+           [
+             {
+               "name": "Project001",
+               "description": "",
+               "creationdate": "2015-10-31 09:39:00",
+               "location": {
+                 "coordSystem": "",
+                 "coord1": 0,
+                 "coord2": 0,
+                 "coord3": 0
+               }
+             },
+             ...
+           ]
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("projects_35a2864c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _projects_db92a2a5(self, media):
+        """Return the project information of the projects on the specified storage media.
+           
+           The data is returned as JSON string, see projects().
+           
+           Arguments:
+             media (StorageMedia): the storage media
+           
+           Returns: str"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = int(media)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("projects_db92a2a5", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def scanpositions(self, *args):
+        """
+           scanpositions()
+               Return the scanpositions of the active project.
+               
+               The data is returned as JSON string in the following format:
+               [
+                 {
+                   "name": "ScanPos001"
+                 },
+                 ...
+               ]
+               
+               Returns: str
+
+           scanpositions(media, project)
+               Return the scanpositions of the specified project.
+               
+               The data is returned as JSON string, see scanpositions().
+               
+               Arguments:
+                 media (StorageMedia): the storage media
+                 project (str): the name of the project
+               
+               Returns: str
+
+        """
+        if len(args) == 0:
+            return await self._scanpositions_cd12961e(*args)
+        elif len(args) == 2:
+            return await self._scanpositions_e6ffb63a(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _scanpositions_cd12961e(self):
+        """Return the scanpositions of the active project.
+           
+           The data is returned as JSON string in the following format:
+           [
+             {
+               "name": "ScanPos001"
+             },
+             ...
+           ]
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scanpositions_cd12961e", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _scanpositions_e6ffb63a(self, media, project):
+        """Return the scanpositions of the specified project.
+           
+           The data is returned as JSON string, see scanpositions().
+           
+           Arguments:
+             media (StorageMedia): the storage media
+             project (str): the name of the project
+           
+           Returns: str"""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].i32 = int(media)
+        inputs[1].s = project
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scanpositions_e6ffb63a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def scans(self, *args):
+        """
+           scans()
+               Return information about the available scans of the active scanposition.
+               
+               The data is returned as JSON string in the following format:
+               [
+                 {
+                   "name": "Scan001",
+                  "path": "/media/intern/Project001.PROJ/ScanPos001.SCNPOS/scans",
+                   "measurementFile": "160101_082200.rxp",
+                   "monitorFile": "160101_082200.mon.rxp",
+                   "previewFile": "160101_082200.png",
+                   "metadataFile": "160101_082200.scn",
+                   "fov": {...}
+                 },
+                 ...
+               ]
+               
+               The attributes 'measurementFile' and 'monitorFile' are optional and are
+               only present if the files do actually exist.
+               
+               Returns: str
+
+           scans(media, project, scanposition)
+               Return information about the available scans of the specified scanposition.
+               
+               The data is returned as JSON string, see scans().
+               
+               Arguments:
+                 media (StorageMedia): the storage media
+                 project (str): the name of the project
+                 scanposition (str): the name of scan position
+               
+               Returns: str
+
+        """
+        if len(args) == 0:
+            return await self._scans_68bbe47a(*args)
+        elif len(args) == 3:
+            return await self._scans_a763cc21(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _scans_68bbe47a(self):
+        """Return information about the available scans of the active scanposition.
+           
+           The data is returned as JSON string in the following format:
+           [
+             {
+               "name": "Scan001",
+              "path": "/media/intern/Project001.PROJ/ScanPos001.SCNPOS/scans",
+               "measurementFile": "160101_082200.rxp",
+               "monitorFile": "160101_082200.mon.rxp",
+               "previewFile": "160101_082200.png",
+               "metadataFile": "160101_082200.scn",
+               "fov": {...}
+             },
+             ...
+           ]
+           
+           The attributes 'measurementFile' and 'monitorFile' are optional and are
+           only present if the files do actually exist.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scans_68bbe47a", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _scans_a763cc21(self, media, project, scanposition):
+        """Return information about the available scans of the specified scanposition.
+           
+           The data is returned as JSON string, see scans().
+           
+           Arguments:
+             media (StorageMedia): the storage media
+             project (str): the name of the project
+             scanposition (str): the name of scan position
+           
+           Returns: str"""
+        inputs = [riconnect.Value() for i in range(0, 3)]
+        inputs[0].i32 = int(media)
+        inputs[1].s = project
+        inputs[2].s = scanposition
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("scans_a763cc21", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def images(self, *args):
+        """
+           images()
+               Return information about the available images of the active scanposition.
+               
+               The data is returned as JSON string in the following format:
+               [
+                 {
+                   "path": "/media/intern/Project001.PROJ/ScanPos001.SCNPOS",
+                   "lineAngle": 0,
+                   "frameAngle": 90,
+                   "fileName": "160101_080120_2500ms_0.jpg",
+                   "thumbnailName": "160101_080120_2500ms_0.thumb.jpg",
+                   "metadataFile": "160101_080120_2500ms_0.img"
+                 },
+                 ...
+               ]
+               
+               Returns: str
+
+           images(media, project, scanposition)
+               Return information about the available images of the specified scanposition.
+               
+               The data is returned as JSON string, see images().
+               
+               Arguments:
+                 media (StorageMedia): the storage media containing the project
+                 project (str): the name of the project
+                 scanposition (str): the name of the scan position
+               
+               Returns: str
+
+        """
+        if len(args) == 0:
+            return await self._images_59b51417(*args)
+        elif len(args) == 3:
+            return await self._images_bba4fd3d(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _images_59b51417(self):
+        """Return information about the available images of the active scanposition.
+           
+           The data is returned as JSON string in the following format:
+           [
+             {
+               "path": "/media/intern/Project001.PROJ/ScanPos001.SCNPOS",
+               "lineAngle": 0,
+               "frameAngle": 90,
+               "fileName": "160101_080120_2500ms_0.jpg",
+               "thumbnailName": "160101_080120_2500ms_0.thumb.jpg",
+               "metadataFile": "160101_080120_2500ms_0.img"
+             },
+             ...
+           ]
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("images_59b51417", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _images_bba4fd3d(self, media, project, scanposition):
+        """Return information about the available images of the specified scanposition.
+           
+           The data is returned as JSON string, see images().
+           
+           Arguments:
+             media (StorageMedia): the storage media containing the project
+             project (str): the name of the project
+             scanposition (str): the name of the scan position
+           
+           Returns: str"""
+        inputs = [riconnect.Value() for i in range(0, 3)]
+        inputs[0].i32 = int(media)
+        inputs[1].s = project
+        inputs[2].s = scanposition
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("images_bba4fd3d", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def tiepointscans(self, *args):
+        """
+           tiepointscans()
+               Return information about the available tie point scans of the active scanposition.
+               
+               The data is returned as JSON string in the following format:
+               [
+                 {
+                   "name": "160101_082500_TP0",
+                  "path": "/media/intern/Project001.PROJ/ScanPos001.SCNPOS/tiepointscans",
+                   "measurementFile": "160101_082500_TP0.rxp",
+                   "previewFile": "160101_082500_TP0.png",
+                   "metadataFile": "160101_082500_TP0.tp",
+                   "fov": {...}
+                 },
+                 ...
+               ]
+               
+               Returns: str
+
+           tiepointscans(media, project, scanposition)
+               Return information about the available tie point scans of the specified scanposition.
+               
+               The data is returned as JSON string, see tiepointscans().
+               
+               Arguments:
+                 media (StorageMedia): the storage media containing the project
+                 project (str): the name of the project
+                 scanposition (str): the name of the scan position
+               
+               Returns: str
+
+        """
+        if len(args) == 0:
+            return await self._tiepointscans_71806058(*args)
+        elif len(args) == 3:
+            return await self._tiepointscans_1b3ab54c(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _tiepointscans_71806058(self):
+        """Return information about the available tie point scans of the active scanposition.
+           
+           The data is returned as JSON string in the following format:
+           [
+             {
+               "name": "160101_082500_TP0",
+              "path": "/media/intern/Project001.PROJ/ScanPos001.SCNPOS/tiepointscans",
+               "measurementFile": "160101_082500_TP0.rxp",
+               "previewFile": "160101_082500_TP0.png",
+               "metadataFile": "160101_082500_TP0.tp",
+               "fov": {...}
+             },
+             ...
+           ]
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("tiepointscans_71806058", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _tiepointscans_1b3ab54c(self, media, project, scanposition):
+        """Return information about the available tie point scans of the specified scanposition.
+           
+           The data is returned as JSON string, see tiepointscans().
+           
+           Arguments:
+             media (StorageMedia): the storage media containing the project
+             project (str): the name of the project
+             scanposition (str): the name of the scan position
+           
+           Returns: str"""
+        inputs = [riconnect.Value() for i in range(0, 3)]
+        inputs[0].i32 = int(media)
+        inputs[1].s = project
+        inputs[2].s = scanposition
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("tiepointscans_1b3ab54c", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setProjectLocation(self, coordSystem, coord1, coord2, coord3):
+        """Set the current project's location information.
+           
+           Arguments:
+             coordSystem (str): the EPSG code (e.g. 'EPSG::4978') or name of the coordinate system
+             coord1 (float): value of first coordinate axis
+             coord2 (float): value of second coordinate axis
+             coord3 (float): value of third coordinate axis"""
+        inputs = [riconnect.Value() for i in range(0, 4)]
+        inputs[0].s = coordSystem
+        inputs[1].d = coord1
+        inputs[2].d = coord2
+        inputs[3].d = coord3
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setProjectLocation_383fa642", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def project(self):
+        """Return information about the active project.
+           
+           The data is returned as JSON string in the following format:
+           {
+             "name": "Project001",
+             "path": "/media/intern/projects/Project001.PROJ",
+             "location": { "coordSystem": "", "coord1": 0, "coord2": 0, "coord3": 0}
+           }
+           
+           The project's location has not been set if either the 'location'
+           attribute does not exist or the 'coordSystem' is empty.
+           
+           Returns: str"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("project_46f86faa", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].s)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def save(self):
+        """Save service properties."""
+        with self._lock:
+            await self._svc.callFunction("__risc__service_properties__save_fn")
+
+    async def restore(self):
+        """Restore service properties."""
+        with self._lock:
+            await self._svc.callFunction("__risc__service_properties__restore_fn")
+
+    def error(self):
+        """The error signal allows services to report problems that are
+           unrelated to service calls. It was intended to allow services
+           to report hardware related problems. But since most services
+           provide some kind of business logic, this signal is rarely used.
+           
+           Returns: ServiceSignal
+           Payload: dict"""
+        return self._error
+
+    def storageMediaChanged(self):
+        """This signal is emitted when the active storage media changed.
+           
+           The active storage media can change due to a call of setStorageMedia()
+           or if the media was ejected (e.g. USB, or SD-Card).
+           
+           Returns: ServiceSignal
+           Payload: StorageMedia"""
+        return self._storageMediaChanged
+
+    def projectChanged(self):
+        """This signal is emitted when the active project changed.
+           
+           The signal payload is the name of the new active project.
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._projectChanged
+
+    def scanpositionChanged(self):
+        """This signal is emitted when the active scanposition changed.
+           
+           The signal payload is the name of the new active scanposition.
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._scanpositionChanged
@@ -0,0 +1,309 @@
+# pylint: skip-file
+# Generated by tools/gen-aio.py from vzi_services/riconnectswitch.py, do not edit.
+import json
+import riconnect
+from ..riconnectswitch import RiconnectSwitch, Message, ServiceSignal, SysError, _riconnectswitch_addnode_decoder, _riconnectswitch_error_decoder, _riconnectswitch_removenode_decoder, _riconnectswitch_syserror_decoder
+from .facade import AsyncServiceFacade
+
+class AsyncRiconnectSwitch(AsyncServiceFacade):
+    """The RiconnectSwitch service."""
+    SERVICE_CLASS = RiconnectSwitch
+    SysErrorSeverity = RiconnectSwitch.SysErrorSeverity
+    INFO = RiconnectSwitch.INFO
+    DEFAULT = RiconnectSwitch.DEFAULT
+    CRITICAL = RiconnectSwitch.CRITICAL
+    SERVICE_NAME = RiconnectSwitch.SERVICE_NAME
+
+    def _initSignals(self):
+        # service signals
+        self._error = ServiceSignal(self._svc, "error", decoderFn=_riconnectswitch_error_decoder)
+        self._addNode = ServiceSignal(self._svc, "addNode", decoderFn=_riconnectswitch_addnode_decoder)
+        self._removeNode = ServiceSignal(self._svc, "removeNode", decoderFn=_riconnectswitch_removenode_decoder)
+        self._syserror = ServiceSignal(self._svc, "syserror", decoderFn=_riconnectswitch_syserror_decoder)
+        self._sysErrorAck = ServiceSignal(self._svc, "sysErrorAck")
+
+    async def ping(self, serviceName):
+        """Ping RiConnect network nodes by name.
+           
+           Arguments:
+             serviceName (str): The name of the service network node.
+           
+           Returns: bool"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = serviceName
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("ping_ace41814", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def numSysErrors(self):
+        """Return the number of errors on the error stack.
+           
+           Returns: int"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("numSysErrors_b2e5d228", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def numCriticalSysErrors(self):
+        """Return the number of critical errors on the error stack.
+           
+           Returns: int"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("numCriticalSysErrors_548a6792", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def readSysErrors(self):
+        """Return the system errors on the error stack.
+           
+           Returns: list(SysError)"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("readSysErrors_b40c2333", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([SysError(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def pushSysError(self, code, severity, serviceName, briefMessage):
+        """Push a system error onto the error stack.
+           
+           Returns true if the error was successfully pushed on the error stack.
+           
+           Arguments:
+             code (int): System error code.
+             severity (SysErrorSeverity): System error severity.
+             serviceName (str): Name of the module pushing the error.
+             briefMessage (str): Error message text.
+           
+           Returns: bool"""
+        inputs = [riconnect.Value() for i in range(0, 4)]
+        inputs[0].u32 = code
+        inputs[1].i32 = int(severity)
+        inputs[2].s = serviceName
+        inputs[3].s = briefMessage
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("pushSysError_89658fbc", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def ackSysError(self, id, force):
+        """Acknowledge and remove a single error from the error stack.
+           
+           Arguments:
+             id (int): Unique error identifier.
+             force (bool): Force acknowledgement of critical errors.
+           
+           Returns: bool"""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].u32 = id
+        inputs[1].i32 = 1 if force else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("ackSysError_d5295cc5", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def ackSysErrors(self, force):
+        """Acknowledge and remove all errors from the error stack.
+           
+           Arguments:
+             force (bool): Force acknowledgement of critical errors.
+           
+           Returns: int"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].i32 = 1 if force else 0
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("ackSysErrors_06bea832", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append(rvalues[0].u32)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def createPort(self, port_desc):
+        """createPort Create riconnect switch listening server port.
+           
+           Arguments:
+             port_desc (str): Port descriptor, eg. eth0:20000, 127.0.0.1:20000.
+           
+           Returns: bool"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = port_desc
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("createPort_681d0f41", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0, timeout=30.0)
+        outputs = []
+
+        outputs.append(True if rvalues[0].i32 > 0 else False)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def destroyPort(self, port_desc):
+        """destroyPort Destroy riconnect switch listening server port.
+           
+           Arguments:
+             port_desc (str): Port descriptor, eg. eth0:20000, 127.0.0.1:20000."""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = port_desc
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("destroyPort_57e70578", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def getMessages(self, *args):
+        """
+           getMessages()
+               Return all messages from the message box.
+               
+               Returns: list(Message)
+
+           getMessages(category)
+               Return messages from the message box.
+               
+               Arguments:
+                 category (str): The message category.
+               
+               Returns: list(Message)
+
+           getMessages(category, name)
+               Return a messages from the message box.
+               
+               Arguments:
+                 category (str): The message category.
+                 name (str): The message name.
+               
+               Returns: list(Message)
+
+        """
+        if len(args) == 0:
+            return await self._getMessages_486a976e(*args)
+        elif len(args) == 1:
+            return await self._getMessages_9ac9743f(*args)
+        elif len(args) == 2:
+            return await self._getMessages_89fcf63d(*args)
+        else:
+            raise RuntimeError("Invalid function arguments.")
+
+    async def _getMessages_486a976e(self):
+        """Return all messages from the message box.
+           
+           Returns: list(Message)"""
+        inputs = None
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getMessages_486a976e", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([Message(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _getMessages_9ac9743f(self, category):
+        """Return messages from the message box.
+           
+           Arguments:
+             category (str): The message category.
+           
+           Returns: list(Message)"""
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = category
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getMessages_9ac9743f", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([Message(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def _getMessages_89fcf63d(self, category, name):
+        """Return a messages from the message box.
+           
+           Arguments:
+             category (str): The message category.
+             name (str): The message name.
+           
+           Returns: list(Message)"""
+        inputs = [riconnect.Value() for i in range(0, 2)]
+        inputs[0].s = category
+        inputs[1].s = name
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("getMessages_89fcf63d", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+        outputs = []
+
+        outputs.append([Message(k) for k in json.loads(rvalues[0].s)])
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    async def setMessage(self, message):
+        """Send text messages to message box..
+           
+           Arguments:
+             message (Message): """
+        inputs = [riconnect.Value() for i in range(0, 1)]
+        inputs[0].s = json.dumps(message)
+        inputTransfers = None
+        with self._lock:
+            rvalues, rtransfers = await self._svc.callFunction("setMessage_e0781f46", inputs=inputs, inputTransfers=inputTransfers, numOutputTransfers=0)
+
+    async def save(self):
+        """Save service properties."""
+        with self._lock:
+            await self._svc.callFunction("__risc__service_properties__save_fn")
+
+    async def restore(self):
+        """Restore service properties."""
+        with self._lock:
+            await self._svc.callFunction("__risc__service_properties__restore_fn")
+
+    def error(self):
+        """The error signal allows services to report problems that are
+           unrelated to service calls. It was intended to allow services
+           to report hardware related problems. But since most services
+           provide some kind of business logic, this signal is rarely used.
+           
+           Returns: ServiceSignal
+           Payload: dict"""
+        return self._error
+
+    def addNode(self):
+        """This signal is emitted when a network node was added.
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._addNode
+
+    def removeNode(self):
+        """This signal is emitted when a network node was removed.
+           
+           Returns: ServiceSignal
+           Payload: str"""
+        return self._removeNode
+
+    def syserror(self):
+        """This signal is emitted when an error is pushed on the error stack.
+           
+           Returns: ServiceSignal
+           Payload: dict"""
+        return self._syserror
+
+    def sysErrorAck(self):
+        """This signal is emitted when errors have been acknowledged.
+           
+           Returns: ServiceSignal"""
+        return self._sysErrorAck
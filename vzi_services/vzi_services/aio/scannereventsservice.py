@@ -0,0 +1,173 @@
+# pylint: skip-file
+# Generated by tools/gen-aio.py from vzi_services/scannereventsservice.py, do not edit.
+from ..scannereventsservice import ScannereventsService, ServiceSignal, _scannereventsservice_error_decoder, _scannereventsservice_ipcirq_irq_gps_pps_data_decoder, _scannereventsservice_ipcirq_irq_imu_data_array_decoder, _scannereventsservice_ipcirq_irq_imu_data_decoder
+from .facade import AsyncServiceFacade
+
+class AsyncScannereventsService(AsyncServiceFacade):
+    """"""
+    SERVICE_CLASS = ScannereventsService
+    SERVICE_NAME = ScannereventsService.SERVICE_NAME
+
+    def _initSignals(self):
+        # service signals
+        self._error = ServiceSignal(self._svc, "error", decoderFn=_scannereventsservice_error_decoder)
+        self._IPCIRQ_IRQ_SCAN_START = ServiceSignal(self._svc, "IPCIRQ_IRQ_SCAN_START")
+        self._IPCIRQ_IRQ_SCAN_DONE = ServiceSignal(self._svc, "IPCIRQ_IRQ_SCAN_DONE")
+        self._IPCIRQ_IRQ_MEAS_READY = ServiceSignal(self._svc, "IPCIRQ_IRQ_MEAS_READY")
+        self._IPCIRQ_IRQ_MEAS_ACQ_START = ServiceSignal(self._svc, "IPCIRQ_IRQ_MEAS_ACQ_START")
+        self._IPCIRQ_IRQ_MEAS_ACQ_STOP = ServiceSignal(self._svc, "IPCIRQ_IRQ_MEAS_ACQ_STOP")
+        self._IPCIRQ_IRQ_MEAS_ACQ_DONE = ServiceSignal(self._svc, "IPCIRQ_IRQ_MEAS_ACQ_DONE")
+        self._IPCIRQ_IRQ_MEAS_ACQ_ABORT = ServiceSignal(self._svc, "IPCIRQ_IRQ_MEAS_ACQ_ABORT")
+        self._IPCIRQ_IRQ_PROPERTY_UPDATE = ServiceSignal(self._svc, "IPCIRQ_IRQ_PROPERTY_UPDATE")
+        self._IPCIRQ_IRQ_ERROR = ServiceSignal(self._svc, "IPCIRQ_IRQ_ERROR")
+        self._IPCIRQ_IRQ_ERROR_PUSH = ServiceSignal(self._svc, "IPCIRQ_IRQ_ERROR_PUSH")
+        self._IPCIRQ_IRQ_ERROR_ACK = ServiceSignal(self._svc, "IPCIRQ_IRQ_ERROR_ACK")
+        self._IPCIRQ_IRQ_SEQUENCE = ServiceSignal(self._svc, "IPCIRQ_IRQ_SEQUENCE")
+        self._IPCIRQ_IRQ_SEQUENCE_DONE_OK = ServiceSignal(self._svc, "IPCIRQ_IRQ_SEQUENCE_DONE_OK")
+        self._IPCIRQ_IRQ_SEQUENCE_FAILED = ServiceSignal(self._svc, "IPCIRQ_IRQ_SEQUENCE_FAILED")
+        self._IPCIRQ_IRQ_IMG_ACQ_START = ServiceSignal(self._svc, "IPCIRQ_IRQ_IMG_ACQ_START")
+        self._IPCIRQ_IRQ_IMG_ACQ_STOP = ServiceSignal(self._svc, "IPCIRQ_IRQ_IMG_ACQ_STOP")
+        self._IPCIRQ_IRQ_IMG_ACQ_DONE = ServiceSignal(self._svc, "IPCIRQ_IRQ_IMG_ACQ_DONE")
+        self._IPCIRQ_IRQ_IMG_UPDATE = ServiceSignal(self._svc, "IPCIRQ_IRQ_IMG_UPDATE")
+        self._IPCIRQ_IRQ_IMG_EXPOSE = ServiceSignal(self._svc, "IPCIRQ_IRQ_IMG_EXPOSE")
+        self._IPCIRQ_IRQ_IMG_ACQ_CMD = ServiceSignal(self._svc, "IPCIRQ_IRQ_IMG_ACQ_CMD")
+        self._IPCIRQ_IRQ_SHUTDOWN_REQ = ServiceSignal(self._svc, "IPCIRQ_IRQ_SHUTDOWN_REQ")
+        self._IPCIRQ_IRQ_FRAME_UPSCAN = ServiceSignal(self._svc, "IPCIRQ_IRQ_FRAME_UPSCAN")
+        self._IPCIRQ_IRQ_FRAME_DOWNSCAN = ServiceSignal(self._svc, "IPCIRQ_IRQ_FRAME_DOWNSCAN")
+        self._IPCIRQ_IRQ_CAMERA_MOUNT_DETECTION = ServiceSignal(self._svc, "IPCIRQ_IRQ_CAMERA_MOUNT_DETECTION")
+        self._IPCIRQ_IRQ_IMU_DATA = ServiceSignal(self._svc, "IPCIRQ_IRQ_IMU_DATA", decoderFn=_scannereventsservice_ipcirq_irq_imu_data_decoder)
+        self._IPCIRQ_IRQ_IMU_DATA_ARRAY = ServiceSignal(self._svc, "IPCIRQ_IRQ_IMU_DATA", decoderFn=_scannereventsservice_ipcirq_irq_imu_data_array_decoder)
+        self._IPCIRQ_IRQ_GPS_PPS_DATA = ServiceSignal(self._svc, "IPCIRQ_IRQ_GPS_PPS_DATA", decoderFn=_scannereventsservice_ipcirq_irq_gps_pps_data_decoder)
+        self._IPCIRQ_IRQ_LOCAL_TIME_UPDATE = ServiceSignal(self._svc, "IPCIRQ_IRQ_LOCAL_TIME_UPDATE")
+        self._IPCIRQ_IRQ_HALT_TEGRA_REQ = ServiceSignal(self._svc, "IPCIRQ_IRQ_HALT_TEGRA_REQ")
+
+    def error(self):
+        """The error signal allows services to report problems that are
+           unrelated to service calls. It was intended to allow services
+           to report hardware related problems. But since most services
+           provide some kind of business logic, this signal is rarely used.
+           
+           Returns: ServiceSignal
+           Payload: dict"""
+        return self._error
+
+    def IPCIRQ_IRQ_SCAN_START(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_SCAN_START
+
+    def IPCIRQ_IRQ_SCAN_DONE(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_SCAN_DONE
+
+    def IPCIRQ_IRQ_MEAS_READY(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_MEAS_READY
+
+    def IPCIRQ_IRQ_MEAS_ACQ_START(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_MEAS_ACQ_START
+
+    def IPCIRQ_IRQ_MEAS_ACQ_STOP(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_MEAS_ACQ_STOP
+
+    def IPCIRQ_IRQ_MEAS_ACQ_DONE(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_MEAS_ACQ_DONE
+
+    def IPCIRQ_IRQ_MEAS_ACQ_ABORT(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_MEAS_ACQ_ABORT
+
+    def IPCIRQ_IRQ_PROPERTY_UPDATE(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_PROPERTY_UPDATE
+
+    def IPCIRQ_IRQ_ERROR(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_ERROR
+
+    def IPCIRQ_IRQ_ERROR_PUSH(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_ERROR_PUSH
+
+    def IPCIRQ_IRQ_ERROR_ACK(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_ERROR_ACK
+
+    def IPCIRQ_IRQ_SEQUENCE(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_SEQUENCE
+
+    def IPCIRQ_IRQ_SEQUENCE_DONE_OK(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_SEQUENCE_DONE_OK
+
+    def IPCIRQ_IRQ_SEQUENCE_FAILED(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_SEQUENCE_FAILED
+
+    def IPCIRQ_IRQ_IMG_ACQ_START(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_IMG_ACQ_START
+
+    def IPCIRQ_IRQ_IMG_ACQ_STOP(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_IMG_ACQ_STOP
+
+    def IPCIRQ_IRQ_IMG_ACQ_DONE(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_IMG_ACQ_DONE
+
+    def IPCIRQ_IRQ_IMG_UPDATE(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_IMG_UPDATE
+
+    def IPCIRQ_IRQ_IMG_EXPOSE(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_IMG_EXPOSE
+
+    def IPCIRQ_IRQ_IMG_ACQ_CMD(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_IMG_ACQ_CMD
+
+    def IPCIRQ_IRQ_SHUTDOWN_REQ(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_SHUTDOWN_REQ
+
+    def IPCIRQ_IRQ_FRAME_UPSCAN(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_FRAME_UPSCAN
+
+    def IPCIRQ_IRQ_FRAME_DOWNSCAN(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_FRAME_DOWNSCAN
+
+    def IPCIRQ_IRQ_CAMERA_MOUNT_DETECTION(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_CAMERA_MOUNT_DETECTION
+
+    def IPCIRQ_IRQ_IMU_DATA(self):
+        """Returns: ServiceSignal
+           Payload: imu_data"""
+        return self._IPCIRQ_IRQ_IMU_DATA
+
+    def IPCIRQ_IRQ_IMU_DATA_ARRAY(self):
+        """Signal IPCIRQ_IRQ_IMU_DATA with the measurements decoded into a NumPy array.
+
+           Returns: ServiceSignal
+           Payload: imu_data_array"""
+        return self._IPCIRQ_IRQ_IMU_DATA_ARRAY
+
+    def IPCIRQ_IRQ_GPS_PPS_DATA(self):
+        """Returns: ServiceSignal
+           Payload: gps_pps_data"""
+        return self._IPCIRQ_IRQ_GPS_PPS_DATA
+
+    def IPCIRQ_IRQ_LOCAL_TIME_UPDATE(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_LOCAL_TIME_UPDATE
+
+    def IPCIRQ_IRQ_HALT_TEGRA_REQ(self):
+        """Returns: ServiceSignal"""
+        return self._IPCIRQ_IRQ_HALT_TEGRA_REQ
@@ -319,10 +319,15 @@ class CameraService(object):
     AVAILABLE_ADVANCED = AccessLevelAvailable.AVAILABLE_ADVANCED
     AVAILABLE_EXPERT = AccessLevelAvailable.AVAILABLE_EXPERT
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("CameraService")
+    SERVICE_NAME = "CameraService"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_cameraservice_error_decoder)
         self._started = ServiceSignal(self._svc, "started")
@@ -335,7 +340,6 @@ class CameraService(object):
         self._closed = ServiceSignal(self._svc, "closed", decoderFn=_cameraservice_closed_decoder)
         self._calibrationChanged = ServiceSignal(self._svc, "calibrationChanged", decoderFn=_cameraservice_calibrationchanged_decoder)
         self._exposureTimeLimited = ServiceSignal(self._svc, "exposureTimeLimited", decoderFn=_cameraservice_exposuretimelimited_decoder)
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
@@ -135,10 +135,15 @@ class CloudStorageService(object):
     CSP_AMAZON_S3 = StorageProvider.CSP_AMAZON_S3
     CSP_MICROSOFT_AZURE = StorageProvider.CSP_MICROSOFT_AZURE
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("CloudStorageService")
+    SERVICE_NAME = "CloudStorageService"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_cloudstorageservice_error_decoder)
         self._activeStorageProviderChanged = ServiceSignal(self._svc, "activeStorageProviderChanged", decoderFn=_cloudstorageservice_activestorageproviderchanged_decoder)
@@ -151,7 +156,6 @@ class CloudStorageService(object):
         self._fileDownloadProgress = ServiceSignal(self._svc, "fileDownloadProgress", decoderFn=_cloudstorageservice_filedownloadprogress_decoder)
         self._fileDownloadFinished = ServiceSignal(self._svc, "fileDownloadFinished", decoderFn=_cloudstorageservice_filedownloadfinished_decoder)
         self._listFilesAsyncResponse = ServiceSignal(self._svc, "listFilesAsyncResponse", decoderFn=_cloudstorageservice_listfilesasyncresponse_decoder)
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
@@ -485,10 +485,15 @@ class ControlService(object):
     REG_MINING_MEDIUM = RegistrationMode.REG_MINING_MEDIUM
     REG_MINING_LARGE = RegistrationMode.REG_MINING_LARGE
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("ControlService")
+    SERVICE_NAME = "ControlService"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_controlservice_error_decoder)
         self._horizontalImageOverlapChanged = ServiceSignal(self._svc, "horizontalImageOverlapChanged", decoderFn=_controlservice_horizontalimageoverlapchanged_decoder)
@@ -514,7 +519,6 @@ class ControlService(object):
         self._backgroundTaskAdded = ServiceSignal(self._svc, "backgroundTaskAdded", decoderFn=_controlservice_backgroundtaskadded_decoder)
         self._backgroundTaskChanged = ServiceSignal(self._svc, "backgroundTaskChanged", decoderFn=_controlservice_backgroundtaskchanged_decoder)
         self._backgroundTaskRemoved = ServiceSignal(self._svc, "backgroundTaskRemoved", decoderFn=_controlservice_backgroundtaskremoved_decoder)
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
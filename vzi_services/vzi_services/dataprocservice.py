@@ -82,17 +82,21 @@ class DataprocService(object):
     NO_SPACE_LEFT = SystemError.NO_SPACE_LEFT
     SCANNER_SERVICE_COM_ERROR = SystemError.SCANNER_SERVICE_COM_ERROR
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("DataprocService")
+    SERVICE_NAME = "DataprocService"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_dataprocservice_error_decoder)
         self._started = ServiceSignal(self._svc, "started")
         self._stopped = ServiceSignal(self._svc, "stopped")
         self._aborted = ServiceSignal(self._svc, "aborted")
         self._finished = ServiceSignal(self._svc, "finished", decoderFn=_dataprocservice_finished_decoder)
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
@@ -302,10 +302,15 @@ class DeviceService(object):
     POWER1 = PowerSupply.POWER1
     POWER2 = PowerSupply.POWER2
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("DeviceService")
+    SERVICE_NAME = "DeviceService"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_deviceservice_error_decoder)
         self._displayBrightnessChanged = ServiceSignal(self._svc, "displayBrightnessChanged", decoderFn=_deviceservice_displaybrightnesschanged_decoder)
@@ -316,7 +321,6 @@ class DeviceService(object):
         self._powerSupplyConfigurationChanged = ServiceSignal(self._svc, "powerSupplyConfigurationChanged", decoderFn=_deviceservice_powersupplyconfigurationchanged_decoder)
         self._powerSupplyConfigSynchronizationChanged = ServiceSignal(self._svc, "powerSupplyConfigSynchronizationChanged", decoderFn=_deviceservice_powersupplyconfigsynchronizationchanged_decoder)
         self._displayTouchEnabledChanged = ServiceSignal(self._svc, "displayTouchEnabledChanged", decoderFn=_deviceservice_displaytouchenabledchanged_decoder)
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
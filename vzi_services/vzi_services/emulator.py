@@ -0,0 +1,777 @@
+"""Emulator of a riconnect switch with the VZ-i scanner services used by the driver.
+
+   The emulator answers naming, heartbeat, node removal, signal subscription,
+   function call, property and transfer frames of the riconnect protocol.
+   Function calls are dispatched to simulated implementations of the
+   Project, Control, Dataproc, Scanner, Interface, GnssBase, Camera, GeoSys
+   and RiconnectSwitch services. Link latency and bandwidth are configurable
+   and signals can be scheduled, so riconnect, vzi_services and the driver
+   can be exercised and benchmarked without a scanner.
+
+   Example:
+     with SwitchEmulator(latency=0.002) as emu:
+         projSvc = ProjectService(emu.address)
+         projSvc.createProject("PROJ")"""
+
+import re
+import json
+import time
+import queue
+import socket
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import riconnect
+from riconnect import ric_pb2
+from riconnect.lookup3 import hashlittle
+
+def _hash(name):
+    return hashlittle(name, initval=riconnect.RICON_HASH_INITVAL)
+
+def _i32(v):
+    return riconnect.Value(i32=int(v))
+
+def _u32(v):
+    return riconnect.Value(u32=int(v))
+
+def _f(v):
+    return riconnect.Value(f=float(v))
+
+def _s(v):
+    return riconnect.Value(s=v)
+
+def _json(obj):
+    return riconnect.Value(s=json.dumps(obj))
+
+class EmulatedServiceError(Exception):
+    """Error returned by an emulated service function."""
+    def __init__(self, errCode, errMsg=None):
+        super().__init__(errMsg)
+        self.errCode = errCode
+        self.errMsg = errMsg
+
+class EmulatedService(object):
+    """Base class of the emulated services.
+
+       A call of the function 'name_1234abcd' is dispatched to the method
+       'name' (the signature hash is removed), which receives the list of
+       input values and the list of input transfers. It returns a list of
+       output values or a tuple of output values and output transfers.
+       Properties are kept in the dictionary 'properties'."""
+    NAME = None
+
+    def __init__(self, emulator):
+        self._emulator = emulator
+        self.properties = {}
+
+    def _call(self, name, inputs, transfers):
+        methodName = re.sub(r'_[0-9a-f]{8}$', '', name)
+        method = None if methodName.startswith('_') else getattr(self, methodName, None)
+        if method is None:
+            raise EmulatedServiceError(1, "UNKNOWN_METHOD_COMMAND")
+        r = method(inputs, transfers)
+        if isinstance(r, tuple):
+            return r
+        return (r if r is not None else [], [])
+
+    def _getProperty(self, name, index):
+        return self.properties.get(name, riconnect.Value())
+
+    def _setProperty(self, name, value, index):
+        self.properties[name] = value
+
+    def _emit(self, signalName, payload=b'', delay=0):
+        self._emulator.schedule(delay, self.NAME, signalName, payload)
+
+class ProjectServiceEmulator(EmulatedService):
+    NAME = "ProjectService"
+    MEDIA_PATHS = ['/media/intern', '/media/usb', '/media/sdcard', '/media/nas']
+
+    def __init__(self, emulator):
+        super().__init__(emulator)
+        self.media = 0
+        self._projects = {}
+        self.project = ''
+        self.scanposition = ''
+
+    def _projectPath(self, media, project):
+        return '{0}/{1}.PROJ'.format(self.MEDIA_PATHS[media], project)
+
+    def setStorageMedia(self, inputs, transfers):
+        self.media = inputs[0].i32
+
+    def storageMedia(self, inputs, transfers):
+        return [_i32(self.media)]
+
+    def createProject(self, inputs, transfers):
+        name = inputs[-1].s
+        if name in self._projects:
+            return [_i32(4)] # PROJECT_EXISTS
+        self._projects[name] = []
+        return [_i32(0)]
+
+    def loadProject(self, inputs, transfers):
+        name = inputs[0].s
+        if name not in self._projects:
+            return [_i32(3)] # PROJECT_NOT_FOUND
+        self.project = name
+        self.scanposition = ''
+        self._emit("projectChanged", name.encode())
+        return [_i32(0)]
+
+    def projectName(self, inputs, transfers):
+        return [_s(self.project)]
+
+    def projectPath(self, inputs, transfers):
+        if len(inputs) == 2:
+            return [_s(self._projectPath(inputs[0].i32, inputs[1].s))]
+        return [_s(self._projectPath(self.media, self.project) if self.project else '')]
+
+    def projects(self, inputs, transfers):
+        return [_json(sorted(self._projects.keys()))]
+
+    def setProjectLocation(self, inputs, transfers):
+        pass
+
+    def createScanposition(self, inputs, transfers):
+        if not self.project:
+            return [_i32(11)] # NO_PROJECT_LOADED
+        name = inputs[-1].s
+        if name in self._projects[self.project]:
+            return [_i32(22)] # SCANPOS_EXISTS
+        self._projects[self.project].append(name)
+        return [_i32(0)]
+
+    def selectScanposition(self, inputs, transfers):
+        name = inputs[0].s
+        if not self.project or name not in self._projects[self.project]:
+            return [_i32(21)] # SCANPOS_NOT_FOUND
+        self.scanposition = name
+        self._emit("scanpositionChanged", name.encode())
+        return [_i32(0)]
+
+    def scanpositionName(self, inputs, transfers):
+        return [_s(self.scanposition)]
+
+    def scanpositionPath(self, inputs, transfers):
+        return [_s('{0}/{1}.SCNPOS'.format(self._projectPath(self.media, self.project), self.scanposition))]
+
+    def scanpositions(self, inputs, transfers):
+        return [_json(self._projects.get(self.project, []))]
+
+class ControlServiceEmulator(EmulatedService):
+    """Control service emulation.
+
+       A data acquisition takes emulator.acquisitionTime seconds and emits
+       the signals acquisitionStarted, taskProgress and acquisitionFinished.
+       Background tasks take emulator.taskTime seconds and emit the signals
+       backgroundTaskAdded, taskProgress and backgroundTaskRemoved."""
+    NAME = "ControlService"
+    SCAN_PATTERNS = [
+        {'name': 'Panorama_40', 'thetaStart': 30.0, 'thetaStop': 130.0, 'thetaIncrement': 0.04, 'phiStart': 0.0, 'phiStop': 360.0, 'phiIncrement': 0.04},
+        {'name': 'Panorama_80', 'thetaStart': 30.0, 'thetaStop': 130.0, 'thetaIncrement': 0.08, 'phiStart': 0.0, 'phiStop': 360.0, 'phiIncrement': 0.08}
+    ]
+    REFLECTOR_MODELS = [
+        {'name': 'RIEGL flat reflector 5cm'},
+        {'name': 'RIEGL flat reflector 10cm'}
+    ]
+
+    def __init__(self, emulator):
+        super().__init__(emulator)
+        self._lastTaskId = 0
+        self._acquisition = None
+        self._tasks = {}
+        self._threadLock = threading.Lock()
+
+    def scanPatternsDetailed(self, inputs, transfers):
+        return [_json(self.SCAN_PATTERNS)]
+
+    def supportedReflectorSearchModels(self, inputs, transfers):
+        return [_json(self.REFLECTOR_MODELS)]
+
+    def setStoreMeasurementStream(self, inputs, transfers):
+        pass
+
+    def setStoreMonitorStream(self, inputs, transfers):
+        pass
+
+    def setReflectorSearchSettings(self, inputs, transfers):
+        pass
+
+    def setReflectorScanSettings(self, inputs, transfers):
+        pass
+
+    def setHorizontalImageOverlap(self, inputs, transfers):
+        pass
+
+    def setImageCaptureMode(self, inputs, transfers):
+        pass
+
+    def _nextTaskId(self):
+        with self._threadLock:
+            self._lastTaskId += 1
+            return self._lastTaskId
+
+    def startAcquisition(self, inputs, transfers):
+        emu = self._emulator
+        taskId = self._nextTaskId()
+        project = emu.service(ProjectServiceEmulator.NAME)
+        self._acquisition = {
+            'success': True,
+            'canceled': False,
+            'errorMessage': '',
+            'media': project.media,
+            'project': project.project,
+            'scanposition': project.scanposition,
+            'resultJson': '',
+            'filePrefix': time.strftime('%y%m%d_%H%M%S')
+        }
+        emu.service(ScannerServiceEmulator.NAME).busy = True
+        self._emit("acquisitionStarted", struct.pack("!i", 0))
+        emu.schedule(0, DataprocServiceEmulator.NAME, "started", b'')
+        for i in range(1, 10):
+            self._emit("taskProgress", json.dumps({'id': taskId, 'progress': i * 10}).encode(), emu.acquisitionTime * i / 10)
+        emu.schedule(emu.acquisitionTime, None, None, None, self._finishAcquisition)
+
+    def _finishAcquisition(self):
+        self._emulator.service(ScannerServiceEmulator.NAME).busy = False
+        self._emulator.schedule(0, DataprocServiceEmulator.NAME, "finished", b'')
+        self._emit("acquisitionFinished", struct.pack("!i", 0))
+
+    def lastAcquisition(self, inputs, transfers):
+        return [_json(self._acquisition if self._acquisition is not None else {'success': False, 'canceled': False})]
+
+    def _addTask(self, taskType):
+        taskId = self._nextTaskId()
+        task = json.dumps({'id': taskId, 'type': taskType}).encode()
+        self._emit("backgroundTaskAdded", task)
+        for i in range(1, 4):
+            self._emit("taskProgress", json.dumps({'id': taskId, 'progress': i * 25}).encode(), self._emulator.taskTime * i / 4)
+        self._tasks[taskId] = self._emulator.schedule(self._emulator.taskTime, self.NAME, "backgroundTaskRemoved", task)
+        return [_u32(taskId)]
+
+    def addRdbCreationTask(self, inputs, transfers):
+        return self._addTask('RdbCreation')
+
+    def addRegistrationTask(self, inputs, transfers):
+        return self._addTask('Registration')
+
+    def cancelBackgroundTask(self, inputs, transfers):
+        timer = self._tasks.pop(inputs[0].u32, None)
+        if timer is not None and timer.cancel():
+            self._emit("backgroundTaskRemoved", json.dumps({'id': inputs[0].u32, 'canceled': True}).encode())
+
+    def stop(self, inputs, transfers):
+        if self._acquisition is not None:
+            self._acquisition['canceled'] = True
+
+class DataprocServiceEmulator(EmulatedService):
+    NAME = "DataprocService"
+
+    def actualFile(self, inputs, transfers):
+        emu = self._emulator
+        acquisition = emu.service(ControlServiceEmulator.NAME)._acquisition
+        prefix = acquisition['filePrefix'] if acquisition else time.strftime('%y%m%d_%H%M%S')
+        scanposPath = emu.service(ProjectServiceEmulator.NAME).scanpositionPath([], [])[0].s
+        return [_s('{0}/SINGLESCANS/{1}{2}.rxp'.format(scanposPath, prefix, '.mon' if inputs[0].u32 == 1 else ''))]
+
+    def stop(self, inputs, transfers):
+        return [_i32(0)]
+
+class ScannerServiceEmulator(EmulatedService):
+    NAME = "SCANNER"
+
+    def __init__(self, emulator):
+        super().__init__(emulator)
+        self.busy = False
+        self.properties.update({
+            'INST_IDENT': _s('VZ-400i'),
+            'SN': _s('S9999999'),
+            'INST_MODEL_NUM': _s('0'),
+            'INST_MODIF': _s(''),
+            'MEAS_PROG': _i32(3),
+            'LASER': _i32(1),
+            'GPS_MODE': _i32(0)
+        })
+
+    def MEAS_BUSY(self, inputs, transfers):
+        return [_i32(1 if self.busy else 0)]
+
+    def MEAS_SET_PROG(self, inputs, transfers):
+        self.properties['MEAS_PROG'] = _i32(inputs[0].i32)
+
+    def SCN_SET_RECT_FOV_SEQ(self, inputs, transfers):
+        for name, v in zip(['THETA_SOCS_START', 'THETA_SOCS_STOP', 'THETA_SOCS_INCR', 'PHI_SOCS_START', 'PHI_SOCS_STOP', 'PHI_SOCS_INCR'], inputs):
+            self.properties['SCN_SET_' + name] = _f(v.f)
+
+    def SCN_SET_FINE_SCAN(self, inputs, transfers):
+        pass
+
+    def SHUTDOWN(self, inputs, transfers):
+        pass
+
+    def REBOOT(self, inputs, transfers):
+        pass
+
+class InterfaceServiceEmulator(EmulatedService):
+    NAME = "InterfaceService"
+
+    def getStorageInterfaces(self, inputs, transfers):
+        return [_json([{
+            'id': inputs[0].i32 if inputs else 0,
+            'mounts': [{'storage_space': {'total_space': 512 * 1024 * 1024, 'used_space': 128 * 1024 * 1024}}]
+        }])]
+
+    def triggerInputEvent(self, inputs, transfers):
+        pass
+
+class GnssBaseServiceEmulator(EmulatedService):
+    NAME = "GnssBaseService"
+    ESTIMATE_INFO = {
+        'fix': 1, 'num_sat': 12, 'longitude': 15.6, 'latitude': 48.6, 'height': 300.0,
+        'hor_acc': 0.5, 'ver_acc': 1.0, 'hdop': 0.8, 'vdop': 1.1, 'pdop': 1.4,
+        'recOriginCSIdent': 'EPSG::4979'
+    }
+
+    def estimateInfo(self, inputs, transfers):
+        return [_json(self.ESTIMATE_INFO)]
+
+class CameraServiceEmulator(EmulatedService):
+    NAME = "CameraService"
+
+    def __init__(self, emulator):
+        super().__init__(emulator)
+        self.cameras = [1]
+
+    def list(self, inputs, transfers):
+        return ([], [struct.pack("!{0}I".format(len(self.cameras)), *self.cameras)])
+
+class GeoSysServiceEmulator(EmulatedService):
+    NAME = "GeoSysService"
+
+    def findCoordinateSystem(self, inputs, transfers):
+        return [_json({'uid': _hash(inputs[0].s), 'ident': inputs[0].s})]
+
+    def transformCoordinate(self, inputs, transfers):
+        # identity transformation
+        return [_json({'coord1': inputs[2].d, 'coord2': inputs[3].d, 'coord3': inputs[4].d})]
+
+    def transformToWgs84(self, inputs, transfers):
+        return [_json({'coord1': inputs[1].d, 'coord2': inputs[2].d, 'coord3': inputs[3].d})]
+
+    def reloadCoordinateSystems(self, inputs, transfers):
+        pass
+
+class RiconnectSwitchEmulator(EmulatedService):
+    NAME = "RiconnectSwitch"
+    VERSIONS = {
+        'GnssBaseService': '1.11.1'
+    }
+
+    def getMessages(self, inputs, transfers):
+        if len(inputs) == 2 and inputs[0].s == 'version':
+            return [_json([{'name': inputs[1].s, 'category': 'version', 'text': self.VERSIONS.get(inputs[1].s, '1.0.0')}])]
+        return [_json([])]
+
+    def readSysErrors(self, inputs, transfers):
+        return [_json([])]
+
+EMULATED_SERVICES = [
+    ProjectServiceEmulator,
+    ControlServiceEmulator,
+    DataprocServiceEmulator,
+    ScannerServiceEmulator,
+    InterfaceServiceEmulator,
+    GnssBaseServiceEmulator,
+    CameraServiceEmulator,
+    GeoSysServiceEmulator,
+    RiconnectSwitchEmulator
+]
+
+class _Transfer(object):
+    def __init__(self, request):
+        self.request = request
+        self.inputs = []
+        self.future = None
+
+class _Link(object):
+    """Client connection of the switch emulator.
+
+       Frames are sent by a sender thread, each frame not before the link
+       latency has passed and limited to the link bandwidth."""
+    def __init__(self, emulator, sock):
+        self.emulator = emulator
+        self.sock = sock
+        self.names = {}
+        self.transfers = {}
+        self._acks = {}
+        self._lock = threading.Lock()
+        self._frames = queue.Queue()
+        threading.Thread(target=self._receiveLoop, daemon=True).start()
+        threading.Thread(target=self._sendLoop, daemon=True).start()
+
+    def send(self, pkg):
+        self._frames.put((time.monotonic() + self.emulator.latency, pkg))
+
+    def sendFrame(self, frameType, srcHash, dstHash, linkId, payload=b'', protocol=riconnect.RICON_SWL_PROTOCOL_TYPE_NONE):
+        pkg = bytearray(4)
+        pkg.extend(riconnect.createFrameHeader(linkId, frameType, srcHash=srcHash, dstHash=dstHash, protocol=protocol))
+        pkg.extend(payload)
+        riconnect.updateFrameSize(pkg)
+        self.send(pkg)
+
+    def sendMessage(self, srcHash, dstHash, linkId, msgDomain, msgType, txnId, msgData=None):
+        self.sendFrame(riconnect.RICON_SWL_FRAME_TYPE_DATA, srcHash, dstHash, linkId,
+            riconnect.createMessage(msgDomain, msgType, txnId, msgData), riconnect.RICON_SWL_PROTOCOL_TYPE_RIC)
+
+    def acks(self, clientHash, serviceHash):
+        """Return semaphore counting the acknowledgments received from a client."""
+        with self._lock:
+            sem = self._acks.get((clientHash, serviceHash))
+            if sem is None:
+                sem = self._acks[(clientHash, serviceHash)] = threading.Semaphore(0)
+            return sem
+
+    def close(self):
+        self._frames.put((0, None))
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+            self.sock.close()
+        except OSError:
+            pass
+
+    def _sendLoop(self):
+        while True:
+            due, pkg = self._frames.get()
+            if pkg is None:
+                break
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                self.sock.sendall(pkg)
+            except OSError:
+                break
+            self.emulator._countSent(len(pkg))
+            if self.emulator.bandwidth:
+                time.sleep(len(pkg) / self.emulator.bandwidth)
+
+    def _receiveLoop(self):
+        try:
+            while True:
+                self.emulator._onFrame(self, riconnect.readFrame(self.sock))
+        except Exception:
+            pass
+        self.emulator._onDisconnect(self)
+
+class SwitchEmulator(object):
+    """Pure Python emulation of the riconnect switch of a VZ-i scanner.
+
+       Arguments:
+         address (str): listen address, the port 0 selects a free port
+         latency (float): one-way link latency in seconds
+         bandwidth (float): link bandwidth in bytes per second, None for unlimited
+         acquisitionTime (float): duration of an emulated data acquisition in seconds
+         taskTime (float): duration of an emulated background task in seconds
+         services (list): emulated service classes, defaults to EMULATED_SERVICES"""
+    def __init__(self, address='127.0.0.1:0', latency=0.0, bandwidth=None, acquisitionTime=1.0, taskTime=0.5, services=None):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.acquisitionTime = acquisitionTime
+        self.taskTime = taskTime
+        self.bufferSize = riconnect.CONFIG_RIC_TRANSFER_DATA_BUFFER_SIZE
+        host, port = address.rsplit(':', 1)
+        self._server = socket.socket()
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((host, int(port)))
+        self.address = '{0}:{1}'.format(host, self._server.getsockname()[1])
+        self._services = {}
+        for serviceClass in (EMULATED_SERVICES if services is None else services):
+            self.addService(serviceClass(self))
+        self._links = []
+        self._subscriptions = []
+        self._nodes = {}
+        self._timers = []
+        self._pool = ThreadPoolExecutor(max_workers=32)
+        self._threadLock = threading.Lock()
+        self._stats = {'connections': 0, 'frames_received': 0, 'frames_sent': 0, 'bytes_sent': 0, 'calls': 0}
+        self._stopped = False
+
+    def _lock(self):
+        self._threadLock.acquire()
+
+    def _unlock(self):
+        self._threadLock.release()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        """Start accepting client connections."""
+        self._server.listen(64)
+        threading.Thread(target=self._acceptLoop, daemon=True).start()
+
+    def stop(self):
+        """Close all client connections and stop the emulator."""
+        self._stopped = True
+        self._lock()
+        links = self._links[:]
+        timers = self._timers[:]
+        self._unlock()
+        for timer in timers:
+            timer.cancel()
+        for link in links:
+            link.close()
+        try:
+            self._server.close()
+        except OSError:
+            pass
+        self._pool.shutdown(wait=False)
+
+    def addService(self, service):
+        """Add emulated service instance."""
+        self._services[_hash(service.NAME)] = service
+
+    def service(self, name):
+        """Return emulated service instance by service name."""
+        return self._services.get(_hash(name))
+
+    def emit(self, serviceName, signalName, payload=b''):
+        """Send service signal to all subscribers."""
+        signallerHash = _hash(serviceName)
+        signalHash = _hash(signalName)
+        self._lock()
+        subscriptions = [s for s in self._subscriptions if s[2] == signallerHash and s[3] == signalHash]
+        self._unlock()
+        for link, linkId, signaller, signal, subscriber in subscriptions:
+            sigData = ric_pb2.SignalSend()
+            sigData.signal = signalHash
+            sigData.signaller = signallerHash
+            sigData.subscriber = subscriber
+            sigData.data = bytes(payload)
+            link.sendMessage(signallerHash, subscriber, linkId, riconnect.RICON_RIC_MESSAGE_SIGNAL,
+                riconnect.RICON_RIC_MESSAGE_TYPE_SIGNAL_SEND, 0, sigData.SerializeToString())
+
+    def schedule(self, delay, serviceName, signalName, payload=b'', fn=None):
+        """Emit signal (or call fn) after delay seconds, returns the timer."""
+        action = fn if fn is not None else (lambda: self.emit(serviceName, signalName, payload))
+        timer = threading.Timer(delay, action)
+        timer.daemon = True
+        self._lock()
+        self._timers = [t for t in self._timers if t.is_alive()]
+        self._timers.append(timer)
+        self._unlock()
+        timer.start()
+        return timer
+
+    def script(self, events):
+        """Schedule signals given as list of (delay, serviceName, signalName, payload)."""
+        return [self.schedule(delay, serviceName, signalName, payload) for delay, serviceName, signalName, payload in events]
+
+    def getStatistics(self):
+        """Return number of client connections, frames, sent bytes and function calls."""
+        self._lock()
+        stats = dict(self._stats)
+        stats['links'] = len(self._links)
+        stats['nodes'] = len(self._nodes)
+        self._unlock()
+        return stats
+
+    def _countSent(self, numBytes):
+        self._lock()
+        self._stats['frames_sent'] += 1
+        self._stats['bytes_sent'] += numBytes
+        self._unlock()
+
+    def _acceptLoop(self):
+        while not self._stopped:
+            try:
+                sock, addr = self._server.accept()
+            except OSError:
+                break
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._lock()
+            self._stats['connections'] += 1
+            self._links.append(_Link(self, sock))
+            self._unlock()
+
+    def _onDisconnect(self, link):
+        self._lock()
+        if link in self._links:
+            self._links.remove(link)
+        self._subscriptions = [s for s in self._subscriptions if s[0] is not link]
+        for nodeHash in link.names:
+            self._nodes.pop(nodeHash, None)
+        self._unlock()
+        link.close()
+
+    def _onFrame(self, link, frameBuffer):
+        srcHash, dstHash, linkId, fType, proto = struct.unpack_from("!IIHBB", frameBuffer)
+        self._lock()
+        self._stats['frames_received'] += 1
+        self._unlock()
+        if fType == riconnect.RICON_SWL_FRAME_TYPE_NAMING_REQUEST:
+            name = bytes(frameBuffer[13:13 + riconnect.CONFIG_NODE_NAME_MAX_STRLEN]).rstrip(b'\0').decode()
+            self._lock()
+            # node names are unique, append a counter to a name in use
+            uniqueName = name
+            i = 1
+            while _hash(uniqueName) in self._nodes:
+                uniqueName = '{0}-{1}'.format(name, i)
+                i += 1
+            self._nodes[_hash(uniqueName)] = uniqueName
+            link.names[_hash(uniqueName)] = uniqueName
+            self._unlock()
+            link.sendFrame(riconnect.RICON_SWL_FRAME_TYPE_NAMING_RESPONSE, riconnect.RICON_SWL_NODE_ALIAS_SWITCH_HASH,
+                riconnect.RICON_SWL_NODE_ALIAS_ENDPOINT_HASH, linkId, uniqueName.encode())
+        elif fType == riconnect.RICON_SWL_FRAME_TYPE_ALIVE_HEARTBEAT:
+            link.sendFrame(riconnect.RICON_SWL_FRAME_TYPE_ALIVE_HEARTBEAT_ACK, riconnect.RICON_SWL_NODE_ALIAS_SWITCH_HASH, srcHash, linkId)
+        elif fType == riconnect.RICON_SWL_FRAME_TYPE_NODE_REMOVE_REQUEST:
+            self._lock()
+            self._nodes.pop(srcHash, None)
+            self._subscriptions = [s for s in self._subscriptions if s[4] != srcHash]
+            self._unlock()
+            link.sendFrame(riconnect.RICON_SWL_FRAME_TYPE_NODE_REMOVE_RESPONSE, riconnect.RICON_SWL_NODE_ALIAS_SWITCH_HASH, srcHash, linkId)
+        elif fType == riconnect.RICON_SWL_FRAME_TYPE_DATA and len(frameBuffer) >= 14:
+            self._onMessage(link, srcHash, dstHash, linkId, memoryview(frameBuffer)[12:])
+
+    def _onMessage(self, link, srcHash, dstHash, linkId, message):
+        msgDomain, msgType = struct.unpack_from("BB", message)
+        if msgDomain == riconnect.RICON_RIC_MESSAGE_ACK:
+            link.acks(srcHash, dstHash).release()
+            return
+        txnId = struct.unpack_from("!H", message, 2)[0]
+        msgData = bytes(message[4:])
+        needsAck = (msgDomain & riconnect.RICON_RIC_MESSAGE_ACK_REQ) > 0
+        msgDomain = msgDomain & (~riconnect.RICON_RIC_MESSAGE_ACK_REQ)
+        if msgDomain == riconnect.RICON_RIC_MESSAGE_SIGNAL:
+            self._onSignalMessage(link, linkId, msgType, msgData)
+            return
+        service = self._services.get(dstHash)
+        if service is None:
+            link.sendFrame(riconnect.RICON_SWL_FRAME_TYPE_NO_ROUTE, riconnect.RICON_SWL_NODE_ALIAS_SWITCH_HASH, srcHash, linkId)
+            return
+        reply = (link, service, dstHash, srcHash, linkId, txnId)
+        if msgDomain in (riconnect.RICON_RIC_MESSAGE_SERVICE_REQUEST, riconnect.RICON_RIC_MESSAGE_SERVICE_REQUEST_WITH_TRANSFER):
+            if msgType == riconnect.RICON_RIC_MESSAGE_TYPE_CALL_REQUEST:
+                request = ric_pb2.CallRequest()
+                request.ParseFromString(msgData)
+                if msgDomain == riconnect.RICON_RIC_MESSAGE_SERVICE_REQUEST:
+                    self._pool.submit(self._callFunction, reply, request, [])
+                else:
+                    link.transfers[(srcHash, txnId)] = _Transfer(request)
+            elif msgType == riconnect.RICON_RIC_MESSAGE_TYPE_GET_REQUEST:
+                request = ric_pb2.GetRequest()
+                request.ParseFromString(msgData)
+                self._pool.submit(self._getProperty, reply, request)
+            elif msgType == riconnect.RICON_RIC_MESSAGE_TYPE_SET_REQUEST:
+                request = ric_pb2.SetRequest()
+                request.ParseFromString(msgData)
+                self._pool.submit(self._setProperty, reply, request)
+        elif msgDomain == riconnect.RICON_RIC_MESSAGE_TRANSFER:
+            transfer = link.transfers.get((srcHash, txnId))
+            if transfer is None:
+                return
+            if msgType == riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_START_REQUEST:
+                if msgData[0] == riconnect.RICON_RIC_TRANSFER_MODE_C2S:
+                    link.sendMessage(dstHash, srcHash, linkId, riconnect.RICON_RIC_MESSAGE_TRANSFER,
+                        riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_START_RESPONSE, txnId,
+                        struct.pack("!BII", riconnect.RICON_RIC_TRANSFER_MODE_C2S, self.bufferSize, riconnect.CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS))
+                else:
+                    del link.transfers[(srcHash, txnId)]
+                    if transfer.future is None:
+                        transfer.future = self._pool.submit(self._execute, service, transfer.request, transfer.inputs)
+                    self._pool.submit(self._sendOutputTransfers, reply, transfer.future)
+                return
+            if needsAck:
+                link.send(riconnect.createMessageAcknowledgment(linkId, dstHash, srcHash))
+            if msgType in (riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_BINARY_DATA, riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_ASCII_DATA):
+                transfer.inputs.append(msgData)
+            elif msgType == riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_END:
+                # input transfers complete, respond unless output transfers follow
+                transfer.future = self._pool.submit(self._execute, service, transfer.request, transfer.inputs)
+                transfer.future.add_done_callback(lambda f: self._onInputTransfersDone(reply, transfer, f))
+
+    def _onSignalMessage(self, link, linkId, msgType, msgData):
+        if msgType == riconnect.RICON_RIC_MESSAGE_TYPE_SIGNAL_SUBSCRIBE:
+            payload = ric_pb2.SignalSubscribe()
+        elif msgType == riconnect.RICON_RIC_MESSAGE_TYPE_SIGNAL_UNSUBSCRIBE:
+            payload = ric_pb2.SignalUnsubscribe()
+        else:
+            return
+        payload.ParseFromString(msgData)
+        subscription = (link, linkId, _hash(payload.signaller), _hash(payload.signal), _hash(payload.subscriber))
+        self._lock()
+        self._subscriptions = [s for s in self._subscriptions if s[2:] != subscription[2:]]
+        if msgType == riconnect.RICON_RIC_MESSAGE_TYPE_SIGNAL_SUBSCRIBE:
+            self._subscriptions.append(subscription)
+        self._unlock()
+
+    def _execute(self, service, request, inputTransfers):
+        self._lock()
+        self._stats['calls'] += 1
+        self._unlock()
+        response = ric_pb2.CallResponse()
+        outputTransfers = []
+        try:
+            outputs, outputTransfers = service._call(request.command, list(request.param), inputTransfers)
+            response.status = 0
+            response.num = len(outputs)
+            for v in outputs:
+                response.param.add().CopyFrom(v)
+        except EmulatedServiceError as err:
+            response.status = err.errCode
+            response.num = 0
+            if err.errMsg is not None:
+                response.errstr = err.errMsg
+        return (response, outputTransfers)
+
+    def _sendResponse(self, reply, msgType, response):
+        link, service, srcHash, dstHash, linkId, txnId = reply
+        link.sendMessage(srcHash, dstHash, linkId, riconnect.RICON_RIC_MESSAGE_SERVICE_RESPONSE, msgType, txnId, response.SerializeToString())
+
+    def _callFunction(self, reply, request, inputTransfers):
+        response, outputTransfers = self._execute(reply[1], request, inputTransfers)
+        self._sendResponse(reply, riconnect.RICON_RIC_MESSAGE_TYPE_CALL_RESPONSE, response)
+
+    def _onInputTransfersDone(self, reply, transfer, future):
+        response, outputTransfers = future.result()
+        if len(outputTransfers) == 0:
+            link = reply[0]
+            link.transfers.pop((reply[3], reply[5]), None)
+            self._sendResponse(reply, riconnect.RICON_RIC_MESSAGE_TYPE_CALL_RESPONSE, response)
+
+    def _sendOutputTransfers(self, reply, future):
+        link, service, srcHash, dstHash, linkId, txnId = reply
+        response, outputTransfers = future.result()
+        link.sendMessage(srcHash, dstHash, linkId, riconnect.RICON_RIC_MESSAGE_TRANSFER,
+            riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_START_RESPONSE, txnId,
+            struct.pack("!BII", riconnect.RICON_RIC_TRANSFER_MODE_S2C, self.bufferSize, riconnect.CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS))
+        acks = link.acks(dstHash, srcHash)
+        for data in outputTransfers:
+            for offset in range(0, len(data), self.bufferSize):
+                link.sendMessage(srcHash, dstHash, linkId, riconnect.RICON_RIC_MESSAGE_TRANSFER | riconnect.RICON_RIC_MESSAGE_ACK_REQ,
+                    riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_BINARY_DATA, txnId, data[offset:offset + self.bufferSize])
+                if not acks.acquire(timeout=riconnect.CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS / 1000):
+                    return
+        link.sendMessage(srcHash, dstHash, linkId, riconnect.RICON_RIC_MESSAGE_TRANSFER | riconnect.RICON_RIC_MESSAGE_ACK_REQ,
+            riconnect.RICON_RIC_MESSAGE_TYPE_TRANSFER_END, txnId)
+        if not acks.acquire(timeout=riconnect.CONFIG_RIC_DEFAULT_SERVICE_TIMEOUT_MS / 1000):
+            return
+        self._sendResponse(reply, riconnect.RICON_RIC_MESSAGE_TYPE_CALL_RESPONSE, response)
+
+    def _getProperty(self, reply, request):
+        response = ric_pb2.GetResponse()
+        response.status = 0
+        response.value.CopyFrom(reply[1]._getProperty(request.command, (request.index0, request.index1, request.index2)))
+        self._sendResponse(reply, riconnect.RICON_RIC_MESSAGE_TYPE_GET_RESPONSE, response)
+
+    def _setProperty(self, reply, request):
+        reply[1]._setProperty(request.command, request.value, (request.index0, request.index1, request.index2))
+        response = ric_pb2.SetResponse()
+        response.status = 0
+        self._sendResponse(reply, riconnect.RICON_RIC_MESSAGE_TYPE_SET_RESPONSE, response)
@@ -97,14 +97,18 @@ class GeoSysService(object):
                         two axes and Heightfor last axis
          UNKNOWN    ... unknown axes configuration"""
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("GeoSysService")
+    SERVICE_NAME = "GeoSysService"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_geosysservice_error_decoder)
         self._coordinateSystemsChanged = ServiceSignal(self._svc, "coordinateSystemsChanged")
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
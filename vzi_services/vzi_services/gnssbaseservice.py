@@ -143,10 +143,15 @@ class GnssBaseService(object):
     MM_TEGRA = MasterMode.MM_TEGRA
     MM_ZYNQ = MasterMode.MM_ZYNQ
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("GnssBaseService")
+    SERVICE_NAME = "GnssBaseService"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_gnssbaseservice_error_decoder)
         self._statusChanged = ServiceSignal(self._svc, "statusChanged", decoderFn=_gnssbaseservice_statuschanged_decoder)
@@ -155,7 +160,6 @@ class GnssBaseService(object):
         self._logRawDataChanged = ServiceSignal(self._svc, "logRawDataChanged", decoderFn=_gnssbaseservice_lograwdatachanged_decoder)
         self._timesyncChanged = ServiceSignal(self._svc, "timesyncChanged", decoderFn=_gnssbaseservice_timesyncchanged_decoder)
         self._positionUpdate = ServiceSignal(self._svc, "positionUpdate", decoderFn=_gnssbaseservice_positionupdate_decoder)
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
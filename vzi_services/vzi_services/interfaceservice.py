@@ -1071,10 +1071,15 @@ class InterfaceService(object):
     MOBIF_SIM_FACTORY = MobileSimSelect.MOBIF_SIM_FACTORY
     MOBIF_SIM_USER = MobileSimSelect.MOBIF_SIM_USER
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("InterfaceService")
+    SERVICE_NAME = "InterfaceService"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_interfaceservice_error_decoder)
         self._internetConnectionStatusUpdate = ServiceSignal(self._svc, "internetConnectionStatusUpdate", decoderFn=_interfaceservice_internetconnectionstatusupdate_decoder)
@@ -1087,7 +1092,6 @@ class InterfaceService(object):
         self._bluetoothInterfaceChanged = ServiceSignal(self._svc, "bluetoothInterfaceChanged", decoderFn=_interfaceservice_bluetoothinterfacechanged_decoder)
         self._bluetoothDeviceScanFinished = ServiceSignal(self._svc, "bluetoothDeviceScanFinished", decoderFn=_interfaceservice_bluetoothdevicescanfinished_decoder)
         self._bluetoothConnectionChanged = ServiceSignal(self._svc, "bluetoothConnectionChanged", decoderFn=_interfaceservice_bluetoothconnectionchanged_decoder)
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
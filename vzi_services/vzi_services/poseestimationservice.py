@@ -136,10 +136,15 @@ class PoseEstimationService(object):
     SENSITIVITY_MEDIUM = MotionDetectorSensitivity.SENSITIVITY_MEDIUM
     SENSITIVITY_HIGH = MotionDetectorSensitivity.SENSITIVITY_HIGH
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("PoseEstimationService")
+    SERVICE_NAME = "PoseEstimationService"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_poseestimationservice_error_decoder)
         self._started = ServiceSignal(self._svc, "started")
@@ -150,7 +155,6 @@ class PoseEstimationService(object):
         self._motionDetected = ServiceSignal(self._svc, "motionDetected", decoderFn=_poseestimationservice_motiondetected_decoder)
         self._motionDetectorStateChanged = ServiceSignal(self._svc, "motionDetectorStateChanged", decoderFn=_poseestimationservice_motiondetectorstatechanged_decoder)
         self._motionDetectorSensitivityChanged = ServiceSignal(self._svc, "motionDetectorSensitivityChanged", decoderFn=_poseestimationservice_motiondetectorsensitivitychanged_decoder)
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
@@ -85,17 +85,21 @@ class PreviewgenService(object):
 
     RXP_STREAM_ERROR = ErrorCode.RXP_STREAM_ERROR
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("PreviewgenService")
+    SERVICE_NAME = "PreviewgenService"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_previewgenservice_error_decoder)
         self._reflectanceMinimumChanged = ServiceSignal(self._svc, "reflectanceMinimumChanged", decoderFn=_previewgenservice_reflectanceminimumchanged_decoder)
         self._reflectanceThresholdChanged = ServiceSignal(self._svc, "reflectanceThresholdChanged", decoderFn=_previewgenservice_reflectancethresholdchanged_decoder)
         self._started = ServiceSignal(self._svc, "started")
         self._finished = ServiceSignal(self._svc, "finished", decoderFn=_previewgenservice_finished_decoder)
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
@@ -119,16 +119,20 @@ class ProjectService(object):
     SCANPOS_CREATE_MKDIR_FAILED = Error.SCANPOS_CREATE_MKDIR_FAILED
     INTERNAL_SERVER_ERROR = Error.INTERNAL_SERVER_ERROR
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("ProjectService")
+    SERVICE_NAME = "ProjectService"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_projectservice_error_decoder)
         self._storageMediaChanged = ServiceSignal(self._svc, "storageMediaChanged", decoderFn=_projectservice_storagemediachanged_decoder)
         self._projectChanged = ServiceSignal(self._svc, "projectChanged", decoderFn=_projectservice_projectchanged_decoder)
         self._scanpositionChanged = ServiceSignal(self._svc, "scanpositionChanged", decoderFn=_projectservice_scanpositionchanged_decoder)
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
@@ -0,0 +1,93 @@
+import threading
+import riconnect
+
+class ServiceRegistry(object):
+    """Registry of long-lived service clients.
+
+       Service instances are created once per address and service class and
+       share the socket connections, heartbeat and signal threads of one
+       connection factory. A service instance whose connection has been lost
+       is replaced with a newly connected instance on the next lookup.
+
+       Since the services of an address share their connections, all service
+       instances of the address are replaced at once and the generation of
+       the address is incremented. Holders of long-lived instances and signal
+       connections compare the generation (or the instance returned by
+       getService()) to detect a replacement and have to reconnect their
+       signals then.
+
+       Example:
+         projSvc = getService(ProjectService, "127.0.0.1:20000")
+         print(projSvc.projectPath())"""
+    def __init__(self):
+        self._factory = riconnect.ConnectionFactory()
+        self._services = {}
+        self._lock = threading.Lock()
+        self._created = 0
+        self._generations = {}
+
+    def get(self, serviceClass, address):
+        """Return connected service instance.
+
+           Arguments:
+             serviceClass (type): service class, e.g. ProjectService
+             address (str): service address consisting of hostname/IP-address and port number"""
+        key = (address, serviceClass.__name__)
+        with self._lock:
+            svc = self._services.get(key)
+            if svc is not None and not svc._svc.isConnected():
+                # connection lost, drop all services on the broken connections
+                self._factory.invalidate(address)
+                for k in [k for k in self._services if k[0] == address]:
+                    del self._services[k]
+                self._generations[address] = self._generations.get(address, 0) + 1
+                svc = None
+            if svc is not None:
+                return svc
+        # connecting may take up to the connection timeout, lookups of other
+        # services must not be blocked meanwhile
+        svc = serviceClass(address, connectionFactory=self._factory)
+        with self._lock:
+            other = self._services.get(key)
+            if other is None or not other._svc.isConnected():
+                self._services[key] = svc
+                self._created += 1
+                return svc
+        # another thread was faster, discard this instance
+        svc._svc.close()
+        return other
+
+    def generation(self, address):
+        """Return number of times the services of the address have been replaced."""
+        with self._lock:
+            return self._generations.get(address, 0)
+
+    def close(self):
+        """Close all service connections."""
+        with self._lock:
+            services = list(self._services.values())
+            self._services = {}
+        for svc in services:
+            svc._svc.close()
+
+    def getStatistics(self):
+        """Return number of services, open sockets, threads and reconnects."""
+        stats = self._factory.getStatistics()
+        with self._lock:
+            stats['services'] = len(self._services)
+            stats['created'] = self._created
+        return stats
+
+_registry = ServiceRegistry()
+
+def getService(serviceClass, address):
+    """Return long-lived service instance of the process wide service registry."""
+    return _registry.get(serviceClass, address)
+
+def getGeneration(address):
+    """Return service generation of the address in the process wide service registry."""
+    return _registry.generation(address)
+
+def getServiceRegistry():
+    """Return the process wide service registry."""
+    return _registry
@@ -189,17 +189,21 @@ class RiconnectSwitch(object):
     DEFAULT = SysErrorSeverity.DEFAULT
     CRITICAL = SysErrorSeverity.CRITICAL
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("RiconnectSwitch")
+    SERVICE_NAME = "RiconnectSwitch"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_riconnectswitch_error_decoder)
         self._addNode = ServiceSignal(self._svc, "addNode", decoderFn=_riconnectswitch_addnode_decoder)
         self._removeNode = ServiceSignal(self._svc, "removeNode", decoderFn=_riconnectswitch_removenode_decoder)
         self._syserror = ServiceSignal(self._svc, "syserror", decoderFn=_riconnectswitch_syserror_decoder)
         self._sysErrorAck = ServiceSignal(self._svc, "sysErrorAck")
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
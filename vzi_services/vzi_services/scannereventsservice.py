@@ -5,6 +5,10 @@ import threading
 import enum
 import weakref
 import riconnect
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 __version__ = "1.4"
 
@@ -280,6 +284,51 @@ class gps_pps_data(dict):
     def pulse_counter(self, value):
         self['pulse_counter'] = value
 
+class imu_data_array(dict):
+    """IMU data package with the measurements in a NumPy structured array
+       (fields as in imu_measurement, native byte order)."""
+    def __init__(self, *args, **kwargs):
+        self['package_index'] = None
+        self['package_count'] = None
+        self['measurements'] = None
+        super().__init__(*args, **kwargs)
+    @property
+    def package_index(self):
+        return self['package_index']
+    @package_index.setter
+    def package_index(self, value):
+        self['package_index'] = value
+    @property
+    def package_count(self):
+        return self['package_count']
+    @package_count.setter
+    def package_count(self, value):
+        self['package_count'] = value
+    @property
+    def measurements(self):
+        return self['measurements']
+    @measurements.setter
+    def measurements(self, value):
+        self['measurements'] = value
+
+IMU_MEASUREMENT_FIELDS = [
+    ('systime', 'u4'),
+    ('line_angle', 'i4'),
+    ('frame_angle', 'i4'),
+    ('gyro_x', 'i2'),
+    ('gyro_y', 'i2'),
+    ('gyro_z', 'i2'),
+    ('acc_x', 'i2'),
+    ('acc_y', 'i2'),
+    ('acc_z', 'i2'),
+    ('mag_x', 'i2'),
+    ('mag_y', 'i2'),
+    ('mag_z', 'i2'),
+    ('temperature', 'i2'),
+    ('frame_speed', 'i4'),
+    ('flags', 'u4')
+]
+
 class ImuDataDecoder:
     def decode(self, payload):
         if self._isJsonEncoded(payload):
@@ -288,7 +337,7 @@ class ImuDataDecoder:
             return self._decodeRaw(payload)
 
     def _isJsonEncoded(self, payload):
-        if len(payload) > 25 and payload[0] == b'{':
+        if len(payload) > 25 and payload[:1] == b'{':
             substr = payload[:25]
             keyFound = False
             for key in [b'measurements', b'package_index', b'package_count']:
@@ -301,6 +350,56 @@ class ImuDataDecoder:
     def _decodeJson(self, payload):
         return imu_data(json.loads(payload.decode()))
 
+    def _measurementDtype(self, endian, itemsize):
+        """Return structured dtype of the 'I2i10hiI' measurement record with the given record size."""
+        names = []
+        formats = []
+        offsets = []
+        offset = 0
+        for name, fmt in IMU_MEASUREMENT_FIELDS:
+            names.append(name)
+            formats.append(endian + fmt)
+            offsets.append(offset)
+            offset += int(fmt[1])
+        return np.dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': max(itemsize, offset)})
+
+    def decodeArray(self, payload):
+        """Decode raw payload into imu_data_array, all measurements are read with one np.frombuffer call."""
+        if np is None:
+            raise RuntimeError("NumPy is required for decoding IMU data into arrays.")
+        if self._isJsonEncoded(payload):
+            data = self._decodeJson(payload)
+            return imu_data_array(
+                package_index=data.package_index,
+                package_count=data.package_count,
+                measurements=np.array(
+                    [tuple(m[name] for name, fmt in IMU_MEASUREMENT_FIELDS) for m in data.measurements],
+                    dtype=[(name, fmt) for name, fmt in IMU_MEASUREMENT_FIELDS]))
+        if len(payload) < 16:
+            raise RuntimeError("Parsing of RAW signal payload failed. Invalid data length.")
+
+        package_id, package_endianess = struct.unpack_from("<2B", payload, 0)
+        endian = "<" if package_endianess == 0 else ">"
+        package_header_size, package_header_cnt = struct.unpack_from(endian+"2H", payload, 4)
+
+        r = imu_data_array()
+        offset = 8
+        pkg_index, pkg_count, num_meas = struct.unpack_from(endian+"3i", payload, offset)
+        r.package_index = pkg_index
+        r.package_count = pkg_count
+        offset += package_header_size * package_header_cnt
+
+        pkg_meas_size, pkg_meas_count = struct.unpack_from(endian+"2H", payload, offset)
+        offset += 4
+
+        dtype = self._measurementDtype(endian, pkg_meas_size)
+        if offset + pkg_meas_count * dtype.itemsize > len(payload):
+            raise RuntimeError("Parsing of RAW signal payload failed. Invalid data length.")
+        meas = np.frombuffer(payload, dtype=dtype, count=pkg_meas_count, offset=offset)
+        # packed copy in native byte order
+        r.measurements = meas.astype(np.dtype([(name, fmt) for name, fmt in IMU_MEASUREMENT_FIELDS]))
+        return r
+
     def _decodeRaw(self, payload):
         if len(payload) < 16:
             raise RuntimeError("Parsing of RAW signal payload failed. Invalid data length.")
@@ -347,16 +446,23 @@ def _scannereventsservice_error_decoder(payload):
     return json.loads(payload.decode())
 def _scannereventsservice_ipcirq_irq_imu_data_decoder(payload):
     return ImuDataDecoder().decode(payload)
+def _scannereventsservice_ipcirq_irq_imu_data_array_decoder(payload):
+    return ImuDataDecoder().decodeArray(payload)
 def _scannereventsservice_ipcirq_irq_gps_pps_data_decoder(payload):
     return gps_pps_data(json.loads(payload.decode()))
 
 class ScannereventsService(object):
     """"""
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("SCANNER", connectionFactory=_ridFactory)
+    SERVICE_NAME = "SCANNER"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=_ridFactory if connectionFactory is None else connectionFactory)
         self._svc.open(address)
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # service signals
         self._error = ServiceSignal(self._svc, "error", decoderFn=_scannereventsservice_error_decoder)
         self._IPCIRQ_IRQ_SCAN_START = ServiceSignal(self._svc, "IPCIRQ_IRQ_SCAN_START")
@@ -384,10 +490,10 @@ class ScannereventsService(object):
         self._IPCIRQ_IRQ_FRAME_DOWNSCAN = ServiceSignal(self._svc, "IPCIRQ_IRQ_FRAME_DOWNSCAN")
         self._IPCIRQ_IRQ_CAMERA_MOUNT_DETECTION = ServiceSignal(self._svc, "IPCIRQ_IRQ_CAMERA_MOUNT_DETECTION")
         self._IPCIRQ_IRQ_IMU_DATA = ServiceSignal(self._svc, "IPCIRQ_IRQ_IMU_DATA", decoderFn=_scannereventsservice_ipcirq_irq_imu_data_decoder)
+        self._IPCIRQ_IRQ_IMU_DATA_ARRAY = ServiceSignal(self._svc, "IPCIRQ_IRQ_IMU_DATA", decoderFn=_scannereventsservice_ipcirq_irq_imu_data_array_decoder)
         self._IPCIRQ_IRQ_GPS_PPS_DATA = ServiceSignal(self._svc, "IPCIRQ_IRQ_GPS_PPS_DATA", decoderFn=_scannereventsservice_ipcirq_irq_gps_pps_data_decoder)
         self._IPCIRQ_IRQ_LOCAL_TIME_UPDATE = ServiceSignal(self._svc, "IPCIRQ_IRQ_LOCAL_TIME_UPDATE")
         self._IPCIRQ_IRQ_HALT_TEGRA_REQ = ServiceSignal(self._svc, "IPCIRQ_IRQ_HALT_TEGRA_REQ")
-        self._lock = threading.Lock()
 
     def __enter__(self):
         return self
@@ -510,6 +616,13 @@ class ScannereventsService(object):
            Payload: imu_data"""
         return self._IPCIRQ_IRQ_IMU_DATA
 
+    def IPCIRQ_IRQ_IMU_DATA_ARRAY(self):
+        """Signal IPCIRQ_IRQ_IMU_DATA with the measurements decoded into a NumPy array.
+
+           Returns: ServiceSignal
+           Payload: imu_data_array"""
+        return self._IPCIRQ_IRQ_IMU_DATA_ARRAY
+
     def IPCIRQ_IRQ_GPS_PPS_DATA(self):
         """Returns: ServiceSignal
            Payload: gps_pps_data"""
@@ -287,11 +287,15 @@ class ScannerService(object):
     MEAS_WAVEFORM_ONLY = AcquisitionMode.MEAS_WAVEFORM_ONLY
     MEAS_RANGE_WAVEFORM = AcquisitionMode.MEAS_RANGE_WAVEFORM
 
-    def __init__(self, address):
-        self._svc = riconnect.Service("SCANNER")
+    SERVICE_NAME = "SCANNER"
+
+    def __init__(self, address, connectionFactory=None):
+        self._svc = riconnect.Service(self.SERVICE_NAME, connectionFactory=connectionFactory)
         self._svc.open(address)
-        self._lock = threading.Lock()
+        self._initSignals()
+        self._lock = self._svc.callLock()
 
+    def _initSignals(self):
         # connect to signals
         self._svc.subscribe("IPCIRQ_IRQ_MEAS_ACQ_START", weakref.WeakMethod(self._onMeasAcqStart))
         self._svc.subscribe("IPCIRQ_IRQ_MEAS_ACQ_STOP", weakref.WeakMethod(self._onMeasAcqStop))